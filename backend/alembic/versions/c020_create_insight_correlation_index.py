@@ -0,0 +1,62 @@
+"""create insight_correlation_index table for LSH-based correlation
+
+Revision ID: c020
+Revises: c019
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "c020"
+down_revision: str | Sequence[str] | None = "c019"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "insight_correlation_index",
+        sa.Column(
+            "insight_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("insights.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("source", sa.String(50), nullable=False),
+        sa.Column("insight_created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("term_counts", sa.JSON(), nullable=False),
+        sa.Column("band_keys", postgresql.ARRAY(sa.String(24)), nullable=False),
+        sa.Column(
+            "indexed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_index(
+        "ix_insight_correlation_index_insight_created_at",
+        "insight_correlation_index",
+        ["insight_created_at"],
+    )
+    # GIN index backs the band_keys && ARRAY[...] candidate lookup
+    op.create_index(
+        "ix_insight_correlation_index_band_keys",
+        "insight_correlation_index",
+        ["band_keys"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_insight_correlation_index_band_keys",
+        table_name="insight_correlation_index",
+    )
+    op.drop_index(
+        "ix_insight_correlation_index_insight_created_at",
+        table_name="insight_correlation_index",
+    )
+    op.drop_table("insight_correlation_index")
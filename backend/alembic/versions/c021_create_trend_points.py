@@ -0,0 +1,106 @@
+"""create trend_points time-series table and backfill realtime trend blobs
+
+Moves raw_signals.extra_metadata["trend_data_realtime"] ({"timestamps": [...],
+"values": [...]}) into an append-only (keyword, geo, ts, value) table.
+
+Revision ID: c021
+Revises: c020
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "c021"
+down_revision: str | Sequence[str] | None = "c020"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "trend_points",
+        sa.Column("keyword", sa.String(255), nullable=False),
+        sa.Column("geo", sa.String(10), nullable=False, server_default="US"),
+        sa.Column("ts", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("value", sa.SmallInteger(), nullable=False),
+        # Covering PK: range reads per (keyword, geo) are index-only scans
+        sa.PrimaryKeyConstraint(
+            "keyword", "geo", "ts", name="pk_trend_points", postgresql_include=["value"]
+        ),
+    )
+    # BRIN on an append-only timestamp: tiny index for range retention deletes
+    op.create_index(
+        "ix_trend_points_ts_brin",
+        "trend_points",
+        ["ts"],
+        postgresql_using="brin",
+    )
+
+    # Backfill: zip the timestamps/values arrays by ordinality. Stored timestamps
+    # are UTC (some naive, from before the UTC fix), so read them as UTC.
+    op.execute(
+        """
+        INSERT INTO trend_points (keyword, geo, ts, value)
+        SELECT
+            rs.extra_metadata->>'keyword',
+            COALESCE(NULLIF(rs.extra_metadata->>'geo', ''), 'US'),
+            (t.ts::timestamp AT TIME ZONE 'UTC'),
+            LEAST(GREATEST(ROUND(v.value::numeric), 0), 100)::smallint
+        FROM raw_signals rs
+        CROSS JOIN LATERAL json_array_elements_text(
+            rs.extra_metadata->'trend_data_realtime'->'timestamps'
+        ) WITH ORDINALITY AS t(ts, n)
+        JOIN LATERAL json_array_elements_text(
+            rs.extra_metadata->'trend_data_realtime'->'values'
+        ) WITH ORDINALITY AS v(value, n) ON v.n = t.n
+        WHERE rs.extra_metadata->>'keyword' IS NOT NULL
+          AND v.value IS NOT NULL
+          AND json_typeof(rs.extra_metadata->'trend_data_realtime'->'timestamps') = 'array'
+          AND json_typeof(rs.extra_metadata->'trend_data_realtime'->'values') = 'array'
+        ON CONFLICT DO NOTHING
+        """
+    )
+
+    # Drop the migrated blobs so there is a single source of truth
+    op.execute(
+        """
+        UPDATE raw_signals
+        SET extra_metadata = (extra_metadata::jsonb - 'trend_data_realtime')::json
+        WHERE extra_metadata->'trend_data_realtime' IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    # Rebuild the blobs on every Google Trends signal for each (keyword, geo)
+    op.execute(
+        """
+        WITH series AS (
+            SELECT
+                keyword,
+                geo,
+                json_build_object(
+                    'timestamps', json_agg(
+                        to_char(ts AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS.US"+00:00"')
+                        ORDER BY ts
+                    ),
+                    'values', json_agg(value ORDER BY ts)
+                ) AS blob
+            FROM trend_points
+            GROUP BY keyword, geo
+        )
+        UPDATE raw_signals rs
+        SET extra_metadata = (
+            rs.extra_metadata::jsonb || jsonb_build_object('trend_data_realtime', s.blob::jsonb)
+        )::json
+        FROM series s
+        WHERE rs.source = 'google_trends'
+          AND rs.extra_metadata->>'keyword' = s.keyword
+          AND COALESCE(NULLIF(rs.extra_metadata->>'geo', ''), 'US') = s.geo
+        """
+    )
+    op.drop_index("ix_trend_points_ts_brin", table_name="trend_points")
+    op.drop_table("trend_points")
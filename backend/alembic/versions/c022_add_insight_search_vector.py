@@ -0,0 +1,51 @@
+"""add generated full-text search vector to insights
+
+insights.search_vector is a stored tsvector generated from title (weight A),
+problem_statement and proposed_solution (weight B), with a GIN index. Replaces
+leading-wildcard ILIKE scans in insight search and explore categories.
+
+Revision ID: c022
+Revises: c021
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "c022"
+down_revision: str | Sequence[str] | None = "c021"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SEARCH_DOCUMENT_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(problem_statement, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(proposed_solution, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    # Stored generated column: computed on write, backfilled for existing rows
+    op.add_column(
+        "insights",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_DOCUMENT_SQL, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_insights_search_vector",
+        "insights",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_insights_search_vector", table_name="insights")
+    op.drop_column("insights", "search_vector")
@@ -0,0 +1,64 @@
+"""create insight_categories table for programmatic SEO explore pages
+
+Rows are populated by sync_category_index() on the next worker startup (every
+category starts out unindexed) and kept current by Insight mapper hooks.
+
+Revision ID: c023
+Revises: c022
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "c023"
+down_revision: str | Sequence[str] | None = "c022"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "insight_categories",
+        sa.Column("category_slug", sa.String(100), primary_key=True),
+        sa.Column(
+            "insight_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("insights.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("keywords_hash", sa.String(16), nullable=False),
+        sa.Column("relevance_score", sa.Float(), nullable=False),
+        sa.Column("insight_created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "indexed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_index(
+        "ix_insight_categories_insight_id",
+        "insight_categories",
+        ["insight_id"],
+    )
+    # Explore page order (relevance) and widget order (recency) within a category
+    op.create_index(
+        "ix_insight_categories_slug_relevance",
+        "insight_categories",
+        ["category_slug", "relevance_score", "insight_id"],
+    )
+    op.create_index(
+        "ix_insight_categories_slug_created",
+        "insight_categories",
+        ["category_slug", "insight_created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_insight_categories_slug_created", table_name="insight_categories")
+    op.drop_index("ix_insight_categories_slug_relevance", table_name="insight_categories")
+    op.drop_index("ix_insight_categories_insight_id", table_name="insight_categories")
+    op.drop_table("insight_categories")
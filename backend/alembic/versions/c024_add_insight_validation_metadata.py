@@ -0,0 +1,28 @@
+"""add validation_metadata to insights for the post-LLM validation stage
+
+Revision ID: c024
+Revises: c023
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "c024"
+down_revision: str | Sequence[str] | None = "c023"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "insights",
+        sa.Column("validation_metadata", postgresql.JSONB(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("insights", "validation_metadata")
@@ -4,18 +4,46 @@ Phase 4.3: Enhanced 8-dimension scoring (analyze_signal_enhanced)
 Phase 5.1: Research agent (analyze_idea)
 """
 
-from app.agents.enhanced_analyzer import (
-    analyze_signal_enhanced,
-    analyze_signal_enhanced_with_retry,
-    calculate_aggregate_score,
-    upgrade_insight_scoring,
-)
-from app.agents.research_agent import (
-    RESEARCH_QUOTA_LIMITS,
-    analyze_idea,
-    analyze_idea_with_retry,
-    get_quota_limit,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.agents.enhanced_analyzer import (
+        analyze_signal_enhanced,
+        analyze_signal_enhanced_with_retry,
+        calculate_aggregate_score,
+        upgrade_insight_scoring,
+    )
+    from app.agents.research_agent import (
+        RESEARCH_QUOTA_LIMITS,
+        analyze_idea,
+        analyze_idea_with_retry,
+        get_quota_limit,
+    )
+
+# Exports resolve on first access (PEP 562), so importing one submodule such as
+# app.agents.chat_agent does not load every agent (and the pydantic-ai, PRAW and
+# pytrends dependencies behind them)
+_EXPORTS: dict[str, str] = {
+    "analyze_signal_enhanced": "app.agents.enhanced_analyzer",
+    "analyze_signal_enhanced_with_retry": "app.agents.enhanced_analyzer",
+    "calculate_aggregate_score": "app.agents.enhanced_analyzer",
+    "upgrade_insight_scoring": "app.agents.enhanced_analyzer",
+    "RESEARCH_QUOTA_LIMITS": "app.agents.research_agent",
+    "analyze_idea": "app.agents.research_agent",
+    "analyze_idea_with_retry": "app.agents.research_agent",
+    "get_quota_limit": "app.agents.research_agent",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Enhanced analyzer (Phase 4.3)
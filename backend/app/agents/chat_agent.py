@@ -7,17 +7,23 @@ Conversational AI agent with 5 strategist modes:
 4. Pricing Strategy: Suggests pricing tiers, competitive analysis
 5. Competitive: Competitive landscape analysis and positioning
 
-Uses PydanticAI with Gemini 2.0 Flash for structured output.
+Uses PydanticAI with Gemini 2.0 Flash; replies are streamed as text deltas.
 """
 
+import asyncio
 import logging
+import time
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
+from functools import cache
+from typing import TYPE_CHECKING
 
 import httpx
-from pydantic import BaseModel, Field
-from pydantic_ai import Agent
-from pydantic_ai.exceptions import UnexpectedModelBehavior
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+from app.monitoring.metrics import get_metrics_tracker
+
+if TYPE_CHECKING:
+    from pydantic_ai import Agent
 
 logger = logging.getLogger(__name__)
 
@@ -138,17 +144,6 @@ SYSTEM_PROMPTS = {
 }
 
 
-# ============================================================
-# Agent Output Schema
-# ============================================================
-
-
-class ChatAgentResponse(BaseModel):
-    """Structured response from the chat agent."""
-
-    response: str = Field(description="The assistant's response to the user")
-
-
 # ============================================================
 # Context
 # ============================================================
@@ -171,8 +166,10 @@ class ChatContext:
 # ============================================================
 
 
-def _build_agent(mode: str, custom_prompt: str | None = None) -> Agent:
+def _build_agent(mode: str, custom_prompt: str | None = None) -> "Agent":
     """Build a PydanticAI agent for the given chat mode."""
+    from pydantic_ai import Agent
+
     system_prompt = custom_prompt or SYSTEM_PROMPTS.get(mode, SYSTEM_PROMPTS["general"])
 
     return Agent(
@@ -181,44 +178,12 @@ def _build_agent(mode: str, custom_prompt: str | None = None) -> Agent:
     )
 
 
-# ============================================================
-# Main Chat Function
-# ============================================================
-
-
-@retry(
-    retry=retry_if_exception_type(
-        (
-            httpx.HTTPStatusError,
-            httpx.TimeoutException,
-            UnexpectedModelBehavior,
-        )
-    ),
-    wait=wait_exponential(min=2, max=10),
-    stop=stop_after_attempt(3),
-    reraise=True,
-)
-async def get_chat_response(
-    mode: str,
+def _build_prompt(
     user_message: str,
     context: ChatContext,
     conversation_history: list[dict],
-    custom_prompt: str | None = None,
-) -> ChatAgentResponse:
-    """Generate a chat response for the given mode and context.
-
-    Args:
-        mode: One of 'general', 'pressure_test', 'gtm_planning', 'pricing_strategy', 'competitive'
-        user_message: The user's current message
-        context: Idea context (title, problem, solution, scores)
-        conversation_history: List of prior messages [{"role": "user"|"assistant", "content": "..."}]
-        custom_prompt: Optional custom system prompt override from AgentConfiguration
-
-    Returns:
-        ChatAgentResponse with the assistant's response
-    """
-    agent = _build_agent(mode, custom_prompt)
-
+) -> str:
+    """Build the full prompt: idea context + recent history + current message."""
     # Build the full prompt with context + history
     context_block = f"""## Idea Being Discussed
 **Title:** {context.insight_title}
@@ -247,5 +212,105 @@ async def get_chat_response(
 ## Current User Message
 {user_message}"""
 
-    result = await agent.run(full_prompt)
-    return ChatAgentResponse(response=str(result.output))
+    return full_prompt
+
+
+# ============================================================
+# Main Chat Function
+# ============================================================
+
+
+_MAX_ATTEMPTS = 3
+
+
+@cache
+def _retryable_errors() -> tuple[type[Exception], ...]:
+    """Transient errors worth retrying (pydantic-ai imported on first use)."""
+    from pydantic_ai.exceptions import UnexpectedModelBehavior
+
+    return (httpx.HTTPStatusError, httpx.TimeoutException, UnexpectedModelBehavior)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    return isinstance(exc, _retryable_errors())
+
+
+async def stream_chat_response(
+    mode: str,
+    user_message: str,
+    context: ChatContext,
+    conversation_history: list[dict],
+    custom_prompt: str | None = None,
+) -> AsyncIterator[str]:
+    """Stream a chat response as text deltas as the model produces them.
+
+    Errors matching _is_retryable are retried with backoff only while
+    nothing has been yielded yet; once text has reached the client a retry would
+    duplicate it, so later failures propagate. Time to first token and output
+    tokens/s are recorded in MetricsTracker.
+
+    Args:
+        mode: One of 'general', 'pressure_test', 'gtm_planning', 'pricing_strategy', 'competitive'
+        user_message: The user's current message
+        context: Idea context (title, problem, solution, scores)
+        conversation_history: List of prior messages [{"role": "user"|"assistant", "content": "..."}]
+        custom_prompt: Optional custom system prompt override from AgentConfiguration
+
+    Yields:
+        Response text chunks, in order; their concatenation is the full reply
+    """
+    agent = _build_agent(mode, custom_prompt)
+    full_prompt = _build_prompt(user_message, context, conversation_history)
+    metrics_tracker = get_metrics_tracker()
+
+    for attempt in range(1, _MAX_ATTEMPTS + 1):
+        start = time.perf_counter()
+        first_token_at: float | None = None
+        chunks: list[str] = []
+        try:
+            async with agent.run_stream(full_prompt) as result:
+                async for delta in result.stream_text(delta=True, debounce_by=None):
+                    if not delta:
+                        continue
+                    if first_token_at is None:
+                        first_token_at = time.perf_counter()
+                    chunks.append(delta)
+                    yield delta
+                usage = result.usage()
+        except Exception as e:
+            if not _is_retryable(e):
+                raise
+            metrics_tracker.track_llm_call(
+                model="gemini-2.0-flash",
+                prompt=full_prompt,
+                response=None,
+                input_tokens=len(full_prompt) // 4,
+                output_tokens=0,
+                latency_ms=(time.perf_counter() - start) * 1000,
+                success=False,
+                error=str(e),
+            )
+            if chunks or attempt == _MAX_ATTEMPTS:
+                raise
+            backoff = min(2**attempt, 10)
+            logger.warning(f"Chat stream attempt {attempt} failed ({e}), retrying in {backoff}s")
+            await asyncio.sleep(backoff)
+            continue
+
+        end = time.perf_counter()
+        response_text = "".join(chunks)
+        output_tokens = usage.output_tokens or len(response_text) // 4
+        ttft_ms = (first_token_at - start) * 1000 if first_token_at is not None else None
+        decode_seconds = end - first_token_at if first_token_at is not None else 0.0
+        metrics_tracker.track_llm_call(
+            model="gemini-2.0-flash",
+            prompt=full_prompt,
+            response=response_text,
+            input_tokens=usage.input_tokens or len(full_prompt) // 4,
+            output_tokens=output_tokens,
+            latency_ms=(end - start) * 1000,
+            success=True,
+            ttft_ms=ttft_ms,
+            tokens_per_second=output_tokens / decode_seconds if decode_seconds > 0 else None,
+        )
+        return
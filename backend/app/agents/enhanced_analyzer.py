@@ -16,7 +16,8 @@ import asyncio
 import logging
 import re
 import time
-from typing import Literal
+from collections.abc import Awaitable, Callable
+from typing import Literal, TypeVar
 
 from pydantic import BaseModel, Field, HttpUrl
 from pydantic_ai import Agent
@@ -30,6 +31,7 @@ from tenacity import (
 from app.agents.sentry_tracing import trace_agent_run
 from app.core.config import settings
 from app.core.constants import SOURCE_CREDIBILITY_WEIGHTS
+from app.core.llm_rate_limiter import estimate_llm_tokens, get_llm_rate_limiter
 from app.models.insight import Insight
 from app.models.raw_signal import RawSignal
 from app.monitoring.metrics import get_metrics_tracker
@@ -43,6 +45,8 @@ from app.services.url_validator import get_url_validator
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 # ============================================================
 # Pydantic Schemas for Enhanced Structured LLM Output
@@ -491,6 +495,119 @@ def get_enhanced_agent(language: str = "en") -> Agent:
     )
 
 
+# ============================================================
+# Post-LLM Validation Stage
+# ============================================================
+
+
+async def _timed_validator(
+    name: str, call: Callable[[], Awaitable[T]], timeout: float
+) -> tuple[T | None, dict]:
+    """
+    Await one validator within its time budget.
+
+    Args:
+        name: Validator name (metadata and metrics key)
+        call: Starts the validation; called inside the budget so setup errors count too
+        timeout: Budget in seconds
+
+    Returns:
+        Tuple of (result, or None on timeout/error; report entry)
+    """
+    start = time.perf_counter()
+    result, status = None, "ok"
+    try:
+        result = await asyncio.wait_for(call(), timeout=timeout)
+    except TimeoutError:
+        # Blocking work already handed to a thread (PRAW, pytrends) finishes
+        # in the background; the pipeline no longer waits for it
+        status = "timeout"
+        logger.warning(f"{name} validation exceeded its {timeout:.0f}s budget; kept LLM values")
+    except Exception as e:
+        status = "error"
+        logger.warning(f"{name} validation skipped due to error: {e}")
+    latency_ms = (time.perf_counter() - start) * 1000
+    get_metrics_tracker().track_validation(name, latency_ms, status)
+    return result, {"status": status, "latency_ms": round(latency_ms, 1)}
+
+
+async def run_validation_stage(
+    community_signals: list[dict],
+    trend_keywords: list[dict],
+    competitors: list[dict],
+) -> tuple[list[dict], list[dict], list[dict], dict]:
+    """
+    Verify community signals, trend keywords and competitor URLs concurrently.
+
+    The three checks are independent and network-bound, so the stage takes as
+    long as the slowest one, capped by its budget. A validator that errors or
+    runs out of time leaves its input as the LLM produced it.
+
+    Args:
+        community_signals: LLM community signals (subreddits checked via PRAW)
+        trend_keywords: LLM trend keywords (checked against Google Trends)
+        competitors: LLM competitor entries (URLs checked for reachability)
+
+    Returns:
+        Tuple of (community_signals, trend_keywords, competitors, validation report)
+    """
+    start = time.perf_counter()
+    (
+        (communities, community_report),
+        (trends, trend_report),
+        (urls, url_report),
+    ) = await asyncio.gather(
+        _timed_validator(
+            "community",
+            lambda: get_community_validator().validate_community_signals(community_signals),
+            settings.community_validation_timeout,
+        ),
+        _timed_validator(
+            "trend",
+            lambda: get_trend_verifier().verify_trend_keywords(trend_keywords),
+            settings.trend_verification_timeout,
+        ),
+        _timed_validator(
+            "url",
+            lambda: get_url_validator().validate_competitors(competitors),
+            settings.url_validation_timeout,
+        ),
+    )
+
+    if communities is not None:
+        validated_communities, valid_count, invalid_count = communities
+        if invalid_count > 0:
+            logger.info(f"Community validation: {valid_count} valid, {invalid_count} invalid")
+        # Use validated communities (with real member counts)
+        community_signals = validated_communities
+        community_report.update(valid=valid_count, invalid=invalid_count)
+
+    if trends is not None:
+        verified_trends, verified_count, unverified_count = trends
+        if unverified_count > 0:
+            logger.info(
+                f"Trend verification: {verified_count} verified, {unverified_count} unverified"
+            )
+        # Use verified trends (with real growth data)
+        if verified_trends:
+            trend_keywords = verified_trends
+        trend_report.update(valid=verified_count, invalid=unverified_count)
+
+    if urls is not None:
+        valid_competitors, valid_url_count, invalid_url_count = urls
+        if invalid_url_count > 0:
+            logger.info(f"URL validation: {valid_url_count} valid, {invalid_url_count} invalid")
+        # Use only competitors with valid URLs
+        competitors = valid_competitors
+        url_report.update(valid=valid_url_count, invalid=invalid_url_count)
+
+    report = {
+        "validators": {"community": community_report, "trend": trend_report, "url": url_report},
+        "stage_latency_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
+    return community_signals, trend_keywords, competitors, report
+
+
 # ============================================================
 # Core Enhanced Analysis Function
 # ============================================================
@@ -519,6 +636,10 @@ async def analyze_signal_enhanced(raw_signal: RawSignal, language: str = "en") -
         # Get enhanced agent instance with language support
         agent = get_enhanced_agent(language)
 
+        # Wait for RPM/TPM quota — each retry attempt consumes its own request slot
+        await get_llm_rate_limiter().acquire(estimate_llm_tokens(raw_signal.content))
+        start_time = time.time()  # Latency excludes time queued for quota
+
         # Call PydanticAI agent with enhanced schema
         async with trace_agent_run("enhanced_analyzer"):
             result = await asyncio.wait_for(
@@ -580,59 +701,18 @@ async def analyze_signal_enhanced(raw_signal: RawSignal, language: str = "en") -
 
         # ============================================
         # Phase 1: Additional Data Quality Verification
-        # Validate community signals, trends, and competitor URLs
+        # Community signals, trend keywords and competitor URLs, concurrently
         # ============================================
-
-        # 1. Validate community signals (verify subreddits exist)
-        community_signals = [c.model_dump() for c in insight_data.community_signals]
-        try:
-            community_validator = get_community_validator()
-            (
-                validated_communities,
-                valid_count,
-                invalid_count,
-            ) = await community_validator.validate_community_signals(community_signals)
-            if invalid_count > 0:
-                logger.info(f"Community validation: {valid_count} valid, {invalid_count} invalid")
-            # Use validated communities (with real member counts)
-            community_signals = validated_communities
-        except Exception as e:
-            logger.warning(f"Community validation skipped due to error: {e}")
-
-        # 2. Validate trend keywords (verify with Google Trends)
-        trend_keywords = [t.model_dump() for t in insight_data.trend_keywords]
-        try:
-            trend_verifier = get_trend_verifier()
-            (
-                verified_trends,
-                verified_count,
-                unverified_count,
-            ) = await trend_verifier.verify_trend_keywords(trend_keywords)
-            if unverified_count > 0:
-                logger.info(
-                    f"Trend verification: {verified_count} verified, {unverified_count} unverified"
-                )
-            # Use verified trends (with real growth data)
-            if verified_trends:
-                trend_keywords = verified_trends
-        except Exception as e:
-            logger.warning(f"Trend verification skipped due to error: {e}")
-
-        # 3. Validate competitor URLs (verify they're reachable)
-        competitors = [c.model_dump() for c in insight_data.competitor_analysis]
-        try:
-            url_validator = get_url_validator()
-            (
-                valid_competitors,
-                valid_url_count,
-                invalid_url_count,
-            ) = await url_validator.validate_competitors(competitors)
-            if invalid_url_count > 0:
-                logger.info(f"URL validation: {valid_url_count} valid, {invalid_url_count} invalid")
-            # Use only competitors with valid URLs
-            competitors = valid_competitors
-        except Exception as e:
-            logger.warning(f"URL validation skipped due to error: {e}")
+        (
+            community_signals,
+            trend_keywords,
+            competitors,
+            validation_report,
+        ) = await run_validation_stage(
+            community_signals=[c.model_dump() for c in insight_data.community_signals],
+            trend_keywords=[t.model_dump() for t in insight_data.trend_keywords],
+            competitors=[c.model_dump() for c in insight_data.competitor_analysis],
+        )
 
         # Estimate tokens (rough approximation: ~4 chars per token)
         input_tokens = len(raw_signal.content) // 4
@@ -687,6 +767,7 @@ async def analyze_signal_enhanced(raw_signal: RawSignal, language: str = "en") -
             trend_keywords=trend_keywords,  # Use verified trends
             # Market sizing
             market_sizing=insight_data.market_sizing.model_dump(),
+            validation_metadata=validation_report,
         )
 
         # Track successful insight generation
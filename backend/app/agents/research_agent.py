@@ -16,9 +16,9 @@ See architecture.md "Research Agent Architecture" for specification.
 import asyncio
 import logging
 import time
+from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field
-from pydantic_ai import Agent
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -40,6 +40,9 @@ from app.schemas.research import (
     ValueEquation,
 )
 
+if TYPE_CHECKING:
+    from pydantic_ai import Agent
+
 logger = logging.getLogger(__name__)
 
 
@@ -185,8 +188,10 @@ Return a structured JSON object matching the ResearchResult schema."""
 # ============================================================
 
 
-def get_research_agent() -> Agent:
+def get_research_agent() -> "Agent":
     """Get PydanticAI agent for research analysis (API key from GOOGLE_API_KEY env)."""
+    from pydantic_ai import Agent
+
     return Agent(
         model=settings.default_llm_model,
         system_prompt=RESEARCH_SYSTEM_PROMPT,
@@ -6,13 +6,17 @@ See architecture.md "Authentication Architecture" for full specification.
 Supports both ES256 (JWKS-based, Supabase default) and HS256 (legacy) JWT verification.
 """
 
+import hashlib
+import json
 import logging
 import time
 from enum import Enum
 from typing import Annotated
+from uuid import UUID
 
 import httpx
 import jwt
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jwt.algorithms import ECAlgorithm
@@ -64,6 +68,81 @@ async def get_redis() -> aioredis.Redis:
     return await _get_cache_redis()
 
 
+# ============================================
+# Verified-principal cache
+# ============================================
+# Maps token `sub` → (claims hash, users.id). When a request's provisioning
+# claims hash matches the cached entry, the user is loaded by primary key
+# instead of running the JIT UPSERT (no write, row lock or WAL per request).
+# L1 is process-local with a short TTL; Redis backs it across processes.
+_PRINCIPAL_KEY_PREFIX = "auth:principal:"
+_principal_l1: TTLCache = TTLCache(maxsize=10_000, ttl=settings.principal_cache_local_ttl)
+
+
+def _principal_claims_hash(payload: dict) -> str:
+    """Hash the token claims that drive user provisioning (email, name, avatar)."""
+    user_metadata = payload.get("user_metadata", {}) or {}
+    claims = {
+        "email": payload.get("email"),
+        "full_name": user_metadata.get("full_name"),
+        "avatar_url": user_metadata.get("avatar_url"),
+    }
+    return hashlib.sha256(json.dumps(claims, sort_keys=True).encode()).hexdigest()[:32]
+
+
+async def _get_cached_principal(supabase_user_id: str) -> tuple[str, str] | None:
+    """Return (claims_hash, user_id) for a subject, checking L1 then Redis."""
+    entry = _principal_l1.get(supabase_user_id)
+    if entry is not None:
+        return entry
+
+    try:
+        redis = await get_redis()
+        value = await redis.get(f"{_PRINCIPAL_KEY_PREFIX}{supabase_user_id}")
+    except Exception as e:
+        logger.debug(f"Principal cache read failed: {e}")
+        return None
+
+    if not value or ":" not in value:
+        return None
+    claims_hash, user_id = value.split(":", 1)
+    _principal_l1[supabase_user_id] = (claims_hash, user_id)
+    return claims_hash, user_id
+
+
+async def _set_cached_principal(supabase_user_id: str, claims_hash: str, user_id: str) -> None:
+    """Store a verified principal in L1 and Redis."""
+    _principal_l1[supabase_user_id] = (claims_hash, user_id)
+    try:
+        redis = await get_redis()
+        await redis.setex(
+            f"{_PRINCIPAL_KEY_PREFIX}{supabase_user_id}",
+            settings.principal_cache_ttl,
+            f"{claims_hash}:{user_id}",
+        )
+    except Exception as e:
+        logger.debug(f"Principal cache write failed: {e}")
+
+
+async def invalidate_principal_cache(supabase_user_id: str | None) -> None:
+    """
+    Drop a cached principal so the next request re-provisions the user.
+
+    Call after updating or deleting a user row.
+
+    Args:
+        supabase_user_id: Token subject (User.supabase_user_id)
+    """
+    if not supabase_user_id:
+        return
+    _principal_l1.pop(supabase_user_id, None)
+    try:
+        redis = await get_redis()
+        await redis.delete(f"{_PRINCIPAL_KEY_PREFIX}{supabase_user_id}")
+    except Exception as e:
+        logger.warning(f"Principal cache invalidation failed for {supabase_user_id}: {e}")
+
+
 # HTTP Bearer token scheme
 security = HTTPBearer(auto_error=False)
 
@@ -274,29 +353,40 @@ async def _verify_and_get_user(token: str, db: AsyncSession) -> User:
         logger.warning(f"JWKS fetch or key lookup failed: {e}")
         raise credentials_exception
 
-    # Find or create user (JIT provisioning) - atomic UPSERT prevents race conditions
-    stmt = (
-        insert(User)
-        .values(
-            supabase_user_id=supabase_user_id,
-            email=email or f"{supabase_user_id}@supabase.auth",
-            display_name=payload.get("user_metadata", {}).get("full_name"),
-            avatar_url=payload.get("user_metadata", {}).get("avatar_url"),
-            preferences={},
-        )
-        .on_conflict_do_update(
-            index_elements=["supabase_user_id"],
-            set_={
-                "email": email or f"{supabase_user_id}@supabase.auth",
-                "display_name": payload.get("user_metadata", {}).get("full_name"),
-                "avatar_url": payload.get("user_metadata", {}).get("avatar_url"),
-            },
+    # Fast path: claims unchanged since last provisioning → primary-key read only
+    claims_hash = _principal_claims_hash(payload)
+    user: User | None = None
+    cached = await _get_cached_principal(supabase_user_id)
+    if cached is not None and cached[0] == claims_hash:
+        user = await db.get(User, UUID(cached[1]))
+        if user is not None and user.supabase_user_id != supabase_user_id:
+            user = None  # Stale mapping — fall through to provisioning
+
+    provisioned = user is None
+    if provisioned:
+        # Find or create user (JIT provisioning) - atomic UPSERT prevents race conditions
+        stmt = (
+            insert(User)
+            .values(
+                supabase_user_id=supabase_user_id,
+                email=email or f"{supabase_user_id}@supabase.auth",
+                display_name=payload.get("user_metadata", {}).get("full_name"),
+                avatar_url=payload.get("user_metadata", {}).get("avatar_url"),
+                preferences={},
+            )
+            .on_conflict_do_update(
+                index_elements=["supabase_user_id"],
+                set_={
+                    "email": email or f"{supabase_user_id}@supabase.auth",
+                    "display_name": payload.get("user_metadata", {}).get("full_name"),
+                    "avatar_url": payload.get("user_metadata", {}).get("avatar_url"),
+                },
+            )
+            .returning(User)
         )
-        .returning(User)
-    )
 
-    result = await db.execute(stmt)
-    user = result.scalar_one()
+        result = await db.execute(stmt)
+        user = result.scalar_one()
 
     # Grant API tier to admin/superadmin users (in-memory override, not persisted)
     app_metadata = payload.get("app_metadata", {}) or {}
@@ -312,22 +402,24 @@ async def _verify_and_get_user(token: str, db: AsyncSession) -> User:
     except ImportError:
         pass
 
-    await db.commit()
-
-    # Link newsletter subscriber record if this email subscribed before signing up
-    if email:
-        try:
-            await db.execute(
-                text(
-                    "UPDATE newsletter_subscribers "
-                    "SET user_id = :uid "
-                    "WHERE email = :email AND user_id IS NULL"
-                ),
-                {"uid": str(user.id), "email": email},
-            )
-            await db.commit()
-        except Exception as e:
-            logger.warning(f"Newsletter subscriber merge failed (non-fatal): {e}")
+    if provisioned:
+        await db.commit()
+        await _set_cached_principal(supabase_user_id, claims_hash, str(user.id))
+
+        # Link newsletter subscriber record if this email subscribed before signing up
+        if email:
+            try:
+                await db.execute(
+                    text(
+                        "UPDATE newsletter_subscribers "
+                        "SET user_id = :uid "
+                        "WHERE email = :email AND user_id IS NULL"
+                    ),
+                    {"uid": str(user.id), "email": email},
+                )
+                await db.commit()
+            except Exception as e:
+                logger.warning(f"Newsletter subscriber merge failed (non-fatal): {e}")
 
     # ✅ Check if user is soft-deleted (account deactivated)
     if user.deleted_at is not None:
@@ -31,10 +31,11 @@ from starlette.responses import StreamingResponse
 
 from app.api.deps import AdminUser
 from app.api.utils import escape_like
+from app.core.cache import invalidate_insights_cache, invalidate_trends_cache
 from app.core.config import settings
 from app.core.constants import InsightStatus
 from app.core.rate_limits import limiter
-from app.db.query_helpers import count_by_field
+from app.db.query_helpers import SortKey, count_by_field, paginate
 from app.db.session import AsyncSessionLocal, get_db
 from app.models.admin_user import AdminUser as AdminUserModel
 from app.models.agent_control import AgentConfiguration, AuditLog
@@ -67,14 +68,18 @@ from app.schemas.admin import (
     MetricSummaryResponse,
     ReviewQueueResponse,
 )
+from app.services.sse_broadcaster import SlowConsumerError, get_sse_broadcaster
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
-# SSE connection tracking (prevent connection exhaustion)
+# SSE connection tracking. Streams share one metrics producer via the SSE
+# broadcaster, so DB load no longer grows with the number of open tabs.
 _active_sse_connections = set()
-_MAX_SSE_CONNECTIONS = 10  # Limit concurrent admin SSE streams
+_MAX_SSE_CONNECTIONS = 100  # Limit concurrent admin SSE streams
+_ADMIN_METRICS_TOPIC = "admin:metrics"
+_ADMIN_METRICS_INTERVAL = 5.0
 
 
 # ============================================
@@ -114,14 +119,16 @@ async def admin_event_stream(
     Sends metrics_update events every 5 seconds with heartbeat.
 
     Security:
-    - Limited to 10 concurrent connections (prevents DB pool exhaustion)
-    - Creates fresh DB session per query (prevents session leak)
+    - Limited to 100 concurrent connections per process
+    - Metrics are computed once per interval by a shared producer (one fresh DB
+      session per snapshot, not per connection) and fanned out to all streams
+    - Clients that fall behind are dropped instead of buffered
     - Heartbeat detects client disconnects
     - Auto-cleanup on disconnect
     """
     connection_id = id(request)
 
-    # ✅ CONNECTION LIMIT - Prevent DB pool exhaustion
+    # ✅ CONNECTION LIMIT - Bounds per-process fan-out work
     if len(_active_sse_connections) >= _MAX_SSE_CONNECTIONS:
         logger.warning(f"SSE connection limit reached ({_MAX_SSE_CONNECTIONS})")
         raise HTTPException(
@@ -135,39 +142,33 @@ async def admin_event_stream(
         logger.info(f"Admin SSE connected: {admin.email} (total: {len(_active_sse_connections)})")
 
         try:
-            while True:
-                # ✅ CHECK CLIENT DISCONNECT - Heartbeat mechanism
-                if await request.is_disconnected():
-                    logger.info(f"Admin SSE client disconnected: {admin.email}")
-                    break
+            async with get_sse_broadcaster().subscribe(
+                _ADMIN_METRICS_TOPIC, _produce_admin_metrics, _ADMIN_METRICS_INTERVAL
+            ) as subscription:
+                while True:
+                    # ✅ CHECK CLIENT DISCONNECT - Heartbeat mechanism
+                    if await request.is_disconnected():
+                        logger.info(f"Admin SSE client disconnected: {admin.email}")
+                        break
+
+                    try:
+                        payload = await subscription.next(timeout=_ADMIN_METRICS_INTERVAL * 3)
+                    except SlowConsumerError:
+                        logger.info(f"Admin SSE dropped slow client: {admin.email}")
+                        break
+                    except asyncio.CancelledError:
+                        logger.info(f"Admin SSE cancelled: {admin.email}")
+                        break
+
+                    if payload is None:
+                        continue
 
-                try:
-                    # ✅ FRESH DB SESSION - Prevents connection leak
-                    async with AsyncSessionLocal() as db:
-                        metrics = await _gather_admin_metrics(db)
-
-                    # Send metrics update
                     yield {
-                        "event": "metrics_update",
-                        "data": json.dumps(metrics, default=str),
+                        "event": payload["event"],
+                        "data": payload["data"],
                         "retry": 5000,
                     }
 
-                    # Wait 5 seconds
-                    await asyncio.sleep(5)
-
-                except asyncio.CancelledError:
-                    logger.info(f"Admin SSE cancelled: {admin.email}")
-                    break
-                except Exception as e:
-                    logger.error(f"SSE metrics error: {e}", exc_info=True)
-                    # Send error event but keep connection alive
-                    yield {
-                        "event": "error",
-                        "data": json.dumps({"error": "Internal metrics error"}),
-                    }
-                    await asyncio.sleep(5)
-
         finally:
             # ✅ CLEANUP - Always remove from active connections
             _active_sse_connections.discard(connection_id)
@@ -178,6 +179,15 @@ async def admin_event_stream(
     return EventSourceResponse(event_generator())
 
 
+async def _produce_admin_metrics() -> dict:
+    """Build one metrics_update payload for all admin SSE subscribers."""
+    # ✅ FRESH DB SESSION - one per snapshot, shared by every stream
+    async with AsyncSessionLocal() as db:
+        metrics = await _gather_admin_metrics(db)
+    # Serialised once here rather than once per connection
+    return {"event": "metrics_update", "data": json.dumps(metrics, default=str)}
+
+
 async def _gather_admin_metrics(db: AsyncSession) -> dict:
     """
     Gather all metrics for admin dashboard with optimized queries.
@@ -600,6 +610,7 @@ async def create_insight_admin(
     db.add(audit)
 
     await db.commit()
+    await invalidate_insights_cache()
     await db.refresh(insight)
 
     logger.info(f"Admin {admin.email} created insight {insight.id}: {create_data.title}")
@@ -708,20 +719,17 @@ async def list_insights_admin(
     max_score: Annotated[float | None, Query(ge=0.0, le=1.0)] = None,
     limit: Annotated[int, Query(ge=1, le=100)] = 20,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: Annotated[str | None, Query(description="next_cursor from the previous page")] = None,
     db: AsyncSession = Depends(get_db),
 ) -> InsightAdminListResponse:
     """
     Full paginated insights list for admin with search and filters (Phase 15.1).
     """
-    query = (
-        select(Insight)
-        .options(
-            selectinload(Insight.raw_signal),
-            noload(Insight.interactions),
-            noload(Insight.team_shares),
-            noload(Insight.competitors),
-        )
-        .order_by(Insight.created_at.desc())
+    query = select(Insight).options(
+        selectinload(Insight.raw_signal),
+        noload(Insight.interactions),
+        noload(Insight.team_shares),
+        noload(Insight.competitors),
     )
 
     if status_filter:
@@ -738,16 +746,25 @@ async def list_insights_admin(
             | Insight.title.ilike(search_term)
         )
 
-    # Count queries
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar_one()
-
-    pending_count = await count_by_field(db, Insight, "admin_status", InsightStatus.PENDING)
-    approved_count = await count_by_field(db, Insight, "admin_status", InsightStatus.APPROVED)
-    rejected_count = await count_by_field(db, Insight, "admin_status", InsightStatus.REJECTED)
+    # Moderators act on these numbers, so totals stay exact (no count cache)
+    page = await paginate(
+        db,
+        query,
+        [SortKey(Insight.created_at), SortKey(Insight.id)],
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+    )
+    insights = page.items
 
-    result = await db.execute(query.limit(limit).offset(offset))
-    insights = result.scalars().all()
+    # Status counts in one grouped query
+    status_counts = dict(
+        (
+            await db.execute(
+                select(Insight.admin_status, func.count()).group_by(Insight.admin_status)
+            )
+        ).all()
+    )
 
     return InsightAdminListResponse(
         items=[
@@ -781,10 +798,11 @@ async def list_insights_admin(
             )
             for i in insights
         ],
-        total=total,
-        pending_count=pending_count,
-        approved_count=approved_count,
-        rejected_count=rejected_count,
+        total=page.total,
+        pending_count=status_counts.get(InsightStatus.PENDING.value, 0),
+        approved_count=status_counts.get(InsightStatus.APPROVED.value, 0),
+        rejected_count=status_counts.get(InsightStatus.REJECTED.value, 0),
+        next_cursor=page.next_cursor,
     )
 
 
@@ -837,6 +855,7 @@ async def update_insight_admin(
         db.add(audit)
 
     await db.commit()
+    await invalidate_insights_cache()
     await db.refresh(insight)
 
     logger.info(f"Admin {admin.email} updated insight {insight_id}: {list(changes.keys())}")
@@ -900,6 +919,7 @@ async def delete_insight(
     insight.edited_at = datetime.now(UTC)
 
     await db.commit()
+    await invalidate_insights_cache()
 
     logger.info(f"Admin {admin.email} soft-deleted insight {insight_id}")
 
@@ -1109,6 +1129,7 @@ async def bulk_delete_insights(
     db.add(audit)
 
     await db.commit()
+    await invalidate_insights_cache()
 
     logger.info(f"Admin {admin.email} bulk-deleted {deleted_count} insights")
 
@@ -1496,6 +1517,8 @@ async def import_content(
         # Commit all successful imports
         if imported_count > 0:
             await db.commit()
+            if content_type == "trends":
+                await invalidate_trends_cache()
 
         logger.info(
             f"Admin {admin.email} imported {imported_count} {content_type} records "
@@ -23,6 +23,7 @@ from app.db.session import AsyncSessionLocal
 from app.models.agent_control import AgentConfiguration, AuditLog
 from app.models.agent_execution_log import AgentExecutionLog
 from app.models.user import User
+from app.services.sse_broadcaster import SlowConsumerError, get_sse_broadcaster
 
 logger = logging.getLogger(__name__)
 
@@ -698,6 +699,43 @@ async def get_audit_stats(
 # ============================================
 
 
+_AGENT_LOGS_INTERVAL = 3.0
+
+
+async def _produce_agent_log_snapshot(agent_name: str) -> dict:
+    """Latest 20 log entries for one agent, oldest first, each pre-serialised."""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(AgentExecutionLog)
+            .where(AgentExecutionLog.agent_type == agent_name)
+            .order_by(AgentExecutionLog.started_at.desc())
+            .limit(20)
+        )
+        logs = result.scalars().all()
+
+    entries = [
+        [
+            str(log.id),
+            json.dumps(
+                {
+                    "id": str(log.id),
+                    "agent_type": log.agent_type,
+                    "source": log.source,
+                    "status": log.status,
+                    "started_at": log.started_at.isoformat() if log.started_at else None,
+                    "completed_at": log.completed_at.isoformat() if log.completed_at else None,
+                    "duration_ms": log.duration_ms,
+                    "items_processed": log.items_processed,
+                    "error_message": log.error_message,
+                },
+                default=str,
+            ),
+        ]
+        for log in reversed(logs)
+    ]
+    return {"event": "log_snapshot", "data": entries}
+
+
 @router.get("/{agent_name}/logs/stream")
 async def stream_agent_logs(
     request: Request,
@@ -708,67 +746,48 @@ async def stream_agent_logs(
     SSE stream tailing agent_execution_logs for a specific agent.
 
     Sends new log entries every 3 seconds. Useful for monitoring
-    agent execution in real-time from the admin UI.
+    agent execution in real-time from the admin UI. All streams for the same
+    agent share one poller via the SSE broadcaster.
     """
-    last_seen_id: UUID | None = None
+
+    async def produce() -> dict:
+        return await _produce_agent_log_snapshot(agent_name)
 
     async def event_generator():
-        nonlocal last_seen_id
+        seen_ids: set[str] = set()
 
         try:
-            while True:
-                if await request.is_disconnected():
-                    break
-
-                try:
-                    async with AsyncSessionLocal() as db:
-                        query = (
-                            select(AgentExecutionLog)
-                            .where(AgentExecutionLog.agent_type == agent_name)
-                            .order_by(AgentExecutionLog.started_at.desc())
-                            .limit(20)
-                        )
-                        if last_seen_id:
-                            query = query.where(AgentExecutionLog.id != last_seen_id)
-
-                        result = await db.execute(query)
-                        logs = result.scalars().all()
-
-                    if logs:
-                        last_seen_id = logs[0].id
-                        for log in reversed(logs):
-                            yield {
-                                "event": "log_entry",
-                                "data": json.dumps(
-                                    {
-                                        "id": str(log.id),
-                                        "agent_type": log.agent_type,
-                                        "source": log.source,
-                                        "status": log.status,
-                                        "started_at": log.started_at.isoformat()
-                                        if log.started_at
-                                        else None,
-                                        "completed_at": log.completed_at.isoformat()
-                                        if log.completed_at
-                                        else None,
-                                        "duration_ms": log.duration_ms,
-                                        "items_processed": log.items_processed,
-                                        "error_message": log.error_message,
-                                    },
-                                    default=str,
-                                ),
-                            }
+            async with get_sse_broadcaster().subscribe(
+                f"agent_logs:{agent_name}", produce, _AGENT_LOGS_INTERVAL
+            ) as subscription:
+                while True:
+                    if await request.is_disconnected():
+                        break
+
+                    try:
+                        payload = await subscription.next(timeout=_AGENT_LOGS_INTERVAL * 3)
+                    except SlowConsumerError:
+                        break
+                    except asyncio.CancelledError:
+                        break
+
+                    if payload is None:
+                        yield {"event": "heartbeat", "data": ""}
+                        continue
+                    if payload["event"] != "log_snapshot":
+                        # Producer error event — pass through, keep the stream open
+                        yield {"event": payload["event"], "data": payload["data"]}
+                        continue
+
+                    new_entries = [
+                        (log_id, data) for log_id, data in payload["data"] if log_id not in seen_ids
+                    ]
+                    if new_entries:
+                        for _, data in new_entries:
+                            yield {"event": "log_entry", "data": data}
                     else:
                         yield {"event": "heartbeat", "data": ""}
-
-                    await asyncio.sleep(3)
-
-                except asyncio.CancelledError:
-                    break
-                except Exception as e:
-                    logger.error(f"Agent logs SSE error: {e}")
-                    yield {"event": "error", "data": json.dumps({"error": str(e)})}
-                    await asyncio.sleep(5)
+                    seen_ids = {log_id for log_id, _ in payload["data"]}
         finally:
             logger.info(f"Agent logs SSE closed for {agent_name}")
 
@@ -16,7 +16,7 @@ from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from sqlalchemy import and_, distinct, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, require_admin
+from app.api.deps import get_db, invalidate_principal_cache, require_admin
 from app.api.utils import escape_like
 from app.models.admin_user import AdminUser
 from app.models.agent_control import AuditLog
@@ -587,6 +587,7 @@ async def update_user(
 
     await db.commit()
     await db.refresh(user)
+    await invalidate_principal_cache(user.supabase_user_id)
 
     logger.info(f"User {user_id} updated by admin {admin.id}")
     return {"status": "updated", "user_id": str(user_id)}
@@ -662,6 +663,7 @@ async def delete_user(
     db.add(audit)
 
     await db.commit()
+    await invalidate_principal_cache(user.supabase_user_id)
 
     logger.info(f"User {user_id} soft-deleted by admin {admin.id}")
     return {"status": "deleted", "user_id": str(user_id)}
@@ -724,6 +726,8 @@ async def bulk_user_action(
     db.add(audit)
 
     await db.commit()
+    for user in users:
+        await invalidate_principal_cache(user.supabase_user_id)
 
     logger.info(f"Bulk {payload.action} on {affected} users by admin {admin.id}")
     return {"status": "ok", "affected": affected}
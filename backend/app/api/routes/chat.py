@@ -13,11 +13,12 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.agents.chat_agent import ChatContext, get_chat_response
+from app.agents.chat_agent import ChatContext, stream_chat_response
 from app.api.deps import get_current_user, get_db
+from app.db.query_helpers import SortKey, paginate
 from app.models.agent_control import AgentConfiguration
 from app.models.idea_chat import IdeaChat, IdeaChatMessage
 from app.models.insight import Insight
@@ -100,24 +101,23 @@ async def list_chats(
     insight_id: UUID | None = Query(None),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
 ):
     """List user's chat sessions, optionally filtered by insight."""
     query = select(IdeaChat).where(IdeaChat.user_id == current_user.id)
-    count_query = (
-        select(func.count()).select_from(IdeaChat).where(IdeaChat.user_id == current_user.id)
-    )
-
     if insight_id:
         query = query.where(IdeaChat.insight_id == insight_id)
-        count_query = count_query.where(IdeaChat.insight_id == insight_id)
-
-    query = query.order_by(IdeaChat.updated_at.desc()).limit(limit).offset(offset)
 
-    result = await db.execute(query)
-    chats = result.scalars().all()
-
-    count_result = await db.execute(count_query)
-    total = count_result.scalar() or 0
+    # Per-user list: exact total (the user's own chats, indexed by user_id)
+    page = await paginate(
+        db,
+        query,
+        [SortKey(IdeaChat.updated_at), SortKey(IdeaChat.id)],
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+    )
+    chats = page.items
 
     return ChatListResponse(
         items=[
@@ -131,7 +131,8 @@ async def list_chats(
             )
             for c in chats
         ],
-        total=total,
+        total=page.total,
+        next_cursor=page.next_cursor,
     )
 
 
@@ -257,28 +258,32 @@ async def send_message(
             # Send thinking indicator
             yield f"data: {json.dumps({'type': 'thinking'})}\n\n"
 
-            # Get AI response
-            agent_response = await get_chat_response(
+            # Stream the AI response as it is generated
+            chunks: list[str] = []
+            async for delta in stream_chat_response(
                 mode=chat.mode or "pressure_test",
                 user_message=payload.content,
                 context=context,
                 conversation_history=conversation_history,
                 custom_prompt=custom_prompt,
-            )
+            ):
+                chunks.append(delta)
+                yield f"data: {json.dumps({'type': 'assistant_delta', 'content': delta})}\n\n"
+            response_text = "".join(chunks)
 
             # Save assistant message
             assistant_msg = IdeaChatMessage(
                 chat_id=chat.id,
                 role=IdeaChatMessage.ROLE_ASSISTANT,
-                content=agent_response.response,
+                content=response_text,
             )
             db.add(assistant_msg)
             chat.message_count += 1
             await db.commit()
             await db.refresh(assistant_msg)
 
-            # Send assistant message event
-            yield f"data: {json.dumps({'type': 'assistant_message', 'id': str(assistant_msg.id), 'content': agent_response.response})}\n\n"
+            # Send the complete assistant message (final, persisted content)
+            yield f"data: {json.dumps({'type': 'assistant_message', 'id': str(assistant_msg.id), 'content': response_text})}\n\n"
 
             # Send done event
             yield f"data: {json.dumps({'type': 'done'})}\n\n"
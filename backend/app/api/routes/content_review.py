@@ -18,6 +18,7 @@ from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db, require_admin
+from app.core.cache import invalidate_insights_cache
 from app.models.content_review import ContentReviewQueue, ContentSimilarity
 from app.models.insight import Insight
 from app.models.user import User
@@ -377,6 +378,7 @@ async def resolve_duplicate(
         )
 
     await db.commit()
+    await invalidate_insights_cache()
     await db.refresh(similarity)
 
     logger.info(f"Duplicate {similarity_id} resolved as {action.resolution} by admin {admin.id}")
@@ -4,23 +4,24 @@ Phase 15.4: APAC Multi-language Support - Accept-Language header negotiation
 """
 
 import asyncio
-import hashlib
 import json
 import logging
 from datetime import UTC, datetime, timedelta
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
 from fastapi.responses import StreamingResponse
-from sqlalchemy import distinct, func, or_, select
+from sqlalchemy import distinct, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import noload, selectinload
 
 from app.api.deps import AdminUser, CurrentUser, check_report_access
-from app.core.cache import cache_get, cache_set
+from app.core.cache_registry import register_cached_query
 from app.core.config import settings
+from app.core.constants import PAGINATION_COUNT_TTL_SECONDS
 from app.core.rate_limits import limiter
+from app.db.query_helpers import SortKey, paginate
 from app.db.session import get_db
 from app.models.insight import Insight
 from app.models.raw_signal import RawSignal
@@ -32,6 +33,8 @@ from app.schemas.insight import (
     InsightResponse,
     MessageResponse,
 )
+from app.services.insight_search import search_insights
+from app.services.trend_points import get_trend_series, trend_key
 from app.services.trend_prediction import generate_trend_predictions
 
 logger = logging.getLogger(__name__)
@@ -172,6 +175,129 @@ def _serialize_insight(insight: Insight, target_language: str = "en") -> dict:
     return apply_translation(insight_dict, target_language)
 
 
+async def _load_insight_list(
+    db: AsyncSession,
+    *,
+    min_score: float,
+    source: str | None,
+    sort: str,
+    search: str | None,
+    featured: bool,
+    limit: int,
+    offset: int,
+    cursor: str | None,
+    language: str,
+) -> InsightListResponse:
+    """Query one page of insights for list_insights (the cache loader)."""
+    # Build query — noload unused selectin relationships to avoid N+4 query fan-out
+    query = select(Insight).options(
+        selectinload(Insight.raw_signal),
+        noload(Insight.interactions),
+        noload(Insight.team_shares),
+        noload(Insight.competitors),
+    )
+
+    # Filter by minimum score
+    if min_score > 0.0:
+        query = query.where(Insight.relevance_score >= min_score)
+
+    # Filter featured (high-quality) insights
+    if featured:
+        query = query.where(Insight.relevance_score >= 0.85)
+
+    # Filter by source (via raw_signal relationship)
+    if source:
+        query = query.join(Insight.raw_signal).where(RawSignal.source == source)
+
+    # Dynamic sorting based on sort parameter (keyset keys; id breaks ties)
+    sort_mapping = {
+        "relevance": SortKey(Insight.relevance_score),
+        "founder_fit": SortKey(Insight.founder_fit_score, nulls_last=True),
+        "fit": SortKey(Insight.founder_fit_score, nulls_last=True),  # Alias for founder_fit
+        "opportunity": SortKey(Insight.opportunity_score, nulls_last=True),
+        "problem": SortKey(Insight.problem_score, nulls_last=True),
+        "feasibility": SortKey(Insight.feasibility_score, nulls_last=True),
+        "easy": SortKey(Insight.feasibility_score, nulls_last=True),  # Alias for feasibility
+        "why_now": SortKey(Insight.why_now_score, nulls_last=True),
+        "go_to_market": SortKey(Insight.go_to_market_score, nulls_last=True),
+        "newest": SortKey(Insight.created_at),
+        "recent": SortKey(Insight.created_at),  # Alias for newest
+    }
+    sort_keys = [sort_mapping.get(sort, sort_mapping["relevance"]), SortKey(Insight.id)]
+
+    # Full-text search: ranked page, highlights and total in one query
+    # (default sort puts text rank first, explicit sorts keep their order)
+    hits: dict = {}
+    next_cursor = None
+    if search:
+        page = await search_insights(
+            db,
+            query,
+            term=search,
+            order_by=[key.ordering() for key in sort_keys],
+            rank_first=sort == "relevance",
+            limit=limit,
+            offset=offset,
+        )
+        insights = [hit.insight for hit in page.hits]
+        hits = {hit.insight.id: hit for hit in page.hits}
+        total = page.total
+    else:
+        page = await paginate(
+            db,
+            query,
+            sort_keys,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count_ttl=PAGINATION_COUNT_TTL_SECONDS,
+        )
+        insights, total, next_cursor = page.items, page.total, page.next_cursor
+
+    logger.info(
+        f"Listed {len(insights)} insights (min_score={min_score}, "
+        f"source={source}, language={language}, total={total})"
+    )
+
+    # Apply translations and inject trend_data
+    translated_insights = []
+    for insight in insights:
+        insight_dict = _serialize_insight(insight, language)
+        if hit := hits.get(insight.id):
+            insight_dict["search_rank"] = hit.rank
+            insight_dict["search_highlight"] = hit.highlight
+        translated_insights.append(InsightResponse.model_validate(insight_dict))
+
+    return InsightListResponse(
+        insights=translated_insights,
+        total=total or 0,
+        limit=limit,
+        offset=offset,
+        next_cursor=next_cursor,
+    )
+
+
+INSIGHT_LIST_QUERY = register_cached_query(
+    "insights_list",
+    _load_insight_list,
+    InsightListResponse,
+    params={
+        "min_score": 0.0,
+        "source": None,
+        "sort": "relevance",
+        "search": None,
+        "featured": False,
+        "limit": 20,
+        "offset": 0,
+        "cursor": None,
+        "language": "en",
+    },
+    ttl=60,
+    depends_on=("insights",),
+    hydrate_top=10,
+)
+
+
 @router.get("", response_model=InsightListResponse)
 @limiter.limit("100/minute")
 async def list_insights(
@@ -194,13 +320,16 @@ async def list_insights(
     ] = False,
     limit: Annotated[int, Query(ge=1, le=100, description="Number of results")] = 20,
     offset: Annotated[int, Query(ge=0, description="Pagination offset")] = 0,
+    cursor: Annotated[
+        str | None, Query(description="next_cursor from the previous page (replaces offset)")
+    ] = None,
     accept_language: Annotated[str | None, Header()] = None,
     language: Annotated[
         str | None,
         Query(description="Explicit language override (en, zh-CN, id-ID, vi-VN, th-TH, tl-PH)"),
     ] = None,
     db: AsyncSession = Depends(get_db),
-) -> InsightListResponse:
+) -> Response:
     """
     List all insights with filtering and pagination.
 
@@ -210,6 +339,7 @@ async def list_insights(
     - **source**: Filter by source (reddit, product_hunt, google_trends)
     - **limit**: Number of results per page (max 100)
     - **offset**: Pagination offset
+    - **cursor**: Keyset cursor from the previous page's next_cursor (not used with search)
     - **language**: Explicit language override (en, zh-CN, id-ID, vi-VN, th-TH, tl-PH)
     - **Accept-Language**: HTTP header for automatic language detection
 
@@ -218,112 +348,24 @@ async def list_insights(
     # Determine target language (explicit parameter takes precedence)
     target_language = language or parse_accept_language(accept_language)
 
-    # --- Cache lookup (TTL: 60s) ---
-    # Key encodes all params that affect the result, including language.
-    _cache_raw = (
-        f"{min_score}:{source}:{sort}:{search}:{featured}:{limit}:{offset}:{target_language}"
-    )
-    cache_key = f"insights:list:{hashlib.md5(_cache_raw.encode()).hexdigest()}"
-    cached_response = await cache_get(cache_key)
-    if cached_response is not None:
-        return InsightListResponse.model_validate(cached_response)
-
-    # Build query — noload unused selectin relationships to avoid N+4 query fan-out
-    query = select(Insight).options(
-        selectinload(Insight.raw_signal),
-        noload(Insight.interactions),
-        noload(Insight.team_shares),
-        noload(Insight.competitors),
-    )
-
-    # Filter by minimum score
-    if min_score > 0.0:
-        query = query.where(Insight.relevance_score >= min_score)
-
-    # Filter featured (high-quality) insights
-    if featured:
-        query = query.where(Insight.relevance_score >= 0.85)
-
-    # Filter by source (via raw_signal relationship)
-    if source:
-        query = query.join(Insight.raw_signal).where(RawSignal.source == source)
-
-    # Search by title or proposed solution
-    if search:
-        search_term = f"%{search}%"
-        query = query.where(
-            or_(
-                Insight.title.ilike(search_term),
-                Insight.proposed_solution.ilike(search_term),
-            )
-        )
-
-    # Dynamic sorting based on sort parameter
-    sort_mapping = {
-        "relevance": Insight.relevance_score.desc(),
-        "founder_fit": Insight.founder_fit_score.desc().nulls_last(),
-        "fit": Insight.founder_fit_score.desc().nulls_last(),  # Alias for founder_fit
-        "opportunity": Insight.opportunity_score.desc().nulls_last(),
-        "problem": Insight.problem_score.desc().nulls_last(),
-        "feasibility": Insight.feasibility_score.desc().nulls_last(),
-        "easy": Insight.feasibility_score.desc().nulls_last(),  # Alias for feasibility
-        "why_now": Insight.why_now_score.desc().nulls_last(),
-        "go_to_market": Insight.go_to_market_score.desc().nulls_last(),
-        "newest": Insight.created_at.desc(),
-        "recent": Insight.created_at.desc(),  # Alias for newest
-    }
-    sort_column = sort_mapping.get(sort, Insight.relevance_score.desc())
-    query = query.order_by(sort_column)
-
-    # Pagination
-    query = query.limit(limit).offset(offset)
-
-    # Execute
-    result = await db.execute(query)
-    insights = result.scalars().all()
-
-    # Get total count (must match all filters applied to main query)
-    count_query = select(func.count(Insight.id))
-    if min_score > 0.0:
-        count_query = count_query.where(Insight.relevance_score >= min_score)
-    if featured:
-        count_query = count_query.where(Insight.relevance_score >= 0.85)
-    if source:
-        count_query = count_query.join(Insight.raw_signal).where(RawSignal.source == source)
-    if search:
-        search_term = f"%{search}%"
-        count_query = count_query.where(
-            or_(
-                Insight.title.ilike(search_term),
-                Insight.proposed_solution.ilike(search_term),
-            )
-        )
-
-    total = await db.scalar(count_query)
-
-    logger.info(
-        f"Listed {len(insights)} insights (min_score={min_score}, "
-        f"source={source}, language={target_language}, total={total})"
-    )
-
-    # Apply translations and inject trend_data
-    translated_insights = []
-    for insight in insights:
-        insight_dict = _serialize_insight(insight, target_language)
-        translated_insights.append(InsightResponse.model_validate(insight_dict))
-
-    response = InsightListResponse(
-        insights=translated_insights,
-        total=total or 0,
-        limit=limit,
-        offset=offset,
+    # Cached per parameter set (TTL: 60s), including language; hits are sent as
+    # stored, without parsing or re-validation (see INSIGHT_LIST_QUERY)
+    return Response(
+        content=await INSIGHT_LIST_QUERY.get_json(
+            db,
+            min_score=min_score,
+            source=source,
+            sort=sort,
+            search=search,
+            featured=featured,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            language=target_language,
+        ),
+        media_type="application/json",
     )
 
-    # Store serialised response in cache (fire-and-forget; failures are swallowed)
-    await cache_set(cache_key, response.model_dump(), ttl=60)
-
-    return response
-
 
 @router.get("/daily-top", response_model=list[InsightResponse])
 async def get_daily_top(
@@ -777,8 +819,9 @@ async def stream_trend_data(
         Polls the database every 60 seconds for new trend data points and yields them
         as SSE events. Creates NEW database session per iteration to avoid starving pool.
         """
-        # Track last seen timestamp to only send new data
-        last_timestamp = None
+        # Track last seen sample time to only send new data
+        last_timestamp: datetime | None = None
+        key = None
         max_duration = settings.sse_max_duration
         start_time = time.time()
 
@@ -797,49 +840,44 @@ async def stream_trend_data(
 
                 # Create NEW session for each iteration (don't hold connection)
                 async with AsyncSessionLocal() as db:
-                    # Fetch insight with raw signal
-                    query = (
-                        select(Insight)
-                        .options(selectinload(Insight.raw_signal))
-                        .where(Insight.id == insight_id)
-                    )
-
-                    result = await db.execute(query)
-                    insight = result.scalar_one_or_none()
-
-                    if not insight or not insight.raw_signal:
-                        yield 'event: error\ndata: {"error": "Insight not found"}\n\n'
-                        break
-
-                    # Extract realtime trend data
-                    extra_metadata = insight.raw_signal.extra_metadata or {}
-                    realtime_data = extra_metadata.get("trend_data_realtime", {})
-                    timestamps = realtime_data.get("timestamps", [])
-                    values = realtime_data.get("values", [])
-
-                    if not timestamps or not values:
+                    if key is None:
+                        # Resolve (keyword, geo) once from the insight's raw signal
+                        query = (
+                            select(Insight)
+                            .options(selectinload(Insight.raw_signal))
+                            .where(Insight.id == insight_id)
+                        )
+
+                        result = await db.execute(query)
+                        insight = result.scalar_one_or_none()
+
+                        if not insight or not insight.raw_signal:
+                            yield 'event: error\ndata: {"error": "Insight not found"}\n\n'
+                            break
+
+                        key = trend_key(insight.raw_signal.extra_metadata) or ()
+
+                    # Only samples newer than the last one sent
+                    series = await get_trend_series(db, *key, since=last_timestamp) if key else None
+                    new_points = series.after(last_timestamp) if series is not None else None
+
+                    if last_timestamp is None and not new_points:
                         # Send initial message that realtime data is not available yet
                         yield 'event: info\ndata: {"message": "Waiting for real-time data..."}\n\n'
                         await asyncio.sleep(60)
                         continue
 
-                    # Find new data points (timestamps after last_timestamp)
-                    new_data_points = []
-                    for ts, val in zip(timestamps, values):
-                        if last_timestamp is None or ts > last_timestamp:
-                            new_data_points.append({"timestamp": ts, "value": val})
-
                     # Yield new data points as SSE events
-                    if new_data_points:
-                        for data_point in new_data_points:
+                    if new_points:
+                        for data_point in new_points.to_points():
                             event_data = json.dumps(data_point)
                             yield f"event: trend-update\ndata: {event_data}\n\n"
-                            last_timestamp = data_point["timestamp"]
 
                             logger.debug(
                                 f"Streamed trend update for insight {insight_id}: "
                                 f"timestamp={data_point['timestamp']}, value={data_point['value']}"
                             )
+                        last_timestamp = new_points.latest_timestamp
 
                     # Send heartbeat to keep connection alive
                     else:
@@ -926,28 +964,24 @@ async def get_trend_predictions(
                 )
                 return insight.trend_predictions
 
-    # Extract historical trend data from raw signal
+    # Prefer realtime samples (hourly updates, aggregated to daily means),
+    # fall back to the scrape-time trend_data snapshot
     extra_metadata = insight.raw_signal.extra_metadata or {}
-
-    # Try realtime data first (hourly updates), fallback to standard trend_data
-    trend_data = extra_metadata.get("trend_data_realtime") or extra_metadata.get("trend_data")
+    trend_data = None
+    key = trend_key(extra_metadata)
+    if key:
+        series = await get_trend_series(db, *key)
+        if len(series):
+            trend_data = series.daily()
+    if not trend_data:
+        trend_data = extra_metadata.get("trend_data")
 
     if not trend_data or not trend_data.get("dates") or not trend_data.get("values"):
         raise HTTPException(
             status_code=400, detail="No historical trend data available for this insight"
         )
 
-    # Convert timestamp format to date format if needed (for realtime data)
-    if "timestamps" in trend_data:
-        # Realtime data uses timestamps, convert to dates
-        trend_data = {
-            "dates": [
-                datetime.fromisoformat(ts).strftime("%Y-%m-%d") for ts in trend_data["timestamps"]
-            ],
-            "values": trend_data["values"],
-        }
-
-    # Generate predictions using Prophet
+    # Generate predictions (Holt-Winters for short series, Prophet for long ones)
     try:
         predictions = await generate_trend_predictions(trend_data, periods)
 
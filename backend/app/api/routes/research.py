@@ -26,6 +26,7 @@ from app.agents.research_agent import (
 from app.api.deps import AdminUser, CurrentUser
 from app.core.constants import AnalysisStatus
 from app.core.rate_limits import limiter
+from app.db.query_helpers import SortKey, paginate
 from app.db.session import get_db
 from app.models.custom_analysis import CustomAnalysis
 from app.models.research_request import ResearchRequest
@@ -313,6 +314,7 @@ async def list_analyses(
     current_user: CurrentUser,
     limit: Annotated[int, Query(ge=1, le=50)] = 20,
     offset: Annotated[int, Query(ge=0)] = 0,
+    cursor: Annotated[str | None, Query(description="next_cursor from the previous page")] = None,
     db: AsyncSession = Depends(get_db),
 ) -> ResearchAnalysisListResponse:
     """
@@ -320,24 +322,15 @@ async def list_analyses(
 
     Returns a paginated list of analyses with summary information.
     """
-    # Get total count
-    count_query = (
-        select(func.count())
-        .select_from(CustomAnalysis)
-        .where(CustomAnalysis.user_id == current_user.id)
-    )
-    total = await db.scalar(count_query) or 0
-
-    # Get analyses
-    query = (
-        select(CustomAnalysis)
-        .where(CustomAnalysis.user_id == current_user.id)
-        .order_by(CustomAnalysis.created_at.desc())
-        .limit(limit)
-        .offset(offset)
+    page = await paginate(
+        db,
+        select(CustomAnalysis).where(CustomAnalysis.user_id == current_user.id),
+        [SortKey(CustomAnalysis.created_at), SortKey(CustomAnalysis.id)],
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
     )
-    result = await db.execute(query)
-    analyses = result.scalars().all()
+    analyses = page.items
 
     return ResearchAnalysisListResponse(
         items=[
@@ -353,7 +346,8 @@ async def list_analyses(
             )
             for a in analyses
         ],
-        total=total,
+        total=page.total,
+        next_cursor=page.next_cursor,
     )
 
 
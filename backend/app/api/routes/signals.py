@@ -19,6 +19,8 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import require_admin
+from app.core.constants import PAGINATION_COUNT_TTL_SECONDS
+from app.db.query_helpers import InvalidCursorError, SortKey, paginate
 from app.db.session import get_db
 from app.models.raw_signal import RawSignal
 from app.models.user import User
@@ -97,6 +99,7 @@ async def list_signals(
     processed: bool | None = Query(None, description="Filter by processed status"),
     limit: int = Query(20, ge=1, le=100, description="Number of signals to return"),
     offset: int = Query(0, ge=0, description="Number of signals to skip"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -106,7 +109,8 @@ async def list_signals(
         source: Optional source filter
         processed: Optional processed status filter
         limit: Number of signals to return (max 100)
-        offset: Number of signals to skip
+        offset: Number of signals to skip (ignored when cursor is given)
+        cursor: Keyset cursor from the previous page
         db: Database session
 
     Returns:
@@ -122,24 +126,17 @@ async def list_signals(
         if processed is not None:
             query = query.where(RawSignal.processed == processed)
 
-        # Order by created_at descending (newest first)
-        query = query.order_by(RawSignal.created_at.desc())
-
-        # Get total count (direct count with same filters, avoids subquery)
-        count_query = select(func.count(RawSignal.id))
-        if source:
-            count_query = count_query.where(RawSignal.source == source)
-        if processed is not None:
-            count_query = count_query.where(RawSignal.processed == processed)
-        total_result = await db.execute(count_query)
-        total = total_result.scalar() or 0
-
-        # Apply pagination
-        query = query.limit(limit).offset(offset)
-
-        # Execute query
-        result = await db.execute(query)
-        signals = result.scalars().all()
+        # Newest first; total cached briefly so deep pages skip the count
+        page = await paginate(
+            db,
+            query,
+            [SortKey(RawSignal.created_at), SortKey(RawSignal.id)],
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count_ttl=PAGINATION_COUNT_TTL_SECONDS,
+        )
+        signals, total = page.items, page.total
 
         # Convert to response models
         signal_responses = [RawSignalResponse.model_validate(signal) for signal in signals]
@@ -149,9 +146,12 @@ async def list_signals(
             total=total,
             limit=limit,
             offset=offset,
-            has_more=(offset + limit) < total,
+            has_more=page.has_more,
+            next_cursor=page.next_cursor,
         )
 
+    except InvalidCursorError:
+        raise
     except Exception as e:
         logger.error(f"Error listing signals: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="An internal error occurred. Please try again.")
@@ -2,24 +2,26 @@
 
 Provides CRUD operations for the 180+ trending keywords with volume/growth metrics.
 Sprint 3.1: Adds predictive trend analytics with Prophet forecasting.
+Forecasts are precomputed by the background forecast engine; prediction
+endpoints only read them.
 """
 
-import hashlib
 import logging
-import random
-from datetime import UTC, datetime, timedelta
 from typing import Annotated, Any, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import AdminUser
 from app.api.utils import escape_like
-from app.core.cache import cache_get, cache_set
+from app.core.cache import invalidate_trends_cache
+from app.core.cache_registry import register_cached_query
+from app.core.constants import PAGINATION_COUNT_TTL_SECONDS
 from app.core.rate_limits import limiter
+from app.db.query_helpers import SortKey, paginate
 from app.db.session import get_db
 from app.models.trend import Trend
 from app.schemas.public_content import (
@@ -28,7 +30,7 @@ from app.schemas.public_content import (
     TrendResponse,
     TrendUpdate,
 )
-from app.services.trend_prediction import generate_trend_predictions
+from app.services.forecast_engine import get_forecast_engine, trend_history
 
 # ============================================================================
 # PREDICTION SCHEMAS
@@ -65,6 +67,76 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/trends", tags=["trends"])
 
 
+async def _load_trend_list(
+    db: AsyncSession,
+    *,
+    category: str | None,
+    sort: str | None,
+    featured: bool | None,
+    search: str | None,
+    limit: int,
+    offset: int,
+    cursor: str | None,
+) -> TrendListResponse:
+    """Query one page of published trends for list_trends (the cache loader)."""
+    # Build query - only published trends
+    query = select(Trend).where(Trend.is_published == True)
+
+    # Apply filters
+    if category:
+        query = query.where(Trend.category == category)
+    if featured is not None:
+        query = query.where(Trend.is_featured == featured)
+    if search:
+        query = query.where(Trend.keyword.ilike(f"%{escape_like(search)}%"))
+
+    # Apply sorting (keyset keys; id breaks ties)
+    sort_mapping = {
+        "volume": SortKey(Trend.search_volume),
+        "growth": SortKey(Trend.growth_percentage),
+        "recent": SortKey(Trend.created_at),
+    }
+    page = await paginate(
+        db,
+        query,
+        [sort_mapping.get(sort or "recent", sort_mapping["recent"]), SortKey(Trend.id)],
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        count_ttl=PAGINATION_COUNT_TTL_SECONDS,
+    )
+    trends, total = page.items, page.total
+
+    logger.info(f"Listed {len(trends)} trends (category={category}, sort={sort}, total={total})")
+
+    return TrendListResponse(
+        trends=[TrendResponse.model_validate(t) for t in trends],
+        total=total or 0,
+        limit=limit,
+        offset=offset,
+        next_cursor=page.next_cursor,
+    )
+
+
+TREND_LIST_QUERY = register_cached_query(
+    "trends_list",
+    _load_trend_list,
+    TrendListResponse,
+    params={
+        "category": None,
+        "sort": "recent",
+        "featured": None,
+        "search": None,
+        "limit": 12,
+        "offset": 0,
+        "cursor": None,
+    },
+    ttl=300,
+    depends_on=("trends",),
+    hydrate_top=5,
+)
+
+
 @router.get("", response_model=TrendListResponse)
 @limiter.limit("30/minute")
 async def list_trends(
@@ -78,8 +150,11 @@ async def list_trends(
     search: Annotated[str | None, Query(description="Search by keyword")] = None,
     limit: Annotated[int, Query(ge=1, le=100, description="Number of results")] = 12,
     offset: Annotated[int, Query(ge=0, description="Pagination offset")] = 0,
+    cursor: Annotated[
+        str | None, Query(description="next_cursor from the previous page (replaces offset)")
+    ] = None,
     db: AsyncSession = Depends(get_db),
-) -> TrendListResponse:
+) -> Response:
     """
     List all trends with filtering, sorting, and pagination.
 
@@ -91,65 +166,24 @@ async def list_trends(
     - **search**: Search in keyword
     - **limit**: Number of results per page (default 12, max 100)
     - **offset**: Pagination offset
+    - **cursor**: Keyset cursor from the previous page's next_cursor
     """
-    # --- Cache lookup (TTL: 300s) ---
-    _cache_raw = f"{category}:{sort}:{featured}:{search}:{limit}:{offset}"
-    cache_key = f"trends:list:{hashlib.md5(_cache_raw.encode()).hexdigest()}"
-    cached_response = await cache_get(cache_key)
-    if cached_response is not None:
-        return TrendListResponse.model_validate(cached_response)
-
-    # Build query - only published trends
-    query = select(Trend).where(Trend.is_published == True)
-
-    # Apply filters
-    if category:
-        query = query.where(Trend.category == category)
-    if featured is not None:
-        query = query.where(Trend.is_featured == featured)
-    if search:
-        query = query.where(Trend.keyword.ilike(f"%{escape_like(search)}%"))
-
-    # Apply sorting
-    if sort == "volume":
-        query = query.order_by(Trend.search_volume.desc())
-    elif sort == "growth":
-        query = query.order_by(Trend.growth_percentage.desc())
-    else:  # recent (default)
-        query = query.order_by(Trend.created_at.desc())
-
-    # Pagination
-    query = query.limit(limit).offset(offset)
-
-    # Execute
-    result = await db.execute(query)
-    trends = result.scalars().all()
-
-    # Get total count
-    count_query = select(func.count(Trend.id)).where(Trend.is_published == True)
-    if category:
-        count_query = count_query.where(Trend.category == category)
-    if featured is not None:
-        count_query = count_query.where(Trend.is_featured == featured)
-    if search:
-        count_query = count_query.where(Trend.keyword.ilike(f"%{escape_like(search)}%"))
-
-    total = await db.scalar(count_query)
-
-    logger.info(f"Listed {len(trends)} trends (category={category}, sort={sort}, total={total})")
-
-    response = TrendListResponse(
-        trends=[TrendResponse.model_validate(t) for t in trends],
-        total=total or 0,
-        limit=limit,
-        offset=offset,
+    # Cached per parameter set (TTL: 300s); hits are sent as stored, without
+    # parsing or re-validation (see TREND_LIST_QUERY)
+    return Response(
+        content=await TREND_LIST_QUERY.get_json(
+            db,
+            category=category,
+            sort=sort,
+            featured=featured,
+            search=search,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        ),
+        media_type="application/json",
     )
 
-    # Store serialised response in cache (fire-and-forget; failures are swallowed)
-    await cache_set(cache_key, response.model_dump(), ttl=300)
-
-    return response
-
 
 @router.get("/categories", response_model=list[str])
 @limiter.limit("30/minute")
@@ -206,49 +240,27 @@ async def get_trend_predictions(
     if not trends:
         return []
 
+    engine = get_forecast_engine()
     predictions = []
     for trend in trends:
-        try:
-            historical_dates, historical_values = _get_historical_data(trend, days=30)
-
-            prediction_result = await generate_trend_predictions(
-                trend_data={"dates": historical_dates, "values": historical_values},
-                periods=7,
-            )
-
-            velocity_change, velocity_alert = _calculate_velocity(
-                historical_values, trend.growth_percentage or 0
-            )
-
-            predictions.append(
-                TrendPredictionResponse(
-                    keyword=trend.keyword,
-                    current_volume=trend.search_volume or 0,
-                    predictions=prediction_result,
-                    velocity_alert=velocity_alert,
-                    velocity_change=velocity_change,
-                )
-            )
-
-        except Exception as e:
-            logger.warning(f"Failed to generate prediction for {trend.keyword}: {e}")
-            predictions.append(
-                TrendPredictionResponse(
-                    keyword=trend.keyword,
-                    current_volume=trend.search_volume or 0,
-                    predictions={
-                        "dates": [],
-                        "values": [],
-                        "confidence_intervals": {"lower": [], "upper": []},
-                        "model_accuracy": {"mape": 0, "rmse": 0},
-                        "error": str(e),
-                    },
-                    velocity_alert=False,
-                    velocity_change=0.0,
-                )
+        historical_dates, historical_values = trend_history(trend)
+        prediction_result = await engine.get_or_schedule(
+            trend.keyword, historical_dates, historical_values, periods=7
+        )
+        velocity_change, velocity_alert = _calculate_velocity(
+            historical_values, trend.growth_percentage or 0
+        )
+        predictions.append(
+            TrendPredictionResponse(
+                keyword=trend.keyword,
+                current_volume=trend.search_volume or 0,
+                predictions=prediction_result,
+                velocity_alert=velocity_alert,
+                velocity_change=velocity_change,
             )
+        )
 
-    logger.info(f"Generated predictions for {len(predictions)} trends (category={category})")
+    logger.info(f"Served predictions for {len(predictions)} trends (category={category})")
     return predictions
 
 
@@ -277,22 +289,16 @@ async def get_trend_prediction_by_keyword(
     if not trend:
         raise HTTPException(status_code=404, detail=f"Trend '{keyword}' not found")
 
-    historical_dates, historical_values = _get_historical_data(trend, days=90)
-
-    try:
-        prediction_result = await generate_trend_predictions(
-            trend_data={"dates": historical_dates, "values": historical_values},
-            periods=periods,
-        )
-    except Exception as e:
-        logger.error(f"Prediction failed for {keyword}: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Prediction failed. Please try again.")
+    historical_dates, historical_values = trend_history(trend)
+    prediction_result = await get_forecast_engine().get_or_schedule(
+        trend.keyword, historical_dates, historical_values, periods=periods
+    )
 
     velocity_change, velocity_alert = _calculate_velocity(
         historical_values, trend.growth_percentage or 0
     )
 
-    logger.info(f"Generated {periods}-day prediction for '{trend.keyword}'")
+    logger.info(f"Served {periods}-day prediction for '{trend.keyword}'")
 
     return TrendPredictionResponse(
         keyword=trend.keyword,
@@ -322,7 +328,7 @@ async def get_trend(
 
     # Populate trend_data with synthetic historical data if empty
     if not trend.trend_data or not trend.trend_data.get("dates"):
-        dates, values = _get_historical_data(trend)
+        dates, values = trend_history(trend)
         response = TrendResponse.model_validate(trend)
         response.trend_data = {
             "dates": dates,
@@ -359,10 +365,13 @@ async def create_trend(
     trend = Trend(**trend_data.model_dump())
     db.add(trend)
     await db.commit()
+    await invalidate_trends_cache()
     await db.refresh(trend)
 
     logger.info(f"Created trend: {trend.keyword} (id={trend.id})")
 
+    get_forecast_engine().schedule_refit(trend.keyword, *trend_history(trend))
+
     return TrendResponse.model_validate(trend)
 
 
@@ -400,37 +409,15 @@ async def update_trend(
         setattr(trend, field, value)
 
     await db.commit()
+    await invalidate_trends_cache()
     await db.refresh(trend)
 
     logger.info(f"Updated trend: {trend.keyword} (id={trend.id})")
 
-    return TrendResponse.model_validate(trend)
-
-
-def _get_historical_data(trend: Trend, days: int = 30) -> tuple[list[str], list[int]]:
-    """Get historical dates and values from trend, generating synthetic data if needed."""
-    trend_data = trend.trend_data or {}
-    historical_dates = trend_data.get("dates", [])
-    historical_values = trend_data.get("values", [])
-
-    if len(historical_dates) >= 7:
-        return historical_dates, historical_values
-
-    historical_dates = [
-        (datetime.now(UTC) - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days, 0, -1)
-    ]
+    if {"keyword", "trend_data", "growth_percentage"} & update_data.keys():
+        get_forecast_engine().schedule_refit(trend.keyword, *trend_history(trend))
 
-    # Normalize to 0-100 scale (matching Google Trends format)
-    growth_rate = (trend.growth_percentage or 10) / 100
-    raw_values = [
-        max(1.0, 100 * (1 - growth_rate * (days - i) / days) + random.uniform(-3, 3))
-        for i in range(days)
-    ]
-    # Scale so the peak = 100 (Google Trends convention)
-    peak = max(raw_values) or 1
-    historical_values = [max(1, int(v * 100 / peak)) for v in raw_values]
-
-    return historical_dates, historical_values
+    return TrendResponse.model_validate(trend)
 
 
 def _calculate_velocity(historical_values: list[int], fallback: float) -> tuple[float, bool]:
@@ -483,24 +470,19 @@ async def compare_trends(
     max_growth = -float("inf")
     winner = None
 
+    engine = get_forecast_engine()
     for trend in trends:
-        historical_dates, historical_values = _get_historical_data(trend, days=30)
-
-        try:
-            prediction_result = await generate_trend_predictions(
-                trend_data={"dates": historical_dates, "values": historical_values},
-                periods=7,
-            )
+        historical_dates, historical_values = trend_history(trend)
+        prediction_result = await engine.get_or_schedule(
+            trend.keyword, historical_dates, historical_values, periods=7
+        )
+        if prediction_result["values"]:
             predicted_growth = (
                 (prediction_result["values"][-1] - trend.search_volume)
                 / max(trend.search_volume, 1)
                 * 100
-                if prediction_result["values"]
-                else 0
             )
-        except Exception as e:
-            logger.warning(f"Prediction failed for {trend.keyword}: {e}")
-            prediction_result = {}
+        else:
             predicted_growth = trend.growth_percentage or 0
 
         if predicted_growth > max_growth:
@@ -555,5 +537,6 @@ async def delete_trend(
 
     await db.delete(trend)
     await db.commit()
+    await invalidate_trends_cache()
 
     logger.info(f"Deleted trend: {trend.keyword} (id={trend_id})")
@@ -22,7 +22,7 @@ from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.api.deps import CurrentUser, OptionalUser
+from app.api.deps import CurrentUser, OptionalUser, invalidate_principal_cache
 from app.db.query_helpers import count_by_field
 from app.db.session import get_db
 from app.models.insight import Insight
@@ -127,6 +127,7 @@ async def update_user_profile(
     current_user.updated_at = datetime.now(UTC)
     await db.commit()
     await db.refresh(current_user)
+    await invalidate_principal_cache(current_user.supabase_user_id)
 
     logger.info(f"User profile updated: {current_user.email}")
     return UserResponse.model_validate(current_user)
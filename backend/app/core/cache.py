@@ -11,22 +11,45 @@ Phase 6.1B: Stale-on-error cache fallback (dual-key pattern)
 Phase 6.1C: Negative caching (sentinel value to prevent thundering herd)
 Phase 6.3A: L1 in-memory TTL cache layer (cachetools)
 
-Uses JSON serialization for simple data structures.
+Invalidation:
+- Every key's namespace (the part before the first ':') has a generation
+  counter in Redis; it is part of the Redis key, so invalidating a whole
+  namespace ("insights:*") is one HINCRBY instead of a SCAN over the keyspace.
+  Superseded entries are never read again and expire on their TTL.
+- Deletes and generation bumps are published on a pub/sub channel; every
+  process running start_invalidation_listener() evicts the matching L1
+  entries, so no process keeps serving an invalidated value from memory.
+
+Stampede protection (cache_get_or_compute, used by @cached and the list routes):
+- Single-flight: concurrent misses for a key share one computation, within
+  a process (a shared future) and across processes (a short Redis lock; the
+  losers poll for the winner's value instead of running the same query)
+- XFetch: a hit may recompute early, with probability rising as expiry
+  nears and with the cost of the last computation, so hot keys are
+  refreshed by one request before they expire instead of by all at once
+
+Values are stored as versioned, compressed JSON (app.core.cache_codec), read
+through a bytes client (get_redis_binary); cache_get_or_compute_json hands
+cached JSON documents to callers without parsing them.
 """
 
+import asyncio
 import json
 import logging
-from collections.abc import Callable
-from datetime import date, datetime
-from decimal import Decimal
+import math
+import random
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from fnmatch import fnmatchcase
 from functools import wraps
 from typing import Any, TypeVar
-from uuid import UUID
 
 import redis.asyncio as redis
 from cachetools import TTLCache
-from pydantic import BaseModel
 
+from app.core import cache_codec
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -35,22 +58,41 @@ T = TypeVar("T")
 
 # Phase 6.1C: Sentinel value for negative caching
 _NEGATIVE_SENTINEL = "__NEG__"
+_NEGATIVE_SENTINEL_BYTES = _NEGATIVE_SENTINEL.encode()
 
 # Phase 6.3A: L1 in-memory cache (process-local, avoids Redis round-trip for hot keys)
 _l1_cache: TTLCache = TTLCache(maxsize=256, ttl=30)
 
-
-class _Encoder(json.JSONEncoder):
-    """Custom JSON encoder that handles types common in SQLAlchemy responses."""
-
-    def default(self, obj: Any) -> Any:
-        if isinstance(obj, UUID):
-            return str(obj)
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        if isinstance(obj, Decimal):
-            return float(obj)
-        return super().default(obj)
+# Namespace generation counters (Redis hash) and invalidation broadcast channel
+_GENERATIONS_KEY = "cache-generations"
+_INVALIDATION_CHANNEL = "cache:invalidate"
+# Re-read generations at least this often, in case a broadcast was missed
+_GENERATIONS_REFRESH_SECONDS = 5.0
+_LISTENER_RETRY_SECONDS = 5.0
+_GLOB_CHARS = frozenset("*?[")
+
+_generations: dict[str, int] = {}
+_generations_loaded_at: float | None = None
+_listener_task: asyncio.Task | None = None
+
+# Single-flight and XFetch early refresh
+_LOCK_PREFIX = "cache-lock:"
+_DELTA_PREFIX = "cache-delta:"  # Last computation time (ms) of a cached value
+_SINGLE_FLIGHT_LOCK_MS = 5000  # Upper bound on a computation before others give up waiting
+_SINGLE_FLIGHT_POLL_SECONDS = 0.05
+_XFETCH_BETA = 1.0  # >1 refreshes earlier, <1 later
+_RELEASE_LOCK_SCRIPT = (
+    "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) end return 0"
+)
+
+_inflight: dict[str, asyncio.Future] = {}
+_single_flight_stats = {
+    "computed": 0,  # Computations run by this process
+    "coalesced_local": 0,  # Misses that joined a computation in this process
+    "coalesced_remote": 0,  # Misses served by another process's computation
+    "early_refreshes": 0,  # Hits recomputed ahead of expiry (XFetch)
+    "lock_wait_timeouts": 0,  # Waited for another process, then computed anyway
+}
 
 
 # Cache TTL configuration (in seconds)
@@ -67,8 +109,21 @@ CACHE_TTL = {
     "default": 300,  # 5 minutes default
 }
 
-# Global Redis connection pool
+# Global Redis connection pools (text, and bytes for cached values)
 _redis_pool: redis.Redis | None = None
+_redis_binary_pool: redis.Redis | None = None
+
+
+def _redis_from_settings(decode_responses: bool) -> redis.Redis:
+    kwargs = {
+        "encoding": "utf-8",
+        "decode_responses": decode_responses,
+        "socket_connect_timeout": settings.redis_socket_connect_timeout,
+        "socket_timeout": settings.redis_socket_timeout,
+    }
+    if settings.redis_ssl:
+        kwargs["ssl"] = True
+    return redis.from_url(settings.redis_url, **kwargs)
 
 
 async def get_redis() -> redis.Redis:
@@ -76,40 +131,164 @@ async def get_redis() -> redis.Redis:
     global _redis_pool
 
     if _redis_pool is None:
-        kwargs = {
-            "encoding": "utf-8",
-            "decode_responses": True,
-            "socket_connect_timeout": settings.redis_socket_connect_timeout,
-            "socket_timeout": settings.redis_socket_timeout,
-        }
-        if settings.redis_ssl:
-            kwargs["ssl"] = True
-        _redis_pool = redis.from_url(settings.redis_url, **kwargs)
+        _redis_pool = _redis_from_settings(decode_responses=True)
 
     return _redis_pool
 
 
+async def get_redis_binary() -> redis.Redis:
+    """Get or create the Redis connection pool for cached values (raw bytes, not str)."""
+    global _redis_binary_pool
+
+    if _redis_binary_pool is None:
+        _redis_binary_pool = _redis_from_settings(decode_responses=False)
+
+    return _redis_binary_pool
+
+
 async def close_redis():
-    """Close Redis connection pool."""
-    global _redis_pool
+    """Close Redis connection pools."""
+    global _redis_pool, _redis_binary_pool
 
     if _redis_pool:
         await _redis_pool.close()
         _redis_pool = None
+    if _redis_binary_pool:
+        await _redis_binary_pool.close()
+        _redis_binary_pool = None
+
+
+async def _load_generations(force: bool = False) -> None:
+    """Refresh the local copy of the namespace generations from Redis."""
+    global _generations_loaded_at
+
+    now = time.monotonic()
+    if (
+        not force
+        and _generations_loaded_at is not None
+        and now - _generations_loaded_at < _GENERATIONS_REFRESH_SECONDS
+    ):
+        return
+    # Set first: a failing Redis is retried once per refresh interval, not per call
+    _generations_loaded_at = now
+    try:
+        r = await get_redis()
+        stored = await r.hgetall(_GENERATIONS_KEY)
+        for namespace, generation in stored.items():
+            _generations[namespace] = max(_generations.get(namespace, 0), int(generation))
+    except Exception as e:
+        logger.debug(f"Cache generation refresh failed: {e}")
 
 
-def _serialize(data: Any) -> str:
-    """Serialize data to JSON string."""
-    if isinstance(data, BaseModel):
-        return data.model_dump_json()
-    if isinstance(data, list) and data and isinstance(data[0], BaseModel):
-        return json.dumps([item.model_dump() for item in data], cls=_Encoder)
-    return json.dumps(data, cls=_Encoder)
+async def _redis_key(key: str) -> str:
+    """
+    Redis key for a cache key (or pattern), at its namespace's current generation.
+
+    Generation 0 keeps the plain cache:{key} form.
+    """
+    namespace, sep, rest = key.partition(":")
+    if _GLOB_CHARS & set(namespace):
+        return f"cache:{key}"
+    await _load_generations()
+    generation = _generations.get(namespace, 0)
+    if not generation:
+        return f"cache:{key}"
+    return f"cache:{namespace}@{generation}{sep}{rest}"
+
+
+def _stale_key(redis_key: str) -> str:
+    """Stale-copy key for a resolved Redis key (cache:stale:...)."""
+    return f"cache:stale:{redis_key.removeprefix('cache:')}"
+
+
+def _evict_l1(*, keys: list[str] | None = None, pattern: str | None = None) -> None:
+    """Drop process-local entries by exact key or glob pattern."""
+    for key in keys or []:
+        _l1_cache.pop(key, None)
+    if pattern is not None:
+        for key in [k for k in list(_l1_cache.keys()) if fnmatchcase(k, pattern)]:
+            _l1_cache.pop(key, None)
+
+
+def _apply_invalidation(message: dict) -> None:
+    """Apply an invalidation (published by this or another process) locally."""
+    namespace = message.get("namespace")
+    if namespace is not None:
+        _generations[namespace] = max(_generations.get(namespace, 0), message["generation"])
+        _evict_l1(keys=[namespace], pattern=f"{namespace}:*")
+    _evict_l1(keys=message.get("keys"), pattern=message.get("pattern"))
+
+
+async def _broadcast_invalidation(message: dict) -> None:
+    """Apply an invalidation here and publish it to the other processes."""
+    _apply_invalidation(message)
+    try:
+        r = await get_redis()
+        await r.publish(_INVALIDATION_CHANNEL, json.dumps(message))
+    except Exception as e:
+        logger.warning(f"Cache invalidation broadcast failed: {e}")
 
 
-def _deserialize(data: str) -> Any:
-    """Deserialize JSON string to data."""
-    return json.loads(data)
+async def _listen_for_invalidations() -> None:
+    """Subscribe to the invalidation channel and apply messages, reconnecting on errors."""
+    while True:
+        try:
+            r = await get_redis()
+            pubsub = r.pubsub()
+            await pubsub.subscribe(_INVALIDATION_CHANNEL)
+            try:
+                # Catch up on generation bumps made while unsubscribed
+                await _load_generations(force=True)
+                while True:
+                    # Poll below the client socket_timeout so an idle channel doesn't error
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message and message.get("type") == "message":
+                        _apply_invalidation(json.loads(message["data"]))
+            finally:
+                with suppress(Exception):
+                    await pubsub.unsubscribe()
+                    await pubsub.aclose()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Messages may have been missed: nothing in L1 can be trusted
+            _l1_cache.clear()
+            logger.warning(f"Cache invalidation listener error, retrying: {e}")
+            await asyncio.sleep(_LISTENER_RETRY_SECONDS)
+
+
+async def start_invalidation_listener() -> None:
+    """Start applying invalidations published by other processes (app/worker startup)."""
+    global _listener_task
+
+    if _listener_task is None or _listener_task.done():
+        _listener_task = asyncio.create_task(_listen_for_invalidations())
+
+
+async def stop_invalidation_listener() -> None:
+    """Stop the invalidation listener (before close_redis on shutdown)."""
+    global _listener_task
+
+    if _listener_task is not None:
+        _listener_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await _listener_task
+        _listener_task = None
+
+
+def _serialize(data: Any) -> bytes:
+    """Serialize data to a stored payload (see app.core.cache_codec)."""
+    return cache_codec.encode(data)
+
+
+def _deserialize(data: bytes | str) -> Any:
+    """Rebuild data from a stored payload (or legacy JSON text)."""
+    return cache_codec.decode(data)
+
+
+def _is_negative(value: bytes | str) -> bool:
+    """Whether a stored value is the negative-cache sentinel."""
+    return value in (_NEGATIVE_SENTINEL, _NEGATIVE_SENTINEL_BYTES)
 
 
 async def cache_get(key: str) -> Any | None:
@@ -129,8 +308,8 @@ async def cache_get(key: str) -> Any | None:
         return l1_value
 
     try:
-        r = await get_redis()
-        value = await r.get(f"cache:{key}")
+        r = await get_redis_binary()
+        value = await r.get(await _redis_key(key))
         if value:
             deserialized = _deserialize(value)
             # Promote to L1
@@ -157,10 +336,10 @@ async def cache_set(key: str, value: Any, ttl: int | None = None) -> bool:
         True if successful, False otherwise
     """
     try:
-        r = await get_redis()
+        r = await get_redis_binary()
         ttl = ttl or CACHE_TTL.get("default", 300)
         serialized = _serialize(value)
-        await r.setex(f"cache:{key}", ttl, serialized)
+        await r.setex(await _redis_key(key), ttl, serialized)
         # Phase 6.3A: Update L1
         _l1_cache[key] = value
         logger.debug(f"Cache SET: {key} (TTL: {ttl}s)")
@@ -170,6 +349,53 @@ async def cache_set(key: str, value: Any, ttl: int | None = None) -> bool:
         return False
 
 
+async def cache_get_raw(key: str) -> bytes | None:
+    """
+    Get bytes stored with cache_set_raw. Checks L1 first, then Redis.
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Stored bytes or None if not found/expired
+    """
+    l1_value = _l1_cache.get(key)
+    if isinstance(l1_value, bytes):
+        return l1_value
+
+    try:
+        r = await get_redis_binary()
+        value = await r.get(await _redis_key(key))
+        if value:
+            _l1_cache[key] = value
+        return value or None
+    except Exception as e:
+        logger.warning(f"Cache get error for {key}: {e}")
+        return None
+
+
+async def cache_set_raw(key: str, data: bytes, ttl: int) -> bool:
+    """
+    Store bytes as they are (no serialization). Also updates L1.
+
+    Args:
+        key: Cache key
+        data: Bytes to store
+        ttl: Time to live in seconds
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        r = await get_redis_binary()
+        await r.setex(await _redis_key(key), ttl, data)
+        _l1_cache[key] = data
+        return True
+    except Exception as e:
+        logger.warning(f"Cache set error for {key}: {e}")
+        return False
+
+
 async def cache_set_with_stale(key: str, value: Any, ttl: int | None = None) -> bool:
     """
     Phase 6.1B: Set cached value with a stale backup copy.
@@ -184,13 +410,14 @@ async def cache_set_with_stale(key: str, value: Any, ttl: int | None = None) ->
         ttl: Time to live in seconds (default from CACHE_TTL)
     """
     try:
-        r = await get_redis()
+        r = await get_redis_binary()
         ttl = ttl or CACHE_TTL.get("default", 300)
         serialized = _serialize(value)
         stale_ttl = ttl * 10  # Stale copy lives 10× longer
+        redis_key = await _redis_key(key)
         pipe = r.pipeline()
-        pipe.setex(f"cache:{key}", ttl, serialized)
-        pipe.setex(f"cache:stale:{key}", stale_ttl, serialized)
+        pipe.setex(redis_key, ttl, serialized)
+        pipe.setex(_stale_key(redis_key), stale_ttl, serialized)
         await pipe.execute()
         # Update L1
         _l1_cache[key] = value
@@ -221,13 +448,14 @@ async def cache_get_with_fallback(key: str) -> Any | None:
         return l1_value
 
     try:
-        r = await get_redis()
+        r = await get_redis_binary()
+        redis_key = await _redis_key(key)
 
         # Check fresh key
-        value = await r.get(f"cache:{key}")
+        value = await r.get(redis_key)
         if value:
             # Check for negative sentinel
-            if value == _NEGATIVE_SENTINEL:
+            if _is_negative(value):
                 _l1_cache[key] = _NEGATIVE_SENTINEL
                 logger.debug(f"Cache NEG HIT: {key}")
                 return None
@@ -236,7 +464,7 @@ async def cache_get_with_fallback(key: str) -> Any | None:
             return deserialized
 
         # Fresh miss — try stale fallback
-        stale_value = await r.get(f"cache:stale:{key}")
+        stale_value = await r.get(_stale_key(redis_key))
         if stale_value:
             deserialized = _deserialize(stale_value)
             _l1_cache[key] = deserialized
@@ -262,8 +490,8 @@ async def cache_negative(key: str, ttl: int = 60) -> bool:
         ttl: How long to suppress retries (default 60s)
     """
     try:
-        r = await get_redis()
-        await r.setex(f"cache:{key}", ttl, _NEGATIVE_SENTINEL)
+        r = await get_redis_binary()
+        await r.setex(await _redis_key(key), ttl, _NEGATIVE_SENTINEL)
         _l1_cache[key] = _NEGATIVE_SENTINEL
         logger.debug(f"Cache NEG SET: {key} (TTL: {ttl}s)")
         return True
@@ -274,7 +502,7 @@ async def cache_negative(key: str, ttl: int = 60) -> bool:
 
 async def cache_delete(key: str) -> bool:
     """
-    Delete cached value.
+    Delete cached value, here and in every process's L1.
 
     Args:
         key: Cache key
@@ -284,7 +512,8 @@ async def cache_delete(key: str) -> bool:
     """
     try:
         r = await get_redis()
-        await r.delete(f"cache:{key}")
+        await r.delete(await _redis_key(key))
+        await _broadcast_invalidation({"keys": [key]})
         logger.debug(f"Cache DELETE: {key}")
         return True
     except Exception as e:
@@ -294,19 +523,28 @@ async def cache_delete(key: str) -> bool:
 
 async def cache_delete_pattern(pattern: str) -> int:
     """
-    Delete all keys matching pattern.
+    Delete all keys matching pattern, here and in every process's L1.
+
+    A whole namespace ("insights:*") is invalidated in O(1) by bumping its
+    generation (see invalidate_namespace); other patterns SCAN the keyspace.
 
     Args:
-        pattern: Glob pattern (e.g., "insights:*")
+        pattern: Glob pattern (e.g., "insights:*", "insights:list:*")
 
     Returns:
-        Number of keys deleted
+        Number of keys deleted (0 for a generation bump, which deletes nothing)
     """
+    namespace, _, rest = pattern.partition(":")
+    if rest == "*" and not _GLOB_CHARS & set(namespace):
+        await invalidate_namespace(namespace)
+        return 0
+
     try:
         r = await get_redis()
         keys = []
-        async for key in r.scan_iter(f"cache:{pattern}"):
+        async for key in r.scan_iter(await _redis_key(pattern)):
             keys.append(key)
+        await _broadcast_invalidation({"pattern": pattern})
         if keys:
             await r.delete(*keys)
             logger.info(f"Cache DELETE pattern {pattern}: {len(keys)} keys")
@@ -317,10 +555,293 @@ async def cache_delete_pattern(pattern: str) -> int:
         return 0
 
 
+async def invalidate_namespace(namespace: str) -> bool:
+    """
+    Invalidate every key in a namespace by bumping its generation.
+
+    Args:
+        namespace: Key prefix before the first ':' (e.g., "insights")
+
+    Returns:
+        True if the generation was bumped in Redis, False otherwise
+    """
+    try:
+        r = await get_redis()
+        generation = await r.hincrby(_GENERATIONS_KEY, namespace, 1)
+    except Exception as e:
+        logger.warning(f"Cache invalidate namespace error for {namespace}: {e}")
+        # Redis is unreachable, so only this process's L1 can be dropped
+        _evict_l1(keys=[namespace], pattern=f"{namespace}:*")
+        return False
+
+    await _broadcast_invalidation({"namespace": namespace, "generation": generation})
+    logger.info(f"Cache INVALIDATE namespace {namespace} (generation {generation})")
+    return True
+
+
+def get_single_flight_stats() -> dict:
+    """Counters for coalesced, early-refreshed and computed cache fills."""
+    return dict(_single_flight_stats)
+
+
+def _refresh_early(delta_ms: float, remaining_ms: int, beta: float) -> bool:
+    """XFetch: recompute now with probability growing as expiry nears."""
+    if delta_ms <= 0 or remaining_ms <= 0:
+        return False
+    return -delta_ms * beta * math.log(1.0 - random.random()) >= remaining_ms
+
+
+async def _store_computed(
+    r: redis.Redis | None, redis_key: str, value: Any, ttl: int, delta_ms: int
+) -> bool:
+    """Write a computed value and its computation time; True if stored."""
+    if r is None:
+        return False
+    try:
+        pipe = r.pipeline()
+        pipe.setex(redis_key, ttl, _serialize(value))
+        pipe.setex(f"{_DELTA_PREFIX}{redis_key}", ttl, delta_ms)
+        await pipe.execute()
+        return True
+    except Exception as e:
+        logger.warning(f"Cache set error for {redis_key}: {e}")
+        return False
+
+
+async def _compute_and_store(
+    r: redis.Redis | None,
+    key: str,
+    redis_key: str,
+    compute: Callable[[], Awaitable[Any]],
+    ttl: int,
+    as_json: bool = False,
+) -> Any:
+    start = time.perf_counter()
+    value = await compute()
+    if as_json and value is not None:
+        value = cache_codec.dumps(value)  # Serialized once: stored and returned as is
+    delta_ms = max(1, int((time.perf_counter() - start) * 1000))
+    _single_flight_stats["computed"] += 1
+    # Like cache_set, L1 only mirrors what Redis holds (invalidation goes through Redis)
+    if value is not None and await _store_computed(r, redis_key, value, ttl, delta_ms):
+        _l1_cache[key] = value
+    return value
+
+
+def _read_payload(key: str, payload: bytes | str | None, as_json: bool) -> Any | None:
+    """Stored payload as a value (or JSON document); unreadable payloads are misses."""
+    if not payload:
+        return None
+    try:
+        return cache_codec.unpack(payload) if as_json else _deserialize(payload)
+    except ValueError as e:
+        logger.warning(f"Cache payload unreadable for {key}: {e}")
+        return None
+
+
+def _as_requested(value: Any, as_json: bool) -> Any:
+    """Convert between a value and its JSON document (L1 and joined callers hold either)."""
+    if value is None:
+        return None
+    if as_json:
+        return cache_codec.dumps(value)
+    if isinstance(value, cache_codec.JsonBytes):
+        return cache_codec.loads(value)
+    return value
+
+
+async def _wait_for_value(r: redis.Redis, key: str, redis_key: str, as_json: bool) -> Any | None:
+    """Poll for the value another process is computing, up to the lock lifetime."""
+    deadline = time.monotonic() + _SINGLE_FLIGHT_LOCK_MS / 1000
+    while time.monotonic() < deadline:
+        await asyncio.sleep(_SINGLE_FLIGHT_POLL_SECONDS)
+        value = _read_payload(key, await r.get(redis_key), as_json)
+        if value is not None:
+            return value
+    return None
+
+
+async def _load_or_compute(
+    key: str, compute: Callable[[], Awaitable[Any]], ttl: int, beta: float, as_json: bool
+) -> Any:
+    """Redis lookup (with XFetch) and lock-guarded computation for one key."""
+    redis_key = await _redis_key(key)
+    try:
+        r = await get_redis_binary()
+        pipe = r.pipeline()
+        pipe.get(redis_key)
+        pipe.pttl(redis_key)
+        pipe.get(f"{_DELTA_PREFIX}{redis_key}")
+        raw, remaining_ms, delta_ms = await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Cache get error for {key}: {e}")
+        # No Redis: no cross-process coordination either
+        return await _compute_and_store(None, key, redis_key, compute, ttl, as_json)
+
+    current = _read_payload(key, raw, as_json)
+    if current is not None and not _refresh_early(float(delta_ms or 0), remaining_ms, beta):
+        _l1_cache[key] = current
+        logger.debug(f"Cache HIT: {key}")
+        return current
+
+    lock_key = f"{_LOCK_PREFIX}{redis_key}"
+    token = uuid.uuid4().hex
+    try:
+        acquired = await r.set(lock_key, token, nx=True, px=_SINGLE_FLIGHT_LOCK_MS)
+    except Exception as e:
+        logger.warning(f"Cache lock error for {key}: {e}")
+        acquired = True  # Fail open: compute without the lock
+        token = None
+
+    if not acquired:
+        if current is not None:
+            # Another process is already refreshing early; serve the current value
+            _l1_cache[key] = current
+            return current
+        _single_flight_stats["coalesced_remote"] += 1
+        try:
+            value = await _wait_for_value(r, key, redis_key, as_json)
+        except Exception as e:
+            logger.warning(f"Cache wait error for {key}: {e}")
+            value = None
+        if value is not None:
+            _l1_cache[key] = value
+            return value
+        _single_flight_stats["lock_wait_timeouts"] += 1
+        return await _compute_and_store(r, key, redis_key, compute, ttl, as_json)
+
+    if current is not None:
+        _single_flight_stats["early_refreshes"] += 1
+        logger.debug(f"Cache EARLY REFRESH: {key}")
+    try:
+        return await _compute_and_store(r, key, redis_key, compute, ttl, as_json)
+    finally:
+        if token is not None:
+            with suppress(Exception):
+                await r.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+
+
+async def _get_or_compute(
+    key: str,
+    compute: Callable[[], Awaitable[Any]],
+    ttl: int | None,
+    beta: float,
+    as_json: bool,
+) -> Any:
+    value = _l1_cache.get(key)
+    if value is not None:
+        logger.debug(f"Cache L1 HIT: {key}")
+        return _as_requested(value, as_json)
+
+    ttl = ttl or CACHE_TTL.get("default", 300)
+    while (inflight := _inflight.get(key)) is not None:
+        _single_flight_stats["coalesced_local"] += 1
+        try:
+            return _as_requested(await asyncio.shield(inflight), as_json)
+        except asyncio.CancelledError:
+            if not inflight.cancelled():
+                raise  # This caller was cancelled
+            # The computing caller was cancelled: take over
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        value = await _load_or_compute(key, compute, ttl, beta, as_json)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # Retrieved even when nobody else was waiting
+        raise
+    else:
+        future.set_result(value)
+        return value
+    finally:
+        _inflight.pop(key, None)
+
+
+async def cache_get_or_compute(
+    key: str,
+    compute: Callable[[], Awaitable[T]],
+    ttl: int | None = None,
+    *,
+    beta: float = _XFETCH_BETA,
+) -> T:
+    """
+    Get a cached value, computing it at most once across concurrent callers.
+
+    Lookup order is L1, then Redis. On a miss exactly one caller computes:
+    others in this process await the same computation, others in other
+    processes wait (bounded) for the value to appear. A Redis hit close to
+    expiry may be recomputed early by one caller (XFetch). None results are
+    returned but not cached.
+
+    Args:
+        key: Cache key
+        compute: Coroutine function producing the value on a miss
+        ttl: Time to live in seconds (uses default if not specified)
+        beta: XFetch eagerness (0 disables early refresh)
+
+    Returns:
+        Cached or freshly computed value
+    """
+    return await _get_or_compute(key, compute, ttl, beta, as_json=False)
+
+
+async def cache_get_or_compute_json(
+    key: str,
+    compute: Callable[[], Awaitable[Any]],
+    ttl: int | None = None,
+    *,
+    beta: float = _XFETCH_BETA,
+) -> cache_codec.JsonBytes | None:
+    """
+    Like cache_get_or_compute, but return the value as a serialized JSON document.
+
+    A hit is returned as stored (decompressed, never parsed), and a computed
+    value is serialized once for both Redis and the caller, so a response
+    can be sent from it without validating or re-encoding it.
+
+    Args:
+        key: Cache key
+        compute: Coroutine function producing the value (e.g. a Pydantic model)
+        ttl: Time to live in seconds (uses default if not specified)
+        beta: XFetch eagerness (0 disables early refresh)
+
+    Returns:
+        JSON document, or None if compute returned None
+    """
+    return await _get_or_compute(key, compute, ttl, beta, as_json=True)
+
+
+async def cache_refresh(key: str, compute: Callable[[], Awaitable[T]], ttl: int | None = None) -> T:
+    """
+    Compute a value and store it unconditionally (cache warming).
+
+    Writes the same entry cache_get_or_compute would, so later reads are hits.
+
+    Args:
+        key: Cache key
+        compute: Coroutine function producing the value
+        ttl: Time to live in seconds (uses default if not specified)
+
+    Returns:
+        Freshly computed value
+    """
+    redis_key = await _redis_key(key)
+    try:
+        r = await get_redis_binary()
+    except Exception as e:
+        logger.warning(f"Cache refresh error for {key}: {e}")
+        r = None
+    return await _compute_and_store(r, key, redis_key, compute, ttl or CACHE_TTL["default"])
+
+
 # Decorator for caching function results
 def cached(cache_key: str, ttl_key: str | None = None, ttl: int | None = None):
     """
-    Decorator to cache function results.
+    Decorator to cache function results, with single-flight and early refresh.
 
     Usage:
         @cached("tools:list")
@@ -346,21 +867,11 @@ def cached(cache_key: str, ttl_key: str | None = None, ttl: int | None = None):
             except KeyError:
                 key = cache_key
 
-            # Try to get from cache
-            cached_value = await cache_get(key)
-            if cached_value is not None:
-                return cached_value
-
-            # Execute function and cache result
-            result = await func(*args, **kwargs)
-
             # Determine TTL
             cache_ttl = ttl or CACHE_TTL.get(ttl_key or "default", 300)
 
-            # Cache the result
-            await cache_set(key, result, cache_ttl)
-
-            return result
+            # Concurrent misses share one call (see cache_get_or_compute)
+            return await cache_get_or_compute(key, lambda: func(*args, **kwargs), cache_ttl)
 
         return wrapper
 
@@ -374,13 +885,23 @@ async def invalidate_tools_cache():
 
 
 async def invalidate_trends_cache():
-    """Invalidate all trends cache."""
+    """Invalidate all trends cache: list totals, registered queries and HTTP responses."""
+    from app.core.cache_registry import invalidate_dependents
+
     await cache_delete_pattern("trends:*")
+    await cache_delete_pattern("count:*")
+    await cache_delete_pattern("http:*")
+    await invalidate_dependents("trends")
 
 
 async def invalidate_insights_cache():
-    """Invalidate all insights cache."""
+    """Invalidate all insights cache: list totals, registered queries and HTTP responses."""
+    from app.core.cache_registry import invalidate_dependents
+
     await cache_delete_pattern("insights:*")
+    await cache_delete_pattern("count:*")
+    await cache_delete_pattern("http:*")
+    await invalidate_dependents("insights")
 
 
 async def invalidate_success_stories_cache():
@@ -404,7 +925,7 @@ async def cache_health_check() -> dict:
     Check Redis cache health.
 
     Returns:
-        Dict with status and latency
+        Dict with status, latency and single-flight counters
     """
     import time
 
@@ -422,6 +943,7 @@ async def cache_health_check() -> dict:
             "status": "healthy",
             "latency_ms": round(latency, 2),
             "used_memory": used_memory,
+            "single_flight": get_single_flight_stats(),
         }
     except Exception as e:
         return {
@@ -434,52 +956,21 @@ async def cache_health_check() -> dict:
 async def hydrate_cache() -> dict:
     """Pre-warm Redis cache with most-accessed data on worker startup.
 
-    Hydrates: insights page 1, pulse stats, idea of the day.
-    Prevents cold-cache misses after Railway deploys (~4x/day).
+    Warms every registered cached query (app.core.cache_registry) under the
+    keys its route reads: the default parameters plus the parameter sets
+    requested most often. Prevents cold-cache misses after Railway deploys
+    (~4x/day).
 
     Returns:
-        Dict with hydration results per key.
+        Dict with the number of parameter sets warmed per query.
     """
-    from sqlalchemy import desc, func, select
+    # The route modules register the queries (and their loaders) on import
+    import app.api.routes  # noqa: F401
+    from app.core.cache_registry import hydrate_cached_queries
 
-    from app.db.session import AsyncSessionLocal
-    from app.models.insight import Insight
-
-    results = {}
+    results: dict = {}
     try:
-        async with AsyncSessionLocal() as session:
-            # 1. Insights page 1 (most common API call)
-            stmt = (
-                select(Insight)
-                .where(Insight.admin_status == "approved")
-                .order_by(desc(Insight.relevance_score))
-                .limit(20)
-            )
-            result = await session.execute(stmt)
-            insights = result.scalars().all()
-            if insights:
-                # Serialize minimal data for cache
-                insights_data = [
-                    {
-                        "id": str(i.id),
-                        "title": i.title,
-                        "relevance_score": i.relevance_score,
-                    }
-                    for i in insights
-                ]
-                await cache_set_with_stale(
-                    "insights:list:1:20", insights_data, CACHE_TTL.get("insights", 300)
-                )
-                results["insights_page_1"] = len(insights_data)
-
-            # 2. Total insights count (used by pulse/stats)
-            count_result = await session.execute(select(func.count(Insight.id)))
-            total = count_result.scalar() or 0
-            await cache_set_with_stale(
-                "insights:total_count", total, CACHE_TTL.get("insights", 300)
-            )
-            results["insights_total"] = total
-
+        results = await hydrate_cached_queries()
         logger.info(f"Bootstrap cache hydration complete: {results}")
     except Exception as e:
         logger.warning(f"Bootstrap cache hydration failed: {e}")
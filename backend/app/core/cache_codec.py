@@ -0,0 +1,153 @@
+"""Binary encoding of cached values.
+
+A stored payload is one format byte followed by a JSON document, compressed
+when it is large:
+
+- 0x01: JSON
+- 0x02: zstd-compressed JSON
+- 0x03: zlib-compressed JSON (written when zstandard is not installed)
+
+JSON (rather than msgpack) keeps the decompressed payload usable as an HTTP
+response body as-is: cached list endpoints return it without parsing or
+re-validating it (see JsonBytes). orjson is used when installed, the stdlib
+json module otherwise; the output is interchangeable.
+
+Payloads written before the format byte existed are plain JSON text, whose
+first byte is never a format byte, so they are still read.
+"""
+
+import json
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.core.constants import CACHE_COMPRESS_LEVEL, CACHE_COMPRESS_MIN_BYTES
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional, zlib is the fallback
+    zstandard = None
+
+FORMAT_JSON = 1
+FORMAT_ZSTD = 2
+FORMAT_ZLIB = 3
+
+_zstd_compressor = zstandard.ZstdCompressor(level=CACHE_COMPRESS_LEVEL) if zstandard else None
+_zstd_decompressor = zstandard.ZstdDecompressor() if zstandard else None
+
+
+class CodecError(ValueError):
+    """Payload in an unknown format, or one this process cannot decompress."""
+
+
+class JsonBytes(bytes):
+    """A serialized JSON document, passed through instead of parsed."""
+
+
+def _default(obj: Any) -> Any:
+    """Types common in SQLAlchemy responses that JSON has no encoding for."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> JsonBytes:
+    """
+    Serialize a value to JSON.
+
+    Pydantic models are serialized by their own (compiled) serializer.
+
+    Args:
+        value: Model, list of models, or JSON-compatible data
+
+    Returns:
+        UTF-8 JSON document
+    """
+    if isinstance(value, JsonBytes):
+        return value
+    if isinstance(value, BaseModel):
+        return JsonBytes(value.__pydantic_serializer__.to_json(value))
+    if orjson is not None:
+        return JsonBytes(orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS))
+    return JsonBytes(json.dumps(value, default=_default, separators=(",", ":")).encode())
+
+
+def loads(body: bytes | str) -> Any:
+    """Parse a JSON document."""
+    if orjson is not None:
+        # orjson rejects bytes subclasses (JsonBytes); a memoryview is zero-copy
+        return orjson.loads(memoryview(body) if isinstance(body, bytes) else body)
+    return json.loads(body)
+
+
+def pack(body: bytes) -> bytes:
+    """
+    Frame a JSON document for storage, compressing it above the size threshold.
+
+    Args:
+        body: JSON document
+
+    Returns:
+        Format byte followed by the (possibly compressed) document
+    """
+    if len(body) < CACHE_COMPRESS_MIN_BYTES:
+        return bytes((FORMAT_JSON,)) + body
+    if _zstd_compressor is not None:
+        return bytes((FORMAT_ZSTD,)) + _zstd_compressor.compress(body)
+    return bytes((FORMAT_ZLIB,)) + zlib.compress(body, CACHE_COMPRESS_LEVEL)
+
+
+def unpack(payload: bytes | str) -> JsonBytes:
+    """
+    JSON document held by a stored payload.
+
+    Args:
+        payload: Stored payload (or legacy JSON text)
+
+    Returns:
+        UTF-8 JSON document
+
+    Raises:
+        CodecError: Unknown format, or zstd payload without zstandard installed
+    """
+    if isinstance(payload, str):
+        return JsonBytes(payload.encode())
+    if not payload:
+        raise CodecError("Empty cache payload")
+    fmt, data = payload[0], payload[1:]
+    if fmt == FORMAT_JSON:
+        return JsonBytes(data)
+    if fmt == FORMAT_ZSTD:
+        if _zstd_decompressor is None:
+            raise CodecError("zstd cache payload, but zstandard is not installed")
+        return JsonBytes(_zstd_decompressor.decompress(data))
+    if fmt == FORMAT_ZLIB:
+        return JsonBytes(zlib.decompress(data))
+    if fmt < 0x20 and fmt not in b"\t\n\r":
+        raise CodecError(f"Unknown cache payload format {fmt}")
+    return JsonBytes(payload)  # Legacy JSON text
+
+
+def encode(value: Any) -> bytes:
+    """Serialize and frame a value for storage."""
+    return pack(dumps(value))
+
+
+def decode(payload: bytes | str) -> Any:
+    """Rebuild a value from a stored payload (or legacy JSON text)."""
+    return loads(unpack(payload))
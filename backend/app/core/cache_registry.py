@@ -0,0 +1,292 @@
+"""Registry of cached read queries.
+
+Each cached endpoint declares one CachedQuery: its parameters (with their
+defaults), a loader, the response model, the TTL and the tables it reads.
+That one declaration is used to:
+
+- build the cache key when the route reads through it (CachedQuery.get)
+- warm the most requested parameter sets after a deploy; requests are counted
+  per parameter set in Redis (cache-usage:{name}) and hydrate_cached_queries()
+  recomputes the top ones plus the defaults
+- invalidate the query when a table it reads changes (invalidate_dependents)
+
+Keys are "{name}:{md5 of the parameter values}", and each query name is its
+own cache namespace, so invalidating a query is a single generation bump and
+two queries can never write the same key.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import (
+    _GLOB_CHARS,
+    cache_delete_pattern,
+    cache_get_or_compute,
+    cache_get_or_compute_json,
+    cache_refresh,
+    get_redis,
+)
+from app.core.cache_codec import JsonBytes
+from app.core.constants import (
+    CACHED_QUERY_USAGE_FLUSH_SECONDS,
+    CACHED_QUERY_USAGE_KEEP,
+    CACHED_QUERY_USAGE_TTL_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+_USAGE_PREFIX = "cache-usage:"
+
+_registry: dict[str, "CachedQuery"] = {}
+
+
+class CachedQuery(Generic[M]):
+    """
+    A cached, parameterized read query. Create with register_cached_query().
+
+    Args:
+        name: Query name; also the cache namespace, so no ':' or glob characters
+        loader: Coroutine function (db, **params) returning the response model
+        response_model: Pydantic model the cached value is validated into
+        params: Parameter names, in key order, mapped to their defaults
+        ttl: Time to live in seconds
+        depends_on: Tables whose changes invalidate the query
+        hydrate_top: Parameter sets to warm after a deploy (0 disables)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loader: Callable[..., Awaitable[M]],
+        response_model: type[M],
+        params: dict[str, Any],
+        ttl: int,
+        depends_on: tuple[str, ...],
+        hydrate_top: int,
+    ):
+        self.name = name
+        self.loader = loader
+        self.response_model = response_model
+        self.params = dict(params)
+        self.ttl = ttl
+        self.depends_on = depends_on
+        self.hydrate_top = hydrate_top
+        self._usage: Counter[str] = Counter()
+        self._usage_flushed_at = time.monotonic()
+
+    def _encode(self, params: dict[str, Any]) -> str:
+        """Canonical encoding of a full parameter set (shared by keys and usage)."""
+        missing = self.params.keys() - params.keys()
+        unknown = params.keys() - self.params.keys()
+        if missing or unknown:
+            raise TypeError(
+                f"Cached query {self.name}: missing {sorted(missing)}, unknown {sorted(unknown)}"
+            )
+        return json.dumps([params[name] for name in self.params], separators=(",", ":"))
+
+    def key(self, **params: Any) -> str:
+        """
+        Cache key for one parameter set.
+
+        Args:
+            **params: Every declared parameter, no others
+
+        Returns:
+            "{name}:{digest}"
+        """
+        digest = hashlib.md5(self._encode(params).encode()).hexdigest()
+        return f"{self.name}:{digest}"
+
+    async def get(self, db: AsyncSession, **params: Any) -> M:
+        """
+        Read through the cache, loading on a miss (single-flight, see cache_get_or_compute).
+
+        Args:
+            db: Database session for the loader
+            **params: Every declared parameter, no others
+
+        Returns:
+            Response model instance
+        """
+        key = self.key(**params)
+        await self._record_usage(self._encode(params))
+        value = await cache_get_or_compute(key, lambda: self.loader(db, **params), ttl=self.ttl)
+        return self.response_model.model_validate(value)
+
+    async def get_json(self, db: AsyncSession, **params: Any) -> JsonBytes:
+        """
+        Like get, but return the response as serialized JSON.
+
+        Hits skip parsing and response-model validation entirely; serve the
+        document with a plain Response (it is what the response model produces).
+
+        Args:
+            db: Database session for the loader
+            **params: Every declared parameter, no others
+
+        Returns:
+            JSON document of the response model
+        """
+        key = self.key(**params)
+        await self._record_usage(self._encode(params))
+        return await cache_get_or_compute_json(key, lambda: self.loader(db, **params), ttl=self.ttl)
+
+    async def warm(self, db: AsyncSession, **params: Any) -> M:
+        """Load one parameter set and store it, whatever the cache holds."""
+        value = await cache_refresh(
+            self.key(**params), lambda: self.loader(db, **params), ttl=self.ttl
+        )
+        return self.response_model.model_validate(value)
+
+    async def invalidate(self) -> None:
+        """Drop every cached parameter set of this query."""
+        await cache_delete_pattern(f"{self.name}:*")
+
+    async def _record_usage(self, encoded: str) -> None:
+        """Count a request locally; push the counts to Redis once per flush interval."""
+        self._usage[encoded] += 1
+        if time.monotonic() - self._usage_flushed_at < CACHED_QUERY_USAGE_FLUSH_SECONDS:
+            return
+        await self.flush_usage()
+
+    async def flush_usage(self) -> None:
+        """Add the locally counted requests to the shared ranking in Redis."""
+        counts, self._usage = self._usage, Counter()
+        self._usage_flushed_at = time.monotonic()
+        if not counts:
+            return
+        usage_key = f"{_USAGE_PREFIX}{self.name}"
+        try:
+            r = await get_redis()
+            pipe = r.pipeline()
+            for encoded, count in counts.items():
+                pipe.zincrby(usage_key, count, encoded)
+            # Keep the ranking bounded: one-off searches and deep cursors fall off
+            pipe.zremrangebyrank(usage_key, 0, -CACHED_QUERY_USAGE_KEEP - 1)
+            pipe.expire(usage_key, CACHED_QUERY_USAGE_TTL_SECONDS)
+            await pipe.execute()
+        except Exception as e:
+            logger.debug(f"Cached query usage flush failed for {self.name}: {e}")
+
+    async def popular_params(self, limit: int) -> list[dict[str, Any]]:
+        """
+        Most requested parameter sets, most requested first.
+
+        Args:
+            limit: Maximum number of parameter sets
+
+        Returns:
+            Parameter dicts (sets recorded under a different signature are skipped)
+        """
+        try:
+            r = await get_redis()
+            members = await r.zrevrange(f"{_USAGE_PREFIX}{self.name}", 0, limit - 1)
+        except Exception as e:
+            logger.debug(f"Cached query usage read failed for {self.name}: {e}")
+            return []
+
+        popular = []
+        for member in members:
+            values = json.loads(member)
+            if len(values) == len(self.params):
+                popular.append(dict(zip(self.params, values, strict=True)))
+        return popular
+
+
+def register_cached_query(
+    name: str,
+    loader: Callable[..., Awaitable[M]],
+    response_model: type[M],
+    *,
+    params: dict[str, Any] | None = None,
+    ttl: int,
+    depends_on: tuple[str, ...] = (),
+    hydrate_top: int = 0,
+) -> CachedQuery[M]:
+    """
+    Declare a cached query (at import time of the module defining the loader).
+
+    Args:
+        name: Unique query name, e.g. "insights_list"
+        loader: Coroutine function (db, **params) returning the response model
+        response_model: Pydantic model of the response
+        params: Parameter names, in key order, mapped to their defaults
+        ttl: Time to live in seconds
+        depends_on: Tables whose changes invalidate the query
+        hydrate_top: Parameter sets to warm after a deploy (0 disables)
+
+    Returns:
+        The registered CachedQuery
+
+    Raises:
+        ValueError: If the name is taken or not usable as a cache namespace
+    """
+    if name in _registry:
+        raise ValueError(f"Cached query {name!r} is already registered")
+    if ":" in name or _GLOB_CHARS & set(name):
+        raise ValueError(f"Cached query name {name!r} must not contain ':' or glob characters")
+    query = CachedQuery(name, loader, response_model, params or {}, ttl, depends_on, hydrate_top)
+    _registry[name] = query
+    return query
+
+
+def get_cached_queries() -> list[CachedQuery]:
+    """All registered queries, in registration order."""
+    return list(_registry.values())
+
+
+async def invalidate_dependents(table: str) -> list[str]:
+    """
+    Invalidate every registered query that reads a table.
+
+    Args:
+        table: Table name (e.g., "insights")
+
+    Returns:
+        Names of the invalidated queries
+    """
+    names = []
+    for query in _registry.values():
+        if table in query.depends_on:
+            await query.invalidate()
+            names.append(query.name)
+    return names
+
+
+async def hydrate_cached_queries() -> dict[str, int]:
+    """
+    Warm each query's defaults and most requested parameter sets.
+
+    Returns:
+        Dict of query name to the number of parameter sets warmed
+    """
+    from app.db.session import AsyncSessionLocal
+
+    results = {}
+    for query in _registry.values():
+        if query.hydrate_top <= 0:
+            continue
+        candidates = [query.params, *await query.popular_params(query.hydrate_top)]
+        param_sets = list({query._encode(p): p for p in candidates}.values())[: query.hydrate_top]
+
+        warmed = 0
+        async with AsyncSessionLocal() as session:
+            for params in param_sets:
+                try:
+                    await query.warm(session, **params)
+                    warmed += 1
+                except Exception as e:
+                    logger.warning(f"Cache hydration failed for {query.name} {params}: {e}")
+                    await session.rollback()
+        results[query.name] = warmed
+    return results
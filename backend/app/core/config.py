@@ -23,6 +23,7 @@ class Settings(BaseSettings):
 
     # Redis
     redis_url: str = "redis://localhost:6379"
+    response_cache_enabled: bool = True  # HTTP response cache for public read endpoints
 
     # API Configuration
     api_host: str = "0.0.0.0"
@@ -52,6 +53,8 @@ class Settings(BaseSettings):
 
     # PMF Optimization Flags (minimal-cost deployment)
     use_crawl4ai: bool = True  # Use Crawl4AI instead of Firecrawl (save $149/mo)
+    crawl4ai_pool_size: int = 2  # Warm browsers kept per process
+    crawl4ai_max_pages_per_browser: int = 50  # Recycle a browser after this many pages
     enable_daily_digest: bool = False  # Disable to save email quota (stay in Resend Free tier)
 
     # Supabase (Phase 4+ - Asia Pacific)
@@ -129,6 +132,17 @@ class Settings(BaseSettings):
     default_llm_model: str = "google-gla:gemini-2.0-flash"
     llm_call_timeout: int = 120  # seconds
     ai_fallback_enabled: bool = True  # Phase 6.5A: Enable Claude/rule-based fallback chain
+    llm_requests_per_minute: int = 15  # Gemini free-tier RPM quota
+    llm_tokens_per_minute: int = 1_000_000  # Gemini free-tier TPM quota
+    llm_expected_output_tokens: int = 4000  # Completion budget used for TPM estimates
+
+    # Signal analysis concurrency (analyze_signals_task)
+    analysis_concurrency: int = 3  # Signals in flight at once; 1 = sequential
+
+    # Post-LLM validation stage: validators run concurrently, each within its own budget
+    community_validation_timeout: float = 15.0  # Subreddit checks (PRAW)
+    trend_verification_timeout: float = 25.0  # Google Trends (pytrends, 10s between requests)
+    url_validation_timeout: float = 15.0  # Competitor URL reachability
 
     # Database Connection Pool (Supabase session-mode pooler safe ceiling)
     db_pool_size: int = 3  # session-mode pooler: ~7 per process, ~14 total with worker
@@ -149,6 +163,7 @@ class Settings(BaseSettings):
     # Worker (Arq)
     worker_max_jobs: int = 10
     worker_job_timeout: int = 600
+    forecast_pool_workers: int = 2  # Processes for background trend forecast fits
 
     # Scraper Defaults
     reddit_subreddits: str = "startups,SaaS"
@@ -161,12 +176,20 @@ class Settings(BaseSettings):
     product_hunt_limit: int = 10
     trends_timeframe: str = "now 7-d"
     trends_geo: str = "US"
+    scrape_all_concurrency: int = 3  # Sources scraped at once by scrape_all_sources_task
+    scraper_run_timeout: int = 600  # Seconds before a single scraper run is abandoned
 
     # Middleware & Security
     max_request_size: int = 1_000_000
     sse_max_duration: int = 3600
+    sse_subscriber_queue_size: int = 16  # Buffered snapshots before a slow SSE client is dropped
+    sse_broadcast_use_redis: bool = True  # Share SSE producers cluster-wide via Redis pub/sub
+    rate_limit_use_redis: bool = True  # Shared GCRA counters across workers (falls back in-process)
+    rate_limit_local_max_keys: int = 10_000  # LRU bound for the in-process fallback
     jwks_fetch_timeout: float = 10.0
     jwks_cache_ttl: int = 3600
+    principal_cache_ttl: int = 300  # Redis TTL for verified-principal cache (seconds)
+    principal_cache_local_ttl: int = 30  # In-process TTL for verified-principal cache
     cors_allowed_methods: str = "GET,POST,PUT,PATCH,DELETE,OPTIONS"
     cors_allowed_headers: str = "*"
     cors_origin_regex: str = (
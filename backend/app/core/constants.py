@@ -94,9 +94,16 @@ RATE_LIMITS: dict[str, dict[str, int]] = {
 SPIKE_MULTIPLIER: float = 3.0
 SPIKE_COOLDOWN_SECONDS: int = 1800
 MIN_SPIKE_BASELINE_POINTS: int = 4
+TREND_POINTS_RETENTION_DAYS: int = 90
+FORECAST_MAX_HORIZON_DAYS: int = 30  # Forecasts are fit once at this horizon and sliced
+FORECAST_HISTORY_DAYS: int = 30  # Length of synthetic history for trends without data
+FORECAST_CACHE_TTL_SECONDS: int = 7 * 86400  # Content-addressed by data hash, so long-lived
+FORECAST_PROPHET_MIN_POINTS: int = 90  # Shorter series use the NumPy Holt-Winters backend
 SIMILARITY_THRESHOLD: float = 0.3
 CORRELATION_WINDOW_HOURS: int = 24
 MAX_INSIGHTS_TO_SCAN: int = 200
+CORRELATION_MINHASH_PERMUTATIONS: int = 128
+CORRELATION_LSH_BANDS: int = 64  # 2 rows/band → ~0.18 Jaccard candidate threshold
 
 # Phase 6.2: Expected scraper sources
 EXPECTED_SOURCES: list[str] = ["reddit", "product_hunt", "google_trends", "twitter", "hacker_news"]
@@ -109,3 +116,65 @@ SOURCE_CREDIBILITY_WEIGHTS: dict[str, float] = {
     "google_trends": 0.9,  # Volume signal, not quality
     "twitter": 0.8,  # Noisy, short-form
 }
+
+# Cold-start import budget (scripts/import_profile.py, tests/unit/test_import_budget.py)
+# Heavy optional dependencies kept off the app.main / app.worker import path:
+# the code that needs them imports them on first use
+LAZY_IMPORT_MODULES: tuple[str, ...] = (
+    "pandas",
+    "prophet",
+    "pytrends",
+    "praw",
+    "tweepy",
+    "crawl4ai",
+    "playwright",
+    "firecrawl",
+    "weasyprint",
+    "pydantic_ai",
+)
+# Cumulative cold import time per entry point (about 2x the measured baseline)
+IMPORT_TIME_BUDGET_SECONDS: dict[str, float] = {"app.main": 6.0, "app.worker": 4.0}
+# Modules loaded by a cold import per entry point (about 1.2x the measured
+# 1656 / 1251); unlike wall-clock time this does not depend on the machine
+IMPORT_MODULE_BUDGET: dict[str, int] = {"app.main": 2000, "app.worker": 1500}
+
+# List pagination (app.db.query_helpers.paginate)
+PAGINATION_COUNT_TTL_SECONDS: int = 60  # Cached filtered totals on public list endpoints
+
+# Verification cache (app.services.verification_cache): (positive, negative) TTL per kind
+VERIFICATION_CACHE_TTL_SECONDS: dict[str, tuple[int, int]] = {
+    "url": (7 * 86400, 3600),  # Dead links can come back; live ones rarely die within a week
+    "subreddit": (86400, 6 * 3600),  # Subscriber counts drift slowly
+    "trend": (6 * 3600, 3600),  # Trends data is refreshed hourly
+}
+VERIFICATION_CACHE_LOCAL_TTL_SECONDS: int = 600  # In-process tier; Redis holds the full TTL
+VERIFICATION_CACHE_LOCAL_SIZE: int = 2048  # Entries per kind in the in-process LRU
+
+# Cached query registry (app.core.cache_registry)
+CACHED_QUERY_USAGE_FLUSH_SECONDS: int = 60  # Batch parameter-usage counts into Redis this often
+CACHED_QUERY_USAGE_KEEP: int = 200  # Most requested parameter sets kept per query
+CACHED_QUERY_USAGE_TTL_SECONDS: int = 7 * 86400  # Usage of a query nobody calls fades out
+
+# Cached payload encoding (app.core.cache_codec)
+CACHE_COMPRESS_MIN_BYTES: int = 1024  # Smaller payloads gain little and cost a round of CPU
+CACHE_COMPRESS_LEVEL: int = 3  # zstd (or zlib fallback) level; fast, ~4x on insight lists
+
+# HTTP response cache (app.middleware.response_cache), anonymous GET/HEAD only:
+# path pattern -> (max-age, stale-while-revalidate, query parameters). max-age is
+# also how long the server keeps the response. Only the listed parameters are part
+# of the key; requests with any other parameter (e.g. free-text search, cursors)
+# bypass the cache, so clients cannot mint unbounded entries.
+RESPONSE_CACHE_POLICIES: dict[str, tuple[int, int, tuple[str, ...]]] = {
+    "/api/insights": (
+        60,
+        300,
+        ("min_score", "source", "sort", "featured", "limit", "offset", "language"),
+    ),
+    "/api/insights/daily-top": (300, 900, ("limit",)),
+    "/api/insights/idea-of-the-day": (900, 3600, ()),
+    "/api/pulse": (30, 120, ()),
+    "/api/trends": (300, 900, ("category", "sort", "featured", "limit", "offset")),
+    "/api/feed/rss": (900, 3600, ()),
+    "/api/explore/{slug}": (300, 900, ("limit", "offset")),
+}
+RESPONSE_CACHE_MAX_BYTES: int = 1024 * 1024  # Larger responses are passed through uncached
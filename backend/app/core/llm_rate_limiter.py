@@ -0,0 +1,157 @@
+"""Token-bucket rate limiting for LLM provider quotas.
+
+Replaces fixed sleeps between LLM calls with a limiter sized to the provider's
+requests-per-minute (RPM) and tokens-per-minute (TPM) quota. Callers acquire
+capacity before each model call; concurrent callers queue FIFO until both
+buckets have room.
+
+Usage:
+    limiter = get_llm_rate_limiter()
+    await limiter.acquire(estimated_tokens=6000)
+    result = await agent.run(prompt)
+"""
+
+import asyncio
+import logging
+import time
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Classic token bucket: holds up to `capacity` tokens, refilled continuously.
+
+    Not thread-safe on its own — LLMRateLimiter serializes access with an asyncio lock.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+            self._updated_at = now
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available (after refill)."""
+        self._refill()
+        return self._tokens
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` tokens are available (0.0 if available now)."""
+        amount = min(amount, self.capacity)
+        self._refill()
+        deficit = amount - self._tokens
+        if deficit <= 0:
+            return 0.0
+        if self.refill_per_second <= 0:
+            return float("inf")
+        return deficit / self.refill_per_second
+
+    def consume(self, amount: float) -> None:
+        """Remove `amount` tokens (clamped to capacity). Caller must check wait_time first."""
+        self._refill()
+        self._tokens -= min(amount, self.capacity)
+
+
+class LLMRateLimiter:
+    """
+    Combined RPM + TPM limiter for one LLM provider.
+
+    Both buckets start full so a cold worker can burst up to one minute of quota,
+    then settles to the steady-state refill rate.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests = TokenBucket(requests_per_minute, requests_per_minute / 60.0)
+        self.tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60.0)
+        self._lock = asyncio.Lock()
+        self.total_acquired = 0
+        self.total_wait_seconds = 0.0
+
+    async def acquire(self, estimated_tokens: int = 0) -> float:
+        """
+        Block until one request and `estimated_tokens` tokens fit within quota.
+
+        The lock is held while sleeping so waiters are served in arrival order.
+
+        Args:
+            estimated_tokens: Expected prompt + completion tokens for the call
+
+        Returns:
+            Seconds spent waiting for capacity
+        """
+        waited = 0.0
+        async with self._lock:
+            while True:
+                delay = max(
+                    self.requests.wait_time(1),
+                    self.tokens.wait_time(estimated_tokens),
+                )
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+                waited += delay
+
+            self.requests.consume(1)
+            self.tokens.consume(estimated_tokens)
+            self.total_acquired += 1
+            self.total_wait_seconds += waited
+
+        if waited > 0:
+            logger.debug(f"LLM rate limiter: waited {waited:.2f}s for capacity")
+        return waited
+
+    def get_stats(self) -> dict[str, float]:
+        """Current bucket levels and cumulative wait time."""
+        return {
+            "requests_available": round(self.requests.available, 2),
+            "tokens_available": round(self.tokens.available, 2),
+            "total_acquired": self.total_acquired,
+            "total_wait_seconds": round(self.total_wait_seconds, 2),
+        }
+
+
+# Global limiter instance (one per process)
+_llm_rate_limiter: LLMRateLimiter | None = None
+
+
+def get_llm_rate_limiter() -> LLMRateLimiter:
+    """
+    Get or create the process-wide LLM rate limiter.
+
+    Returns:
+        LLMRateLimiter: Singleton limiter sized from settings
+    """
+    global _llm_rate_limiter
+    if _llm_rate_limiter is None:
+        _llm_rate_limiter = LLMRateLimiter(
+            requests_per_minute=settings.llm_requests_per_minute,
+            tokens_per_minute=settings.llm_tokens_per_minute,
+        )
+    return _llm_rate_limiter
+
+
+def estimate_llm_tokens(prompt: str, expected_output_tokens: int | None = None) -> int:
+    """
+    Rough token estimate for quota accounting (~4 chars per token).
+
+    Args:
+        prompt: Input text sent to the model
+        expected_output_tokens: Completion budget; defaults to settings value
+
+    Returns:
+        Estimated total tokens for the call
+    """
+    if expected_output_tokens is None:
+        expected_output_tokens = settings.llm_expected_output_tokens
+    return len(prompt or "") // 4 + expected_output_tokens
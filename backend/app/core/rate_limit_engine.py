@@ -0,0 +1,170 @@
+"""Shared GCRA rate limiting engine (Redis, with in-process fallback).
+
+Generic Cell Rate Algorithm: each key stores a single "theoretical arrival
+time" (TAT), so a check is O(1) in time and memory no matter how many requests
+fall in the window, and it behaves like a sliding window of `limit` requests
+per `period` (bursts up to `limit`, then one request every period/limit).
+
+- Redis: one Lua script per check (atomic across uvicorn workers/instances,
+  clocked by Redis TIME so hosts need not agree on time)
+- Fallback: a bounded LRU of TATs per process, used while Redis is unreachable
+
+Usage:
+    result = await get_rate_limit_engine().hit("payments:1.2.3.4", limit=100, period=3600)
+    if not result.allowed:
+        ...  # 429, Retry-After: result.retry_after
+"""
+
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1] = bucket key; ARGV = emission interval (ms), period (ms), cost
+# Returns {allowed, remaining, retry_after_ms}
+_GCRA_LUA = """
+local emission = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+if tat < now then tat = now end
+local new_tat = tat + emission * cost
+local allow_at = new_tat - period
+if now < allow_at then
+    return {0, 0, math.ceil(allow_at - now)}
+end
+redis.call('SET', KEYS[1], string.format('%.3f', new_tat), 'PX', math.max(1, math.ceil(new_tat - now)))
+return {1, math.floor((period - (new_tat - now)) / emission), 0}
+"""
+
+# Seconds to stay on the local fallback after a Redis error before retrying
+_REDIS_RETRY_SECONDS = 30.0
+
+
+class RateLimitResult(NamedTuple):
+    """Outcome of one rate limit check."""
+
+    allowed: bool
+    remaining: int  # Requests still allowed right now
+    retry_after: float  # Seconds until the next request would be allowed (0 if allowed)
+
+
+class LocalGCRA:
+    """
+    In-process GCRA with a bounded key set.
+
+    Least-recently-used keys are evicted beyond `max_keys`; an evicted key simply
+    starts with a full allowance, so memory stays flat under IP churn.
+    """
+
+    def __init__(self, max_keys: int = 10_000):
+        self.max_keys = max_keys
+        self._tats: OrderedDict[str, float] = OrderedDict()
+
+    def hit(self, key: str, limit: int, period: float, cost: int = 1) -> RateLimitResult:
+        """Check and (if allowed) consume `cost` from the key's allowance."""
+        emission = period / limit
+        now = time.monotonic()
+        tat = max(self._tats.get(key, now), now)
+        new_tat = tat + emission * cost
+        allow_at = new_tat - period
+        if now < allow_at:
+            return RateLimitResult(False, 0, allow_at - now)
+
+        self._tats[key] = new_tat
+        self._tats.move_to_end(key)
+        while len(self._tats) > self.max_keys:
+            self._tats.popitem(last=False)
+        return RateLimitResult(True, math.floor((period - (new_tat - now)) / emission), 0.0)
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+
+class RateLimitEngine:
+    """GCRA limiter backed by Redis when reachable, by LocalGCRA otherwise."""
+
+    def __init__(self, use_redis: bool = True, local_max_keys: int = 10_000):
+        self.use_redis = use_redis
+        self.local = LocalGCRA(local_max_keys)
+        self._script = None
+        self._redis_retry_at = 0.0
+        self.redis_checks = 0
+        self.local_checks = 0
+
+    async def _get_script(self):
+        if not self.use_redis or time.monotonic() < self._redis_retry_at:
+            return None
+        if self._script is None:
+            from app.core.cache import get_redis
+
+            redis = await get_redis()
+            self._script = redis.register_script(_GCRA_LUA)
+        return self._script
+
+    async def hit(self, key: str, limit: int, period: float, cost: int = 1) -> RateLimitResult:
+        """
+        Check one request against `limit` requests per `period` seconds.
+
+        Denied requests do not consume allowance.
+
+        Args:
+            key: Bucket identifier (e.g. "payments:<ip>")
+            limit: Requests allowed per period (also the maximum burst)
+            period: Window length in seconds
+            cost: Units this request consumes
+
+        Returns:
+            RateLimitResult
+        """
+        try:
+            script = await self._get_script()
+            if script is not None:
+                allowed, remaining, retry_after_ms = await script(
+                    keys=[f"ratelimit:{key}"],
+                    args=[period * 1000 / limit, period * 1000, cost],
+                )
+                self.redis_checks += 1
+                return RateLimitResult(bool(allowed), int(remaining), int(retry_after_ms) / 1000)
+        except Exception as e:
+            logger.warning(f"Rate limiter falling back to in-process counters: {e}")
+            self._redis_retry_at = time.monotonic() + _REDIS_RETRY_SECONDS
+            self._script = None
+
+        self.local_checks += 1
+        return self.local.hit(key, limit, period, cost)
+
+    def get_stats(self) -> dict[str, int]:
+        """Check counts per backend and local key count."""
+        return {
+            "redis_checks": self.redis_checks,
+            "local_checks": self.local_checks,
+            "local_keys": len(self.local),
+        }
+
+
+# Global engine instance (one per process)
+_rate_limit_engine: RateLimitEngine | None = None
+
+
+def get_rate_limit_engine() -> RateLimitEngine:
+    """
+    Get or create the process-wide rate limit engine.
+
+    Returns:
+        RateLimitEngine: Singleton configured from settings
+    """
+    global _rate_limit_engine
+    if _rate_limit_engine is None:
+        _rate_limit_engine = RateLimitEngine(
+            use_redis=settings.rate_limit_use_redis,
+            local_max_keys=settings.rate_limit_local_max_keys,
+        )
+    return _rate_limit_engine
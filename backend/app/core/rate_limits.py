@@ -17,6 +17,7 @@ from slowapi import Limiter
 from slowapi.util import get_remote_address
 
 from app.core.config import settings
+from app.core.rate_limit_engine import RateLimitResult, get_rate_limit_engine
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,8 @@ TIER_RATE_LIMITS: dict[str, str] = {
 # Default for unknown tiers
 DEFAULT_RATE_LIMIT = "30/minute"
 
+_PERIOD_SECONDS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
 
 def get_identifier(request: Request) -> str:
     """
@@ -63,6 +66,36 @@ def get_tier_rate_limit(request: Request) -> str:
     return TIER_RATE_LIMITS["anonymous"]
 
 
+def parse_rate_limit(rate: str) -> tuple[int, int]:
+    """
+    Parse a SlowAPI-style limit string ("20/minute", "5/hour") into (limit, period_seconds).
+
+    Raises:
+        ValueError: Unrecognized format or period
+    """
+    count, _, unit = rate.partition("/")
+    period = _PERIOD_SECONDS.get(unit.strip().lower().rstrip("s"))
+    if period is None:
+        raise ValueError(f"Unrecognized rate limit: {rate!r}")
+    return int(count), period
+
+
+async def check_tier_rate_limit(identifier: str, tier: str | None) -> RateLimitResult:
+    """
+    Check one request against the subscription tier's limit in the shared GCRA engine.
+
+    Args:
+        identifier: Bucket owner (e.g. "user:<id>", "apikey:<id>", an IP address)
+        tier: Subscription tier; None means anonymous
+
+    Returns:
+        RateLimitResult
+    """
+    rate = TIER_RATE_LIMITS.get(tier or "anonymous", DEFAULT_RATE_LIMIT)
+    limit, period = parse_rate_limit(rate)
+    return await get_rate_limit_engine().hit(f"tier:{identifier}", limit, period)
+
+
 # Initialize SlowAPI limiter
 # Production: Redis-backed distributed rate limiting
 # Non-production: in-memory fallback (avoids Redis dependency in staging/dev)
@@ -5,14 +5,26 @@ handling soft deletes, pagination, and count queries.
 
 Code simplification Phase 1: Added count_by_field() and paginate_query() to
 eliminate 16+ duplicate count queries and 10+ pagination blocks.
+
+Keyset pagination: paginate() pages over a list of SortKeys with opaque
+cursor tokens (offset still accepted) and can serve the filtered total from
+the cache.
 """
 
+import base64
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Any, TypeVar
+from uuid import UUID
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import Select, and_, false, func, literal, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeMeta
+from sqlalchemy.sql.elements import ColumnElement
 
+from app.core.cache import cache_get_or_compute
 from app.models import User
 
 T = TypeVar("T", bound=DeclarativeMeta)
@@ -170,3 +182,194 @@ async def paginate_query(
     items = result.scalars().all()
 
     return items, total
+
+
+# ============================================
+# KEYSET PAGINATION
+# ============================================
+
+
+class InvalidCursorError(ValueError):
+    """Cursor token is malformed or belongs to a different sort (HTTP 400)."""
+
+
+def encode_cursor(values: list[Any]) -> str:
+    """
+    Opaque cursor token for the sort-key values of the last row on a page.
+
+    Args:
+        values: Sort-key values (UUIDs and datetimes are stored as strings)
+
+    Returns:
+        URL-safe token
+    """
+    raw = json.dumps(values, default=str, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> list[Any]:
+    """
+    Sort-key values from a token made by encode_cursor().
+
+    Raises:
+        InvalidCursorError: Token is malformed
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+    except ValueError as e:
+        raise InvalidCursorError(f"malformed cursor: {e}") from None
+    if not isinstance(values, list):
+        raise InvalidCursorError("cursor must encode a list")
+    return values
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """
+    One column of a keyset sort.
+
+    The last key of a sort must be unique (usually the primary key) so every
+    row has a distinct position. nulls_last marks a nullable column, ordered
+    NULLS LAST on every backend; other columns are assumed NOT NULL.
+    """
+
+    column: Any
+    descending: bool = True
+    nulls_last: bool = False
+
+    def ordering(self) -> ColumnElement:
+        """ORDER BY expression for this key."""
+        expr = self.column.desc() if self.descending else self.column.asc()
+        return expr.nulls_last() if self.nulls_last else expr
+
+    def coerce(self, value: Any) -> Any:
+        """Cursor JSON value back to the column's Python type."""
+        if value is None:
+            return None
+        try:
+            python_type = self.column.type.python_type
+        except NotImplementedError:
+            return value
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is UUID:
+            return UUID(value)
+        if python_type in (int, float) and not isinstance(value, int | float):
+            raise ValueError(f"expected a number, got {value!r}")
+        return value
+
+
+@dataclass
+class Page:
+    """One page of results with the total and a cursor for the next page."""
+
+    items: list[Any]
+    total: int
+    next_cursor: str | None = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def _after(sort: list[SortKey], values: list[Any]) -> ColumnElement:
+    """WHERE clause selecting the rows that sort after `values`."""
+    if all(key.descending == sort[0].descending and not key.nulls_last for key in sort):
+        # Uniform direction, no NULLs: one row-value comparison the index can seek on
+        columns = tuple_(*(key.column for key in sort))
+        bound = tuple_(*(literal(v, key.column.type) for key, v in zip(sort, values, strict=True)))
+        return columns < bound if sort[0].descending else columns > bound
+
+    branches = []
+    for i, key in enumerate(sort):
+        terms = [
+            prev.column.is_(None) if value is None else prev.column == value
+            for prev, value in zip(sort[:i], values[:i], strict=True)
+        ]
+        value = values[i]
+        if value is None:
+            # NULLs sort last: only later keys can advance past a NULL
+            terms.append(false())
+        else:
+            beyond = key.column < value if key.descending else key.column > value
+            terms.append(or_(beyond, key.column.is_(None)) if key.nulls_last else beyond)
+        branches.append(and_(*terms))
+    return or_(*branches)
+
+
+async def _count(db: AsyncSession, query: Select, ttl: int) -> int:
+    """Row count of `query`, cached for `ttl` seconds when ttl > 0."""
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+    if ttl <= 0:
+        return await db.scalar(count_query) or 0
+
+    compiled = count_query.compile(dialect=db.get_bind().dialect)
+    digest = hashlib.md5(f"{compiled}|{sorted(compiled.params.items())!r}".encode()).hexdigest()
+
+    async def _run_count() -> int:
+        return await db.scalar(count_query) or 0
+
+    return await cache_get_or_compute(f"count:{digest}", _run_count, ttl=ttl)
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    sort: list[SortKey],
+    *,
+    limit: int = 20,
+    offset: int = 0,
+    cursor: str | None = None,
+    count_ttl: int = 0,
+) -> Page:
+    """
+    Execute a single-entity query as one page, keyset or offset.
+
+    With a cursor the page starts after the cursor row (offset is ignored),
+    so deep pages cost the same as the first. Without one, offset is applied
+    as before. Either way the page carries a next_cursor when more rows follow.
+
+    Args:
+        db: Database session
+        query: select(Model) with filters, joins and loader options, unordered
+        sort: Sort keys, ending with a unique key
+        limit: Page size
+        offset: Offset when no cursor is given
+        cursor: next_cursor from the previous page
+        count_ttl: Cache the filtered total for this many seconds (0 = exact)
+
+    Returns:
+        Page with the model instances, total and next_cursor
+
+    Raises:
+        InvalidCursorError: Cursor is malformed or from a different sort
+    """
+    total = await _count(db, query, count_ttl)
+
+    page_query = query
+    if cursor:
+        raw = decode_cursor(cursor)
+        if len(raw) != len(sort):
+            raise InvalidCursorError("cursor does not match the requested sort")
+        try:
+            values = [key.coerce(value) for key, value in zip(sort, raw, strict=True)]
+        except (TypeError, ValueError) as e:
+            raise InvalidCursorError(f"cursor does not match the requested sort: {e}") from None
+        page_query = page_query.where(_after(sort, values))
+    elif offset:
+        page_query = page_query.offset(offset)
+
+    # Sort-key values ride along as extra columns so the cursor can be built
+    # from the last row, even when a key lives on a joined table
+    result = await db.execute(
+        page_query.add_columns(*(key.column for key in sort))
+        .order_by(*(key.ordering() for key in sort))
+        .limit(limit + 1)
+    )
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(list(rows[-1][1:]))
+    return Page(items=[row[0] for row in rows], total=total, next_cursor=next_cursor)
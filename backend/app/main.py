@@ -2,7 +2,6 @@
 
 import logging
 import os
-import uuid
 from contextlib import asynccontextmanager
 from pathlib import Path
 
@@ -19,13 +18,12 @@ from fastapi.staticfiles import StaticFiles
 from jwt.exceptions import InvalidTokenError
 from slowapi.errors import RateLimitExceeded
 from sqlalchemy.exc import IntegrityError, OperationalError
-from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.core.config import settings
 from app.core.rate_limits import limiter
-from app.middleware.api_version import APIVersionMiddleware
-from app.middleware.request_size_limit import RequestSizeLimitMiddleware
-from app.middleware.security_headers import SecurityHeadersMiddleware
+from app.db.query_helpers import InvalidCursorError
+from app.middleware.pipeline import RequestPipelineMiddleware
+from app.middleware.response_cache import ResponseCacheMiddleware
 from app.tasks import schedule_scraping_tasks, stop_scheduler
 
 # Sentry error tracking (production + staging)
@@ -93,7 +91,7 @@ async def lifespan(app: FastAPI):
     Lifespan context manager for FastAPI startup and shutdown events.
 
     Handles:
-    - Startup: Initialize task scheduler
+    - Startup: Initialize task scheduler, start the cache invalidation listener
     - Shutdown: Stop task scheduler, close DB pool, close Redis
     """
     # Startup
@@ -106,6 +104,11 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Task scheduler unavailable (Redis not configured): {e}")
 
+    # Evict L1 cache entries invalidated by other processes
+    from app.core.cache import start_invalidation_listener
+
+    await start_invalidation_listener()
+
     yield
 
     # Graceful shutdown
@@ -118,16 +121,25 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error stopping scheduler: {e}")
 
-    # 2. Close Redis connections
+    # 2. Stop the forecast process pool
+    try:
+        from app.services.forecast_engine import get_forecast_engine
+
+        get_forecast_engine().shutdown()
+    except Exception as e:
+        logger.error(f"Error stopping forecast pool: {e}")
+
+    # 3. Close Redis connections
     try:
-        from app.core.cache import close_redis
+        from app.core.cache import close_redis, stop_invalidation_listener
 
+        await stop_invalidation_listener()
         await close_redis()
         logger.info("Redis connections closed")
     except Exception as e:
         logger.error(f"Error closing Redis: {e}")
 
-    # 3. Close database connection pool
+    # 4. Close database connection pool
     try:
         from app.db.session import close_db
 
@@ -156,38 +168,16 @@ app = FastAPI(
 )
 
 
-# Request ID middleware for correlation (add BEFORE CORS)
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """Add X-Request-ID to all requests for log correlation."""
-
-    async def dispatch(self, request: Request, call_next):
-        # Generate or extract request ID
-        request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
-        request.state.request_id = request_id
-
-        # Process request
-        response = await call_next(request)
-
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
-        return response
-
+# Public read endpoints served from stored response bytes, with ETag/304
+# (innermost: hits still pass through the request pipeline below, but skip the
+# routes' SlowAPI limits since the app is not called)
+app.add_middleware(ResponseCacheMiddleware)
 
-from app.middleware.dlp_monitoring import DLPMonitoringMiddleware
-from app.middleware.session_security import SessionSecurityMiddleware
-from app.middleware.tracing import TracingMiddleware
-from app.middleware.zero_trust_security import ZeroTrustSecurityMiddleware
-
-app.add_middleware(TracingMiddleware)
-app.add_middleware(RequestIDMiddleware)
-app.add_middleware(ZeroTrustSecurityMiddleware)
-app.add_middleware(DLPMonitoringMiddleware)
-app.add_middleware(SessionSecurityMiddleware)
-
-# Security headers and API version (BEFORE CORS)
-app.add_middleware(SecurityHeadersMiddleware)
-app.add_middleware(RequestSizeLimitMiddleware)
-app.add_middleware(APIVersionMiddleware)
+# Tracing, request IDs, DLP checks, security/version headers, size and payment
+# rate limits: one fused pure-ASGI layer (runs inside CORS)
+app.add_middleware(
+    RequestPipelineMiddleware, rate_limit_max_requests=100, rate_limit_window_seconds=3600
+)
 
 # Configure CORS
 app.add_middleware(
@@ -202,11 +192,6 @@ app.add_middleware(
 # Register SlowAPI limiter (Phase 2: Code Simplification)
 app.state.limiter = limiter
 
-# Add rate limiting middleware for sensitive endpoints
-from app.middleware.rate_limiter import RateLimiterMiddleware
-
-app.add_middleware(RateLimiterMiddleware, max_requests=100, window_seconds=3600)
-
 # ============================================================================
 # Global Exception Handlers (Production Security)
 # ============================================================================
@@ -335,6 +320,15 @@ async def jwt_error_handler(request: Request, exc: InvalidTokenError):
     )
 
 
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursorError):
+    """Handle stale or tampered pagination cursors (400 errors)."""
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": f"Invalid cursor: {exc}"},
+    )
+
+
 @app.exception_handler(RateLimitExceeded)
 async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
     """
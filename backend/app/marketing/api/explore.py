@@ -2,19 +2,25 @@
 
 GET /api/explore/categories — list all SEO categories (for sitemap)
 GET /api/explore/{slug}    — insights matching a topic slug's keywords
-GET /api/widgets/trending   — embeddable widget (top 5 trending ideas, CORS: *)
+GET /api/widgets/trending   — embeddable widget (top 5 trending ideas, optional ?category=, CORS: *)
+
+Category membership is read from the materialized insight_categories index
+(app.marketing.services.category_index), not matched per request.
 """
 
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import JSONResponse
-from sqlalchemy import or_, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.constants import PAGINATION_COUNT_TTL_SECONDS
+from app.db.query_helpers import SortKey, paginate
 from app.db.session import get_db
 from app.marketing.services.seo_categories import get_all_categories, get_category
 from app.models.insight import Insight
+from app.models.insight_category import InsightCategory
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +46,7 @@ async def get_topic_insights(
     slug: str,
     limit: int = Query(20, le=50),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
     db: AsyncSession = Depends(get_db),
 ):
     """Return insights matching a topic slug's keywords for programmatic SEO pages."""
@@ -47,25 +54,21 @@ async def get_topic_insights(
     if not category:
         raise HTTPException(status_code=404, detail=f"Category '{slug}' not found")
 
-    # Build OR filter matching any keyword in title, problem_statement, or proposed_solution
-    keyword_filters = []
-    for kw in category.keywords:
-        pattern = f"%{kw}%"
-        keyword_filters.append(Insight.title.ilike(pattern))
-        keyword_filters.append(Insight.problem_statement.ilike(pattern))
-        keyword_filters.append(Insight.proposed_solution.ilike(pattern))
-
-    result = await db.execute(
+    page = await paginate(
+        db,
         select(Insight)
+        .join(InsightCategory, InsightCategory.insight_id == Insight.id)
         .where(
-            Insight.relevance_score >= 0.5,
-            or_(*keyword_filters),
-        )
-        .order_by(Insight.relevance_score.desc())
-        .offset(offset)
-        .limit(limit)
+            InsightCategory.category_slug == category.slug,
+            InsightCategory.relevance_score >= 0.5,
+        ),
+        [SortKey(InsightCategory.relevance_score), SortKey(InsightCategory.insight_id)],
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        count_ttl=PAGINATION_COUNT_TTL_SECONDS,
     )
-    insights = result.scalars().all()
+    insights = page.items
 
     return {
         "category": {
@@ -88,24 +91,39 @@ async def get_topic_insights(
             }
             for i in insights
         ],
-        "total": len(insights),
+        "total": page.total,
         "limit": limit,
         "offset": offset,
+        "next_cursor": page.next_cursor,
     }
 
 
 @router.get("/widgets/trending")
 async def widget_trending_ideas(
     limit: int = Query(5, le=10),
+    category: str | None = Query(None, description="Restrict to an explore category slug"),
     db: AsyncSession = Depends(get_db),
 ):
     """Embeddable widget endpoint — top trending ideas as JSON. CORS: allow all origins."""
-    result = await db.execute(
-        select(Insight)
-        .where(Insight.relevance_score >= 0.7)
-        .order_by(Insight.created_at.desc())
-        .limit(limit)
-    )
+    if category is None:
+        query = (
+            select(Insight)
+            .where(Insight.relevance_score >= 0.7)
+            .order_by(Insight.created_at.desc())
+        )
+    elif get_category(category):
+        query = (
+            select(Insight)
+            .join(InsightCategory, InsightCategory.insight_id == Insight.id)
+            .where(
+                InsightCategory.category_slug == category,
+                InsightCategory.relevance_score >= 0.7,
+            )
+            .order_by(InsightCategory.insight_created_at.desc())
+        )
+    else:
+        raise HTTPException(status_code=404, detail=f"Category '{category}' not found")
+    result = await db.execute(query.limit(limit))
     insights = result.scalars().all()
 
     data = [
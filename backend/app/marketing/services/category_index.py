@@ -0,0 +1,138 @@
+"""Maintenance of the materialized insight → SEO category index.
+
+insight_categories holds one row per (insight, category) match, computed
+with the same matching as search (full-text on PostgreSQL, ILIKE elsewhere):
+
+- refresh_memberships(): recompute the rows for some insights; called by the
+  Insight mapper hooks on the flush connection, so every ORM insert/update
+  keeps the index current in the same transaction
+- sync_category_index(): rebuild each category whose keyword list changed
+  since its rows were computed (and drop removed categories); runs on worker
+  startup, force=True rebuilds everything
+"""
+
+import hashlib
+import logging
+from collections import defaultdict
+from uuid import UUID
+
+from sqlalchemy import Connection, String, delete, insert, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import CompoundSelect
+
+from app.marketing.services.seo_categories import SEOCategory, get_all_categories
+from app.models.insight import Insight
+from app.models.insight_category import InsightCategory
+from app.services.insight_search import keywords_match
+
+logger = logging.getLogger(__name__)
+
+# Insight fields that decide membership or are copied into the index
+MATCHED_FIELDS = (
+    "title",
+    "problem_statement",
+    "proposed_solution",
+    "relevance_score",
+    "created_at",
+)
+
+_COLUMNS = [
+    "category_slug",
+    "insight_id",
+    "keywords_hash",
+    "relevance_score",
+    "insight_created_at",
+]
+
+
+def keywords_hash(category: SEOCategory) -> str:
+    """Short fingerprint of a category's keyword list."""
+    return hashlib.sha256("\n".join(category.keywords).encode()).hexdigest()[:16]
+
+
+def _memberships(
+    dialect_name: str,
+    categories: list[SEOCategory],
+    insight_ids: list[UUID] | None = None,
+) -> CompoundSelect:
+    """One SELECT per category, UNION ALL-ed, shaped like insight_categories."""
+    selects = []
+    for category in categories:
+        stmt = select(
+            literal(category.slug, String),
+            Insight.id,
+            literal(keywords_hash(category), String),
+            Insight.relevance_score,
+            Insight.created_at,
+        ).where(keywords_match(dialect_name, category.keywords))
+        if insight_ids is not None:
+            stmt = stmt.where(Insight.id.in_(insight_ids))
+        selects.append(stmt)
+    return union_all(*selects)
+
+
+def refresh_memberships(connection: Connection, insight_ids: list[UUID]) -> None:
+    """
+    Recompute the category rows for the given insights.
+
+    Synchronous so it can run inside a flush (mapper events); the async
+    session runs flushes on a sync connection.
+
+    Args:
+        connection: Connection of the current transaction
+        insight_ids: Insights to re-match
+    """
+    connection.execute(delete(InsightCategory).where(InsightCategory.insight_id.in_(insight_ids)))
+    connection.execute(
+        insert(InsightCategory).from_select(
+            _COLUMNS,
+            _memberships(connection.dialect.name, get_all_categories(), insight_ids),
+        )
+    )
+
+
+async def sync_category_index(db: AsyncSession, force: bool = False) -> dict:
+    """
+    Rebuild categories whose keywords changed since they were indexed.
+
+    A category with no rows (new, or matching nothing) is rebuilt too; that
+    is a single indexed query.
+
+    Args:
+        db: Database session (committed on return)
+        force: Rebuild every category
+
+    Returns:
+        Dict with the rebuilt and removed category slugs
+    """
+    categories = get_all_categories()
+    result = await db.execute(
+        select(InsightCategory.category_slug, InsightCategory.keywords_hash).group_by(
+            InsightCategory.category_slug, InsightCategory.keywords_hash
+        )
+    )
+    indexed: dict[str, set[str]] = defaultdict(set)
+    for slug, hash_ in result.all():
+        indexed[slug].add(hash_)
+
+    removed = sorted(set(indexed) - {c.slug for c in categories})
+    if removed:
+        await db.execute(delete(InsightCategory).where(InsightCategory.category_slug.in_(removed)))
+
+    dialect_name = db.get_bind().dialect.name
+    rebuilt = []
+    for category in categories:
+        if not force and indexed.get(category.slug) == {keywords_hash(category)}:
+            continue
+        await db.execute(
+            delete(InsightCategory).where(InsightCategory.category_slug == category.slug)
+        )
+        await db.execute(
+            insert(InsightCategory).from_select(_COLUMNS, _memberships(dialect_name, [category]))
+        )
+        rebuilt.append(category.slug)
+
+    await db.commit()
+    if rebuilt or removed:
+        logger.info(f"Category index: rebuilt {rebuilt}, removed {removed}")
+    return {"rebuilt": rebuilt, "removed": removed}
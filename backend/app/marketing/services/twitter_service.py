@@ -2,15 +2,17 @@
 
 import asyncio
 import logging
-
-import tweepy
+from typing import TYPE_CHECKING
 
 from app.core.config import settings
 
+if TYPE_CHECKING:
+    import tweepy
+
 logger = logging.getLogger(__name__)
 
 
-def _get_client() -> tweepy.Client | None:
+def _get_client() -> "tweepy.Client | None":
     """Build Tweepy v2 Client for posting. Returns None if creds missing."""
     if not all(
         [
@@ -23,6 +25,8 @@ def _get_client() -> tweepy.Client | None:
         logger.warning("Twitter credentials not configured — skipping")
         return None
 
+    import tweepy
+
     return tweepy.Client(
         consumer_key=settings.twitter_api_key,
         consumer_secret=settings.twitter_api_secret,
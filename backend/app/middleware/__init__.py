@@ -3,6 +3,7 @@
 Sprint 2.3: Request tracing and observability middleware.
 """
 
-from .tracing import TracingMiddleware
+from .pipeline import RequestPipelineMiddleware
+from .response_cache import ResponseCacheMiddleware
 
-__all__ = ["TracingMiddleware"]
+__all__ = ["RequestPipelineMiddleware", "ResponseCacheMiddleware"]
@@ -1,31 +1,16 @@
-"""API version header middleware.
+"""API version headers.
 
-Adds API-Version and Deprecation headers to all responses.
-Prepares the codebase for future /api/v2 versioning.
+Adds API-Version and X-API-Version headers to all responses (applied by
+RequestPipelineMiddleware). Prepares the codebase for future /api/v2 versioning.
 
 Current version: v1 (all existing endpoints)
 """
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-
 API_VERSION = "1"
 API_VERSION_FULL = "1.0.0"
 
-
-class APIVersionMiddleware(BaseHTTPMiddleware):
-    """
-    Add API version information to all responses.
-
-    Headers added:
-    - API-Version: Current API version
-    - X-API-Version: Full semantic version
-    """
-
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-
-        response.headers["API-Version"] = API_VERSION
-        response.headers["X-API-Version"] = API_VERSION_FULL
-
-        return response
+# Raw ASGI headers, encoded once at import
+API_VERSION_HEADERS: list[tuple[bytes, bytes]] = [
+    (b"api-version", API_VERSION.encode()),
+    (b"x-api-version", API_VERSION_FULL.encode()),
+]
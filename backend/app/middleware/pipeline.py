@@ -0,0 +1,173 @@
+"""Fused pure-ASGI request pipeline.
+
+Replaces the former stack of BaseHTTPMiddleware layers (tracing, request ID,
+zero-trust, DLP, session security, security headers, size limit, API version,
+rate limiter). Each BaseHTTPMiddleware added a task hop and re-wrapped the
+response, and buffered streaming/SSE bodies through every layer. This runs all
+of them in one ASGI callable:
+
+Request phase (before the app):
+- Payment endpoint rate limit -> 429
+- Content-Length size limit -> 413
+- Correlation ID / request ID, logging context, timer start
+- DLP pattern checks (logged, never blocking)
+
+Response phase (on http.response.start only; body chunks pass straight through):
+- API version, security, X-Request-ID, X-Correlation-ID and X-Response-Time-Ms headers
+- Request completion log
+"""
+
+import time
+import uuid
+
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.status import HTTP_429_TOO_MANY_REQUESTS
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging import (
+    clear_request_context,
+    generate_correlation_id,
+    get_logger,
+    set_correlation_id,
+    set_request_context,
+)
+from app.middleware.api_version import API_VERSION_HEADERS
+from app.middleware.dlp_monitoring import DLPMonitor
+from app.middleware.rate_limiter import PaymentRateLimiter
+from app.middleware.request_size_limit import exceeds_size_limit, payload_too_large_response
+from app.middleware.security_headers import build_security_headers
+
+logger = get_logger(__name__)
+
+# Per-request headers set by the pipeline (replace any set by the app)
+_DYNAMIC_HEADER_NAMES = frozenset((b"x-request-id", b"x-correlation-id", b"x-response-time-ms"))
+
+
+def _client_ip(scope: Scope, headers: Headers) -> str:
+    """Client IP from X-Forwarded-For (proxies/load balancers) or the socket peer."""
+    forwarded_for = headers.get("x-forwarded-for")
+    if forwarded_for:
+        return forwarded_for.split(",")[0].strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+class RequestPipelineMiddleware:
+    """Single pure-ASGI middleware applying all per-request cross-cutting concerns."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        rate_limit_max_requests: int = 100,
+        rate_limit_window_seconds: int = 3600,
+        dlp_suspicious_threshold: int = 10,
+        dlp_time_window_minutes: int = 60,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            app: ASGI application
+            rate_limit_max_requests: Payment endpoint requests allowed per window
+            rate_limit_window_seconds: Payment endpoint rate limit window
+            dlp_suspicious_threshold: Suspicious events per IP before alerting
+            dlp_time_window_minutes: DLP anomaly detection window
+        """
+        self.app = app
+        self.rate_limiter = PaymentRateLimiter(rate_limit_max_requests, rate_limit_window_seconds)
+        self.dlp = DLPMonitor(dlp_suspicious_threshold, dlp_time_window_minutes)
+
+        # Static response headers, encoded once (security headers vary only by scheme)
+        self._static_headers = {
+            https: API_VERSION_HEADERS + build_security_headers(https) for https in (False, True)
+        }
+        self._static_header_names = {
+            https: frozenset(name for name, _ in headers)
+            for https, headers in self._static_headers.items()
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        method = scope["method"]
+        path = scope["path"]
+        client_ip = _client_ip(scope, headers)
+        https = scope.get("scheme") == "https"
+
+        # Correlation / request IDs
+        correlation_id = headers.get("x-correlation-id") or generate_correlation_id()
+        request_id = headers.get("x-request-id") or str(uuid.uuid4())
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        start_time = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
+                message["headers"] = self._response_headers(
+                    message.get("headers", []), https, request_id, correlation_id, duration_ms
+                )
+                logger.info(
+                    f"{method} {path} -> {status_code}",
+                    method=method,
+                    path=path,
+                    status_code=status_code,
+                    duration_ms=duration_ms,
+                    client_ip=client_ip,
+                )
+            await send(message)
+
+        # Short-circuit rejections still carry version/security/correlation headers
+        if not await self.rate_limiter.allow(method, path, client_ip):
+            response = Response(content="Too Many Requests", status_code=HTTP_429_TOO_MANY_REQUESTS)
+            await response(scope, receive, send_wrapper)
+            return
+        if exceeds_size_limit(headers):
+            await payload_too_large_response()(scope, receive, send_wrapper)
+            return
+
+        set_correlation_id(correlation_id)
+        set_request_context(method=method, path=path, user_id=None, client_ip=client_ip)
+        await self.dlp.monitor_request(path, headers.get("user-agent", ""), client_ip)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            logger.error(
+                f"{method} {path} -> 500 ERROR",
+                method=method,
+                path=path,
+                status_code=500,
+                duration_ms=round((time.perf_counter() - start_time) * 1000, 2),
+                client_ip=client_ip,
+                error=str(e),
+            )
+            raise
+        finally:
+            clear_request_context()
+
+    def _response_headers(
+        self,
+        raw_headers: list[tuple[bytes, bytes]],
+        https: bool,
+        request_id: str,
+        correlation_id: str,
+        duration_ms: float,
+    ) -> list[tuple[bytes, bytes]]:
+        """Replace-or-add the pipeline's headers in one pass over the app's headers."""
+        names = self._static_header_names[https]
+        merged = [
+            (name, value)
+            for name, value in raw_headers
+            if name.lower() not in names and name.lower() not in _DYNAMIC_HEADER_NAMES
+        ]
+        merged.extend(self._static_headers[https])
+        merged.append((b"x-request-id", request_id.encode("latin-1")))
+        merged.append((b"x-correlation-id", correlation_id.encode("latin-1")))
+        merged.append((b"x-response-time-ms", str(duration_ms).encode()))
+        return merged
@@ -1,38 +1,33 @@
-"""Request size limit middleware for DoS protection."""
+"""Request size limit for DoS protection (enforced by RequestPipelineMiddleware)."""
 
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
 
 from app.core.config import settings
 
 MAX_REQUEST_SIZE = settings.max_request_size
 
 
-class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
+def exceeds_size_limit(headers: Headers) -> bool:
     """
-    Enforce maximum request body size to prevent DoS attacks.
+    Check the declared Content-Length against MAX_REQUEST_SIZE.
 
-    Limits:
-    - Maximum request size: 1MB
-    - Returns 413 Payload Too Large if exceeded
+    Missing or malformed Content-Length headers are treated as within limits.
     """
-
-    async def dispatch(self, request: Request, call_next):
-        # Check Content-Length header if present
-        content_length = request.headers.get("content-length")
-
-        if content_length:
-            try:
-                parsed_length = int(content_length)
-            except (ValueError, TypeError):
-                parsed_length = 0
-            if parsed_length > MAX_REQUEST_SIZE:
-                return JSONResponse(
-                    status_code=413,
-                    content={
-                        "detail": f"Request body too large. Maximum size: {MAX_REQUEST_SIZE / 1_000_000}MB"
-                    },
-                )
-
-        return await call_next(request)
+    content_length = headers.get("content-length")
+    if not content_length:
+        return False
+    try:
+        return int(content_length) > MAX_REQUEST_SIZE
+    except (ValueError, TypeError):
+        return False
+
+
+def payload_too_large_response() -> JSONResponse:
+    """413 Payload Too Large response for oversized requests."""
+    return JSONResponse(
+        status_code=413,
+        content={
+            "detail": f"Request body too large. Maximum size: {MAX_REQUEST_SIZE / 1_000_000}MB"
+        },
+    )
@@ -0,0 +1,253 @@
+"""HTTP response cache for public, anonymous read endpoints.
+
+Pure ASGI, inside the request pipeline (cached responses still get request
+IDs, security headers and the access log). Applies to GET/HEAD requests
+without an Authorization header on a path in RESPONSE_CACHE_POLICIES, whose
+query parameters are all declared by that path's policy (anything else is
+passed through uncached, so arbitrary parameters cannot fill the cache):
+
+- Key: path, query parameters (sorted) and the negotiated language (one of
+  SUPPORTED_LANGUAGES, however the Accept-Language header is spelled)
+- Hit: the stored body and headers are sent without calling the app; a
+  request whose If-None-Match holds the stored ETag gets a 304
+- Miss: the app's 200 response is buffered, stored with a strong ETag
+  (cache key http:{digest}), then sent, or answered with a 304 if the client
+  already holds that ETag
+
+Responses carry ETag, Age, Vary: Accept-Language and the policy's
+Cache-Control (public, max-age, stale-while-revalidate; an app-set
+Cache-Control is kept), so browsers and the CDN answer repeat requests
+themselves. invalidate_insights_cache / invalidate_trends_cache drop every
+stored response.
+
+Hits are served before the app runs, so they are exempt from the routes'
+SlowAPI limits: a hit costs no database work, and only misses reach the
+handler and count against its limit. The request pipeline's own checks
+(payload size, payment limits, DLP) still run on every request.
+"""
+
+import hashlib
+import json
+import re
+import time
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.routes.insights import parse_accept_language
+from app.core.cache import cache_get_raw, cache_set_raw
+from app.core.config import settings
+from app.core.constants import RESPONSE_CACHE_MAX_BYTES, RESPONSE_CACHE_POLICIES
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_CACHEABLE_METHODS = frozenset(("GET", "HEAD"))
+# App headers not replayed from the cache (recomputed, per-response or per-client)
+_UNSTORED_HEADERS = frozenset(
+    (b"content-length", b"date", b"server", b"set-cookie", b"etag", b"age", b"x-cache")
+)
+
+
+def _compile_policies(
+    policies: dict[str, tuple[int, int, tuple[str, ...]]],
+) -> list[tuple[re.Pattern, int, int, frozenset[str]]]:
+    """Path patterns ("/api/explore/{slug}") as regexes, with max-age, SWR and parameters."""
+    compiled = []
+    for pattern, (max_age, stale_while_revalidate, params) in policies.items():
+        regex = re.sub(r"\\\{[^/]+?\\\}", "[^/]+", re.escape(pattern))
+        compiled.append(
+            (re.compile(f"^{regex}$"), max_age, stale_while_revalidate, frozenset(params))
+        )
+    return compiled
+
+
+def _cache_key(path: str, query: list[tuple[str, str]], headers: Headers) -> str:
+    """http:{digest} of the path, sorted query parameters and negotiated language."""
+    language = parse_accept_language(headers.get("accept-language"))
+    raw = f"{path}?{urlencode(sorted(query))}|{language}"
+    return f"http:{hashlib.md5(raw.encode()).hexdigest()}"
+
+
+def _etag(body: bytes) -> str:
+    """Strong ETag of a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match uses the weak comparison: W/ prefixes are ignored."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def _is_storable(start: Message, body: bytes) -> bool:
+    """Only complete, shared-safe 200 responses are stored."""
+    if start["status"] != 200 or len(body) > RESPONSE_CACHE_MAX_BYTES:
+        return False
+    for name, value in start.get("headers", []):
+        name = name.lower()
+        if name == b"set-cookie":
+            return False
+        if name == b"cache-control" and re.search(rb"no-store|private", value.lower()):
+            return False
+    return True
+
+
+def _vary_on_language(headers: list[tuple[bytes, bytes]]) -> list[tuple[bytes, bytes]]:
+    """Add Accept-Language to the response's Vary header (it is part of the key)."""
+    for index, (name, value) in enumerate(headers):
+        if name.lower() == b"vary":
+            if b"accept-language" not in value.lower() and value.strip() != b"*":
+                headers[index] = (name, value + b", Accept-Language")
+            return headers
+    return [*headers, (b"vary", b"Accept-Language")]
+
+
+def _pack(headers: list[tuple[bytes, bytes]], etag: str, body: bytes) -> bytes:
+    """Stored entry: one line of JSON metadata, then the body."""
+    meta = {
+        "headers": [[name.decode("latin-1"), value.decode("latin-1")] for name, value in headers],
+        "etag": etag,
+        "stored_at": time.time(),
+    }
+    return json.dumps(meta, separators=(",", ":")).encode() + b"\n" + body
+
+
+def _unpack(entry: bytes) -> tuple[list[tuple[bytes, bytes]], str, float, bytes]:
+    """Headers, ETag, storage time and body of a stored entry."""
+    meta, _, body = entry.partition(b"\n")
+    data = json.loads(meta)
+    headers = [(name.encode("latin-1"), value.encode("latin-1")) for name, value in data["headers"]]
+    return headers, data["etag"], data["stored_at"], body
+
+
+class ResponseCacheMiddleware:
+    """Serve public read endpoints from stored response bytes, with ETag/304 support."""
+
+    def __init__(
+        self, app: ASGIApp, policies: dict[str, tuple[int, int, tuple[str, ...]]] | None = None
+    ):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: ASGI application
+            policies: Path pattern -> (max-age and stale-while-revalidate seconds,
+                cacheable query parameters); defaults to RESPONSE_CACHE_POLICIES
+        """
+        self.app = app
+        self._policies = _compile_policies(
+            RESPONSE_CACHE_POLICIES if policies is None else policies
+        )
+
+    def _policy(self, path: str) -> tuple[int, int, frozenset[str]] | None:
+        for regex, max_age, stale_while_revalidate, params in self._policies:
+            if regex.match(path):
+                return max_age, stale_while_revalidate, params
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in _CACHEABLE_METHODS
+            or not settings.response_cache_enabled
+        ):
+            await self.app(scope, receive, send)
+            return
+        policy = self._policy(scope["path"])
+        headers = Headers(scope=scope)
+        if policy is None or "authorization" in headers:
+            await self.app(scope, receive, send)
+            return
+
+        max_age, stale_while_revalidate, params = policy
+        query = parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True)
+        if any(name not in params for name, _ in query):
+            await self.app(scope, receive, send)
+            return
+
+        cache_control = (
+            f"public, max-age={max_age}, stale-while-revalidate={stale_while_revalidate}"
+        )
+        key = _cache_key(scope["path"], query, headers)
+        if_none_match = headers.get("if-none-match")
+
+        entry = await cache_get_raw(key)
+        if entry is not None:
+            try:
+                stored_headers, etag, stored_at, body = _unpack(entry)
+            except ValueError as e:
+                logger.warning(f"Unreadable cached response for {scope['path']}: {e}")
+            else:
+                age = max(0, int(time.time() - stored_at))
+                if age < max_age:  # L1 may outlive the Redis TTL by a little
+                    await self._send(
+                        send, stored_headers, etag, body, cache_control, age, if_none_match, b"HIT"
+                    )
+                    return
+
+        start: Message | None = None
+        chunks: list[bytes] = []
+
+        async def capture(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+        if start is None:
+            return
+        body = b"".join(chunks)
+
+        if not _is_storable(start, body):
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        app_headers = _vary_on_language(
+            [
+                (name, value)
+                for name, value in start.get("headers", [])
+                if name.lower() not in _UNSTORED_HEADERS
+            ]
+        )
+        etag = _etag(body)
+        await cache_set_raw(key, _pack(app_headers, etag, body), max_age)
+        await self._send(send, app_headers, etag, body, cache_control, 0, if_none_match, b"MISS")
+
+    @staticmethod
+    async def _send(
+        send: Send,
+        app_headers: list[tuple[bytes, bytes]],
+        etag: str,
+        body: bytes,
+        cache_control: str,
+        age: int,
+        if_none_match: str | None,
+        cache_status: bytes,
+    ) -> None:
+        """Send a stored or just-stored response, or a 304 if the client holds its ETag."""
+        names = {name.lower() for name, _ in app_headers}
+        validators = [
+            (b"etag", etag.encode("latin-1")),
+            (b"age", str(age).encode()),
+            (b"x-cache", cache_status),
+        ]
+        if b"cache-control" not in names:
+            validators.append((b"cache-control", cache_control.encode()))
+
+        if _etag_matches(if_none_match, etag):
+            # 304 repeats the caching headers only (RFC 9110 15.4.5)
+            kept = [(n, v) for n, v in app_headers if n.lower() in (b"cache-control", b"vary")]
+            await send({"type": "http.response.start", "status": 304, "headers": kept + validators})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        headers = [*app_headers, (b"content-length", str(len(body)).encode()), *validators]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
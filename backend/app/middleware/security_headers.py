@@ -1,51 +1,47 @@
-"""Security headers middleware for production hardening."""
-
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+"""Security headers for production hardening (applied by RequestPipelineMiddleware)."""
 
 from app.core.config import settings
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+def build_security_headers(https: bool) -> list[tuple[bytes, bytes]]:
     """
-    Add security headers to all responses.
+    Build the security headers added to every response, as raw ASGI headers.
 
     Headers added:
     - X-Frame-Options: Prevent clickjacking attacks
     - X-Content-Type-Options: Prevent MIME sniffing
-    - Strict-Transport-Security (HSTS): Enforce HTTPS
+    - Strict-Transport-Security (HSTS): Enforce HTTPS (HTTPS connections only)
     - X-XSS-Protection: Enable browser XSS protection (legacy but harmless)
     - Referrer-Policy: Control referrer information
     - Content-Security-Policy: Restrict resource loading
-    """
 
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
+    Args:
+        https: Whether the request arrived over HTTPS
 
+    Returns:
+        List of (name, value) byte pairs
+    """
+    headers = {
         # Prevent clickjacking
-        response.headers["X-Frame-Options"] = "DENY"
-
+        "x-frame-options": "DENY",
         # Prevent MIME sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
-
-        # HTTPS enforcement (HSTS) - only for HTTPS connections
-        if request.url.scheme == "https":
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-
+        "x-content-type-options": "nosniff",
         # XSS protection (legacy but harmless)
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-
+        "x-xss-protection": "1; mode=block",
         # Privacy header
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-
+        "referrer-policy": "strict-origin-when-cross-origin",
         # Content Security Policy (adjust based on needs)
-        response.headers["Content-Security-Policy"] = (
+        "content-security-policy": (
             "default-src 'self'; "
             "script-src 'self' 'unsafe-inline'; "
             "style-src 'self' 'unsafe-inline'; "
             "img-src 'self' data: https:; "
             "font-src 'self' data:; "
             f"connect-src {settings.csp_connect_src};"
-        )
+        ),
+    }
+    # HTTPS enforcement (HSTS) - only for HTTPS connections
+    if https:
+        headers["strict-transport-security"] = "max-age=31536000; includeSubDomains"
 
-        return response
+    return [(name.encode(), value.encode()) for name, value in headers.items()]
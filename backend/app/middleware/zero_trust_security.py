@@ -1,118 +0,0 @@
-"""Zero-trust security middleware for StartInsight."""
-
-import logging
-
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-
-logger = logging.getLogger(__name__)
-
-
-class ZeroTrustSecurityMiddleware(BaseHTTPMiddleware):
-    """
-    Zero-trust security middleware implementing security-by-design principles.
-
-    This middleware enforces:
-    - Principle of least privilege
-    - Continuous verification
-    - Explicit trust requirements
-    - Enhanced authentication and authorization
-    """
-
-    def __init__(self, app, enforce_strict_security: bool = True):
-        """
-        Initialize zero-trust security middleware.
-
-        Args:
-            app: Starlette application
-            enforce_strict_security: Whether to enforce strict security checks
-        """
-        super().__init__(app)
-        self.enforce_strict_security = enforce_strict_security
-
-    async def dispatch(self, request: Request, call_next):
-        # Perform zero-trust security checks
-        if self.enforce_strict_security:
-            # Check for security headers
-            if not self._validate_security_headers(request):
-                logger.warning("Security headers missing or incorrect")
-                # In production, you might want to reject the request
-                # For now, we'll log and continue
-
-            # Validate request integrity
-            if not self._validate_request_integrity(request):
-                logger.warning("Request integrity check failed")
-                # In production, you might want to reject the request
-                # For now, we'll log and continue
-
-            # Check for suspicious patterns
-            if self._detect_suspicious_patterns(request):
-                logger.warning("Suspicious patterns detected in request")
-                # In production, you might want to reject the request
-                # For now, we'll log and continue
-
-        # Continue with normal processing
-        return await call_next(request)
-
-    def _validate_security_headers(self, request: Request) -> bool:
-        """
-        Validate essential security headers.
-
-        Returns:
-            True if all required security headers are present and valid
-        """
-        # In a real implementation, you'd check:
-        # - Content Security Policy (CSP) headers
-        # - X-Content-Type-Options
-        # - X-Frame-Options
-        # - X-XSS-Protection
-        # - Strict Transport Security (HSTS)
-        # - Referrer Policy
-
-        return True  # Placeholder for actual validation
-
-    def _validate_request_integrity(self, request: Request) -> bool:
-        """
-        Validate request integrity.
-
-        Returns:
-            True if request appears valid and intact
-        """
-        # In a real implementation, you'd check:
-        # - Request size limits
-        # - Header validation
-        # - Body content validation
-        # - Request path validation
-
-        return True  # Placeholder for actual validation
-
-    def _detect_suspicious_patterns(self, request: Request) -> bool:
-        """
-        Detect suspicious patterns in requests.
-
-        Returns:
-            True if suspicious patterns are detected
-        """
-        # In a real implementation, you'd check for:
-        # - Unusual request patterns
-        # - Suspicious user agent strings
-        # - Path traversal attempts
-        # - SQL injection attempts
-        # - Cross-site scripting attempts
-
-        return False  # Placeholder for actual detection
-
-    def _validate_authentication(self, request: Request) -> bool:
-        """
-        Validate authentication for sensitive endpoints.
-
-        Returns:
-            True if authentication is valid
-        """
-        # In a real implementation, you'd check:
-        # - JWT token validity
-        # - Token expiration
-        # - Role-based access control
-        # - Session validity
-
-        return True  # Placeholder for actual validation
@@ -9,6 +9,7 @@ Phase 5.2: ResearchRequest (admin approval queue for research)
 Phase 5.2-5.4: Build tools, export, and real-time feed
 Phase 6.1: Subscription, PaymentHistory, WebhookEvent (Stripe payments)
 Phase 6.4: Team, TeamMember, TeamInvitation, SharedInsight (collaboration)
+Phase 6.4B: InsightCorrelationIndex (cross-source correlation LSH index)
 Phase 7.2: APIKey, APIKeyUsageLog (public API)
 Phase 7.3: Tenant, TenantUser (multi-tenancy)
 Phase 8.1: ContentReviewQueue, ContentSimilarity (content quality management)
@@ -21,6 +22,7 @@ Phase 9.3: IdeaVote, IdeaComment, CommentUpvote, IdeaPoll, PollResponse (communi
 Phase 9.5: FounderProfile, FounderConnection, IdeaClub, ClubMember, ClubPost (social)
 Phase 9.6: Achievement, UserAchievement, UserPoints, UserCredits, CreditTransaction (gamification)
 Phase 12.2: Tool, SuccessStory, Trend, MarketInsight (IdeaBrowser public content)
+TrendPoint: realtime Google Trends time series (keyword, geo, ts, value)
 """
 
 from app.models.admin_user import AdminUser
@@ -46,6 +48,8 @@ from app.models.gamification import (
 # Phase 9.2: Idea Chat
 from app.models.idea_chat import IdeaChat, IdeaChatMessage
 from app.models.insight import Insight
+from app.models.insight_category import InsightCategory
+from app.models.insight_correlation_index import InsightCorrelationIndex
 from app.models.insight_interaction import InsightInteraction
 
 # Phase 10: Integrations
@@ -85,6 +89,7 @@ from app.models.team import SharedInsight, Team, TeamInvitation, TeamMember
 from app.models.tenant import Tenant, TenantUser
 from app.models.tool import Tool
 from app.models.trend import Trend
+from app.models.trend_point import TrendPoint
 from app.models.user import User
 from app.models.user_analytics import UserActivityEvent, UserSession
 
@@ -97,6 +102,8 @@ __all__ = [
     # Phase 1-3
     "RawSignal",
     "Insight",
+    "InsightCategory",
+    "InsightCorrelationIndex",
     # Phase 4.1
     "User",
     "SavedInsight",
@@ -177,6 +184,7 @@ __all__ = [
     "Tool",
     "SuccessStory",
     "Trend",
+    "TrendPoint",
     "MarketInsight",
     # Phase 17: Content Automation Pipeline
     "PipelineRun",
@@ -7,13 +7,30 @@ Phase 4.3: Enhanced 8-dimension scoring (IdeaBrowser parity)
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text, func
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import (
+    Computed,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
 
+# Full-text search document (migration c022): title weighted above body text
+SEARCH_DOCUMENT_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(problem_statement, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(proposed_solution, '')), 'B')"
+)
+
 
 class Insight(Base):
     """
@@ -256,6 +273,13 @@ class Insight(Base):
         doc="Trending keywords with search volume and growth percentage",
     )
 
+    # Validation Metadata: per-validator outcome of the post-LLM checks
+    validation_metadata: Mapped[dict | None] = mapped_column(
+        JSONB,
+        nullable=True,
+        doc="Post-LLM validation stage: status, latency_ms and counts per validator",
+    )
+
     # ============================================
     # Phase 15: APAC Language Support
     # ============================================
@@ -340,6 +364,17 @@ class Insight(Base):
         doc="Number of sources discussing similar topic",
     )
 
+    # ============================================
+    # Full-text search (app/services/insight_search.py)
+    # ============================================
+
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_DOCUMENT_SQL, persisted=True),
+        deferred=True,
+        doc="Generated tsvector over title, problem and solution (GIN-indexed)",
+    )
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -382,6 +417,8 @@ class Insight(Base):
         doc="Competitor companies for this startup idea (Phase 9.2)",
     )
 
+    __table_args__ = (Index("ix_insights_search_vector", "search_vector", postgresql_using="gin"),)
+
     def __repr__(self) -> str:
         """String representation of Insight."""
         return (
@@ -0,0 +1,100 @@
+"""Materialized insight → SEO category membership (programmatic explore pages).
+
+One row per (insight, category) match, so /api/explore/{slug} and the
+category widget are index range scans instead of matching every category
+keyword against every insight per page view.
+
+Rows are kept current by the mapper hooks below (insert, or an update that
+touches matched text or the copied sort keys) and rebuilt per category when
+its keyword list changes (see app.marketing.services.category_index).
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, event, func, inspect
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.models.insight import Insight
+
+
+class InsightCategory(Base):
+    """
+    One insight matched by one SEO category.
+
+    relevance_score and insight_created_at are copies of the insight's values
+    so category pages sort and paginate on this table alone.
+    """
+
+    __tablename__ = "insight_categories"
+
+    category_slug: Mapped[str] = mapped_column(
+        String(100),
+        primary_key=True,
+    )
+
+    insight_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("insights.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
+
+    # Hash of the category's keyword list when this row was computed; a
+    # category whose hash changed is rebuilt
+    keywords_hash: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+    )
+
+    # Copy of insights.relevance_score (explore page sort key)
+    relevance_score: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+    )
+
+    # Copy of insights.created_at (widget sort key)
+    insight_created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+
+    indexed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
+
+    # Scanned backward for the DESC orderings the explore endpoints use
+    __table_args__ = (
+        Index(
+            "ix_insight_categories_slug_relevance",
+            "category_slug",
+            "relevance_score",
+            "insight_id",
+        ),
+        Index(
+            "ix_insight_categories_slug_created",
+            "category_slug",
+            "insight_created_at",
+        ),
+    )
+
+
+@event.listens_for(Insight, "after_insert")
+def _index_new_insight(mapper, connection, target: Insight) -> None:
+    """Compute a new insight's categories on the flush connection."""
+    from app.marketing.services.category_index import refresh_memberships
+
+    refresh_memberships(connection, [target.id])
+
+
+@event.listens_for(Insight, "after_update")
+def _reindex_updated_insight(mapper, connection, target: Insight) -> None:
+    """Recompute categories when matched text or a copied sort key changed."""
+    from app.marketing.services.category_index import MATCHED_FIELDS, refresh_memberships
+
+    attrs = inspect(target).attrs
+    if any(attrs[field].history.has_changes() for field in MATCHED_FIELDS):
+        refresh_memberships(connection, [target.id])
@@ -0,0 +1,74 @@
+"""Persisted near-duplicate index for cross-source signal correlation (Phase 6.4B).
+
+Each approved insight is tokenised once and stored with its term counts and
+MinHash-LSH band keys. The correlation job looks up candidates by band-key
+overlap (GIN index) instead of re-tokenising the whole correlation window.
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, String, func
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class InsightCorrelationIndex(Base):
+    """
+    One row per indexed insight.
+
+    term_counts holds raw term frequencies so TF-IDF can be recomputed over
+    any candidate neighbourhood; band_keys holds the LSH bucket keys derived
+    from the MinHash signature.
+    """
+
+    __tablename__ = "insight_correlation_index"
+
+    insight_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("insights.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # Raw signal source (reddit, product_hunt, ...) — same-source pairs are skipped
+    source: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+    )
+
+    # Copy of insights.created_at so window filtering stays on this table
+    insight_created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        index=True,
+    )
+
+    # {term: count} from title + problem_statement
+    term_counts: Mapped[dict] = mapped_column(
+        JSON,
+        nullable=False,
+        default=dict,
+    )
+
+    # MinHash-LSH bucket keys ("<band>:<digest>")
+    band_keys: Mapped[list[str]] = mapped_column(
+        ARRAY(String(24)),
+        nullable=False,
+        default=list,
+    )
+
+    indexed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_insight_correlation_index_band_keys",
+            "band_keys",
+            postgresql_using="gin",
+        ),
+    )
@@ -0,0 +1,57 @@
+"""Append-only realtime Google Trends time series.
+
+Replaces the raw_signals.extra_metadata["trend_data_realtime"] JSON blob.
+One row per (keyword, geo, ts); the primary key covers `value` so range reads
+are index-only scans, and a BRIN index on ts makes range retention cheap.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, PrimaryKeyConstraint, SmallInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class TrendPoint(Base):
+    """
+    A single realtime interest sample (0-100) for a keyword in a region.
+
+    Written by hourly_trends_update_task; read through app.services.trend_points.
+    """
+
+    __tablename__ = "trend_points"
+
+    keyword: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+    )
+
+    # Google Trends geo code (US, MY, SG, ...)
+    geo: Mapped[str] = mapped_column(
+        String(10),
+        nullable=False,
+        default="US",
+    )
+
+    ts: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+
+    # Google Trends interest score (0-100)
+    value: Mapped[int] = mapped_column(
+        SmallInteger,
+        nullable=False,
+    )
+
+    __table_args__ = (
+        PrimaryKeyConstraint(
+            "keyword",
+            "geo",
+            "ts",
+            name="pk_trend_points",
+            postgresql_include=["value"],
+        ),
+        Index("ix_trend_points_ts_brin", "ts", postgresql_using="brin"),
+    )
@@ -34,6 +34,8 @@ class LLMCallMetrics:
     success: bool  # Whether call succeeded
     error: str | None = None  # Error message if failed
     cost_usd: float = 0.0  # Estimated cost in USD
+    ttft_ms: float | None = None  # Time to first token (streaming calls only)
+    tokens_per_second: float | None = None  # Output decode rate (streaming calls only)
 
     def __post_init__(self):
         """Calculate cost after initialization."""
@@ -62,6 +64,13 @@ class InsightMetrics:
     relevance_scores: list[float] = field(default_factory=list)
     llm_calls: list[LLMCallMetrics] = field(default_factory=list)
     errors_by_type: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    # Post-LLM validators: latencies and outcome counts (ok/timeout/error) by validator
+    validation_latencies_ms: dict[str, list[float]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    validation_outcomes: dict[str, dict[str, int]] = field(
+        default_factory=lambda: defaultdict(lambda: defaultdict(int))
+    )
 
     @property
     def average_relevance_score(self) -> float:
@@ -83,6 +92,26 @@ class InsightMetrics:
             return 0.0
         return sum(call.latency_ms for call in successful_calls) / len(successful_calls)
 
+    @property
+    def average_ttft_ms(self) -> float:
+        """Calculate average time to first token across streaming calls."""
+        values = [c.ttft_ms for c in self.llm_calls if c.success and c.ttft_ms is not None]
+        if not values:
+            return 0.0
+        return sum(values) / len(values)
+
+    @property
+    def average_tokens_per_second(self) -> float:
+        """Calculate average output tokens/s across streaming calls."""
+        values = [
+            c.tokens_per_second
+            for c in self.llm_calls
+            if c.success and c.tokens_per_second is not None
+        ]
+        if not values:
+            return 0.0
+        return sum(values) / len(values)
+
     @property
     def success_rate(self) -> float:
         """Calculate success rate as percentage."""
@@ -131,6 +160,8 @@ class MetricsTracker:
         latency_ms: float,
         success: bool,
         error: str | None = None,
+        ttft_ms: float | None = None,
+        tokens_per_second: float | None = None,
     ) -> None:
         """
         Track a single LLM API call.
@@ -144,6 +175,8 @@ class MetricsTracker:
             latency_ms: API call latency in milliseconds
             success: Whether the call succeeded
             error: Error message if failed
+            ttft_ms: Time to first streamed token in milliseconds (streaming only)
+            tokens_per_second: Output tokens per second after the first token (streaming only)
         """
         call_metrics = LLMCallMetrics(
             timestamp=datetime.now(UTC),
@@ -155,6 +188,8 @@ class MetricsTracker:
             latency_ms=latency_ms,
             success=success,
             error=error,
+            ttft_ms=ttft_ms,
+            tokens_per_second=tokens_per_second,
         )
 
         self.metrics.llm_calls.append(call_metrics)
@@ -164,6 +199,8 @@ class MetricsTracker:
             f"LLM Call: model={model}, tokens={input_tokens}/{output_tokens}, "
             f"latency={latency_ms:.0f}ms, cost=${call_metrics.cost_usd:.4f}, "
             f"success={success}"
+            + (f", ttft={ttft_ms:.0f}ms" if ttft_ms is not None else "")
+            + (f", rate={tokens_per_second:.1f}tok/s" if tokens_per_second is not None else "")
         )
 
         if not success and error:
@@ -210,6 +247,20 @@ class MetricsTracker:
                 f"total_failed={self.metrics.total_insights_failed}"
             )
 
+    def track_validation(self, validator: str, latency_ms: float, status: str) -> None:
+        """
+        Track one post-LLM validator run.
+
+        Args:
+            validator: Validator name (community, trend, url)
+            latency_ms: Wall time including any timeout
+            status: "ok", "timeout" or "error"
+        """
+        self.metrics.validation_latencies_ms[validator].append(latency_ms)
+        self.metrics.validation_outcomes[validator][status] += 1
+
+        logger.info(f"Validation: {validator} {status} in {latency_ms:.0f}ms")
+
     def get_summary(self) -> dict[str, Any]:
         """
         Get metrics summary.
@@ -228,8 +279,19 @@ class MetricsTracker:
                 "total_calls": len(self.metrics.llm_calls),
                 "total_cost_usd": f"${self.metrics.total_cost_usd:.4f}",
                 "average_latency_ms": f"{self.metrics.average_latency_ms:.0f}",
+                "average_ttft_ms": f"{self.metrics.average_ttft_ms:.0f}",
+                "average_tokens_per_second": f"{self.metrics.average_tokens_per_second:.1f}",
             },
             "errors": dict(self.metrics.errors_by_type),
+            "validation": {
+                validator: {
+                    "runs": len(latencies),
+                    "average_latency_ms": f"{sum(latencies) / len(latencies):.0f}",
+                    "max_latency_ms": f"{max(latencies):.0f}",
+                    **self.metrics.validation_outcomes[validator],
+                }
+                for validator, latencies in self.metrics.validation_latencies_ms.items()
+            },
         }
 
     def log_summary(self) -> None:
@@ -312,6 +312,7 @@ class InsightAdminListResponse(BaseModel):
     pending_count: int
     approved_count: int
     rejected_count: int
+    next_cursor: str | None = None
 
 
 class ReviewQueueResponse(BaseModel):
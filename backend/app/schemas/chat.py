@@ -81,3 +81,4 @@ class ChatListResponse(BaseModel):
 
     items: list[ChatListItem]
     total: int
+    next_cursor: str | None = None
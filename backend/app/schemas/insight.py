@@ -209,6 +209,12 @@ class InsightResponse(BaseModel):
     # Freemium paywall access metadata (injected at runtime, not stored in DB)
     report_access: dict[str, Any] | None = None
 
+    # Full-text search results only (list_insights with `search`)
+    search_rank: float | None = None
+    search_highlight: str | None = Field(
+        default=None, description="Matching fragment, HTML-escaped, matches wrapped in <mark>"
+    )
+
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
@@ -219,3 +225,4 @@ class InsightListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: str | None = None
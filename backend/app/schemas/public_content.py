@@ -203,6 +203,7 @@ class TrendListResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: str | None = None
 
 
 # =============================================================================
@@ -213,6 +213,7 @@ class ResearchAnalysisListResponse(BaseModel):
 
     items: list[ResearchAnalysisSummary]
     total: int
+    next_cursor: str | None = None
 
 
 # ============================================
@@ -43,6 +43,7 @@ class RawSignalListResponse(BaseModel):
     limit: int = Field(..., description="Number of signals per page")
     offset: int = Field(..., description="Number of signals skipped")
     has_more: bool = Field(..., description="Whether there are more signals available")
+    next_cursor: str | None = Field(None, description="Cursor for the next page")
 
 
 class SignalStatsResponse(BaseModel):
@@ -6,19 +6,22 @@ including common functionality for:
 - Logging scraping activity
 - Error handling with retry logic
 - Rate limiting integration
-- Data deduplication
+- Set-based data deduplication (one lookup per key, one multi-row INSERT)
 - Per-scraper circuit breakers (Phase 6.1A)
 """
 
 import hashlib
 import logging
 import time
+import uuid
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from dataclasses import asdict, dataclass
 from enum import Enum
 
 import httpx
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from tenacity import (
     before_sleep_log,
@@ -185,6 +188,26 @@ def create_retry_decorator(
 scraper_retry = create_retry_decorator(max_attempts=3, min_wait=2, max_wait=30)
 
 
+@dataclass
+class SaveStats:
+    """Outcome counters for one BaseScraper.save_to_database call."""
+
+    received: int = 0
+    inserted: int = 0
+    deduplicated_by_hash: int = 0
+    deduplicated_by_url: int = 0
+    errors: int = 0
+
+    @property
+    def duplicates_skipped(self) -> int:
+        """Total results skipped as duplicates."""
+        return self.deduplicated_by_hash + self.deduplicated_by_url
+
+    def to_dict(self) -> dict[str, int]:
+        """Serialize counters for task results."""
+        return asdict(self)
+
+
 class BaseScraper(ABC):
     """
     Abstract base class for all data scrapers.
@@ -206,6 +229,7 @@ class BaseScraper(ABC):
             source_name: Identifier for this data source (e.g., "reddit", "product_hunt")
         """
         self.source_name = source_name
+        self.last_save_stats = SaveStats()
         logger.info(f"Initialized {source_name} scraper")
 
     @abstractmethod
@@ -227,9 +251,14 @@ class BaseScraper(ABC):
         self, session: AsyncSession, results: list[ScrapeResult]
     ) -> list[RawSignal]:
         """
-        Save scrape results to database with deduplication.
+        Save scrape results to database with set-based deduplication.
+
+        The whole batch is hashed up front, existing hashes and URLs are resolved
+        with one query each, and new rows are written with a single multi-row
+        INSERT ... ON CONFLICT (content_hash) DO NOTHING RETURNING. A batch of N
+        results therefore costs three round trips instead of 2N.
 
-        Uses content hash to prevent storing duplicate content.
+        Dedup counts are stored on ``self.last_save_stats``.
 
         Args:
             session: Async database session
@@ -245,74 +274,105 @@ class BaseScraper(ABC):
             >>>     signals = await scraper.save_to_database(session, results)
             >>>     await session.commit()
         """
+        stats = SaveStats(received=len(results))
+        self.last_save_stats = stats
+
         if not results:
             logger.warning(f"No results to save from {self.source_name}")
             return []
 
-        signals: list[RawSignal] = []
-        duplicates_skipped = 0
-
+        # Step 1: hash the batch and drop in-batch duplicates (keyed by hash, then URL)
+        rows_by_hash: dict[str, dict] = {}
+        batch_urls: set[str] = set()
         for result in results:
             try:
-                # Compute content hash for deduplication
                 content_hash = self.compute_content_hash(result.content)
-
-                # Check if content already exists
-                existing_query = select(RawSignal).where(RawSignal.content_hash == content_hash)
-                existing_result = await session.execute(existing_query)
-                existing = existing_result.scalar_one_or_none()
-
-                if existing:
-                    logger.debug(
-                        f"Duplicate content skipped: {result.url} (matches signal {existing.id})"
-                    )
-                    duplicates_skipped += 1
+                url = str(result.url)
+                if content_hash in rows_by_hash:
+                    stats.deduplicated_by_hash += 1
                     continue
-
-                # Also check URL deduplication (less strict)
-                url_query = select(RawSignal).where(
-                    RawSignal.url == str(result.url),
-                    RawSignal.source == self.source_name,
-                )
-                url_result = await session.execute(url_query)
-                url_existing = url_result.scalar_one_or_none()
-
-                if url_existing:
-                    logger.debug(f"Duplicate URL skipped: {result.url}")
-                    duplicates_skipped += 1
+                if url in batch_urls:
+                    stats.deduplicated_by_url += 1
                     continue
 
-                # Create RawSignal model instance
-                signal = RawSignal(
-                    source=self.source_name,
-                    url=str(result.url),
-                    content=result.content,
-                    content_hash=content_hash,
-                    extra_metadata={
+                rows_by_hash[content_hash] = {
+                    "id": uuid.uuid4(),
+                    "source": self.source_name,
+                    "url": url,
+                    "content": result.content,
+                    "content_hash": content_hash,
+                    "extra_metadata": {
                         "title": result.title,
                         **result.metadata,
                     },
-                    processed=False,
-                )
+                    "processed": False,
+                }
+                batch_urls.add(url)
+            except Exception as e:
+                stats.errors += 1
+                logger.error(f"Error creating signal for {result.url}: {type(e).__name__} - {e}")
 
-                session.add(signal)
-                signals.append(signal)
+        if not rows_by_hash:
+            self._log_save_summary(stats)
+            return []
 
-                logger.debug(f"Added signal from {self.source_name}: {result.title or result.url}")
+        # Step 2: resolve existing hashes and URLs with one query each
+        hash_result = await session.execute(
+            select(RawSignal.content_hash).where(RawSignal.content_hash.in_(list(rows_by_hash)))
+        )
+        existing_hashes = set(hash_result.scalars().all())
 
-            except Exception as e:
-                logger.error(f"Error creating signal for {result.url}: {type(e).__name__} - {e}")
-                continue
+        url_result = await session.execute(
+            select(RawSignal.url).where(
+                RawSignal.source == self.source_name,
+                RawSignal.url.in_(list(batch_urls)),
+            )
+        )
+        existing_urls = set(url_result.scalars().all())
+
+        rows: list[dict] = []
+        for content_hash, row in rows_by_hash.items():
+            if content_hash in existing_hashes:
+                logger.debug(f"Duplicate content skipped: {row['url']}")
+                stats.deduplicated_by_hash += 1
+            elif row["url"] in existing_urls:
+                logger.debug(f"Duplicate URL skipped: {row['url']}")
+                stats.deduplicated_by_url += 1
+            else:
+                rows.append(row)
+
+        if not rows:
+            self._log_save_summary(stats)
+            return []
+
+        # Step 3: single multi-row INSERT; rows raced in by a concurrent run are
+        # dropped by the partial unique index on content_hash. RETURNING is left
+        # unordered: ordering keys rows on the client-side id sentinel, and a
+        # batch with a dropped row would then fail as a whole.
+        stmt = (
+            insert(RawSignal)
+            .on_conflict_do_nothing(
+                index_elements=["content_hash"],
+                index_where=RawSignal.content_hash.isnot(None),
+            )
+            .returning(RawSignal)
+        )
+        insert_result = await session.execute(stmt, rows)
+        signals: list[RawSignal] = list(insert_result.scalars().all())
 
-        # Flush to get IDs without committing
-        # (commit should be handled by caller)
-        await session.flush()
+        stats.deduplicated_by_hash += len(rows) - len(signals)
+        stats.inserted = len(signals)
 
+        self._log_save_summary(stats)
+        return signals
+
+    def _log_save_summary(self, stats: "SaveStats") -> None:
+        """Log the outcome of a save_to_database call."""
         logger.info(
-            f"Saved {len(signals)} signals from {self.source_name} to database "
-            f"({duplicates_skipped} duplicates skipped)"
+            f"Saved {stats.inserted} signals from {self.source_name} to database "
+            f"({stats.duplicates_skipped} duplicates skipped: "
+            f"{stats.deduplicated_by_hash} by hash, {stats.deduplicated_by_url} by URL)"
         )
-        return signals
 
     @staticmethod
     def compute_content_hash(content: str) -> str:
@@ -2,9 +2,11 @@
 
 import asyncio
 import logging
-from typing import Any
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
 
-from crawl4ai import AsyncWebCrawler
 from pydantic import BaseModel, Field, HttpUrl
 from tenacity import (
     retry,
@@ -13,6 +15,11 @@ from tenacity import (
     wait_exponential,
 )
 
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from crawl4ai import AsyncWebCrawler
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,6 +40,117 @@ class ScrapeResult(BaseModel):
     )
 
 
+class _PooledCrawler:
+    """A started AsyncWebCrawler plus its usage counters."""
+
+    def __init__(self, crawler: "AsyncWebCrawler"):
+        self.crawler = crawler
+        self.pages_served = 0
+        self.created_at = time.monotonic()
+
+
+class BrowserPool:
+    """
+    Size-bounded pool of warm AsyncWebCrawler browsers shared within a process.
+
+    Launching Playwright costs seconds per URL; a leased warm browser costs
+    milliseconds. Each `lease()` hands one browser to one URL. Browsers are
+    recycled after `max_pages` pages, and discarded immediately if a crawl
+    raises (the browser may have crashed). Browsers are started lazily, so an
+    idle process pays nothing until its first crawl.
+
+    Usage:
+        pool = get_browser_pool()
+        async with pool.lease() as crawler:
+            result = await crawler.arun(url=url)
+        ...
+        await pool.close()  # from the Arq shutdown hook
+    """
+
+    def __init__(self, size: int, max_pages: int):
+        self.size = max(1, size)
+        self.max_pages = max(1, max_pages)
+        self._idle: list[_PooledCrawler] = []
+        self._slots = asyncio.Semaphore(self.size)
+        self._lock = asyncio.Lock()
+        self._closed = False
+        self.launched = 0
+        self.recycled = 0
+        self.discarded = 0
+
+    async def _launch(self) -> _PooledCrawler:
+        # Imported on first launch: crawl4ai pulls in Playwright and NumPy
+        from crawl4ai import AsyncWebCrawler
+
+        crawler = AsyncWebCrawler(verbose=False)
+        await crawler.start()
+        self.launched += 1
+        logger.info(f"Browser pool: launched browser #{self.launched}")
+        return _PooledCrawler(crawler)
+
+    @staticmethod
+    async def _shutdown(entry: _PooledCrawler) -> None:
+        try:
+            await entry.crawler.close()
+        except Exception as e:
+            logger.debug(f"Browser pool: error closing browser: {e}")
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator["AsyncWebCrawler"]:
+        """
+        Lease a warm browser for a single URL.
+
+        Blocks while all `size` browsers are leased.
+
+        Raises:
+            RuntimeError: If the pool has been closed
+        """
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+
+        async with self._slots:
+            async with self._lock:
+                entry = self._idle.pop() if self._idle else None
+            if entry is None:
+                entry = await self._launch()
+
+            healthy = False
+            try:
+                yield entry.crawler
+                healthy = True
+            finally:
+                entry.pages_served += 1
+                if not healthy or self._closed:
+                    self.discarded += 1
+                    await self._shutdown(entry)
+                elif entry.pages_served >= self.max_pages:
+                    self.recycled += 1
+                    logger.info(f"Browser pool: recycling browser after {entry.pages_served} pages")
+                    await self._shutdown(entry)
+                else:
+                    async with self._lock:
+                        self._idle.append(entry)
+
+    async def close(self) -> None:
+        """Close all idle browsers; leased browsers close when returned."""
+        self._closed = True
+        async with self._lock:
+            idle, self._idle = self._idle, []
+        for entry in idle:
+            await self._shutdown(entry)
+        logger.info(f"Browser pool closed ({len(idle)} idle browsers shut down)")
+
+    def get_stats(self) -> dict[str, int]:
+        """Pool counters for health checks and logs."""
+        return {
+            "size": self.size,
+            "idle": len(self._idle),
+            "launched": self.launched,
+            "recycled": self.recycled,
+            "discarded": self.discarded,
+        }
+
+
 class Crawl4AIClient:
     """
     Wrapper around Crawl4AI (open-source alternative to Firecrawl).
@@ -52,14 +170,24 @@ class Crawl4AIClient:
     - Structured output via Pydantic models
     """
 
-    def __init__(self):
+    def __init__(self, pool: BrowserPool | None = None):
         """
         Initialize Crawl4AI client.
 
         Note: No API key required (self-hosted).
+
+        Args:
+            pool: Browser pool to lease from (defaults to the process-wide pool)
         """
+        self._pool = pool
         logger.info("Crawl4AI client initialized (self-hosted, $0 cost)")
 
+    @property
+    def pool(self) -> BrowserPool:
+        """Browser pool used for crawls: the injected one, else the current process-wide pool."""
+        # Not cached: after close_browser_pool() the next crawl gets a fresh pool
+        return self._pool if self._pool is not None else get_browser_pool()
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
@@ -92,8 +220,8 @@ class Crawl4AIClient:
         try:
             logger.info(f"Scraping URL with Crawl4AI: {url}")
 
-            # Use AsyncWebCrawler with context manager for proper cleanup
-            async with AsyncWebCrawler(verbose=False) as crawler:
+            # Lease a warm browser from the pool instead of launching one per URL
+            async with self.pool.lease() as crawler:
                 # word_count_threshold=10 filters out boilerplate
                 # 30s timeout prevents hanging the entire scrape_all_sources_task
                 result = await asyncio.wait_for(
@@ -150,10 +278,35 @@ class Crawl4AIClient:
         )
 
 
-# Global client instance for reuse
+# Global pool and client instances for reuse
+_browser_pool: BrowserPool | None = None
 _crawl4ai_client: Crawl4AIClient | None = None
 
 
+def get_browser_pool() -> BrowserPool:
+    """
+    Get or create the process-wide browser pool.
+
+    Returns:
+        BrowserPool: Singleton pool sized from settings
+    """
+    global _browser_pool
+    if _browser_pool is None or _browser_pool._closed:
+        _browser_pool = BrowserPool(
+            size=settings.crawl4ai_pool_size,
+            max_pages=settings.crawl4ai_max_pages_per_browser,
+        )
+    return _browser_pool
+
+
+async def close_browser_pool() -> None:
+    """Shut down the process-wide browser pool (no-op if never created)."""
+    global _browser_pool
+    if _browser_pool is not None:
+        await _browser_pool.close()
+        _browser_pool = None
+
+
 def get_crawl4ai_client() -> Crawl4AIClient:
     """
     Get or create global Crawl4AI client instance.
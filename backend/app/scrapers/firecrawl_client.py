@@ -3,7 +3,6 @@
 import logging
 from typing import Any
 
-from firecrawl import FirecrawlApp
 from pydantic import BaseModel, Field, HttpUrl
 from tenacity import (
     retry,
@@ -61,6 +60,8 @@ class FirecrawlClient:
                 "Firecrawl API key not found. Set FIRECRAWL_API_KEY environment variable."
             )
 
+        from firecrawl import FirecrawlApp
+
         self.client = FirecrawlApp(api_key=self.api_key)
         logger.info("Firecrawl client initialized")
 
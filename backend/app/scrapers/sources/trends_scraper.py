@@ -1,16 +1,18 @@
-"""Google Trends scraper using pytrends."""
+"""Google Trends scraper using pytrends (imported when a scraper is created)."""
 
 import asyncio
 import logging
 import random
+from typing import TYPE_CHECKING
 
-import pandas as pd
 from pydantic import HttpUrl
-from pytrends.request import TrendReq
 
 from app.scrapers.base_scraper import BaseScraper
 from app.scrapers.firecrawl_client import ScrapeResult
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 # Default delay between API calls (seconds)
@@ -70,9 +72,14 @@ class GoogleTrendsScraper(BaseScraper):
         self.timeframe = timeframe
         self.geo = geo
 
-        # Initialize pytrends client
+        # Initialize pytrends client (pulls in pandas)
+        from pytrends.request import TrendReq
+
         self.pytrends = TrendReq(hl="en-US", tz=360)
 
+        # Google Trends requests issued (keyword batches + rising queries)
+        self.request_count = 0
+
         logger.info(
             f"Google Trends scraper initialized "
             f"(keywords={len(self.keywords)}, timeframe={timeframe}, geo={geo})"
@@ -90,6 +97,37 @@ class GoogleTrendsScraper(BaseScraper):
             >>> results = await scraper.scrape()
             >>> print(f"Scraped trends for {len(results)} keywords")
         """
+        all_results = await self.scrape_keywords()
+
+        # Also get rising queries (with delay to avoid rate limits)
+        await asyncio.sleep(DEFAULT_BATCH_DELAY)
+        try:
+            rising_results = await self._scrape_rising_queries()
+            all_results.extend(rising_results)
+        except Exception as e:
+            error_str = str(e).lower()
+            if "429" in error_str or "too many" in error_str:
+                logger.warning(f"Rising queries rate limited, skipping: {e}")
+            else:
+                logger.error(f"Error scraping rising queries: {e}")
+
+        self.log_scrape_summary(all_results)
+        return all_results
+
+    async def scrape_keywords(self) -> list[ScrapeResult]:
+        """
+        Fetch interest over time for the configured keywords only (no rising queries).
+
+        Keywords go out in 5-keyword pytrends batches with exponential backoff on 429s
+        and a fixed delay between batches. `request_count` records each batch attempt.
+
+        pytrends scales a payload to its largest keyword, so "current_interest" depends
+        on the other keywords in the batch. "normalized_interest" rescales it by the
+        keyword's own maximum, the 0-100 value a single-keyword payload would return.
+
+        Returns:
+            List of ScrapeResult objects, one per keyword with data
+        """
         all_results: list[ScrapeResult] = []
 
         # Process keywords in batches of 5 (Google Trends API limit)
@@ -126,19 +164,6 @@ class GoogleTrendsScraper(BaseScraper):
             if i + batch_size < len(self.keywords):
                 await asyncio.sleep(DEFAULT_BATCH_DELAY)
 
-        # Also get rising queries (with delay to avoid rate limits)
-        await asyncio.sleep(DEFAULT_BATCH_DELAY)
-        try:
-            rising_results = await self._scrape_rising_queries()
-            all_results.extend(rising_results)
-        except Exception as e:
-            error_str = str(e).lower()
-            if "429" in error_str or "too many" in error_str:
-                logger.warning(f"Rising queries rate limited, skipping: {e}")
-            else:
-                logger.error(f"Error scraping rising queries: {e}")
-
-        self.log_scrape_summary(all_results)
         return all_results
 
     async def _scrape_keyword_batch(self, keywords: list[str]) -> list[ScrapeResult]:
@@ -153,6 +178,7 @@ class GoogleTrendsScraper(BaseScraper):
         """
         results: list[ScrapeResult] = []
 
+        self.request_count += 1
         try:
             # Build payload for pytrends
             self.pytrends.build_payload(keywords, cat=0, timeframe=self.timeframe, geo=self.geo)
@@ -174,6 +200,11 @@ class GoogleTrendsScraper(BaseScraper):
                 avg_interest = int(keyword_data.mean())
                 max_interest = int(keyword_data.max())
                 current_interest = int(keyword_data.iloc[-1])
+                # Rescaled to the keyword's own peak (batch-independent 0-100)
+                peak = float(keyword_data.max())
+                normalized_interest = (
+                    round(float(keyword_data.iloc[-1]) * 100 / peak) if peak > 0 else 0
+                )
 
                 # Calculate trend direction
                 trend_direction = self._calculate_trend_direction(keyword_data)
@@ -194,6 +225,7 @@ class GoogleTrendsScraper(BaseScraper):
                     "avg_interest": avg_interest,
                     "max_interest": max_interest,
                     "current_interest": current_interest,
+                    "normalized_interest": normalized_interest,
                     "trend_direction": trend_direction,
                     "timeframe": self.timeframe,
                     "geo": self.geo,
@@ -230,6 +262,7 @@ class GoogleTrendsScraper(BaseScraper):
         """
         results: list[ScrapeResult] = []
 
+        self.request_count += 1
         try:
             # Build payload for related queries
             self.pytrends.build_payload(
@@ -281,7 +314,7 @@ class GoogleTrendsScraper(BaseScraper):
         return results
 
     @staticmethod
-    def _calculate_trend_direction(data: pd.Series) -> str:
+    def _calculate_trend_direction(data: "pd.Series") -> str:
         """
         Calculate trend direction (rising, falling, stable).
 
@@ -340,7 +373,7 @@ class GoogleTrendsScraper(BaseScraper):
         return "\n\n".join(content)
 
     @staticmethod
-    def _build_rising_queries_markdown(rising_df: pd.DataFrame) -> str:
+    def _build_rising_queries_markdown(rising_df: "pd.DataFrame") -> str:
         """Build markdown content for rising queries."""
         content = [
             "# Rising Search Queries\n",
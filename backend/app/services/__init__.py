@@ -11,66 +11,134 @@ Phase 7.2: API Key Service (public API)
 Phase 7.3: Tenant Service (multi-tenancy)
 """
 
-from app.services.api_key_service import (
-    APIKeyCreate,
-    APIKeyResponse,
-    check_api_key_rate_limit,
-    check_scope,
-    create_api_key,
-    record_api_key_usage,
-    revoke_api_key,
-    validate_api_key,
-)
-from app.services.brand_generator import BrandPackage, generate_brand_package
-from app.services.email_service import (
-    send_analysis_ready_email,
-    send_daily_digest,
-    send_email,
-    send_password_reset,
-    send_payment_confirmation,
-    send_team_invitation,
-    send_welcome_email,
-)
-from app.services.export_service import (
-    ExportFormat,
-    export_analysis_csv,
-    export_analysis_json,
-    export_analysis_pdf,
-    export_insight_csv,
-    export_insight_pdf,
-)
-from app.services.landing_page import LandingPageTemplate, generate_landing_page
-from app.services.payment_service import (
-    PRICING_TIERS,
-    PricingTier,
-    check_tier_limit,
-    create_checkout_session,
-    create_customer_portal_session,
-    get_tier_limits,
-    handle_webhook_event,
-)
-from app.services.realtime_feed import (
-    InsightFeedMessage,
-    subscribe_to_insights,
-    unsubscribe_from_insights,
-)
-from app.services.team_service import (
-    TeamCreate,
-    TeamMemberAdd,
-    accept_invitation,
-    create_team,
-    invite_member,
-    share_insight_with_team,
-)
-from app.services.tenant_service import (
-    TenantBrandingUpdate,
-    TenantCreate,
-    configure_custom_domain,
-    create_tenant,
-    resolve_tenant_from_host,
-    update_tenant_branding,
-    verify_custom_domain,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.services.api_key_service import (
+        APIKeyCreate,
+        APIKeyResponse,
+        check_api_key_rate_limit,
+        check_scope,
+        create_api_key,
+        record_api_key_usage,
+        revoke_api_key,
+        validate_api_key,
+    )
+    from app.services.brand_generator import BrandPackage, generate_brand_package
+    from app.services.email_service import (
+        send_analysis_ready_email,
+        send_daily_digest,
+        send_email,
+        send_password_reset,
+        send_payment_confirmation,
+        send_team_invitation,
+        send_welcome_email,
+    )
+    from app.services.export_service import (
+        ExportFormat,
+        export_analysis_csv,
+        export_analysis_json,
+        export_analysis_pdf,
+        export_insight_csv,
+        export_insight_pdf,
+    )
+    from app.services.landing_page import LandingPageTemplate, generate_landing_page
+    from app.services.payment_service import (
+        PRICING_TIERS,
+        PricingTier,
+        check_tier_limit,
+        create_checkout_session,
+        create_customer_portal_session,
+        get_tier_limits,
+        handle_webhook_event,
+    )
+    from app.services.realtime_feed import (
+        InsightFeedMessage,
+        subscribe_to_insights,
+        unsubscribe_from_insights,
+    )
+    from app.services.team_service import (
+        TeamCreate,
+        TeamMemberAdd,
+        accept_invitation,
+        create_team,
+        invite_member,
+        share_insight_with_team,
+    )
+    from app.services.tenant_service import (
+        TenantBrandingUpdate,
+        TenantCreate,
+        configure_custom_domain,
+        create_tenant,
+        resolve_tenant_from_host,
+        update_tenant_branding,
+        verify_custom_domain,
+    )
+
+# Exports resolve on first access (PEP 562), so importing one submodule such as
+# app.services.sse_broadcaster does not load every service (and the pydantic-ai,
+# Stripe and Resend clients behind them)
+_EXPORTS: dict[str, str] = {
+    "APIKeyCreate": "app.services.api_key_service",
+    "APIKeyResponse": "app.services.api_key_service",
+    "check_api_key_rate_limit": "app.services.api_key_service",
+    "check_scope": "app.services.api_key_service",
+    "create_api_key": "app.services.api_key_service",
+    "record_api_key_usage": "app.services.api_key_service",
+    "revoke_api_key": "app.services.api_key_service",
+    "validate_api_key": "app.services.api_key_service",
+    "BrandPackage": "app.services.brand_generator",
+    "generate_brand_package": "app.services.brand_generator",
+    "send_analysis_ready_email": "app.services.email_service",
+    "send_daily_digest": "app.services.email_service",
+    "send_email": "app.services.email_service",
+    "send_password_reset": "app.services.email_service",
+    "send_payment_confirmation": "app.services.email_service",
+    "send_team_invitation": "app.services.email_service",
+    "send_welcome_email": "app.services.email_service",
+    "ExportFormat": "app.services.export_service",
+    "export_analysis_csv": "app.services.export_service",
+    "export_analysis_json": "app.services.export_service",
+    "export_analysis_pdf": "app.services.export_service",
+    "export_insight_csv": "app.services.export_service",
+    "export_insight_pdf": "app.services.export_service",
+    "LandingPageTemplate": "app.services.landing_page",
+    "generate_landing_page": "app.services.landing_page",
+    "PRICING_TIERS": "app.services.payment_service",
+    "PricingTier": "app.services.payment_service",
+    "check_tier_limit": "app.services.payment_service",
+    "create_checkout_session": "app.services.payment_service",
+    "create_customer_portal_session": "app.services.payment_service",
+    "get_tier_limits": "app.services.payment_service",
+    "handle_webhook_event": "app.services.payment_service",
+    "InsightFeedMessage": "app.services.realtime_feed",
+    "subscribe_to_insights": "app.services.realtime_feed",
+    "unsubscribe_from_insights": "app.services.realtime_feed",
+    "TeamCreate": "app.services.team_service",
+    "TeamMemberAdd": "app.services.team_service",
+    "accept_invitation": "app.services.team_service",
+    "create_team": "app.services.team_service",
+    "invite_member": "app.services.team_service",
+    "share_insight_with_team": "app.services.team_service",
+    "TenantBrandingUpdate": "app.services.tenant_service",
+    "TenantCreate": "app.services.tenant_service",
+    "configure_custom_domain": "app.services.tenant_service",
+    "create_tenant": "app.services.tenant_service",
+    "resolve_tenant_from_host": "app.services.tenant_service",
+    "update_tenant_branding": "app.services.tenant_service",
+    "verify_custom_domain": "app.services.tenant_service",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Phase 5.2: Build Tools
@@ -6,13 +6,14 @@ Manages API key creation, validation, and usage tracking.
 import hashlib
 import logging
 import secrets
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
 from app.core.config import settings
+from app.core.rate_limits import check_tier_rate_limit
 
 logger = logging.getLogger(__name__)
 
@@ -202,6 +203,10 @@ async def check_api_key_rate_limit(
     """
     Check rate limit for API key.
 
+    Counts the request against the tier's GCRA limit. Callers authenticating
+    a request with an API key must answer 429 when "allowed" is False; no
+    route authenticates with API keys yet, so nothing calls this so far.
+
     Args:
         key_id: API key ID
         user_tier: User's subscription tier
@@ -209,15 +214,13 @@ async def check_api_key_rate_limit(
     Returns:
         Rate limit status
     """
-    # TODO: Rate limiting handled by SlowAPI globally
-    # result = await check_rate_limit(
-    #     identifier=f"apikey:{key_id}",
-    #     tier=user_tier,
-    #     limit_type="api_calls_per_hour",
-    # )
-
-    # Return mock result for now (rate limiting done at route level)
-    return {"allowed": True, "remaining": 1000, "reset_at": None}
+    result = await check_tier_rate_limit(f"apikey:{key_id}", user_tier)
+    reset_at = (
+        None
+        if result.allowed
+        else (datetime.now(UTC) + timedelta(seconds=result.retry_after)).isoformat()
+    )
+    return {"allowed": result.allowed, "remaining": result.remaining, "reset_at": reset_at}
 
 
 async def record_api_key_usage(
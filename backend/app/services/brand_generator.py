@@ -8,12 +8,15 @@ Generates AI-powered brand packages including:
 """
 
 import logging
+from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field
-from pydantic_ai import Agent
 
 from app.core.config import settings
 
+if TYPE_CHECKING:
+    from pydantic_ai import Agent
+
 logger = logging.getLogger(__name__)
 
 
@@ -129,8 +132,10 @@ Be specific, actionable, and creative. Avoid generic suggestions."""
 # ============================================================
 
 
-def get_brand_agent() -> Agent:
+def get_brand_agent() -> "Agent":
     """Get PydanticAI agent for brand generation (API key from GOOGLE_API_KEY env)."""
+    from pydantic_ai import Agent
+
     return Agent(
         model=settings.default_llm_model,
         system_prompt=BRAND_SYSTEM_PROMPT,
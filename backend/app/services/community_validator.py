@@ -5,23 +5,19 @@ with accurate member counts, preventing LLM hallucination of fake
 subreddits, Facebook groups, etc.
 
 Uses PRAW for Reddit validation. Future: Add Facebook, YouTube validation.
+PRAW is imported on first use (keeps it off the API import path).
 """
 
 import asyncio
 import logging
 from dataclasses import dataclass
-
-import praw
-from praw.exceptions import InvalidURL, PRAWException
-from prawcore.exceptions import (
-    Forbidden,
-    NotFound,
-    Redirect,
-    ResponseException,
-    ServerError,
-)
+from typing import TYPE_CHECKING
 
 from app.core.config import settings
+from app.services.verification_cache import VerificationCache
+
+if TYPE_CHECKING:
+    import praw
 
 logger = logging.getLogger(__name__)
 
@@ -64,7 +60,9 @@ class CommunityValidator:
     def __init__(self):
         """Initialize validator with Reddit client."""
         self._reddit: praw.Reddit | None = None
-        self._cache: dict[str, SubredditValidationResult] = {}
+        self._cache: VerificationCache[SubredditValidationResult] = VerificationCache(
+            "subreddit", SubredditValidationResult
+        )
         self._init_reddit()
 
     def _init_reddit(self) -> None:
@@ -76,6 +74,8 @@ class CommunityValidator:
             return
 
         try:
+            import praw
+
             self._reddit = praw.Reddit(
                 client_id=settings.reddit_client_id,
                 client_secret=settings.reddit_client_secret,
@@ -107,19 +107,27 @@ class CommunityValidator:
         """
         Synchronously validate that a subreddit exists and get subscriber count.
 
+        Uncached; validate_subreddit() goes through the verification cache.
+
         Args:
             subreddit_name: Subreddit name (with or without r/ prefix)
 
         Returns:
             SubredditValidationResult with validation status and subscriber count
         """
-        normalized_name = self._normalize_subreddit_name(subreddit_name)
+        return self._check_subreddit(self._normalize_subreddit_name(subreddit_name))[0]
 
-        # Check cache first
-        if normalized_name in self._cache:
-            logger.debug(f"Cache hit for subreddit: r/{normalized_name}")
-            return self._cache[normalized_name]
+    def _check_subreddit(self, normalized_name: str) -> tuple[SubredditValidationResult, bool]:
+        """
+        Look a subreddit up via PRAW.
+
+        Args:
+            normalized_name: Subreddit name without prefix
 
+        Returns:
+            Tuple of (result, cacheable); API errors are not a verdict on the
+            subreddit and are not cacheable
+        """
         if not self._reddit:
             result = SubredditValidationResult(
                 subreddit_name=normalized_name,
@@ -127,7 +135,16 @@ class CommunityValidator:
                 subscriber_count=0,
                 error="Reddit client not initialized",
             )
-            return result
+            return (result, False)
+
+        from praw.exceptions import InvalidURL, PRAWException
+        from prawcore.exceptions import (
+            Forbidden,
+            NotFound,
+            Redirect,
+            ResponseException,
+            ServerError,
+        )
 
         try:
             subreddit = self._reddit.subreddit(normalized_name)
@@ -197,6 +214,7 @@ class CommunityValidator:
                 error=f"Reddit API error: {type(e).__name__}",
             )
             logger.warning(f"Reddit API error for r/{normalized_name}: {e}")
+            return (result, False)
 
         except PRAWException as e:
             result = SubredditValidationResult(
@@ -206,6 +224,7 @@ class CommunityValidator:
                 error=f"PRAW error: {str(e)}",
             )
             logger.error(f"PRAW error validating r/{normalized_name}: {e}")
+            return (result, False)
 
         except Exception as e:
             result = SubredditValidationResult(
@@ -215,16 +234,16 @@ class CommunityValidator:
                 error=f"Unexpected error: {type(e).__name__}",
             )
             logger.error(f"Unexpected error validating r/{normalized_name}: {e}")
+            return (result, False)
 
-        # Cache result
-        self._cache[normalized_name] = result
-        return result
+        return (result, True)
 
     async def validate_subreddit(self, subreddit_name: str) -> SubredditValidationResult:
         """
         Async wrapper for subreddit validation.
 
-        PRAW is synchronous, so this runs the validation in a thread pool.
+        Checks the verification cache first. PRAW is synchronous, so a miss
+        runs the lookup in a thread pool.
 
         Args:
             subreddit_name: Subreddit name to validate
@@ -232,8 +251,17 @@ class CommunityValidator:
         Returns:
             SubredditValidationResult with validation status
         """
+        normalized_name = self._normalize_subreddit_name(subreddit_name)
+        cached = await self._cache.get(normalized_name.lower())
+        if cached is not None:
+            logger.debug(f"Cache hit for subreddit: r/{normalized_name}")
+            return cached
+
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.validate_subreddit_sync, subreddit_name)
+        result, cacheable = await loop.run_in_executor(None, self._check_subreddit, normalized_name)
+        if cacheable:
+            await self._cache.put(normalized_name.lower(), result, positive=result.is_valid)
+        return result
 
     async def validate_community_signal(
         self, signal: CommunitySignalData
@@ -345,10 +373,14 @@ class CommunityValidator:
             return f"{count:,} members"
 
     def clear_cache(self) -> None:
-        """Clear the validation cache."""
-        self._cache.clear()
+        """Clear the in-process validation cache."""
+        self._cache.clear_local()
         logger.info("Community validator cache cleared")
 
+    def get_cache_stats(self) -> dict:
+        """Get cache statistics (hit rates across both tiers)."""
+        return self._cache.get_stats()
+
 
 # Global validator instance
 _community_validator: CommunityValidator | None = None
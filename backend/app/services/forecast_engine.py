@@ -0,0 +1,282 @@
+"""Background forecast engine for trend predictions.
+
+Trend prediction endpoints used to fit one model per trend inside the request.
+Forecasts are now fit off the request path and stored content-addressed:
+
+- Key: forecast:{keyword}:{data_hash}:{horizon}, where data_hash covers the
+  exact (dates, values) series, so a stored forecast is valid until the data
+  changes and never needs explicit invalidation.
+- Each series is fit once at FORECAST_MAX_HORIZON_DAYS; shorter horizons are
+  slices of it.
+- Fits run in a process pool (CPU-bound; keeps the event loop and GIL free) and
+  are deduplicated while in flight.
+- Refits are triggered by the hourly trends task (refresh_trend_forecasts) and
+  by Trend create/update (schedule_refit). Endpoints only read; on a miss they
+  schedule a refit and return a "pending" payload.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from cachetools import TTLCache
+from sqlalchemy import select
+
+from app.core.cache import cache_get, cache_set
+from app.core.config import settings
+from app.core.constants import (
+    FORECAST_CACHE_TTL_SECONDS,
+    FORECAST_HISTORY_DAYS,
+    FORECAST_MAX_HORIZON_DAYS,
+)
+from app.models.trend import Trend
+
+logger = logging.getLogger(__name__)
+
+
+def trend_history(trend: Trend, days: int = FORECAST_HISTORY_DAYS) -> tuple[list[str], list[int]]:
+    """
+    Get historical dates and values from a trend, generating synthetic data if needed.
+
+    Synthetic series are seeded by keyword and day so repeated reads within a
+    day hash (and therefore cache) identically.
+    """
+    trend_data = trend.trend_data or {}
+    historical_dates = trend_data.get("dates", [])
+    historical_values = trend_data.get("values", [])
+
+    if len(historical_dates) >= 7:
+        return historical_dates, historical_values
+
+    today = datetime.now(UTC).date()
+    historical_dates = [(today - timedelta(days=i)).isoformat() for i in range(days, 0, -1)]
+
+    # Normalize to 0-100 scale (matching Google Trends format)
+    rng = random.Random(f"{trend.keyword}:{today.isoformat()}")
+    growth_rate = (trend.growth_percentage or 10) / 100
+    raw_values = [
+        max(1.0, 100 * (1 - growth_rate * (days - i) / days) + rng.uniform(-3, 3))
+        for i in range(days)
+    ]
+    # Scale so the peak = 100 (Google Trends convention)
+    peak = max(raw_values) or 1
+    historical_values = [max(1, int(v * 100 / peak)) for v in raw_values]
+
+    return historical_dates, historical_values
+
+
+def series_hash(dates: list[str], values: list) -> str:
+    """Stable short hash of a (dates, values) series."""
+    payload = json.dumps([dates, values], separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+
+def forecast_cache_key(keyword: str, data_hash: str, horizon: int) -> str:
+    """Cache key for a stored forecast."""
+    return f"forecast:{keyword}:{data_hash}:{horizon}"
+
+
+def slice_forecast(forecast: dict[str, Any], periods: int) -> dict[str, Any]:
+    """Trim a max-horizon forecast to the first `periods` days."""
+    intervals = forecast.get("confidence_intervals", {})
+    return {
+        **forecast,
+        "dates": forecast.get("dates", [])[:periods],
+        "values": forecast.get("values", [])[:periods],
+        "confidence_intervals": {
+            "lower": intervals.get("lower", [])[:periods],
+            "upper": intervals.get("upper", [])[:periods],
+        },
+        "metadata": {**forecast.get("metadata", {}), "prediction_horizon": periods},
+    }
+
+
+def pending_forecast(status: str = "pending") -> dict[str, Any]:
+    """Placeholder returned while a forecast is being computed ("pending") or after it failed."""
+    return {
+        "dates": [],
+        "values": [],
+        "confidence_intervals": {"lower": [], "upper": []},
+        "model_accuracy": {"mape": 0, "rmse": 0},
+        "status": status,
+    }
+
+
+def _fit(trend_data: dict[str, Any], periods: int) -> dict[str, Any]:
+    """Process-pool entry point (module-level so it pickles)."""
+    from app.services.trend_prediction import forecast_trend
+
+    return forecast_trend(trend_data, periods)
+
+
+class ForecastEngine:
+    """Process-pool forecast fitter with a content-addressed result store."""
+
+    def __init__(self, max_workers: int = 2):
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._inflight: dict[str, asyncio.Task] = {}
+        # Process-local copy: serves hot reads without a Redis round-trip and
+        # keeps forecasts available when Redis is down
+        self._local: TTLCache = TTLCache(maxsize=1024, ttl=FORECAST_CACHE_TTL_SECONDS)
+        # Series whose fit failed recently: not rescheduled on every read
+        self._failed: TTLCache = TTLCache(maxsize=1024, ttl=300)
+        self._background: set[asyncio.Task] = set()
+        self.fits_completed = 0
+        self.fits_failed = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: never fork an event loop / DB pool / Redis connections into workers
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def get(self, keyword: str, dates: list[str], values: list, periods: int):
+        """
+        Read a stored forecast (no fitting).
+
+        Returns:
+            Forecast sliced to `periods`, or None if not computed yet
+        """
+        key = forecast_cache_key(keyword, series_hash(dates, values), FORECAST_MAX_HORIZON_DAYS)
+        forecast = self._local.get(key)
+        if forecast is None:
+            forecast = await cache_get(key)
+            if forecast is None:
+                return None
+            self._local[key] = forecast
+        return slice_forecast(forecast, periods)
+
+    async def get_or_schedule(
+        self, keyword: str, dates: list[str], values: list, periods: int
+    ) -> dict[str, Any]:
+        """Read a stored forecast; on a miss, schedule a refit and return a pending payload."""
+        forecast = await self.get(keyword, dates, values, periods)
+        if forecast is not None:
+            return forecast
+        key = forecast_cache_key(keyword, series_hash(dates, values), FORECAST_MAX_HORIZON_DAYS)
+        if key in self._failed:
+            return pending_forecast("unavailable")
+        self.schedule_refit(keyword, dates, values)
+        return pending_forecast()
+
+    async def refit(self, keyword: str, dates: list[str], values: list) -> dict[str, Any]:
+        """
+        Fit (or join an in-flight fit of) the max-horizon forecast and store it.
+
+        Args:
+            keyword: Trend keyword
+            dates: Historical dates
+            values: Historical values
+
+        Returns:
+            The stored max-horizon forecast
+        """
+        key = forecast_cache_key(keyword, series_hash(dates, values), FORECAST_MAX_HORIZON_DAYS)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fit_and_store(key, dates, values))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    def schedule_refit(self, keyword: str, dates: list[str], values: list) -> None:
+        """Fire-and-forget refit (errors are logged, not raised)."""
+
+        async def _run():
+            try:
+                await self.refit(keyword, dates, values)
+            except Exception as e:
+                logger.warning(f"Background forecast for '{keyword}' failed: {e}")
+
+        task = asyncio.create_task(_run())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _fit_and_store(self, key: str, dates: list[str], values: list) -> dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        try:
+            forecast = await loop.run_in_executor(
+                self._get_executor(),
+                _fit,
+                {"dates": dates, "values": values},
+                FORECAST_MAX_HORIZON_DAYS,
+            )
+        except Exception:
+            self.fits_failed += 1
+            self._failed[key] = True
+            raise
+        self.fits_completed += 1
+        self._local[key] = forecast
+        await cache_set(key, forecast, ttl=FORECAST_CACHE_TTL_SECONDS)
+        return forecast
+
+    def shutdown(self) -> None:
+        """Stop the process pool (idempotent)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Global engine instance (one per process)
+_forecast_engine: ForecastEngine | None = None
+
+
+def get_forecast_engine() -> ForecastEngine:
+    """
+    Get or create the process-wide forecast engine.
+
+    Returns:
+        ForecastEngine: Singleton sized from settings
+    """
+    global _forecast_engine
+    if _forecast_engine is None:
+        _forecast_engine = ForecastEngine(max_workers=settings.forecast_pool_workers)
+    return _forecast_engine
+
+
+async def refresh_trend_forecasts(session) -> dict[str, int]:
+    """
+    Refit forecasts for every published trend whose series has no stored forecast.
+
+    Unchanged series hash to an existing key and are skipped, so this is cheap
+    to run after every data update.
+
+    Args:
+        session: Async database session
+
+    Returns:
+        Counts of trends checked, refit and failed
+    """
+    result = await session.execute(select(Trend).where(Trend.is_published == True))
+    trends = result.scalars().all()
+
+    engine = get_forecast_engine()
+    stale = []
+    for trend in trends:
+        dates, values = trend_history(trend)
+        if await engine.get(trend.keyword, dates, values, FORECAST_MAX_HORIZON_DAYS) is None:
+            stale.append((trend.keyword, dates, values))
+
+    outcomes = await asyncio.gather(
+        *(engine.refit(keyword, dates, values) for keyword, dates, values in stale),
+        return_exceptions=True,
+    )
+    failed = sum(isinstance(o, Exception) for o in outcomes)
+    for (keyword, _, _), outcome in zip(stale, outcomes, strict=True):
+        if isinstance(outcome, Exception):
+            logger.warning(f"Forecast refit failed for '{keyword}': {outcome}")
+
+    logger.info(
+        f"Forecast refresh: {len(trends)} trends, {len(stale) - failed} refit, {failed} failed"
+    )
+    return {"checked": len(trends), "refit": len(stale) - failed, "failed": failed}
@@ -0,0 +1,174 @@
+"""Full-text search over insights.
+
+insights.search_vector is a generated tsvector (migration c022): title at
+weight A, problem_statement and proposed_solution at weight B, 'english'
+config, GIN-indexed. Matching therefore resolves through the index instead of
+leading-wildcard ILIKE sequential scans, and matches stemmed words rather than
+substrings ("AI" no longer matches "email").
+
+- search_insights(): one round trip returns the ranked page, an exact total
+  (count(*) OVER ()) and, optionally, highlighted fragments (ts_headline)
+- Free-text queries use websearch_to_tsquery ("quoted phrases", OR, -exclude);
+  keyword lists (explore categories) are OR-ed as phrases
+- On other databases (SQLite in tests) matching falls back to ILIKE, with no
+  rank or highlight
+"""
+
+import html
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy import Select, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.insight import Insight
+
+logger = logging.getLogger(__name__)
+
+SEARCH_CONFIG = "english"
+
+# Control characters as match markers: the fragment is HTML-escaped afterwards
+# and only these are turned into <mark> tags, so source text cannot inject markup
+_START, _STOP = "\x02", "\x03"
+_HEADLINE_OPTIONS = (
+    f"StartSel={_START}, StopSel={_STOP}, MaxWords=35, MinWords=15, "
+    'MaxFragments=2, FragmentDelimiter=" … "'
+)
+
+
+@dataclass
+class SearchHit:
+    """One matching insight with its text rank and highlighted fragment."""
+
+    insight: Insight
+    rank: float | None = None
+    highlight: str | None = None
+
+
+@dataclass
+class SearchPage:
+    """A page of search hits plus the total number of matches."""
+
+    hits: list[SearchHit]
+    total: int
+
+
+def websearch_tsquery(term: str) -> ColumnElement:
+    """tsquery for user input (web-search syntax, never a syntax error)."""
+    return func.websearch_to_tsquery(SEARCH_CONFIG, term)
+
+
+def keywords_tsquery(keywords: list[str]) -> ColumnElement:
+    """tsquery matching any of the keywords, each as a phrase."""
+    phrases = [kw.replace('"', " ").strip() for kw in keywords]
+    return func.websearch_to_tsquery(
+        SEARCH_CONFIG, " OR ".join(f'"{phrase}"' for phrase in phrases if phrase)
+    )
+
+
+def keywords_match(dialect_name: str, keywords: list[str]) -> ColumnElement:
+    """WHERE clause for insights matching any keyword, as search_insights() applies it."""
+    if dialect_name == "postgresql":
+        return Insight.search_vector.op("@@")(keywords_tsquery(keywords))
+    return _ilike_match(keywords)
+
+
+def _ilike_match(terms: list[str]) -> ColumnElement:
+    """Substring fallback for databases without full-text search."""
+    clauses = []
+    for term in terms:
+        pattern = f"%{term}%"
+        clauses += [
+            Insight.title.ilike(pattern),
+            Insight.problem_statement.ilike(pattern),
+            Insight.proposed_solution.ilike(pattern),
+        ]
+    return or_(*clauses)
+
+
+def _render_highlight(fragment: str | None) -> str | None:
+    if not fragment or _START not in fragment:
+        return None
+    return html.escape(fragment).replace(_START, "<mark>").replace(_STOP, "</mark>")
+
+
+async def search_insights(
+    db: AsyncSession,
+    query: Select,
+    *,
+    term: str | None = None,
+    keywords: list[str] | None = None,
+    order_by: list | None = None,
+    rank_first: bool = True,
+    highlight: bool = True,
+    limit: int = 20,
+    offset: int = 0,
+) -> SearchPage:
+    """
+    Run a full-text search on top of an Insight query.
+
+    Args:
+        db: Database session
+        query: select(Insight) with any filters, joins and loader options
+        term: Free-text search input (web-search syntax)
+        keywords: Match any of these phrases instead of `term`
+        order_by: Ordering after (or instead of) text rank
+        rank_first: Order by text rank before `order_by`
+        highlight: Compute highlighted fragments for the page rows
+        limit: Page size
+        offset: Page offset
+
+    Returns:
+        SearchPage with hits in order and the exact number of matches
+    """
+    order_by = list(order_by or [])
+    total_col = func.count().over().label("search_total")
+
+    if db.get_bind().dialect.name == "postgresql":
+        tsquery = websearch_tsquery(term) if term is not None else keywords_tsquery(keywords or [])
+        matched = query.where(Insight.search_vector.op("@@")(tsquery))
+        rank = func.ts_rank_cd(Insight.search_vector, tsquery).label("search_rank")
+        columns = [rank, total_col]
+        if highlight:
+            # ts_headline is declared expensive, so PostgreSQL evaluates it
+            # after ORDER BY/LIMIT: only for the rows on this page
+            document = func.concat_ws(
+                ". ", Insight.title, Insight.problem_statement, Insight.proposed_solution
+            )
+            columns.append(
+                func.ts_headline(SEARCH_CONFIG, document, tsquery, _HEADLINE_OPTIONS).label(
+                    "search_highlight"
+                )
+            )
+        if rank_first:
+            order_by.insert(0, rank.desc())
+    else:
+        matched = query.where(_ilike_match([term] if term is not None else list(keywords or [])))
+        columns = [total_col]
+
+    stmt = matched.add_columns(*columns)
+    result = await db.execute(stmt.order_by(*order_by).limit(limit).offset(offset))
+    rows = result.all()
+
+    hits = []
+    for row in rows:
+        mapping = row._mapping
+        hits.append(
+            SearchHit(
+                insight=row[0],
+                rank=mapping.get("search_rank"),
+                highlight=_render_highlight(mapping.get("search_highlight")),
+            )
+        )
+
+    if rows:
+        total = rows[0].search_total
+    elif offset:
+        # Past the last page: the window count has no row to ride on
+        count_stmt = select(func.count()).select_from(matched.order_by(None).subquery())
+        total = await db.scalar(count_stmt) or 0
+    else:
+        total = 0
+
+    return SearchPage(hits=hits, total=total)
@@ -9,13 +9,16 @@ Generates AI-powered landing page templates including:
 """
 
 import logging
+from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field
-from pydantic_ai import Agent
 
 from app.core.config import settings
 from app.services.brand_generator import BrandPackage
 
+if TYPE_CHECKING:
+    from pydantic_ai import Agent
+
 logger = logging.getLogger(__name__)
 
 
@@ -133,8 +136,10 @@ Be specific to the product. Avoid generic startup cliches."""
 # ============================================================
 
 
-def get_landing_page_agent() -> Agent:
+def get_landing_page_agent() -> "Agent":
     """Get PydanticAI agent for landing page generation (API key from GOOGLE_API_KEY env)."""
+    from pydantic_ai import Agent
+
     return Agent(
         model=settings.default_llm_model,
         system_prompt=LANDING_PAGE_SYSTEM_PROMPT,
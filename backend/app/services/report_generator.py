@@ -14,10 +14,9 @@ import asyncio
 import base64
 import logging
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
-from pydantic_ai import Agent
 from sqlalchemy import or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
@@ -26,6 +25,9 @@ from app.models.insight import Insight
 from app.models.report_request import ReportRequest
 from app.services.email_service import send_email
 
+if TYPE_CHECKING:
+    from pydantic_ai import Agent
+
 logger = logging.getLogger(__name__)
 
 
@@ -99,6 +101,8 @@ def _get_report_agent() -> Agent:
     """Lazy-init the PydanticAI agent (avoids GOOGLE_API_KEY crash at import time in CI)."""
     global _report_agent  # noqa: PLW0603
     if _report_agent is None:
+        from pydantic_ai import Agent
+
         _report_agent = Agent(
             model="google-gla:gemini-2.0-flash",
             output_type=CategoryReportContent,
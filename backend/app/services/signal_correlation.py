@@ -3,25 +3,41 @@
 Detects when multiple sources discuss the same topic within 24h
 using lightweight TF-IDF keyword overlap + cosine similarity.
 
+Candidate generation is MinHash-LSH over a persisted index
+(insight_correlation_index): each approved insight is tokenised once, and
+new insights are matched only against insights sharing an LSH band key.
+Only those candidate pairs are scored with TF-IDF cosine similarity.
+
 No external dependencies (pure Python) — avoids 50MB scikit-learn.
 """
 
+import hashlib
 import logging
 import math
+import random
 import re
 import uuid
+import zlib
 from collections import Counter
+from collections.abc import Iterable, Mapping
 from datetime import UTC, datetime, timedelta
+from typing import NamedTuple
 
-from sqlalchemy import select, update
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.constants import (
+    CORRELATION_LSH_BANDS,
+    CORRELATION_MINHASH_PERMUTATIONS,
     CORRELATION_WINDOW_HOURS,
     MAX_INSIGHTS_TO_SCAN,
     SIMILARITY_THRESHOLD,
 )
 from app.db.session import AsyncSessionLocal
 from app.models.insight import Insight
+from app.models.insight_correlation_index import InsightCorrelationIndex
+from app.models.raw_signal import RawSignal
 
 logger = logging.getLogger(__name__)
 
@@ -144,35 +160,54 @@ _STOP_WORDS = frozenset(
 )
 
 
+# MinHash permutations h(x) = (a*x + b) mod p. Seeded so band keys persisted
+# by one process match those computed by any other.
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_rng = random.Random(6042)
+_PERMUTATIONS: tuple[tuple[int, int], ...] = tuple(
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(CORRELATION_MINHASH_PERMUTATIONS)
+)
+_ROWS_PER_BAND = CORRELATION_MINHASH_PERMUTATIONS // CORRELATION_LSH_BANDS
+
+
+class _IndexedDoc(NamedTuple):
+    """An insight as seen by the correlation engine."""
+
+    insight_id: uuid.UUID
+    source: str
+    term_counts: Mapping[str, int]
+    band_keys: list[str]
+    group_id: uuid.UUID | None = None
+    score: float | None = None
+
+
 def _tokenize(text: str) -> list[str]:
     """Tokenize text into lowercase words, removing stop words and short tokens."""
     words = re.findall(r"[a-zA-Z]{3,}", text.lower())
     return [w for w in words if w not in _STOP_WORDS]
 
 
-def _compute_tfidf(documents: list[list[str]]) -> list[dict[str, float]]:
-    """Compute TF-IDF vectors for a list of tokenized documents.
+def _tfidf_from_counts(term_counts: list[Mapping[str, int]]) -> list[dict[str, float]]:
+    """Compute TF-IDF vectors from per-document term counts.
 
     Returns list of {term: tfidf_weight} dicts, one per document.
     """
-    n_docs = len(documents)
+    n_docs = len(term_counts)
     if n_docs == 0:
         return []
 
     # Document frequency (how many docs contain each term)
     df: Counter = Counter()
-    for doc in documents:
-        unique_terms = set(doc)
-        for term in unique_terms:
-            df[term] += 1
+    for counts in term_counts:
+        df.update(counts.keys())
 
-    # Compute TF-IDF for each document
     tfidf_vectors = []
-    for doc in documents:
-        tf = Counter(doc)
-        doc_len = len(doc) or 1
+    for counts in term_counts:
+        doc_len = sum(counts.values()) or 1
         vector = {}
-        for term, count in tf.items():
+        for term, count in counts.items():
             tf_val = count / doc_len
             idf_val = math.log((n_docs + 1) / (df[term] + 1)) + 1  # Smoothed IDF
             vector[term] = tf_val * idf_val
@@ -181,6 +216,14 @@ def _compute_tfidf(documents: list[list[str]]) -> list[dict[str, float]]:
     return tfidf_vectors
 
 
+def _compute_tfidf(documents: list[list[str]]) -> list[dict[str, float]]:
+    """Compute TF-IDF vectors for a list of tokenized documents.
+
+    Returns list of {term: tfidf_weight} dicts, one per document.
+    """
+    return _tfidf_from_counts([Counter(doc) for doc in documents])
+
+
 def _cosine_similarity(vec_a: dict[str, float], vec_b: dict[str, float]) -> float:
     """Compute cosine similarity between two sparse TF-IDF vectors."""
     # Dot product (only over shared terms)
@@ -200,157 +243,314 @@ def _cosine_similarity(vec_a: dict[str, float], vec_b: dict[str, float]) -> floa
     return dot / (mag_a * mag_b)
 
 
+def _minhash_signature(terms: Iterable[str]) -> list[int]:
+    """MinHash signature of a term set (stable across processes via CRC32)."""
+    hashed = [zlib.crc32(t.encode()) for t in set(terms)]
+    if not hashed:
+        return []
+    return [
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashed) for a, b in _PERMUTATIONS
+    ]
+
+
+def _band_keys(signature: list[int]) -> list[str]:
+    """Split a MinHash signature into LSH bands and hash each band to a bucket key."""
+    keys = []
+    for band in range(len(signature) // _ROWS_PER_BAND):
+        rows = signature[band * _ROWS_PER_BAND : (band + 1) * _ROWS_PER_BAND]
+        digest = hashlib.blake2b(repr(rows).encode(), digest_size=8).hexdigest()
+        keys.append(f"{band}:{digest}")
+    return keys
+
+
+def _candidate_pairs(docs: list[_IndexedDoc], new_ids: set[uuid.UUID]) -> set[tuple[int, int]]:
+    """Index pairs sharing at least one LSH bucket, from different sources.
+
+    At least one side of every pair must be newly indexed — pairs between two
+    previously indexed insights were already considered on an earlier run.
+    """
+    buckets: dict[str, list[int]] = {}
+    for idx, doc in enumerate(docs):
+        for key in doc.band_keys:
+            buckets.setdefault(key, []).append(idx)
+
+    pairs: set[tuple[int, int]] = set()
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        for pos, i in enumerate(members):
+            for j in members[pos + 1 :]:
+                if docs[i].source == docs[j].source:
+                    continue
+                if docs[i].insight_id not in new_ids and docs[j].insight_id not in new_ids:
+                    continue
+                pairs.add((i, j) if i < j else (j, i))
+    return pairs
+
+
+def _score_pairs(
+    docs: list[_IndexedDoc], pairs: Iterable[tuple[int, int]]
+) -> list[tuple[uuid.UUID, uuid.UUID, float]]:
+    """Score candidate pairs with TF-IDF cosine; keep those above the threshold.
+
+    IDF is computed over the candidate neighbourhood (new insights plus their
+    LSH candidates) rather than the full window.
+    """
+    vectors = _tfidf_from_counts([doc.term_counts for doc in docs])
+    scored = []
+    for i, j in pairs:
+        sim = _cosine_similarity(vectors[i], vectors[j])
+        if sim >= SIMILARITY_THRESHOLD:
+            scored.append((docs[i].insight_id, docs[j].insight_id, sim))
+    return scored
+
+
+class _UnionFind:
+    """Union-find with path compression and union by rank."""
+
+    def __init__(self) -> None:
+        self.parent: dict = {}
+        self.rank: dict = {}
+
+    def find(self, x):
+        if x not in self.parent:
+            self.parent[x] = x
+            self.rank[x] = 0
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]  # path compression
+            x = self.parent[x]
+        return x
+
+    def union(self, a, b) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return
+        if self.rank[ra] < self.rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if self.rank[ra] == self.rank[rb]:
+            self.rank[ra] += 1
+
+
+def _plan_group_updates(
+    members: dict[uuid.UUID, _IndexedDoc],
+    pairs: list[tuple[uuid.UUID, uuid.UUID, float]],
+) -> tuple[list[dict], list[dict]]:
+    """Merge scored pairs into correlation groups.
+
+    New pairs are unioned with existing groups: if any member already carries a
+    correlation_group_id, the merged group keeps it, so groups grow across runs
+    instead of being re-minted.
+
+    Args:
+        members: Every insight in a pair plus all members of groups they belong to
+        pairs: (insight_id, insight_id, similarity) above threshold
+
+    Returns:
+        (bulk UPDATE parameter rows, correlation groups found)
+    """
+    uf = _UnionFind()
+    best_sim: dict[uuid.UUID, float] = {}
+    for a, b, sim in pairs:
+        uf.union(a, b)
+        best_sim[a] = max(best_sim.get(a, 0.0), sim)
+        best_sim[b] = max(best_sim.get(b, 0.0), sim)
+
+    # Existing group mates travel with any member touched by a new pair
+    by_group: dict[uuid.UUID, uuid.UUID] = {}
+    for insight_id, doc in members.items():
+        if doc.group_id is None:
+            continue
+        if doc.group_id in by_group:
+            uf.union(by_group[doc.group_id], insight_id)
+        else:
+            by_group[doc.group_id] = insight_id
+
+    touched_roots = {uf.find(a) for a, _, _ in pairs}
+    components: dict[uuid.UUID, list[uuid.UUID]] = {}
+    for insight_id in uf.parent:
+        root = uf.find(insight_id)
+        if root in touched_roots:
+            components.setdefault(root, []).append(insight_id)
+
+    params: list[dict] = []
+    groups_found: list[dict] = []
+    for member_ids in components.values():
+        if len(member_ids) < 2:
+            continue
+        existing = sorted({str(members[m].group_id) for m in member_ids if members[m].group_id})
+        group_id = uuid.UUID(existing[0]) if existing else uuid.uuid4()
+        sources_in_group = {members[m].source for m in member_ids}
+        source_count = len(sources_in_group)
+
+        scores = {}
+        for m in member_ids:
+            previous = members[m].score or 0.0
+            scores[m] = round(max(best_sim.get(m, 0.0), previous), 4)
+            params.append(
+                {
+                    "id": m,
+                    "correlation_group_id": group_id,
+                    "correlation_score": scores[m],
+                    "source_count": source_count,
+                }
+            )
+
+        groups_found.append(
+            {
+                "group_id": str(group_id),
+                "insights": [str(m) for m in member_ids],
+                "sources": list(sources_in_group),
+                "source_count": source_count,
+                "max_similarity": max(scores.values()),
+            }
+        )
+
+    return params, groups_found
+
+
+async def _index_new_insights(session: AsyncSession, cutoff: datetime) -> list[_IndexedDoc]:
+    """Tokenise approved insights not yet in the index and persist their entries.
+
+    Returns:
+        The newly indexed documents.
+    """
+    result = await session.execute(
+        select(
+            Insight.id,
+            Insight.title,
+            Insight.problem_statement,
+            Insight.created_at,
+            RawSignal.source,
+            Insight.correlation_group_id,
+            Insight.correlation_score,
+        )
+        .outerjoin(RawSignal, RawSignal.id == Insight.raw_signal_id)
+        .outerjoin(
+            InsightCorrelationIndex,
+            InsightCorrelationIndex.insight_id == Insight.id,
+        )
+        .where(Insight.created_at >= cutoff)
+        .where(Insight.admin_status == "approved")
+        .where(InsightCorrelationIndex.insight_id.is_(None))
+        .order_by(Insight.created_at.desc())
+        .limit(MAX_INSIGHTS_TO_SCAN)
+    )
+
+    docs: list[_IndexedDoc] = []
+    rows: list[dict] = []
+    for insight_id, title, problem_statement, created_at, source, group_id, score in result.all():
+        source = source or "unknown"
+        term_counts = dict(Counter(_tokenize(f"{title or ''} {problem_statement or ''}")))
+        band_keys = _band_keys(_minhash_signature(term_counts))
+        docs.append(_IndexedDoc(insight_id, source, term_counts, band_keys, group_id, score))
+        rows.append(
+            {
+                "insight_id": insight_id,
+                "source": source,
+                "insight_created_at": created_at,
+                "term_counts": term_counts,
+                "band_keys": band_keys,
+            }
+        )
+
+    if rows:
+        await session.execute(
+            insert(InsightCorrelationIndex)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["insight_id"])
+        )
+    return docs
+
+
 async def correlate_recent_insights() -> list[dict]:
     """Find cross-source correlations among insights created in the last 24 hours.
 
     Algorithm:
-    1. Fetch recent insights (last 24h) across all sources
-    2. Build TF-IDF vectors from problem_statement + title
-    3. Compare every pair from DIFFERENT sources
-    4. Group highly similar pairs (similarity > threshold)
-    5. Assign correlation_group_id to grouped insights
+    1. Drop index entries older than the window; index approved insights not
+       seen before (tokens + MinHash-LSH band keys)
+    2. Look up still-approved indexed insights in the window sharing a band key
+       (GIN overlap)
+    3. Score candidate pairs from DIFFERENT sources with TF-IDF cosine
+    4. Union highly similar pairs (similarity > threshold) with existing groups
+    5. Write correlation_group_id / score / source_count in one bulk UPDATE
 
     Returns:
-        List of correlation groups found.
+        List of correlation groups created or extended on this run.
     """
     cutoff = datetime.now(UTC) - timedelta(hours=CORRELATION_WINDOW_HOURS)
     groups_found = []
 
     try:
         async with AsyncSessionLocal() as session:
-            # Fetch recent insights with their source info
+            # Entries outside the window are never candidates again
+            await session.execute(
+                delete(InsightCorrelationIndex).where(
+                    InsightCorrelationIndex.insight_created_at < cutoff
+                )
+            )
+            new_docs = await _index_new_insights(session, cutoff)
+            if not new_docs:
+                await session.commit()
+                return []
+
+            new_ids = {doc.insight_id for doc in new_docs}
+            lookup_keys = sorted({key for doc in new_docs for key in doc.band_keys})
+
             result = await session.execute(
-                select(Insight)
-                .where(Insight.created_at >= cutoff)
-                .where(Insight.admin_status == "approved")
-                .order_by(Insight.created_at.desc())
-                .limit(MAX_INSIGHTS_TO_SCAN)
+                select(
+                    InsightCorrelationIndex.insight_id,
+                    InsightCorrelationIndex.source,
+                    InsightCorrelationIndex.term_counts,
+                    InsightCorrelationIndex.band_keys,
+                    Insight.correlation_group_id,
+                    Insight.correlation_score,
+                )
+                .join(Insight, Insight.id == InsightCorrelationIndex.insight_id)
+                .where(InsightCorrelationIndex.insight_created_at >= cutoff)
+                .where(Insight.admin_status == "approved")  # Rejected after indexing
+                .where(InsightCorrelationIndex.insight_id.not_in(new_ids))
+                .where(InsightCorrelationIndex.band_keys.overlap(lookup_keys))
             )
-            insights = result.scalars().all()
+            candidates = [_IndexedDoc(*row) for row in result.all()]
+            docs = new_docs + candidates
 
-            if len(insights) < 2:
+            pairs = _score_pairs(docs, _candidate_pairs(docs, new_ids))
+            if not pairs:
+                await session.commit()
                 return []
 
-            # Load source info via raw_signal relationship
-            # Build text corpus
-            texts = []
-            insight_sources = []
-            for ins in insights:
-                text = f"{ins.title or ''} {ins.problem_statement or ''}"
-                texts.append(text)
-                # Get source from raw_signal
-                source = ins.raw_signal.source if ins.raw_signal else "unknown"
-                insight_sources.append(source)
-
-            # Tokenize and compute TF-IDF
-            tokenized = [_tokenize(t) for t in texts]
-            tfidf_vectors = _compute_tfidf(tokenized)
-
-            # Find correlated pairs (different sources only)
-            # Track which insights are already grouped
-            grouped: dict[int, uuid.UUID] = {}  # index → group_id
-            correlation_pairs = []
-
-            for i in range(len(insights)):
-                for j in range(i + 1, len(insights)):
-                    # Skip same-source comparisons
-                    if insight_sources[i] == insight_sources[j]:
-                        continue
-
-                    sim = _cosine_similarity(tfidf_vectors[i], tfidf_vectors[j])
-                    if sim >= SIMILARITY_THRESHOLD:
-                        correlation_pairs.append((i, j, sim))
-
-            # Build groups from pairs using union-find with path compression
-            uf_parent: dict[int, int] = {}
-            uf_rank: dict[int, int] = {}
-
-            def _find(x: int) -> int:
-                if x not in uf_parent:
-                    uf_parent[x] = x
-                    uf_rank[x] = 0
-                while uf_parent[x] != x:
-                    uf_parent[x] = uf_parent[uf_parent[x]]  # path compression
-                    x = uf_parent[x]
-                return x
-
-            def _union(a: int, b: int) -> None:
-                ra, rb = _find(a), _find(b)
-                if ra == rb:
-                    return
-                if uf_rank[ra] < uf_rank[rb]:
-                    ra, rb = rb, ra
-                uf_parent[rb] = ra
-                if uf_rank[ra] == uf_rank[rb]:
-                    uf_rank[ra] += 1
-
-            for i, j, sim in correlation_pairs:
-                _union(i, j)
-
-            group_map: dict[int, uuid.UUID] = {}
-            grouped: dict[int, uuid.UUID] = {}
-            for idx in uf_parent:
-                root = _find(idx)
-                if root not in group_map:
-                    group_map[root] = uuid.uuid4()
-                grouped[idx] = group_map[root]
-
-            # Aggregate groups
-            group_members: dict[uuid.UUID, list[int]] = {}
-            for idx, gid in grouped.items():
-                group_members.setdefault(gid, []).append(idx)
-
-            # Update insights in DB
-            for group_id, member_indices in group_members.items():
-                if len(member_indices) < 2:
-                    continue
-
-                sources_in_group = set(insight_sources[idx] for idx in member_indices)
-                source_count = len(sources_in_group)
-
-                for idx in member_indices:
-                    ins = insights[idx]
-                    # Find best similarity for this insight within the group
-                    best_sim = 0.0
-                    for i, j, sim in correlation_pairs:
-                        if i == idx or j == idx:
-                            best_sim = max(best_sim, sim)
-
-                    await session.execute(
-                        update(Insight)
-                        .where(Insight.id == ins.id)
-                        .values(
-                            correlation_group_id=group_id,
-                            correlation_score=round(best_sim, 4),
-                            source_count=source_count,
-                        )
+            members = {doc.insight_id: doc for doc in docs}
+            existing_groups = {
+                members[i].group_id for a, b, _ in pairs for i in (a, b) if members[i].group_id
+            }
+            if existing_groups:
+                result = await session.execute(
+                    select(
+                        Insight.id,
+                        RawSignal.source,
+                        Insight.correlation_group_id,
+                        Insight.correlation_score,
                     )
-
-                groups_found.append(
-                    {
-                        "group_id": str(group_id),
-                        "insights": [str(insights[idx].id) for idx in member_indices],
-                        "sources": list(sources_in_group),
-                        "source_count": source_count,
-                        "max_similarity": round(
-                            max(
-                                sim
-                                for i, j, sim in correlation_pairs
-                                if i in member_indices or j in member_indices
-                            ),
-                            4,
-                        )
-                        if correlation_pairs
-                        else 0,
-                    }
+                    .outerjoin(RawSignal, RawSignal.id == Insight.raw_signal_id)
+                    .where(Insight.correlation_group_id.in_(existing_groups))
                 )
+                for insight_id, source, group_id, score in result.all():
+                    if insight_id not in members:
+                        members[insight_id] = _IndexedDoc(
+                            insight_id, source or "unknown", {}, [], group_id, score
+                        )
 
+            params, groups_found = _plan_group_updates(members, pairs)
+            if params:
+                # ORM bulk UPDATE by primary key — one executemany statement
+                await session.execute(update(Insight), params)
             await session.commit()
 
         if groups_found:
             logger.info(
                 f"Signal correlation: found {len(groups_found)} groups "
-                f"across {len(insights)} recent insights"
+                f"from {len(new_docs)} new insights ({len(pairs)} pairs scored above threshold)"
             )
 
     except Exception as e:
@@ -0,0 +1,260 @@
+"""Shared pub/sub broadcaster for polling-style SSE streams.
+
+Admin dashboards and agent-log tails used to run their own DB poll per open
+connection. A topic here has exactly one producer that builds each snapshot
+once and fans it out to every subscriber through a bounded queue:
+
+- Per process: the first subscriber starts the topic's producer task, the
+  last one to leave stops it.
+- Per cluster: when Redis is reachable, one process holds a short-lived
+  leader lock per topic and PUBLISHes snapshots; every process relays the
+  channel to its local subscribers. Without Redis, each process produces
+  locally.
+- Slow consumers whose queue fills up are dropped rather than buffered.
+
+Usage:
+    async with get_sse_broadcaster().subscribe("admin:metrics", produce, 5.0) as sub:
+        payload = await sub.next(timeout=15)
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Producer returns one JSON-serialisable payload: {"event": str, "data": Any}.
+# Producers should pre-serialise "data" where possible so it is encoded once per
+# snapshot rather than once per connection.
+Producer = Callable[[], Awaitable[dict[str, Any]]]
+
+_DROPPED = object()
+
+
+class SlowConsumerError(Exception):
+    """Raised by Subscription.next() after the subscriber was dropped for lagging."""
+
+
+class Subscription:
+    """One SSE connection's view of a topic."""
+
+    def __init__(self, topic: str, maxsize: int):
+        self.topic = topic
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.dropped = False
+
+    async def next(self, timeout: float) -> dict[str, Any] | None:
+        """
+        Wait for the next payload.
+
+        Returns:
+            The payload, or None if nothing arrived within `timeout`
+
+        Raises:
+            SlowConsumerError: The subscriber fell behind and was dropped
+        """
+        try:
+            item = await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except TimeoutError:
+            return None
+        if item is _DROPPED:
+            raise SlowConsumerError(self.topic)
+        return item
+
+
+@dataclass
+class _Topic:
+    name: str
+    producer: Producer
+    interval: float
+    subscribers: set[Subscription] = field(default_factory=set)
+    last_payload: dict[str, Any] | None = None
+    task: asyncio.Task | None = None
+
+
+class SSEBroadcaster:
+    """Fan-out hub: one producer per topic, many bounded subscriber queues."""
+
+    def __init__(self, queue_size: int = 16, use_redis: bool = True):
+        self.queue_size = queue_size
+        self.use_redis = use_redis
+        self._topics: dict[str, _Topic] = {}
+        self._instance_id = uuid.uuid4().hex
+        self.snapshots_produced = 0
+        self.dropped_subscribers = 0
+
+    @asynccontextmanager
+    async def subscribe(
+        self, topic: str, producer: Producer, interval: float
+    ) -> AsyncIterator[Subscription]:
+        """
+        Subscribe to a topic, starting its producer if this is the first subscriber.
+
+        The latest snapshot (if any) is delivered immediately so new connections
+        do not wait a full interval.
+
+        Args:
+            topic: Topic name; subscribers of the same topic share one producer
+            producer: Coroutine building one payload (used if the topic is not running)
+            interval: Seconds between snapshots
+        """
+        state = self._topics.get(topic)
+        if state is None:
+            state = _Topic(name=topic, producer=producer, interval=interval)
+            self._topics[topic] = state
+
+        sub = Subscription(topic, self.queue_size)
+        state.subscribers.add(sub)
+        if state.last_payload is not None:
+            sub.queue.put_nowait(state.last_payload)
+        if state.task is None or state.task.done():
+            state.task = asyncio.create_task(self._run(state))
+
+        try:
+            yield sub
+        finally:
+            state.subscribers.discard(sub)
+            if not state.subscribers and self._topics.get(topic) is state:
+                del self._topics[topic]
+                if state.task is not None:
+                    state.task.cancel()
+
+    def subscriber_count(self, topic: str | None = None) -> int:
+        """Open subscriptions for one topic, or across all topics."""
+        if topic is not None:
+            state = self._topics.get(topic)
+            return len(state.subscribers) if state else 0
+        return sum(len(s.subscribers) for s in self._topics.values())
+
+    def get_stats(self) -> dict[str, Any]:
+        """Topic/subscriber counts and cumulative producer/drop counters."""
+        return {
+            "topics": {name: len(s.subscribers) for name, s in self._topics.items()},
+            "subscribers": self.subscriber_count(),
+            "snapshots_produced": self.snapshots_produced,
+            "dropped_subscribers": self.dropped_subscribers,
+        }
+
+    def _fanout(self, state: _Topic, payload: dict[str, Any]) -> None:
+        state.last_payload = payload
+        for sub in list(state.subscribers):
+            try:
+                sub.queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                self._drop(state, sub)
+
+    def _drop(self, state: _Topic, sub: Subscription) -> None:
+        """Disconnect a lagging subscriber instead of buffering without bound."""
+        state.subscribers.discard(sub)
+        sub.dropped = True
+        while not sub.queue.empty():
+            sub.queue.get_nowait()
+        sub.queue.put_nowait(_DROPPED)
+        self.dropped_subscribers += 1
+        logger.warning(f"SSE broadcaster: dropped slow subscriber on {state.name}")
+
+    async def _produce(self, state: _Topic) -> dict[str, Any]:
+        try:
+            payload = await state.producer()
+        except Exception as e:
+            logger.error(f"SSE producer error on {state.name}: {e}", exc_info=True)
+            payload = {"event": "error", "data": json.dumps({"error": "Internal metrics error"})}
+        self.snapshots_produced += 1
+        return payload
+
+    async def _get_redis(self):
+        if not self.use_redis:
+            return None
+        try:
+            from app.core.cache import get_redis
+
+            redis = await get_redis()
+            await redis.ping()
+            return redis
+        except Exception as e:
+            logger.debug(f"SSE broadcaster running process-local (Redis unavailable: {e})")
+            return None
+
+    async def _is_leader(self, redis, state: _Topic) -> bool:
+        """Hold a short-lived per-topic lock so one process per cluster produces."""
+        key = f"sse:leader:{state.name}"
+        ttl_ms = int(state.interval * 3000)
+        if await redis.set(key, self._instance_id, nx=True, px=ttl_ms):
+            return True
+        if await redis.get(key) == self._instance_id:
+            await redis.pexpire(key, ttl_ms)
+            return True
+        return False
+
+    async def _relay(self, redis, state: _Topic) -> None:
+        """Forward payloads published on the topic channel to local subscribers."""
+        pubsub = redis.pubsub()
+        await pubsub.subscribe(f"sse:{state.name}")
+        try:
+            while True:
+                # Poll below the client socket_timeout so idle channels don't error
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message and message.get("type") == "message":
+                    self._fanout(state, json.loads(message["data"]))
+        finally:
+            with suppress(Exception):
+                await pubsub.unsubscribe()
+                await pubsub.aclose()
+
+    async def _run(self, state: _Topic) -> None:
+        redis = await self._get_redis()
+        relay: asyncio.Task | None = None
+        if redis is not None:
+            relay = asyncio.create_task(self._relay(redis, state))
+
+        try:
+            while True:
+                if relay is not None and relay.done():
+                    # Pub/sub connection lost: degrade to process-local production
+                    logger.warning(f"SSE broadcaster relay for {state.name} stopped, going local")
+                    redis, relay = None, None
+
+                if redis is None:
+                    self._fanout(state, await self._produce(state))
+                else:
+                    try:
+                        if await self._is_leader(redis, state):
+                            payload = await self._produce(state)
+                            await redis.publish(f"sse:{state.name}", json.dumps(payload))
+                    except Exception as e:
+                        logger.warning(f"SSE broadcaster Redis error on {state.name}: {e}")
+                        relay.cancel()
+                        redis, relay = None, None
+                        continue
+
+                await asyncio.sleep(state.interval)
+        finally:
+            if relay is not None:
+                relay.cancel()
+
+
+# Global broadcaster instance (one per process)
+_sse_broadcaster: SSEBroadcaster | None = None
+
+
+def get_sse_broadcaster() -> SSEBroadcaster:
+    """
+    Get or create the process-wide SSE broadcaster.
+
+    Returns:
+        SSEBroadcaster: Singleton configured from settings
+    """
+    global _sse_broadcaster
+    if _sse_broadcaster is None:
+        _sse_broadcaster = SSEBroadcaster(
+            queue_size=settings.sse_subscriber_queue_size,
+            use_redis=settings.sse_broadcast_use_redis,
+        )
+    return _sse_broadcaster
@@ -0,0 +1,217 @@
+"""Realtime Google Trends time-series storage (trend_points table).
+
+Write side: hourly_trends_update_task appends one point per (keyword, geo) and
+purges by time range. Read side returns TrendSeries objects whose timestamps
+and values are NumPy arrays, ready for spike detection and forecasting
+without re-parsing ISO strings.
+
+Usage:
+    async with AsyncSessionLocal() as session:
+        series = await get_trend_series(session, "ai agents", geo="US", since=week_ago)
+        baseline = series.values[:-1].mean()
+"""
+
+import logging
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import numpy as np
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.constants import TREND_POINTS_RETENTION_DAYS
+from app.models.trend_point import TrendPoint
+
+logger = logging.getLogger(__name__)
+
+TrendKey = tuple[str, str]  # (keyword, geo)
+
+DEFAULT_GEO = "US"
+
+
+def _to_naive_utc(ts: datetime) -> datetime:
+    """Normalise to naive UTC so NumPy datetime64 conversion is unambiguous."""
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(UTC).replace(tzinfo=None)
+    return ts
+
+
+@dataclass(frozen=True)
+class TrendSeries:
+    """
+    Time-ordered trend samples for one (keyword, geo).
+
+    Attributes:
+        keyword: Google Trends keyword
+        geo: Google Trends geo code
+        timestamps: datetime64[us] array (UTC), ascending
+        values: float64 array of interest scores, aligned with timestamps
+    """
+
+    keyword: str
+    geo: str
+    timestamps: np.ndarray
+    values: np.ndarray
+
+    @classmethod
+    def from_rows(cls, keyword: str, geo: str, rows: list[tuple[datetime, int]]) -> "TrendSeries":
+        """Build a series from (ts, value) rows already sorted by ts."""
+        timestamps = np.array([_to_naive_utc(ts) for ts, _ in rows], dtype="datetime64[us]")
+        values = np.fromiter((v for _, v in rows), dtype=np.float64, count=len(rows))
+        return cls(keyword, geo, timestamps, values)
+
+    @classmethod
+    def empty(cls, keyword: str, geo: str = DEFAULT_GEO) -> "TrendSeries":
+        return cls.from_rows(keyword, geo, [])
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def latest_timestamp(self) -> datetime | None:
+        """Most recent sample time (aware UTC), or None if empty."""
+        if not len(self):
+            return None
+        return self.timestamps[-1].astype(datetime).replace(tzinfo=UTC)
+
+    def after(self, ts: datetime | None) -> "TrendSeries":
+        """Samples strictly newer than `ts` (all samples if None)."""
+        if ts is None:
+            return self
+        mask = self.timestamps > np.datetime64(_to_naive_utc(ts), "us")
+        return TrendSeries(self.keyword, self.geo, self.timestamps[mask], self.values[mask])
+
+    def to_points(self) -> list[dict[str, Any]]:
+        """[{"timestamp": iso8601, "value": int}] for JSON/SSE payloads."""
+        return [
+            {"timestamp": ts.replace(tzinfo=UTC).isoformat(), "value": int(v)}
+            for ts, v in zip(self.timestamps.astype(datetime).tolist(), self.values.tolist())
+        ]
+
+    def daily(self) -> dict[str, list]:
+        """Daily mean in the {"dates": [...], "values": [...]} shape used by forecasting."""
+        if not len(self):
+            return {"dates": [], "values": []}
+        days = self.timestamps.astype("datetime64[D]")
+        unique_days, inverse = np.unique(days, return_inverse=True)
+        sums = np.bincount(inverse, weights=self.values)
+        counts = np.bincount(inverse)
+        return {
+            "dates": [str(d) for d in unique_days],
+            "values": np.round(sums / counts, 2).tolist(),
+        }
+
+
+def trend_key(extra_metadata: Mapping[str, Any] | None) -> TrendKey | None:
+    """(keyword, geo) for a Google Trends raw signal's metadata, or None."""
+    if not extra_metadata:
+        return None
+    keyword = extra_metadata.get("keyword")
+    if not keyword:
+        return None
+    return keyword, extra_metadata.get("geo") or DEFAULT_GEO
+
+
+async def append_trend_points(
+    session: AsyncSession,
+    points: Iterable[tuple[str, str, datetime, int]],
+) -> int:
+    """
+    Append (keyword, geo, ts, value) samples in one INSERT.
+
+    Duplicate (keyword, geo, ts) samples are ignored, so retries are idempotent.
+    Caller commits.
+
+    Returns:
+        Number of rows inserted
+    """
+    # Dedupe within the batch — several insights can share one (keyword, geo)
+    rows = list(
+        {
+            (keyword, geo, ts): {"keyword": keyword, "geo": geo, "ts": ts, "value": int(value)}
+            for keyword, geo, ts, value in points
+        }.values()
+    )
+    if not rows:
+        return 0
+    result = await session.execute(
+        insert(TrendPoint)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["keyword", "geo", "ts"])
+    )
+    return result.rowcount or 0
+
+
+async def purge_trend_points(
+    session: AsyncSession,
+    retention_days: int = TREND_POINTS_RETENTION_DAYS,
+) -> int:
+    """
+    Delete samples older than the retention window (range delete on ts).
+
+    Caller commits.
+
+    Returns:
+        Number of rows deleted
+    """
+    cutoff = datetime.now(UTC) - timedelta(days=retention_days)
+    result = await session.execute(delete(TrendPoint).where(TrendPoint.ts < cutoff))
+    deleted = result.rowcount or 0
+    if deleted:
+        logger.info(f"Purged {deleted} trend points older than {retention_days} days")
+    return deleted
+
+
+async def get_trend_series_many(
+    session: AsyncSession,
+    keys: Iterable[TrendKey] | None = None,
+    since: datetime | None = None,
+) -> dict[TrendKey, TrendSeries]:
+    """
+    Load several series in one query.
+
+    Args:
+        session: Database session
+        keys: (keyword, geo) pairs to load; None loads every key with data
+        since: Only samples at or after this time
+
+    Returns:
+        {(keyword, geo): TrendSeries}; keys without samples are omitted
+    """
+    stmt = select(TrendPoint.keyword, TrendPoint.geo, TrendPoint.ts, TrendPoint.value)
+    if keys is not None:
+        keys = list(keys)
+        if not keys:
+            return {}
+        stmt = stmt.where(tuple_(TrendPoint.keyword, TrendPoint.geo).in_(keys))
+    if since is not None:
+        stmt = stmt.where(TrendPoint.ts >= since)
+    stmt = stmt.order_by(TrendPoint.keyword, TrendPoint.geo, TrendPoint.ts)
+
+    grouped: dict[TrendKey, list[tuple[datetime, int]]] = {}
+    for keyword, geo, ts, value in (await session.execute(stmt)).all():
+        grouped.setdefault((keyword, geo), []).append((ts, value))
+
+    return {
+        (keyword, geo): TrendSeries.from_rows(keyword, geo, rows)
+        for (keyword, geo), rows in grouped.items()
+    }
+
+
+async def get_trend_series(
+    session: AsyncSession,
+    keyword: str,
+    geo: str = DEFAULT_GEO,
+    since: datetime | None = None,
+) -> TrendSeries:
+    """
+    Load one (keyword, geo) series, oldest first.
+
+    Returns:
+        TrendSeries (empty if no samples)
+    """
+    series = await get_trend_series_many(session, [(keyword, geo)], since=since)
+    return series.get((keyword, geo)) or TrendSeries.empty(keyword, geo)
@@ -1,41 +1,244 @@
-"""Trend prediction service using Prophet for time-series forecasting.
+"""Trend prediction service for time-series forecasting.
 
 This service implements AI-powered trend prediction for Google Trends data,
-providing 7-day ahead forecasts with confidence intervals.
+providing N-day ahead forecasts with confidence intervals.
 
 Phase 9.1: AI-Powered Trend Prediction
-- Train Prophet model on historical trend data (90+ days)
-- Generate 7-day ahead predictions
-- Include upper/lower confidence intervals
-- Cache predictions for 24 hours
+- Pluggable forecasters, picked by series length (select_forecaster):
+  - HoltWintersForecaster: NumPy damped-trend exponential smoothing (with
+    weekly seasonality when there is enough daily data) and a residual-based
+    interval; fits in milliseconds, so it serves the short 7-90 point series
+    most trends have
+  - ProphetForecaster: Prophet, reserved for long series
+    (>= FORECAST_PROPHET_MIN_POINTS) where changepoints and seasonality pay
+    for the Stan fit
+- pandas and prophet are imported lazily, only when Prophet is selected
+- Include upper/lower 80% confidence intervals and in-sample MAPE/RMSE
 """
 
 import asyncio
+import itertools
 import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
-import pandas as pd
-from prophet import Prophet
+import numpy as np
+
+from app.core.constants import FORECAST_PROPHET_MIN_POINTS
 
 logger = logging.getLogger(__name__)
 
+# Two-sided 80% normal quantile (matches Prophet's interval_width=0.80)
+_Z_80 = 1.2816
+
+# Minimum history for a forecast
+MIN_TRAINING_POINTS = 7
+
+
+@dataclass
+class ForecastResult:
+    """Raw output of a forecaster (unrounded)."""
+
+    dates: list[str]  # Future dates (YYYY-MM-DD)
+    values: np.ndarray  # Point forecast per future date
+    lower: np.ndarray  # Lower interval bound
+    upper: np.ndarray  # Upper interval bound
+    fitted: np.ndarray  # In-sample one-step-ahead fit, aligned with the history
+
+
+class Forecaster(ABC):
+    """Interface for forecasting backends."""
+
+    name: str = "base"
+
+    @abstractmethod
+    def fit_predict(self, dates: list[str], values: np.ndarray, periods: int) -> ForecastResult:
+        """
+        Fit on a history and forecast `periods` steps ahead.
+
+        Args:
+            dates: Historical dates (ISO format), oldest first
+            values: Historical values aligned with dates
+            periods: Number of steps to forecast
+
+        Returns:
+            ForecastResult
+        """
+
+
+def _median_step_days(dates: list[str]) -> int:
+    days = np.array(dates, dtype="datetime64[D]")
+    if len(days) < 2:
+        return 1
+    return max(int(np.median(np.diff(days).astype(int))), 1)
+
+
+def _future_dates(dates: list[str], periods: int) -> list[str]:
+    """Continue a date series at its spacing (monthly for monthly data, else in days)."""
+    step = _median_step_days(dates)
+    steps = np.arange(1, periods + 1)
+    if 28 <= step <= 31:
+        last_month = np.datetime64(dates[-1], "D").astype("datetime64[M]")
+        return [str(m.astype("datetime64[D]")) for m in last_month + steps]
+    return [str(d) for d in np.datetime64(dates[-1], "D") + steps * step]
+
+
+class HoltWintersForecaster(Forecaster):
+    """
+    Damped additive-trend exponential smoothing in NumPy.
+
+    Smoothing parameters are chosen by a small grid search minimizing one-step
+    squared error. Weekly additive seasonality is added for daily series with
+    at least two full weeks. The interval is the one-step residual spread
+    widened by sqrt(h) over the horizon.
+    """
+
+    name = "holt_winters"
+
+    ALPHAS = (0.1, 0.3, 0.5, 0.8)  # Level
+    BETAS = (0.05, 0.15, 0.3)  # Trend
+    PHIS = (0.8, 0.9, 0.98)  # Trend damping
+    GAMMAS = (0.05, 0.2)  # Seasonality
+    SEASON_LENGTH = 7
+
+    @staticmethod
+    def _smooth(
+        y: np.ndarray, alpha: float, beta: float, phi: float, gamma: float, m: int
+    ) -> tuple[np.ndarray, float, float, np.ndarray]:
+        """Run the recursions; returns (one-step fit, final level, final trend, seasonals)."""
+        n = len(y)
+        # Initial state is backcast one step before y[0], so fitted[0] ~ y[0]
+        if m:
+            mean = float(y[:m].mean())
+            trend = float((y[m : 2 * m].mean() - mean) / m)
+            season = y[:m] - (mean + trend * (np.arange(m) - (m - 1) / 2))
+            level = mean - trend * (m + 1) / 2
+        else:
+            season = np.zeros(1)
+            trend = float(y[1] - y[0])
+            level = float(y[0]) - trend
+
+        fitted = np.empty(n)
+        for t in range(n):
+            s = season[t % m] if m else 0.0
+            fitted[t] = level + phi * trend + s
+            prev_level = level
+            level = alpha * (y[t] - s) + (1 - alpha) * (prev_level + phi * trend)
+            trend = beta * (level - prev_level) + (1 - beta) * phi * trend
+            if m:
+                season[t % m] = gamma * (y[t] - level) + (1 - gamma) * s
+        return fitted, level, trend, season
+
+    def fit_predict(self, dates: list[str], values: np.ndarray, periods: int) -> ForecastResult:
+        y = np.asarray(values, dtype=float)
+        m = (
+            self.SEASON_LENGTH
+            if _median_step_days(dates) == 1 and len(y) >= 2 * self.SEASON_LENGTH
+            else 0
+        )
+        gammas = self.GAMMAS if m else (0.0,)
+
+        best = None
+        for alpha, beta, phi, gamma in itertools.product(
+            self.ALPHAS, self.BETAS, self.PHIS, gammas
+        ):
+            fitted, level, trend, season = self._smooth(y, alpha, beta, phi, gamma, m)
+            # Skip the warm-up step(s) the initial state was estimated from
+            sse = float(np.sum((y[max(m, 1) :] - fitted[max(m, 1) :]) ** 2))
+            if best is None or sse < best[0]:
+                best = (sse, phi, fitted, level, trend, season)
+
+        _, phi, fitted, level, trend, season = best
+        h = np.arange(1, periods + 1)
+        damped = np.cumsum(phi**h) * trend
+        seasonal = season[(len(y) + h - 1) % m] if m else 0.0
+        forecast = level + damped + seasonal
+
+        residuals = y[max(m, 1) :] - fitted[max(m, 1) :]
+        sigma = float(np.std(residuals, ddof=1)) if len(residuals) > 1 else 0.0
+        width = _Z_80 * sigma * np.sqrt(h)
+
+        return ForecastResult(
+            dates=_future_dates(dates, periods),
+            values=forecast,
+            lower=forecast - width,
+            upper=forecast + width,
+            fitted=fitted,
+        )
+
+
+class ProphetForecaster(Forecaster):
+    """
+    Facebook Prophet backend for long series.
+
+    Prophet handles missing data, changepoints and seasonality, at the cost of
+    a Stan fit (seconds, hundreds of MB); pandas and prophet are imported on
+    first use only.
+    """
+
+    name = "prophet"
+
+    def fit_predict(self, dates: list[str], values: np.ndarray, periods: int) -> ForecastResult:
+        import pandas as pd
+        from prophet import Prophet
+
+        # Prepare data for Prophet (requires 'ds' and 'y' columns)
+        df = pd.DataFrame({"ds": pd.to_datetime(dates), "y": values})
+
+        # interval_width=0.80 provides 80% confidence intervals
+        # daily_seasonality=False (not enough intra-day data)
+        # weekly_seasonality='auto' (detect if present)
+        # yearly_seasonality=False (not enough data)
+        model = Prophet(
+            interval_width=0.80,
+            daily_seasonality=False,
+            weekly_seasonality="auto",
+            yearly_seasonality=False,
+            changepoint_prior_scale=0.05,  # Flexibility of trend changes
+        )
+        model.fit(df)
+
+        forecast = model.predict(model.make_future_dataframe(periods=periods))
+        history_rows = forecast.head(len(df))
+        prediction_rows = forecast.tail(periods)
+
+        return ForecastResult(
+            dates=prediction_rows["ds"].dt.strftime("%Y-%m-%d").tolist(),
+            values=prediction_rows["yhat"].to_numpy(),
+            lower=prediction_rows["yhat_lower"].to_numpy(),
+            upper=prediction_rows["yhat_upper"].to_numpy(),
+            fitted=history_rows["yhat"].to_numpy(),
+        )
+
+
+def select_forecaster(n_points: int) -> Forecaster:
+    """
+    Pick a forecasting backend for a series length.
+
+    Args:
+        n_points: Number of historical points
+
+    Returns:
+        ProphetForecaster for long series, HoltWintersForecaster otherwise
+    """
+    if n_points >= FORECAST_PROPHET_MIN_POINTS:
+        return ProphetForecaster()
+    return HoltWintersForecaster()
+
 
 class TrendPredictionService:
     """
-    Service for generating time-series predictions using Facebook Prophet.
-
-    Prophet is a production-ready forecasting library that:
-    - Handles missing data automatically
-    - Detects seasonality (daily, weekly, yearly)
-    - Includes trend changepoints
-    - Provides confidence intervals
-    - Requires minimal hyperparameter tuning
+    Service for generating time-series predictions.
+
+    The backend is chosen per series by select_forecaster unless one is passed
+    explicitly (e.g. for benchmarking).
     """
 
-    def __init__(self):
+    def __init__(self, forecaster: Forecaster | None = None):
         """Initialize the trend prediction service."""
-        self.model = None
+        self.forecaster = forecaster
         self.logger = logger
 
     async def train_and_predict(
@@ -44,7 +247,26 @@ class TrendPredictionService:
         periods: int = 7,
     ) -> dict[str, Any]:
         """
-        Train Prophet model on historical trend data and generate predictions.
+        Train and predict in a worker thread (see fit_predict).
+
+        Args:
+            trend_data: Dictionary with 'dates' and 'values' arrays
+            periods: Number of days to forecast ahead (default: 7)
+
+        Returns:
+            Prediction dictionary (see fit_predict)
+        """
+        return await asyncio.to_thread(self.fit_predict, trend_data, periods)
+
+    def fit_predict(
+        self,
+        trend_data: dict[str, Any],
+        periods: int = 7,
+    ) -> dict[str, Any]:
+        """
+        Fit a forecaster on historical trend data and generate predictions.
+
+        Synchronous and CPU-bound: call from a thread or process pool.
 
         Args:
             trend_data: Dictionary with 'dates' and 'values' arrays
@@ -62,7 +284,8 @@ class TrendPredictionService:
                 "model_accuracy": {
                     "mape": 0.15,  # Mean Absolute Percentage Error
                     "rmse": 5.2    # Root Mean Squared Error
-                }
+                },
+                "metadata": {"model": "holt_winters", ...}
             }
 
         Raises:
@@ -73,61 +296,39 @@ class TrendPredictionService:
             dates = trend_data.get("dates", [])
             values = trend_data.get("values", [])
 
-            if len(dates) < 7:
+            if len(dates) < MIN_TRAINING_POINTS:
                 raise ValueError(
-                    f"Insufficient data for prediction: {len(dates)} days (minimum 7 required)"
+                    f"Insufficient data for prediction: {len(dates)} days "
+                    f"(minimum {MIN_TRAINING_POINTS} required)"
                 )
 
-            # Prepare data for Prophet (requires 'ds' and 'y' columns)
-            df = pd.DataFrame({"ds": pd.to_datetime(dates), "y": values})
-
-            # Initialize Prophet model
-            # interval_width=0.80 provides 80% confidence intervals
-            # daily_seasonality=False (not enough intra-day data)
-            # weekly_seasonality='auto' (detect if present)
-            # yearly_seasonality=False (not enough data)
-            self.model = Prophet(
-                interval_width=0.80,
-                daily_seasonality=False,
-                weekly_seasonality="auto",
-                yearly_seasonality=False,
-                changepoint_prior_scale=0.05,  # Flexibility of trend changes
-            )
-
-            # Train the model
+            actual = np.asarray(values, dtype=float)
+            forecaster = self.forecaster or select_forecaster(len(actual))
             self.logger.info(
-                f"Training Prophet model on {len(df)} data points "
-                f"(from {df['ds'].min()} to {df['ds'].max()})"
+                f"Training {forecaster.name} model on {len(actual)} data points "
+                f"(from {dates[0]} to {dates[-1]})"
             )
-            await asyncio.to_thread(self.model.fit, df)
-
-            # Generate future dataframe for next N days
-            future = self.model.make_future_dataframe(periods=periods)
-
-            # Make predictions
-            forecast = await asyncio.to_thread(self.model.predict, future)
-
-            # Extract prediction values (last N rows)
-            prediction_rows = forecast.tail(periods)
+            result = forecaster.fit_predict(dates, actual, periods)
 
             # Format predictions
             predictions = {
-                "dates": prediction_rows["ds"].dt.strftime("%Y-%m-%d").tolist(),
-                "values": prediction_rows["yhat"].round(0).astype(int).tolist(),
+                "dates": result.dates,
+                "values": np.round(result.values).astype(int).tolist(),
                 "confidence_intervals": {
-                    "lower": prediction_rows["yhat_lower"].round(0).astype(int).tolist(),
-                    "upper": prediction_rows["yhat_upper"].round(0).astype(int).tolist(),
+                    "lower": np.round(result.lower).astype(int).tolist(),
+                    "upper": np.round(result.upper).astype(int).tolist(),
                 },
-                "model_accuracy": self._calculate_accuracy(df, forecast),
+                "model_accuracy": self._calculate_accuracy(actual, result.fitted),
                 "metadata": {
+                    "model": forecaster.name,
                     "forecast_date": datetime.now(UTC).isoformat(),
-                    "training_data_points": len(df),
+                    "training_data_points": len(actual),
                     "prediction_horizon": periods,
                 },
             }
 
             self.logger.info(
-                f"Generated {periods}-day prediction with "
+                f"Generated {periods}-day {forecaster.name} prediction with "
                 f"MAPE={predictions['model_accuracy']['mape']:.2%}"
             )
 
@@ -137,38 +338,32 @@ class TrendPredictionService:
             self.logger.error(f"Prediction failed: {type(e).__name__} - {e}")
             raise
 
-    def _calculate_accuracy(
-        self, historical_df: pd.DataFrame, forecast_df: pd.DataFrame
-    ) -> dict[str, float]:
+    def _calculate_accuracy(self, actual: np.ndarray, predicted: np.ndarray) -> dict[str, float]:
         """
         Calculate model accuracy metrics on historical data.
 
         Args:
-            historical_df: Original training data
-            forecast_df: Full forecast dataframe (includes historical fit)
+            actual: Observed values
+            predicted: Model fit for the same points (any backend)
 
         Returns:
             Dictionary with accuracy metrics (MAPE, RMSE)
         """
         try:
-            # Match historical dates with forecast
-            merged = historical_df.merge(forecast_df[["ds", "yhat"]], on="ds")
-
-            # Calculate MAPE (Mean Absolute Percentage Error)
-            actual = merged["y"]
-            predicted = merged["yhat"]
+            actual = np.asarray(actual, dtype=float)
+            predicted = np.asarray(predicted, dtype=float)
+            errors = actual - predicted
 
             # Avoid division by zero
             non_zero = actual != 0
-            mape = ((actual[non_zero] - predicted[non_zero]).abs() / actual[non_zero].abs()).mean()
-
-            # Calculate RMSE (Root Mean Squared Error)
-            rmse = ((actual - predicted) ** 2).mean() ** 0.5
+            mape = (
+                float(np.mean(np.abs(errors[non_zero]) / np.abs(actual[non_zero])))
+                if non_zero.any()
+                else 0.0
+            )
+            rmse = float(np.sqrt(np.mean(errors**2)))
 
-            return {
-                "mape": float(mape),
-                "rmse": float(rmse),
-            }
+            return {"mape": mape, "rmse": rmse}
 
         except Exception as e:
             self.logger.warning(f"Accuracy calculation failed: {e}")
@@ -202,3 +397,17 @@ async def generate_trend_predictions(
     """
     service = TrendPredictionService()
     return await service.train_and_predict(trend_data, periods)
+
+
+def forecast_trend(trend_data: dict[str, Any], periods: int = 7) -> dict[str, Any]:
+    """
+    Synchronous prediction entry point, picklable for process pools.
+
+    Args:
+        trend_data: Historical trend data with 'dates' and 'values'
+        periods: Number of days to forecast
+
+    Returns:
+        Prediction dictionary with dates, values, and confidence intervals
+    """
+    return TrendPredictionService().fit_predict(trend_data, periods)
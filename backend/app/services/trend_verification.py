@@ -4,18 +4,23 @@ This module cross-references LLM-generated trend claims with actual
 Google Trends data to prevent fabricated growth percentages and
 ensure trend keywords are based on real search data.
 
-Uses pytrends (unofficial Google Trends API wrapper).
+Uses pytrends (unofficial Google Trends API wrapper), imported on first use:
+it pulls in pandas, which the API process otherwise never needs.
 """
 
 import asyncio
 import logging
 import math
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
+from typing import TYPE_CHECKING
 
-from pytrends.exceptions import ResponseError
-from pytrends.request import TrendReq
+from app.services.verification_cache import VerificationCache
+
+if TYPE_CHECKING:
+    from pytrends.request import TrendReq
 
 logger = logging.getLogger(__name__)
 
@@ -74,13 +79,20 @@ class TrendVerifier:
         self._tz = tz
         self._timeout = timeout
         self._pytrends: TrendReq | None = None
-        self._cache: dict[str, TrendVerificationResult] = {}
+        self._cache: VerificationCache[TrendVerificationResult] = VerificationCache(
+            "trend", TrendVerificationResult
+        )
         self._last_request_time: datetime | None = None
         self._min_request_interval = 10.0  # seconds between requests
+        # Verifications run on executor threads (and may outlive a timed-out
+        # validation stage), so the interval is enforced under a lock
+        self._rate_lock = threading.Lock()
 
-    def _get_pytrends(self) -> TrendReq:
+    def _get_pytrends(self) -> "TrendReq":
         """Get or create pytrends instance."""
         if self._pytrends is None:
+            from pytrends.request import TrendReq
+
             self._pytrends = TrendReq(
                 hl=self._hl,
                 tz=self._tz,
@@ -89,14 +101,15 @@ class TrendVerifier:
         return self._pytrends
 
     def _rate_limit(self) -> None:
-        """Apply rate limiting between requests."""
-        if self._last_request_time:
-            elapsed = (datetime.now() - self._last_request_time).total_seconds()
-            if elapsed < self._min_request_interval:
-                sleep_time = self._min_request_interval - elapsed
-                logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
-                time.sleep(sleep_time)
-        self._last_request_time = datetime.now()
+        """Apply rate limiting between requests (across threads)."""
+        with self._rate_lock:
+            if self._last_request_time:
+                elapsed = (datetime.now() - self._last_request_time).total_seconds()
+                if elapsed < self._min_request_interval:
+                    sleep_time = self._min_request_interval - elapsed
+                    logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
+                    time.sleep(sleep_time)
+            self._last_request_time = datetime.now()
 
     def verify_keyword_sync(
         self,
@@ -109,6 +122,8 @@ class TrendVerifier:
         """
         Synchronously verify a keyword's trend data against Google Trends.
 
+        Uncached; verify_keyword() goes through the verification cache.
+
         Args:
             keyword: Search keyword to verify
             timeframe: Google Trends timeframe (default: last 7 days)
@@ -119,11 +134,26 @@ class TrendVerifier:
         Returns:
             TrendVerificationResult with verification status and actual data
         """
-        # Check cache first
-        cache_key = f"{keyword}:{timeframe}:{geo}"
-        if cache_key in self._cache:
-            logger.debug(f"Cache hit for keyword: {keyword}")
-            return self._cache[cache_key]
+        return self._query_trends(keyword, timeframe, geo, llm_claimed_volume, llm_claimed_growth)[
+            0
+        ]
+
+    def _query_trends(
+        self,
+        keyword: str,
+        timeframe: str,
+        geo: str,
+        llm_claimed_volume: str | None,
+        llm_claimed_growth: str | None,
+    ) -> tuple[TrendVerificationResult, bool]:
+        """
+        Query Google Trends for one keyword.
+
+        Returns:
+            Tuple of (result, cacheable); API errors and rate limiting are not
+            cacheable
+        """
+        from pytrends.exceptions import ResponseError
 
         try:
             self._rate_limit()
@@ -149,8 +179,7 @@ class TrendVerifier:
                     llm_claimed_growth=llm_claimed_growth,
                     error="No trend data available for keyword",
                 )
-                self._cache[cache_key] = result
-                return result
+                return (result, True)
 
             # Extract values (fillna so NaN from sparse Trends data doesn't crash int())
             values = interest_df[keyword].fillna(0).values
@@ -201,8 +230,7 @@ class TrendVerifier:
                 else f"volume={avg_volume}"
             )
 
-            self._cache[cache_key] = result
-            return result
+            return (result, True)
 
         except ResponseError as e:
             error_msg = f"Google Trends API error: {e}"
@@ -216,7 +244,7 @@ class TrendVerifier:
                 llm_claimed_growth=llm_claimed_growth,
                 error=error_msg,
             )
-            return result
+            return (result, False)
 
         except Exception as e:
             error_msg = f"Unexpected error: {type(e).__name__}: {e}"
@@ -230,7 +258,7 @@ class TrendVerifier:
                 llm_claimed_growth=llm_claimed_growth,
                 error=error_msg,
             )
-            return result
+            return (result, False)
 
     async def verify_keyword(
         self,
@@ -243,7 +271,8 @@ class TrendVerifier:
         """
         Async wrapper for keyword verification.
 
-        pytrends is synchronous, so this runs in a thread pool.
+        Checks the verification cache first. pytrends is synchronous, so a
+        miss runs in a thread pool.
 
         Args:
             keyword: Search keyword to verify
@@ -255,16 +284,31 @@ class TrendVerifier:
         Returns:
             TrendVerificationResult with verification status
         """
+        cache_key = f"{keyword.lower()}:{timeframe}:{geo}"
+        cached = await self._cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Cache hit for keyword: {keyword}")
+            # The Trends data is shared; the claims being checked are this caller's
+            return replace(
+                cached,
+                keyword=keyword,
+                llm_claimed_volume=llm_claimed_volume,
+                llm_claimed_growth=llm_claimed_growth,
+            )
+
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
+        result, cacheable = await loop.run_in_executor(
             None,
-            self.verify_keyword_sync,
+            self._query_trends,
             keyword,
             timeframe,
             geo,
             llm_claimed_volume,
             llm_claimed_growth,
         )
+        if cacheable:
+            await self._cache.put(cache_key, result, positive=result.verified)
+        return result
 
     async def verify_trend_keywords(
         self,
@@ -371,10 +415,14 @@ class TrendVerifier:
         return f"{sign}{growth:.1f}%"
 
     def clear_cache(self) -> None:
-        """Clear the verification cache."""
-        self._cache.clear()
+        """Clear the in-process verification cache."""
+        self._cache.clear_local()
         logger.info("Trend verifier cache cleared")
 
+    def get_cache_stats(self) -> dict:
+        """Get cache statistics (hit rates across both tiers)."""
+        return self._cache.get_stats()
+
 
 def compare_growth_claims(
     llm_claimed: str | None,
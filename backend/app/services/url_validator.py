@@ -4,16 +4,20 @@ This module validates that competitor URLs are reachable and resolve
 correctly, preventing LLM hallucination of non-existent competitor
 websites.
 
-Uses httpx for async HTTP HEAD requests with redirect following.
+Uses one pooled httpx client (HTTP/2, keep-alive) for HEAD requests with
+redirect following; results go through the shared verification cache.
 """
 
 import asyncio
 import logging
+import time
 from dataclasses import dataclass
 from urllib.parse import urlparse
 
 import httpx
 
+from app.services.verification_cache import VerificationCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,7 +52,8 @@ class URLValidator:
     - Async HTTP HEAD requests for efficiency
     - Follows redirects to get final URL
     - Configurable timeout and retry
-    - Caching to avoid repeated validation
+    - One pooled HTTP/2 client, reused across validations
+    - Two-tier verification cache (dead URLs are cached negatively)
     - Domain normalization
     """
 
@@ -72,7 +77,47 @@ class URLValidator:
         self._max_redirects = max_redirects
         self._verify_ssl = verify_ssl
         self._user_agent = user_agent
-        self._cache: dict[str, URLValidationResult] = {}
+        self._cache: VerificationCache[URLValidationResult] = VerificationCache(
+            "url", URLValidationResult
+        )
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+
+        The connection pool belongs to the event loop it was created on, so a
+        validator used from a new loop closes the old client and gets a new one.
+
+        Returns:
+            Pooled httpx.AsyncClient
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                try:
+                    await self._client.aclose()
+                except Exception as e:  # Its loop may already be closed
+                    logger.debug(f"Closing URL validator client from previous loop failed: {e}")
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=self._timeout,
+                follow_redirects=True,
+                max_redirects=self._max_redirects,
+                verify=self._verify_ssl,
+                headers={"User-Agent": self._user_agent},
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
 
     def _normalize_url(self, url: str) -> str:
         """
@@ -168,9 +213,11 @@ class URLValidator:
             )
 
         # Check cache
-        if use_cache and normalized_url in self._cache:
-            logger.debug(f"Cache hit for URL: {normalized_url}")
-            return self._cache[normalized_url]
+        if use_cache:
+            cached = await self._cache.get(normalized_url)
+            if cached is not None:
+                logger.debug(f"Cache hit for URL: {normalized_url}")
+                return cached
 
         # Validate URL format
         is_valid, format_error = self._is_valid_url_format(normalized_url)
@@ -184,47 +231,37 @@ class URLValidator:
                 response_time_ms=None,
                 error=format_error,
             )
-            self._cache[normalized_url] = result
+            await self._cache.put(normalized_url, result, positive=False)
             return result
 
         # Make HTTP request
         try:
-            async with httpx.AsyncClient(
-                timeout=self._timeout,
-                follow_redirects=True,
-                max_redirects=self._max_redirects,
-                verify=self._verify_ssl,
-            ) as client:
-                import time
+            client = await self._get_client()
+            start_time = time.perf_counter()
 
-                start_time = time.perf_counter()
+            # Use HEAD request for efficiency
+            response = await client.head(normalized_url)
 
-                # Use HEAD request for efficiency
-                response = await client.head(
-                    normalized_url,
-                    headers={"User-Agent": self._user_agent},
-                )
+            response_time_ms = (time.perf_counter() - start_time) * 1000
 
-                response_time_ms = (time.perf_counter() - start_time) * 1000
+            # Check if response is successful (2xx or 3xx)
+            is_valid = response.status_code < 400
 
-                # Check if response is successful (2xx or 3xx)
-                is_valid = response.status_code < 400
-
-                result = URLValidationResult(
-                    url=url,
-                    valid=is_valid,
-                    final_url=str(response.url),
-                    status_code=response.status_code,
-                    redirect_count=len(response.history),
-                    response_time_ms=round(response_time_ms, 2),
-                    error=None if is_valid else f"HTTP {response.status_code}",
-                )
+            result = URLValidationResult(
+                url=url,
+                valid=is_valid,
+                final_url=str(response.url),
+                status_code=response.status_code,
+                redirect_count=len(response.history),
+                response_time_ms=round(response_time_ms, 2),
+                error=None if is_valid else f"HTTP {response.status_code}",
+            )
 
-                logger.info(
-                    f"URL validation {'passed' if is_valid else 'failed'}: "
-                    f"{url} -> {response.status_code} "
-                    f"(final: {response.url}, {response_time_ms:.0f}ms)"
-                )
+            logger.info(
+                f"URL validation {'passed' if is_valid else 'failed'}: "
+                f"{url} -> {response.status_code} "
+                f"(final: {response.url}, {response_time_ms:.0f}ms)"
+            )
 
         except httpx.TimeoutException:
             result = URLValidationResult(
@@ -285,9 +322,11 @@ class URLValidator:
                 error=f"Unexpected error: {type(e).__name__}",
             )
             logger.error(f"Unexpected URL validation error: {url} - {e}")
+            # Not a verdict on the URL: leave it uncached
+            return result
 
-        # Cache result
-        self._cache[normalized_url] = result
+        # Cache result (timeouts and connection errors too: dead domains stay dead)
+        await self._cache.put(normalized_url, result, positive=result.valid)
         return result
 
     async def validate_competitor(
@@ -416,16 +455,18 @@ class URLValidator:
         return processed_results
 
     def clear_cache(self) -> None:
-        """Clear the validation cache."""
-        self._cache.clear()
+        """Clear the in-process validation cache."""
+        self._cache.clear_local()
         logger.info("URL validator cache cleared")
 
     def get_cache_stats(self) -> dict:
-        """Get cache statistics."""
+        """Get cache statistics (in-process entries plus hit rates across both tiers)."""
+        results = self._cache.local_results()
         return {
-            "cached_urls": len(self._cache),
-            "valid_cached": sum(1 for r in self._cache.values() if r.valid),
-            "invalid_cached": sum(1 for r in self._cache.values() if not r.valid),
+            "cached_urls": len(results),
+            "valid_cached": sum(1 for r in results if r.valid),
+            "invalid_cached": sum(1 for r in results if not r.valid),
+            **self._cache.get_stats(),
         }
 
 
@@ -444,3 +485,9 @@ def get_url_validator() -> URLValidator:
     if _url_validator is None:
         _url_validator = URLValidator()
     return _url_validator
+
+
+async def close_url_validator() -> None:
+    """Close the global validator's pooled HTTP client (worker shutdown)."""
+    if _url_validator is not None:
+        await _url_validator.aclose()
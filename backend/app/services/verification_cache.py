@@ -0,0 +1,143 @@
+"""Shared cache for post-LLM verification results.
+
+URL reachability, subreddit existence and Google Trends lookups are slow,
+rate-limited and return the same answer for hours, so their results are cached
+in two tiers:
+
+- In-process LRU with per-entry expiry (at most VERIFICATION_CACHE_LOCAL_TTL_SECONDS)
+- Redis (verify:{kind}:{key}), shared by the API and worker processes and
+  surviving restarts
+
+Negative results (dead URL, unknown subreddit, keyword without data) are
+cached too, with a shorter TTL per kind. Transient failures (API errors,
+rate limits) should not be stored; callers decide what to put().
+"""
+
+import json
+import logging
+import time
+from dataclasses import asdict
+from typing import Any, Generic, TypeVar
+
+from cachetools import TLRUCache
+
+from app.core.cache import get_redis
+from app.core.constants import (
+    VERIFICATION_CACHE_LOCAL_SIZE,
+    VERIFICATION_CACHE_LOCAL_TTL_SECONDS,
+    VERIFICATION_CACHE_TTL_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_KEY_PREFIX = "verify:"
+
+
+def _expires_at(key: str, entry: tuple[float, Any], now: float) -> float:
+    """TLRUCache time-to-use: each entry carries its own TTL."""
+    return now + entry[0]
+
+
+class VerificationCache(Generic[T]):
+    """
+    Two-tier (memory, Redis) cache for one kind of verification result.
+
+    Args:
+        kind: Result kind ("url", "subreddit", "trend"); selects the TTLs
+            and the Redis key namespace
+        result_type: Dataclass the results are rebuilt into from Redis
+    """
+
+    def __init__(self, kind: str, result_type: type[T]):
+        self.kind = kind
+        self._result_type = result_type
+        self._positive_ttl, self._negative_ttl = VERIFICATION_CACHE_TTL_SECONDS[kind]
+        self._local: TLRUCache = TLRUCache(
+            maxsize=VERIFICATION_CACHE_LOCAL_SIZE,
+            ttu=_expires_at,
+            timer=time.monotonic,
+        )
+        self._stats = {"local_hits": 0, "redis_hits": 0, "misses": 0, "stores": 0}
+
+    def _redis_key(self, key: str) -> str:
+        return f"{_KEY_PREFIX}{self.kind}:{key}"
+
+    def _store_local(self, key: str, result: T, ttl: int) -> None:
+        self._local[key] = (min(ttl, VERIFICATION_CACHE_LOCAL_TTL_SECONDS), result)
+
+    async def get(self, key: str) -> T | None:
+        """
+        Look up a result, in memory first, then in Redis.
+
+        Args:
+            key: Normalized lookup key (URL, subreddit name, keyword:timeframe:geo)
+
+        Returns:
+            Cached result, or None on a miss (Redis errors count as misses)
+        """
+        entry = self._local.get(key)
+        if entry is not None:
+            self._stats["local_hits"] += 1
+            return entry[1]
+
+        try:
+            redis = await get_redis()
+            redis_key = self._redis_key(key)
+            pipe = redis.pipeline()
+            pipe.get(redis_key)
+            pipe.ttl(redis_key)
+            value, ttl = await pipe.execute()
+            if value:
+                result = self._result_type(**json.loads(value))
+                # Kept locally no longer than Redis still holds it
+                self._store_local(key, result, ttl if ttl > 0 else self._negative_ttl)
+                self._stats["redis_hits"] += 1
+                return result
+        except Exception as e:
+            logger.debug(f"Verification cache read failed for {self.kind}:{key}: {e}")
+
+        self._stats["misses"] += 1
+        return None
+
+    async def put(self, key: str, result: T, positive: bool) -> None:
+        """
+        Store a result in both tiers.
+
+        Args:
+            key: Normalized lookup key
+            result: Result dataclass
+            positive: Whether the check passed (selects the positive or negative TTL)
+        """
+        ttl = self._positive_ttl if positive else self._negative_ttl
+        self._store_local(key, result, ttl)
+        self._stats["stores"] += 1
+        try:
+            redis = await get_redis()
+            await redis.setex(self._redis_key(key), ttl, json.dumps(asdict(result)))
+        except Exception as e:
+            logger.debug(f"Verification cache write failed for {self.kind}:{key}: {e}")
+
+    def clear_local(self) -> None:
+        """Drop the in-process tier (Redis entries expire on their own)."""
+        self._local.clear()
+
+    def local_results(self) -> list[T]:
+        """Unexpired results held in the in-process tier."""
+        self._local.expire()
+        return [entry[1] for entry in list(self._local.values())]
+
+    def get_stats(self) -> dict:
+        """Hit/miss counters and hit rate since process start."""
+        self._local.expire()
+        hits = self._stats["local_hits"] + self._stats["redis_hits"]
+        lookups = hits + self._stats["misses"]
+        return {
+            "kind": self.kind,
+            "local_entries": len(self._local),
+            **self._stats,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "positive_ttl_seconds": self._positive_ttl,
+            "negative_ttl_seconds": self._negative_ttl,
+        }
@@ -14,7 +14,6 @@ load_dotenv(Path(__file__).resolve().parent.parent / ".env")
 
 from arq import cron
 from arq.connections import RedisSettings
-from sqlalchemy.orm.attributes import flag_modified
 
 from app.core.config import settings
 from app.db.session import AsyncSessionLocal
@@ -495,7 +494,11 @@ async def _run_scraper(source_name: str, scraper: BaseScraper) -> dict[str, Any]
     start_time = _time.time()
     try:
         async with AsyncSessionLocal() as session:
-            signals = await scraper.run(session)
+            # Per-source timeout: a hung Crawl4AI/pytrends call counts as a failure
+            # (circuit breaker + source health) instead of stalling the caller.
+            signals = await asyncio.wait_for(
+                scraper.run(session), timeout=settings.scraper_run_timeout
+            )
             await session.commit()
 
         elapsed_ms = (_time.time() - start_time) * 1000
@@ -518,15 +521,24 @@ async def _run_scraper(source_name: str, scraper: BaseScraper) -> dict[str, Any]
         except Exception as e:
             logger.debug(f"Anomaly detection error for {source_name}: {e}")
 
-        logger.info(f"{source_name} scraping complete: {len(signals)} signals saved")
+        save_stats = scraper.last_save_stats
+        logger.info(
+            f"{source_name} scraping complete: {len(signals)} signals saved "
+            f"({save_stats.deduplicated_by_hash} dup by hash, "
+            f"{save_stats.deduplicated_by_url} dup by URL)"
+        )
         return {
             "status": "success",
             "source": source_name,
             "signals_saved": len(signals),
+            "deduplicated_by_hash": save_stats.deduplicated_by_hash,
+            "deduplicated_by_url": save_stats.deduplicated_by_url,
         }
 
     except Exception as e:
         elapsed_ms = (_time.time() - start_time) * 1000
+        if isinstance(e, TimeoutError):
+            e = TimeoutError(f"scraper run exceeded {settings.scraper_run_timeout}s")
         logger.error(f"{source_name} scraping failed: {type(e).__name__} - {e}")
 
         # Phase 6.1A: Record failure
@@ -703,134 +715,110 @@ async def hourly_trends_update_task(ctx: dict[str, Any]) -> dict[str, Any]:
     """
     Hourly background task to update Google Trends real-time data for top insights.
 
-    This task:
-    1. Fetches top 100 insights by relevance score
-    2. Updates their trend data with latest hourly data point
-    3. Stores realtime trend data in extra_metadata.trend_data_realtime
-    4. Implements 90-day data retention policy
+    Pipeline:
+    1. One query loads the Google Trends signals linked to the top 100 insights
+    2. Keywords are deduped by (keyword, geo) so shared keywords are fetched once
+    3. Each geo is fetched in 5-keyword pytrends batches (429 backoff in the scraper)
+    4. Values are rescaled to each keyword's own 0-100 scale, fanned back out to
+       every insight and appended to trend_points
+    5. Samples older than the 90-day retention window are purged
+    6. Spike detection runs and changed trend forecasts are refit
 
     Args:
         ctx: Arq context dictionary
 
     Returns:
-        Task result with count of insights updated
+        Task result with insight counts, pytrends request count and wall time
     """
-    from datetime import UTC, datetime, timedelta
+    import time as _time
+    from datetime import UTC, datetime
 
     from sqlalchemy import desc, select
 
     from app.models.insight import Insight
     from app.models.raw_signal import RawSignal
+    from app.services.trend_points import append_trend_points, purge_trend_points, trend_key
 
     logger.info("Starting hourly trends update task")
+    started = _time.perf_counter()
 
     try:
-        updated_count = 0
-        failed_count = 0
-
         async with AsyncSessionLocal() as session:
-            # Get top 100 insights by relevance score
-            stmt = select(Insight).order_by(desc(Insight.relevance_score)).limit(100)
-            result = await session.execute(stmt)
-            insights = result.scalars().all()
-
-            logger.info(f"Found {len(insights)} insights to update with hourly trends")
+            # Top 100 insights by relevance, joined to their Google Trends signal
+            top_insights = (
+                select(Insight.id, Insight.raw_signal_id)
+                .order_by(desc(Insight.relevance_score))
+                .limit(100)
+                .subquery()
+            )
+            result = await session.execute(
+                select(top_insights.c.id, RawSignal.extra_metadata)
+                .join(RawSignal, RawSignal.id == top_insights.c.raw_signal_id)
+                .where(RawSignal.source == "google_trends")
+            )
+            linked = result.all()
+
+            insights_by_key: dict[tuple[str, str], list] = {}
+            for insight_id, extra_metadata in linked:
+                key = trend_key(extra_metadata)
+                if key:
+                    insights_by_key.setdefault(key, []).append(insight_id)
+
+            keywords_by_geo: dict[str, list[str]] = {}
+            for keyword, geo in insights_by_key:
+                keywords_by_geo.setdefault(geo, []).append(keyword)
+
+            logger.info(
+                f"Hourly trends: {len(linked)} linked insights, "
+                f"{len(insights_by_key)} unique (keyword, geo) pairs "
+                f"across {len(keywords_by_geo)} geos"
+            )
 
-            # Process each insight
-            for insight in insights:
+            # Fetch each geo's keywords in pytrends batches (one payload = one geo).
+            # Batch values depend on the other keywords in the payload, so store
+            # normalized_interest (rescaled to each keyword's own peak) instead
+            now = datetime.now(UTC)
+            interest: dict[tuple[str, str], int] = {}
+            request_count = 0
+            for geo, keywords in keywords_by_geo.items():
+                results = []
                 try:
-                    # Find associated Google Trends signal
-                    signal_stmt = (
-                        select(RawSignal)
-                        .where(RawSignal.id == insight.raw_signal_id)
-                        .where(RawSignal.source == "google_trends")
-                    )
-                    signal_result = await session.execute(signal_stmt)
-                    signal = signal_result.scalar_one_or_none()
-
-                    if not signal or not signal.extra_metadata:
-                        continue
-
-                    # Extract keyword from signal metadata
-                    keyword = signal.extra_metadata.get("keyword")
-                    if not keyword:
-                        continue
-
-                    # Scrape latest hourly data for this keyword
                     scraper = GoogleTrendsScraper(
-                        keywords=[keyword],
+                        keywords=keywords,
                         timeframe="now 1-H",  # Last hour
-                        geo=signal.extra_metadata.get("geo", "US"),
-                    )
-
-                    # Get latest data point
-                    results = await scraper.scrape()
-                    if not results:
-                        continue
-
-                    latest_result = results[0]
-                    current_interest = latest_result.metadata.get("current_interest", 0)
-
-                    # Initialize or update realtime trend data
-                    if "trend_data_realtime" not in signal.extra_metadata:
-                        signal.extra_metadata["trend_data_realtime"] = {
-                            "timestamps": [],
-                            "values": [],
-                        }
-
-                    # Add new data point
-                    now = datetime.now(UTC)
-                    signal.extra_metadata["trend_data_realtime"]["timestamps"].append(
-                        now.isoformat()
-                    )
-                    signal.extra_metadata["trend_data_realtime"]["values"].append(current_interest)
-
-                    # Implement 90-day retention policy
-                    cutoff_date = now - timedelta(days=90)
-                    timestamps = signal.extra_metadata["trend_data_realtime"]["timestamps"]
-                    values = signal.extra_metadata["trend_data_realtime"]["values"]
-
-                    # Filter out data older than 90 days.
-                    # Guard against naive ISO strings stored before the UTC fix.
-                    filtered_data = []
-                    for ts, val in zip(timestamps, values):
-                        dt = datetime.fromisoformat(ts)
-                        if dt.tzinfo is None:
-                            dt = dt.replace(tzinfo=UTC)
-                        if dt >= cutoff_date:
-                            filtered_data.append((ts, val))
-
-                    if filtered_data:
-                        signal.extra_metadata["trend_data_realtime"]["timestamps"] = [
-                            item[0] for item in filtered_data
-                        ]
-                        signal.extra_metadata["trend_data_realtime"]["values"] = [
-                            item[1] for item in filtered_data
-                        ]
-
-                    # Mark signal as modified — flag_modified required because
-                    # SQLAlchemy does not auto-detect in-place JSON mutations.
-                    flag_modified(signal, "extra_metadata")
-                    session.add(signal)
-
-                    updated_count += 1
-                    logger.debug(
-                        f"Updated hourly trend for insight {insight.id} "
-                        f"(keyword: {keyword}, value: {current_interest})"
+                        geo=geo,
                     )
-
+                    try:
+                        results = await scraper.scrape_keywords()
+                    finally:
+                        request_count += scraper.request_count
                 except Exception as e:
-                    failed_count += 1
                     logger.error(
-                        f"Failed to update hourly trend for insight {insight.id}: "
-                        f"{type(e).__name__} - {e}"
+                        f"Hourly trends fetch failed for geo {geo}: {type(e).__name__} - {e}"
                     )
-
+                for item in results:
+                    keyword = item.metadata.get("keyword")
+                    if keyword:
+                        interest[(keyword, geo)] = item.metadata.get("normalized_interest", 0)
+
+            # Fan out: one sample per (keyword, geo), shared by every linked insight
+            updated_count = sum(len(insights_by_key[key]) for key in interest)
+            failed_count = sum(
+                len(ids) for key, ids in insights_by_key.items() if key not in interest
+            )
+            await append_trend_points(
+                session,
+                [(keyword, geo, now, value) for (keyword, geo), value in interest.items()],
+            )
+            await purge_trend_points(session)
             await session.commit()
 
+        wall_time_ms = round((_time.perf_counter() - started) * 1000, 1)
         logger.info(
             f"Hourly trends update complete: {updated_count} updated, "
-            f"{failed_count} failed out of {len(insights)} insights"
+            f"{failed_count} failed out of {len(linked)} linked insights "
+            f"({request_count} pytrends requests for {len(insights_by_key)} keywords, "
+            f"{wall_time_ms}ms)"
         )
 
         # Phase 6.4C: Run keyword spike detection after trends update
@@ -843,11 +831,23 @@ async def hourly_trends_update_task(ctx: dict[str, Any]) -> dict[str, Any]:
         except Exception as e:
             logger.debug(f"Spike detection error (non-fatal): {e}")
 
+        # Refit trend forecasts whose series changed (unchanged series are skipped)
+        try:
+            from app.services.forecast_engine import refresh_trend_forecasts
+
+            async with AsyncSessionLocal() as session:
+                await refresh_trend_forecasts(session)
+        except Exception as e:
+            logger.warning(f"Forecast refresh error (non-fatal): {e}")
+
         return {
             "status": "success",
             "updated": updated_count,
             "failed": failed_count,
-            "total": len(insights),
+            "total": len(linked),
+            "keywords": len(insights_by_key),
+            "requests": request_count,
+            "wall_time_ms": wall_time_ms,
         }
 
     except Exception as e:
@@ -860,44 +860,136 @@ async def hourly_trends_update_task(ctx: dict[str, Any]) -> dict[str, Any]:
 
 async def scrape_all_sources_task(ctx: dict[str, Any]) -> dict[str, Any]:
     """
-    Background task to scrape all sources sequentially.
+    Background task to scrape all sources concurrently.
 
     This is the main scheduled task that runs every 6 hours.
 
+    Sources fan out under a global cap of `settings.scrape_all_concurrency`
+    (1 = sequential). Each source still goes through _run_scraper, so the
+    circuit breaker, distributed lock and source-health bookkeeping apply per
+    source, and each scraper run is bounded by `settings.scraper_run_timeout`.
+    A source that raises is isolated and reported as an error.
+
     Args:
         ctx: Arq context dictionary
 
     Returns:
-        Aggregated task results from all sources
+        Aggregated task results from all sources, with per-source timings
     """
+    import time as _time
+
     logger.info("Starting scrape_all_sources task")
 
-    results = {
-        "reddit": await scrape_reddit_task(ctx),
-        "product_hunt": await scrape_product_hunt_task(ctx),
-        "google_trends": await scrape_trends_task(ctx),
-        "twitter": await scrape_twitter_task(ctx),
-        "hacker_news": await scrape_hackernews_task(ctx),
+    source_tasks = {
+        "reddit": scrape_reddit_task,
+        "product_hunt": scrape_product_hunt_task,
+        "google_trends": scrape_trends_task,
+        "twitter": scrape_twitter_task,
+        "hacker_news": scrape_hackernews_task,
     }
+    slots = asyncio.Semaphore(max(1, settings.scrape_all_concurrency))
+    timings_ms: dict[str, float] = {}
+
+    async def _run_source(name: str) -> dict[str, Any]:
+        async with slots:
+            started = _time.perf_counter()
+            try:
+                return await source_tasks[name](ctx)
+            except Exception as e:
+                logger.error(f"{name} source task crashed: {type(e).__name__} - {e}")
+                return {"status": "error", "source": name, "error": str(e)}
+            finally:
+                timings_ms[name] = round((_time.perf_counter() - started) * 1000, 1)
+
+    wall_start = _time.perf_counter()
+    outcomes = await asyncio.gather(*(_run_source(name) for name in source_tasks))
+    wall_time_ms = round((_time.perf_counter() - wall_start) * 1000, 1)
+    results = dict(zip(source_tasks, outcomes))
 
     total_signals = sum(
         r.get("signals_saved", 0) for r in results.values() if r.get("status") == "success"
     )
 
-    logger.info(f"scrape_all_sources task complete: {total_signals} total signals saved")
+    logger.info(
+        f"scrape_all_sources task complete: {total_signals} total signals saved "
+        f"in {wall_time_ms:.0f}ms (per source: {timings_ms})"
+    )
 
     return {
         "status": "success",
         "total_signals": total_signals,
+        "wall_time_ms": wall_time_ms,
+        "timings_ms": timings_ms,
         "details": results,
     }
 
 
+async def _analyze_one_signal(signal_id: Any, db_slots: asyncio.Semaphore) -> str:
+    """
+    Analyze a single raw signal using three micro-sessions: fetch, insert, mark.
+
+    No DB connection is held open during the Gemini API call. The signal is
+    marked processed only after its insight has been committed.
+
+    Args:
+        signal_id: RawSignal primary key
+        db_slots: Semaphore bounding concurrent DB sessions across in-flight signals
+
+    Returns:
+        "analyzed" on success, "skipped" if the signal was already processed
+
+    Raises:
+        Exception: Propagated from analysis or persistence; signal stays unprocessed
+    """
+    from sqlalchemy import select, text, update
+
+    from app.agents.enhanced_analyzer import analyze_signal_enhanced_with_fallback
+    from app.models.raw_signal import RawSignal
+
+    # 2a: fetch signal data (close connection before AI call)
+    signal = None
+    async with db_slots, AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(RawSignal).where(RawSignal.id == signal_id, RawSignal.processed == False)  # noqa: E712
+        )
+        signal = result.scalar_one_or_none()
+        if signal is not None:
+            # Expunge so signal is usable after session closes
+            session.expunge(signal)
+
+    if signal is None:
+        return "skipped"  # Already processed by concurrent task
+
+    # 2b: call Gemini (no DB session open; rate limited inside the analyzer)
+    insight = await analyze_signal_enhanced_with_fallback(signal)
+
+    # 2c: insert insight (short session, just an INSERT)
+    # Reset statement_timeout in case a pooled connection inherited one.
+    async with db_slots, AsyncSessionLocal() as session:
+        await session.execute(text("SET LOCAL statement_timeout = 0"))
+        session.add(insight)
+        await session.commit()
+
+    logger.info(f"Committed insight for signal {signal_id} from {signal.source}")
+
+    # 2d: mark signal processed (separate short session)
+    async with db_slots, AsyncSessionLocal() as session:
+        await session.execute(text("SET LOCAL statement_timeout = 0"))
+        await session.execute(
+            update(RawSignal).where(RawSignal.id == signal_id).values(processed=True)
+        )
+        await session.commit()
+
+    return "analyzed"
+
+
 async def analyze_signals_task(ctx: dict[str, Any]) -> dict[str, Any]:
     """
     Background task to analyze unprocessed raw signals.
 
-    Processes signals in batches using PydanticAI enhanced analyzer.
+    Processes signals in batches using PydanticAI enhanced analyzer, with up to
+    `settings.analysis_concurrency` signals in flight. Gemini calls are paced by
+    the shared RPM/TPM token bucket (app.core.llm_rate_limiter).
     Marks signals as processed ONLY AFTER successful commit.
 
     Uses enhanced analyzer for IdeaBrowser-parity content quality:
@@ -915,9 +1007,8 @@ async def analyze_signals_task(ctx: dict[str, Any]) -> dict[str, Any]:
     Returns:
         Task result with count of analyzed signals
     """
-    from sqlalchemy import select, text, update
+    from sqlalchemy import select
 
-    from app.agents.enhanced_analyzer import analyze_signal_enhanced_with_fallback
     from app.models.raw_signal import RawSignal
 
     logger.info("Starting signal analysis task")
@@ -959,60 +1050,38 @@ async def analyze_signals_task(ctx: dict[str, Any]) -> dict[str, Any]:
                 "total": 0,
             }
 
-        logger.info(f"Processing {len(signal_ids)} signals (one session per signal)")
+        concurrency = max(1, settings.analysis_concurrency)
+        logger.info(
+            f"Processing {len(signal_ids)} signals "
+            f"(one session per signal, concurrency={concurrency})"
+        )
 
         analyzed_count = 0
         failed_count = 0
 
-        # Phase 2: three micro-sessions per signal — fetch, insert, mark.
-        # No DB connection is held open during the Gemini API call.
-        for signal_id in signal_ids:
-            try:
-                # 2a: fetch signal data (close connection before AI call)
-                signal = None
-                async with AsyncSessionLocal() as session:
-                    result = await session.execute(
-                        select(RawSignal).where(
-                            RawSignal.id == signal_id, RawSignal.processed == False
-                        )  # noqa: E712
-                    )
-                    signal = result.scalar_one_or_none()
-                    if signal is not None:
-                        # Expunge so signal is usable after session closes
-                        session.expunge(signal)
-
-                if signal is None:
-                    continue  # Already processed by concurrent task
-
-                # 2b: call Gemini (no DB session open)
-                insight = await analyze_signal_enhanced_with_fallback(signal)
-
-                # 2c: insert insight (short session, just an INSERT)
-                # Reset statement_timeout in case a pooled connection inherited one.
-                async with AsyncSessionLocal() as session:
-                    await session.execute(text("SET LOCAL statement_timeout = 0"))
-                    session.add(insight)
-                    await session.commit()
-
-                logger.info(f"Committed insight for signal {signal_id} from {signal.source}")
-
-                # 2d: mark signal processed (separate short session)
-                async with AsyncSessionLocal() as session:
-                    await session.execute(text("SET LOCAL statement_timeout = 0"))
-                    await session.execute(
-                        update(RawSignal).where(RawSignal.id == signal_id).values(processed=True)
-                    )
-                    await session.commit()
+        # Phase 2: up to `concurrency` signals in flight. Gemini pacing comes from
+        # the shared RPM/TPM token bucket inside the analyzer, not a fixed sleep.
+        # DB micro-sessions are gated separately so in-flight signals never take
+        # more than db_pool_size connections, leaving overflow for other jobs.
+        signal_slots = asyncio.Semaphore(concurrency)
+        db_slots = asyncio.Semaphore(max(1, min(concurrency, settings.db_pool_size)))
 
-                analyzed_count += 1
+        async def _bounded(signal_id: Any) -> str:
+            async with signal_slots:
+                return await _analyze_one_signal(signal_id, db_slots)
 
-            except Exception as e:
+        outcomes = await asyncio.gather(
+            *(_bounded(signal_id) for signal_id in signal_ids), return_exceptions=True
+        )
+        for signal_id, outcome in zip(signal_ids, outcomes):
+            if isinstance(outcome, BaseException):
                 failed_count += 1
-                logger.error(f"Failed to analyze signal {signal_id}: {type(e).__name__} - {e}")
+                logger.error(
+                    f"Failed to analyze signal {signal_id}: {type(outcome).__name__} - {outcome}"
+                )
                 # Signal remains unprocessed for retry on next run
-
-            # Brief pause between signals to avoid saturating Gemini rate limits.
-            await asyncio.sleep(5)
+            elif outcome == "analyzed":
+                analyzed_count += 1
 
         logger.info(
             f"Analysis task complete: {analyzed_count} analyzed, "
@@ -1058,9 +1127,15 @@ async def startup(ctx: dict[str, Any]) -> None:
 
     Runs when the worker starts up.
     Phase 6.3B: Pre-warm cache with most-accessed data.
+    Also brings the explore category index in line with seo_categories.
     """
     logger.info("Arq worker starting up")
 
+    # Evict L1 cache entries invalidated by the API (admin edits)
+    from app.core.cache import start_invalidation_listener
+
+    await start_invalidation_listener()
+
     # Phase 6.3B: Bootstrap cache hydration
     try:
         from app.core.cache import hydrate_cache
@@ -1070,15 +1145,52 @@ async def startup(ctx: dict[str, Any]) -> None:
     except Exception as e:
         logger.warning(f"Cache hydration failed (non-fatal): {e}")
 
+    # Rebuild explore categories whose keyword lists changed since last indexed
+    try:
+        from app.marketing.services.category_index import sync_category_index
+
+        async with AsyncSessionLocal() as session:
+            result = await sync_category_index(session)
+        logger.info(f"Category index sync on startup: {result}")
+    except Exception as e:
+        logger.warning(f"Category index sync failed (non-fatal): {e}")
+
 
 async def shutdown(ctx: dict[str, Any]) -> None:
     """
     Shutdown hook for Arq worker.
 
     Runs when the worker shuts down.
+    Closes the shared Crawl4AI browser pool and the forecast process pool so no
+    child processes leak, and the URL validator's pooled HTTP client.
     """
     logger.info("Arq worker shutting down")
 
+    from app.core.cache import stop_invalidation_listener
+
+    await stop_invalidation_listener()
+
+    try:
+        from app.scrapers.crawl4ai_client import close_browser_pool
+
+        await close_browser_pool()
+    except Exception as e:
+        logger.warning(f"Browser pool shutdown failed (non-fatal): {e}")
+
+    try:
+        from app.services.forecast_engine import get_forecast_engine
+
+        get_forecast_engine().shutdown()
+    except Exception as e:
+        logger.warning(f"Forecast pool shutdown failed (non-fatal): {e}")
+
+    try:
+        from app.services.url_validator import close_url_validator
+
+        await close_url_validator()
+    except Exception as e:
+        logger.warning(f"URL validator client shutdown failed (non-fatal): {e}")
+
 
 def _make_worker_redis_settings() -> RedisSettings:
     """Parse REDIS_URL into RedisSettings — handles Upstash TLS (rediss://)."""
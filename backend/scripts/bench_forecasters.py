@@ -0,0 +1,141 @@
+"""Benchmark: forecasting backends on the stored trend_data series.
+
+Loads every trend_data blob (trends.trend_data and
+raw_signals.extra_metadata["trend_data"]), holds out the last --holdout points
+of each series, fits every backend on the rest and reports, per backend and
+series-length bucket:
+
+- holdout MAPE / RMSE (out-of-sample accuracy)
+- in-sample MAPE / RMSE (what _calculate_accuracy reports)
+- mean and p95 fit time
+
+Prophet fits are the slow part; cap them with --limit.
+
+Run: cd backend && uv run python scripts/bench_forecasters.py [--limit 50] [--synthetic]
+"""
+
+import argparse
+import asyncio
+import math
+import statistics
+import time
+
+import numpy as np
+
+from app.services.trend_prediction import (
+    HoltWintersForecaster,
+    ProphetForecaster,
+    TrendPredictionService,
+)
+
+BUCKETS = ((7, 30), (30, 90), (90, 10_000))
+
+
+async def load_series(limit: int) -> list[tuple[str, list[str], list[float]]]:
+    """Fetch (label, dates, values) for every stored trend_data blob."""
+    from sqlalchemy import select
+
+    from app.db.session import AsyncSessionLocal
+    from app.models.raw_signal import RawSignal
+    from app.models.trend import Trend
+
+    series = []
+    async with AsyncSessionLocal() as session:
+        for keyword, data in (await session.execute(select(Trend.keyword, Trend.trend_data))).all():
+            series.append((f"trend:{keyword}", data))
+        rows = await session.execute(
+            select(RawSignal.id, RawSignal.extra_metadata["trend_data"]).limit(limit * 4)
+        )
+        for signal_id, data in rows.all():
+            series.append((f"signal:{signal_id}", data))
+
+    usable = [
+        (label, data["dates"], [float(v) for v in data["values"]])
+        for label, data in series
+        if isinstance(data, dict)
+        and len(data.get("dates") or []) == len(data.get("values") or [])
+        and len(data.get("dates") or []) >= 14
+    ]
+    return usable[:limit]
+
+
+def synthetic_series(count: int) -> list[tuple[str, list[str], list[float]]]:
+    """Trend-shaped series (growth + weekly cycle + noise) of mixed lengths."""
+    rng = np.random.default_rng(7)
+    series = []
+    for i in range(count):
+        n = int(rng.choice([14, 30, 60, 120]))
+        t = np.arange(n)
+        values = (
+            40
+            + rng.uniform(-0.3, 0.8) * t
+            + rng.uniform(0, 8) * np.sin(2 * np.pi * t / 7)
+            + rng.normal(0, 3, n)
+        )
+        dates = [str(np.datetime64("2026-01-01") + np.timedelta64(int(d), "D")) for d in t]
+        series.append((f"synthetic:{i}", dates, np.clip(values, 1, 100).tolist()))
+    return series
+
+
+def bench(series, holdout: int) -> None:
+    service = TrendPredictionService()
+    backends = (HoltWintersForecaster(), ProphetForecaster())
+    results = {(b.name, bucket): [] for b in backends for bucket in BUCKETS}
+
+    for _, dates, values in series:
+        train_dates, train_values = dates[:-holdout], np.array(values[:-holdout])
+        actual = np.array(values[-holdout:])
+        bucket = next(b for b in BUCKETS if b[0] <= len(train_values) < b[1])
+        for backend in backends:
+            start = time.perf_counter()
+            forecast = backend.fit_predict(train_dates, train_values, holdout)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            results[(backend.name, bucket)].append(
+                (
+                    service._calculate_accuracy(actual, forecast.values),
+                    service._calculate_accuracy(train_values, forecast.fitted),
+                    elapsed_ms,
+                )
+            )
+
+    print(f"{len(series)} series, holdout={holdout}")
+    print(
+        f"{'backend':<14}{'points':>10}{'n':>5}{'hold MAPE':>11}{'hold RMSE':>11}"
+        f"{'fit MAPE':>10}{'fit RMSE':>10}{'mean ms':>10}{'p95 ms':>9}"
+    )
+    for (name, (lo, hi)), rows in results.items():
+        if not rows:
+            continue
+        times = sorted(r[2] for r in rows)
+        points = f"{lo}-{hi}" if hi < 10_000 else f"{lo}+"
+        print(
+            f"{name:<14}{points:>10}{len(rows):>5}"
+            f"{statistics.mean(r[0]['mape'] for r in rows):>11.2%}"
+            f"{statistics.mean(r[0]['rmse'] for r in rows):>11.2f}"
+            f"{statistics.mean(r[1]['mape'] for r in rows):>10.2%}"
+            f"{statistics.mean(r[1]['rmse'] for r in rows):>10.2f}"
+            f"{statistics.mean(times):>10.1f}"
+            f"{times[math.ceil(0.95 * len(times)) - 1]:>9.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--limit", type=int, default=50, help="Max series to benchmark")
+    parser.add_argument("--holdout", type=int, default=7, help="Points held out per series")
+    parser.add_argument(
+        "--synthetic", action="store_true", help="Use generated series instead of the database"
+    )
+    args = parser.parse_args()
+
+    series = (
+        synthetic_series(args.limit) if args.synthetic else asyncio.run(load_series(args.limit))
+    )
+    if not series:
+        print("No trend_data series with >= 14 points found (try --synthetic)")
+        return
+    bench(series, args.holdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Microbenchmark: per-request middleware overhead, legacy stack vs fused pipeline.
+
+Drives the ASGI apps directly (no network, no DB) for /health and /api/insights
+endpoints that return payloads shaped like the real ones, and reports mean
+latency and overhead over the bare app:
+
+- bare:   endpoints only
+- legacy: nine pass-through BaseHTTPMiddleware layers doing the former per-layer
+          header work (tracing, request ID, zero-trust, DLP, session security,
+          security headers, size limit, API version, rate limiter)
+- fused:  RequestPipelineMiddleware
+
+Run: cd backend && uv run python scripts/bench_middleware.py [--requests 5000]
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.middleware.pipeline import RequestPipelineMiddleware
+
+_INSIGHTS_PAYLOAD = {
+    "items": [
+        {
+            "id": str(uuid.uuid4()),
+            "problem_statement": "Small firms spend hours on manual bookkeeping " * 3,
+            "proposed_solution": "Autonomous ledger agent reconciling bank feeds " * 3,
+            "market_size_estimate": "Large",
+            "relevance_score": 0.87,
+            "source": "reddit",
+        }
+        for _ in range(20)
+    ],
+    "total": 20,
+    "limit": 20,
+    "offset": 0,
+}
+
+
+def _endpoints() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    @app.get("/api/insights")
+    async def insights():
+        return _INSIGHTS_PAYLOAD
+
+    return app
+
+
+class _LegacyLayer(BaseHTTPMiddleware):
+    """One former BaseHTTPMiddleware layer: call_next plus its header writes."""
+
+    def __init__(self, app, headers: dict[str, str]):
+        super().__init__(app)
+        self.extra_headers = headers
+
+    async def dispatch(self, request, call_next):
+        request.headers.get("x-request-id")
+        response = await call_next(request)
+        for name, value in self.extra_headers.items():
+            response.headers[name] = value
+        return response
+
+
+def _legacy_app() -> FastAPI:
+    app = _endpoints()
+    layers = [
+        {"X-Correlation-ID": "abc", "X-Response-Time-Ms": "0.1"},  # tracing
+        {"X-Request-ID": "req"},  # request ID
+        {},  # zero-trust
+        {},  # DLP
+        {"X-Content-Type-Options": "nosniff", "X-Frame-Options": "DENY"},  # session
+        {"X-Frame-Options": "DENY", "Referrer-Policy": "strict-origin-when-cross-origin"},
+        {},  # size limit
+        {"API-Version": "1", "X-API-Version": "1.0.0"},
+        {},  # rate limiter
+    ]
+    for headers in layers:
+        app.add_middleware(_LegacyLayer, headers=headers)
+    return app
+
+
+def _fused_app() -> FastAPI:
+    app = _endpoints()
+    app.add_middleware(RequestPipelineMiddleware)
+    return app
+
+
+async def _call(app, path: str) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench"), (b"user-agent", b"bench/1.0")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+
+async def _measure(app, path: str, requests: int) -> float:
+    """Mean microseconds per request after a warm-up."""
+    for _ in range(200):
+        await _call(app, path)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await _call(app, path)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+async def main(requests: int) -> None:
+    apps = {"bare": _endpoints(), "legacy": _legacy_app(), "fused": _fused_app()}
+    for path in ("/health", "/api/insights"):
+        results = {name: await _measure(app, path, requests) for name, app in apps.items()}
+        print(f"\n{path} ({requests} requests)")
+        for name, us in results.items():
+            overhead = us - results["bare"]
+            print(f"  {name:<7} {us:8.1f} us/req   overhead {overhead:+8.1f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
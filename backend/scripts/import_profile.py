@@ -0,0 +1,134 @@
+"""Import-time profile for the API and worker entry points.
+
+Runs `python -X importtime -c "import <entry>"` in a fresh interpreter per
+entry point (a true cold import) and reports:
+
+- total cumulative import time vs IMPORT_TIME_BUDGET_SECONDS
+- number of modules loaded vs IMPORT_MODULE_BUDGET
+- the slowest top-level packages (cumulative) and modules (self time)
+- any LAZY_IMPORT_MODULES that leaked onto the import path, with the chain of
+  modules that pulled them in
+
+Run: cd backend && uv run python scripts/import_profile.py [app.main app.worker] [--top 25]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.core.constants import (
+    IMPORT_MODULE_BUDGET,
+    IMPORT_TIME_BUDGET_SECONDS,
+    LAZY_IMPORT_MODULES,
+)
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+    parents: tuple[str, ...]  # Importing modules, outermost first
+
+
+def profile(entry: str) -> list[ImportRecord]:
+    """Cold-import `entry` in a subprocess and parse its -X importtime output."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {entry}"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(BACKEND_DIR)},
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {entry} failed:\n{proc.stderr[-2000:]}")
+
+    # importtime prints children before their parent; collect, then resolve
+    # each module's importer chain from the indentation
+    raw = []
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            raw.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+
+    records: list[ImportRecord] = []
+    pending: list[tuple[int, int]] = []  # (depth, record index) awaiting their parent
+    for module, self_us, cumulative_us, depth in raw:
+        index = len(records)
+        records.append(ImportRecord(module, self_us, cumulative_us, depth, ()))
+        while pending and pending[-1][0] > depth:
+            _, child = pending.pop()
+            records[child].parents = (module,)
+        pending.append((depth, index))
+
+    # Expand single parent links into full chains
+    by_module = {r.module: r for r in records}
+    for record in records:
+        chain, parent = [], record.parents[0] if record.parents else None
+        while parent is not None and parent not in chain:
+            chain.append(parent)
+            parent_record = by_module.get(parent)
+            parent = parent_record.parents[0] if parent_record and parent_record.parents else None
+        record.parents = tuple(reversed(chain))
+    return records
+
+
+def report(entry: str, top: int) -> bool:
+    """Print the profile for one entry point; returns False if over budget or leaking."""
+    records = profile(entry)
+    total = next((r.cumulative_us for r in records if r.module == entry), 0) / 1e6
+    budget = IMPORT_TIME_BUDGET_SECONDS.get(entry)
+    module_budget = IMPORT_MODULE_BUDGET.get(entry)
+    status = "" if budget is None else f" (budget {budget:.1f}s)"
+    module_status = "" if module_budget is None else f" (budget {module_budget})"
+    print(f"\n== {entry}: {total:.2f}s cold import{status}, {len(records)} modules{module_status}")
+
+    packages = {r.module: r.cumulative_us for r in records if "." not in r.module}
+    print("\nSlowest top-level packages (cumulative):")
+    for name, us in sorted(packages.items(), key=lambda kv: -kv[1])[:top]:
+        print(f"  {us / 1000:9.1f} ms  {name}")
+
+    print("\nSlowest modules (self):")
+    for r in sorted(records, key=lambda r: -r.self_us)[:top]:
+        print(f"  {r.self_us / 1000:9.1f} ms  {r.module}")
+
+    loaded = {r.module: r for r in records}
+    leaks = [name for name in LAZY_IMPORT_MODULES if name in loaded]
+    if leaks:
+        print("\nLazy-import modules loaded at startup:")
+        for name in leaks:
+            record = loaded[name]
+            chain = " <- ".join(reversed([*record.parents, name]))
+            print(f"  {record.cumulative_us / 1000:9.1f} ms  {chain}")
+    else:
+        print(f"\nNo lazy-import modules loaded ({', '.join(LAZY_IMPORT_MODULES)})")
+
+    return (
+        not leaks
+        and (budget is None or total <= budget)
+        and (module_budget is None or len(records) <= module_budget)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("entries", nargs="*", default=list(IMPORT_TIME_BUDGET_SECONDS))
+    parser.add_argument("--top", type=int, default=20, help="Rows per table")
+    args = parser.parse_args()
+
+    ok = all([report(entry, args.top) for entry in args.entries])
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,13 +16,13 @@ import pytest
 import pytest_asyncio
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import JSON
+from sqlalchemy import JSON, event
 
 # ============================================
 # SQLite Compatibility for PostgreSQL types
 # ============================================
 # Register PostgreSQL types to use SQLite-compatible types
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.pool import StaticPool
@@ -71,6 +71,22 @@ def compile_array_sqlite(element, compiler, **kw):
     return "TEXT"
 
 
+# tsvector columns become plain TEXT generated from lower-cased text
+@compiles(TSVECTOR, "sqlite")
+def compile_tsvector_sqlite(element, compiler, **kw):
+    return "TEXT"
+
+
+def register_sqlite_search_functions(dbapi_connection, connection_record):
+    """Deterministic stand-ins for the functions used by generated search columns."""
+    dbapi_connection.create_function(
+        "to_tsvector", 2, lambda _config, text: (text or "").lower(), deterministic=True
+    )
+    dbapi_connection.create_function(
+        "setweight", 2, lambda vector, _weight: vector, deterministic=True
+    )
+
+
 # ============================================
 # Database Fixtures
 # ============================================
@@ -96,6 +112,7 @@ async def test_engine():
         poolclass=StaticPool,
         echo=False,
     )
+    event.listen(engine.sync_engine, "connect", register_sqlite_search_functions)
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -4,11 +4,11 @@ End-to-end tests covering BaseScraper.save_to_database, CircuitBreaker
 integration, and the full scrape→save workflow, using a concrete test
 scraper, an in-memory mock session, and a mocked Redis backend.
 
-The save_to_database method performs TWO session.execute calls per result:
-  1. Hash-based dedup check (RawSignal.content_hash == hash)
-  2. URL-based dedup check (RawSignal.url == url AND source == source)
-Tests that need to simulate a duplicate must configure the mock to return
-an existing record on the *first* execute call for that result.
+The save_to_database method performs at most THREE session.execute calls per batch:
+  1. Hash-based dedup lookup (RawSignal.content_hash IN batch hashes)
+  2. URL-based dedup lookup (RawSignal.url IN batch URLs AND source == source)
+  3. Multi-row INSERT ... ON CONFLICT (content_hash) DO NOTHING RETURNING
+Tests simulate duplicates by configuring which hashes/URLs the lookups return.
 """
 
 import time
@@ -16,6 +16,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.models.raw_signal import RawSignal
 from app.scrapers.base_scraper import BaseScraper, CircuitBreaker, CircuitState
 from app.scrapers.firecrawl_client import ScrapeResult
 
@@ -49,20 +50,28 @@ def make_result(
     return ScrapeResult(url=url, title=title, content=content, metadata={})
 
 
-def _no_existing() -> MagicMock:
-    """Mock execute result that signals no existing record (new signal)."""
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = None
-    return mock_result
+def _bulk_execute(existing_hashes=(), existing_urls=(), fail_on_call: int | None = None):
+    """Execute side effect for the bulk save path.
 
+    Call 1 returns existing hashes, call 2 existing URLs, call 3 echoes the
+    INSERT parameters back as RawSignal rows (the RETURNING clause).
+    """
+    calls = {"n": 0}
+
+    async def execute(stmt, params=None):
+        calls["n"] += 1
+        if fail_on_call == calls["n"]:
+            raise RuntimeError("DB error")
+        result = MagicMock()
+        if calls["n"] == 1:
+            result.scalars.return_value.all.return_value = list(existing_hashes)
+        elif calls["n"] == 2:
+            result.scalars.return_value.all.return_value = list(existing_urls)
+        else:
+            result.scalars.return_value.all.return_value = [RawSignal(**row) for row in params]
+        return result
 
-def _existing_record() -> MagicMock:
-    """Mock execute result that signals a duplicate (existing record found)."""
-    existing = MagicMock()
-    existing.id = "existing-uuid"
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = existing
-    return mock_result
+    return execute
 
 
 # ---------------------------------------------------------------------------
@@ -74,7 +83,7 @@ def _existing_record() -> MagicMock:
 def mock_session():
     """Async session where every execute returns 'no existing record'."""
     session = AsyncMock()
-    session.execute = AsyncMock(return_value=_no_existing())
+    session.execute = AsyncMock(side_effect=_bulk_execute())
     session.add = MagicMock()
     session.flush = AsyncMock()
     return session
@@ -111,8 +120,8 @@ async def test_full_scrape_saves_signals(mock_session):
     signals = await scraper.save_to_database(mock_session, results)
 
     assert len(signals) == 3
-    assert mock_session.add.call_count == 3
-    mock_session.flush.assert_awaited_once()
+    # Two dedup lookups + one multi-row INSERT, independent of batch size
+    assert mock_session.execute.await_count == 3
 
 
 # ---------------------------------------------------------------------------
@@ -122,17 +131,19 @@ async def test_full_scrape_saves_signals(mock_session):
 
 @pytest.mark.asyncio
 async def test_duplicate_signals_skipped(mock_session):
-    """When hash-check execute returns an existing record, that result is skipped."""
+    """When the hash lookup returns an existing hash, that result is skipped."""
     result = make_result()
+    existing_hash = BaseScraper.compute_content_hash(result.content)
 
-    # First execute call (hash dedup) returns an existing record → duplicate skipped.
-    mock_session.execute = AsyncMock(return_value=_existing_record())
+    mock_session.execute = AsyncMock(side_effect=_bulk_execute(existing_hashes=[existing_hash]))
 
     scraper = _TestScraper()
     signals = await scraper.save_to_database(mock_session, [result])
 
     assert signals == []
-    mock_session.add.assert_not_called()
+    # No INSERT issued when every row is a duplicate
+    assert mock_session.execute.await_count == 2
+    assert scraper.last_save_stats.deduplicated_by_hash == 1
 
 
 # ---------------------------------------------------------------------------
@@ -217,9 +228,8 @@ async def test_empty_scrape_returns_empty(mock_session):
     signals = await scraper.save_to_database(mock_session, [])
 
     assert signals == []
-    mock_session.add.assert_not_called()
-    # flush is NOT called for an empty list (early return before flush)
-    mock_session.flush.assert_not_awaited()
+    # No DB round trips for an empty list (early return)
+    mock_session.execute.assert_not_awaited()
 
 
 # ---------------------------------------------------------------------------
@@ -264,21 +274,13 @@ async def test_content_hash_dedup(mock_session):
         r2.content
     )
 
-    # save_to_database issues TWO execute calls per result (hash check + URL check).
-    # r1 needs both to return no-existing (hash=new, url=new) so it is saved.
-    # r2 only needs the first (hash check) to find an existing record to be skipped.
-    mock_session.execute = AsyncMock(
-        side_effect=[
-            _no_existing(),  # r1 hash check → new
-            _no_existing(),  # r1 url check  → new (r1 is saved)
-            _existing_record(),  # r2 hash check → duplicate → skip
-        ]
-    )
-
+    # Identical content inside one batch is collapsed before any DB lookup.
     signals = await scraper.save_to_database(mock_session, [r1, r2])
 
     # Only r1 should be saved
     assert len(signals) == 1
+    assert signals[0].url == "https://example.com/a"
+    assert scraper.last_save_stats.deduplicated_by_hash == 1
 
     # Two different contents → different hashes → both saved
     r3 = make_result(url="https://example.com/c", content="Unique content A")
@@ -288,7 +290,7 @@ async def test_content_hash_dedup(mock_session):
     )
 
     mock_session2 = AsyncMock()
-    mock_session2.execute = AsyncMock(return_value=_no_existing())
+    mock_session2.execute = AsyncMock(side_effect=_bulk_execute())
     mock_session2.add = MagicMock()
     mock_session2.flush = AsyncMock()
 
@@ -303,21 +305,21 @@ async def test_content_hash_dedup(mock_session):
 
 @pytest.mark.asyncio
 async def test_url_dedup_per_source(mock_session):
-    """Same URL + source combo is skipped when the URL dedup query finds a match.
+    """Same URL + source combo is skipped when the URL dedup lookup finds a match.
 
-    save_to_database issues two execute calls per result:
-      1st → hash check (no existing), 2nd → URL check (existing found) → skip.
+    1st execute → hash lookup (no existing), 2nd execute → URL lookup (existing found) → skip.
     """
     result = make_result(url="https://example.com/existing")
     scraper = _TestScraper()
 
-    # 1st execute (hash check) → no duplicate; 2nd execute (URL check) → duplicate
-    mock_session.execute = AsyncMock(side_effect=[_no_existing(), _existing_record()])
+    mock_session.execute = AsyncMock(
+        side_effect=_bulk_execute(existing_urls=["https://example.com/existing"])
+    )
 
     signals = await scraper.save_to_database(mock_session, [result])
 
     assert signals == []
-    mock_session.add.assert_not_called()
+    assert scraper.last_save_stats.deduplicated_by_url == 1
 
 
 # ---------------------------------------------------------------------------
@@ -333,8 +335,8 @@ async def test_scraper_run_workflow(mock_session):
 
     signals = await scraper.run(mock_session)
 
-    # save_to_database was called (evidenced by session.add being invoked)
-    assert mock_session.add.call_count == 1
+    # save_to_database was called (evidenced by the INSERT round trip)
+    assert mock_session.execute.await_count == 3
     assert len(signals) == 1
     assert signals[0].source == "test_source"
 
@@ -346,32 +348,35 @@ async def test_scraper_run_workflow(mock_session):
 
 @pytest.mark.asyncio
 async def test_individual_error_continues():
-    """An exception during execute for result 2 does not prevent result 1 being saved."""
+    """A result that cannot be hashed is skipped; the rest of the batch is saved."""
     results = [
         make_result(url="https://example.com/good", content="Good content"),
         make_result(url="https://example.com/bad", content="Bad content"),
     ]
+    results[1].content = None  # compute_content_hash raises for this result
     scraper = _TestScraper(results)
 
     session = AsyncMock()
-    session.add = MagicMock()
-    session.flush = AsyncMock()
+    session.execute = AsyncMock(side_effect=_bulk_execute())
+
+    signals = await scraper.save_to_database(session, results)
 
-    call_count = 0
+    # Result 1 should have been saved; result 2 error is counted and skipped.
+    assert len(signals) == 1
+    assert scraper.last_save_stats.errors == 1
 
-    async def execute_side_effect(query):
-        nonlocal call_count
-        call_count += 1
-        # First two calls belong to result 1 (hash + URL checks) — return no existing.
-        if call_count <= 2:
-            return _no_existing()
-        # Third call (hash check for result 2) raises an error.
-        raise RuntimeError("DB error on second result")
 
-    session.execute = AsyncMock(side_effect=execute_side_effect)
+# ---------------------------------------------------------------------------
+# Test 11: Database errors propagate to the caller
+# ---------------------------------------------------------------------------
 
-    signals = await scraper.save_to_database(session, results)
 
-    # Result 1 should have been saved; result 2 error is swallowed (continue).
-    assert len(signals) == 1
-    assert session.add.call_count == 1
+@pytest.mark.asyncio
+async def test_bulk_insert_error_propagates():
+    """A failed INSERT raises so _run_scraper can roll back and trip the circuit."""
+    scraper = _TestScraper()
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=_bulk_execute(fail_on_call=3))
+
+    with pytest.raises(RuntimeError):
+        await scraper.save_to_database(session, [make_result()])
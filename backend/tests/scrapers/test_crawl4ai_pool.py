@@ -0,0 +1,143 @@
+"""Tests for the Crawl4AI warm browser pool."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.scrapers.crawl4ai_client import (
+    BrowserPool,
+    Crawl4AIClient,
+    close_browser_pool,
+    get_browser_pool,
+)
+
+
+def _fake_crawler_factory():
+    """Patchable AsyncWebCrawler constructor that records every instance."""
+    created: list[MagicMock] = []
+
+    def factory(*args, **kwargs):
+        crawler = MagicMock()
+        crawler.start = AsyncMock()
+        crawler.close = AsyncMock()
+        crawler.arun = AsyncMock(
+            return_value=MagicMock(
+                metadata={"title": "Page"},
+                markdown="# Hello",
+                cleaned_html="",
+                success=True,
+                status_code=200,
+            )
+        )
+        created.append(crawler)
+        return crawler
+
+    return factory, created
+
+
+class TestBrowserPool:
+    """Tests for BrowserPool lease/recycle/close behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_browser_reused_across_leases(self):
+        """Sequential leases reuse the same warm browser."""
+        factory, created = _fake_crawler_factory()
+        pool = BrowserPool(size=2, max_pages=10)
+        with patch("crawl4ai.AsyncWebCrawler", side_effect=factory):
+            for _ in range(3):
+                async with pool.lease() as crawler:
+                    assert crawler is created[0]
+
+        assert len(created) == 1
+        created[0].start.assert_awaited_once()
+        assert pool.get_stats()["idle"] == 1
+
+    @pytest.mark.asyncio
+    async def test_browser_recycled_after_max_pages(self):
+        """A browser is closed and replaced once it has served max_pages."""
+        factory, created = _fake_crawler_factory()
+        pool = BrowserPool(size=1, max_pages=2)
+        with patch("crawl4ai.AsyncWebCrawler", side_effect=factory):
+            for _ in range(3):
+                async with pool.lease():
+                    pass
+
+        assert len(created) == 2
+        created[0].close.assert_awaited_once()
+        assert pool.recycled == 1
+
+    @pytest.mark.asyncio
+    async def test_browser_discarded_on_error(self):
+        """A crawl that raises discards its browser rather than returning it to the pool."""
+        factory, created = _fake_crawler_factory()
+        pool = BrowserPool(size=1, max_pages=10)
+        with patch("crawl4ai.AsyncWebCrawler", side_effect=factory):
+            with pytest.raises(RuntimeError):
+                async with pool.lease():
+                    raise RuntimeError("browser crashed")
+            async with pool.lease() as crawler:
+                assert crawler is created[1]
+
+        created[0].close.assert_awaited_once()
+        assert pool.discarded == 1
+
+    @pytest.mark.asyncio
+    async def test_pool_bounds_concurrent_browsers(self):
+        """No more than `size` browsers are launched under concurrent load."""
+        factory, created = _fake_crawler_factory()
+        pool = BrowserPool(size=2, max_pages=100)
+
+        async def use():
+            async with pool.lease():
+                await asyncio.sleep(0.01)
+
+        with patch("crawl4ai.AsyncWebCrawler", side_effect=factory):
+            await asyncio.gather(*(use() for _ in range(6)))
+
+        assert len(created) == 2
+
+    @pytest.mark.asyncio
+    async def test_close_shuts_down_idle_browsers(self):
+        """close() stops idle browsers and rejects further leases."""
+        factory, created = _fake_crawler_factory()
+        pool = BrowserPool(size=1, max_pages=10)
+        with patch("crawl4ai.AsyncWebCrawler", side_effect=factory):
+            async with pool.lease():
+                pass
+            await pool.close()
+
+            with pytest.raises(RuntimeError):
+                async with pool.lease():
+                    pass
+
+        created[0].close.assert_awaited_once()
+
+
+class TestCrawl4AIClientPooling:
+    """Tests that Crawl4AIClient.scrape_url leases from the pool."""
+
+    @pytest.mark.asyncio
+    async def test_scrape_url_uses_pool(self):
+        """Two scrapes share one browser launch."""
+        factory, created = _fake_crawler_factory()
+        client = Crawl4AIClient(pool=BrowserPool(size=1, max_pages=10))
+        with patch("crawl4ai.AsyncWebCrawler", side_effect=factory):
+            first = await client.scrape_url("https://example.com/a")
+            second = await client.scrape_url("https://example.com/b")
+
+        assert first.content == "# Hello"
+        assert second.title == "Page"
+        assert len(created) == 1
+        assert created[0].arun.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_default_pool_follows_close_browser_pool(self):
+        """A client without an injected pool picks up the pool rebuilt after close."""
+        client = Crawl4AIClient()
+        first = client.pool
+        await close_browser_pool()
+
+        assert client.pool is not first
+        assert client.pool is get_browser_pool()
+        await close_browser_pool()
@@ -0,0 +1,127 @@
+"""Tests for the materialized insight → SEO category index and explore pages."""
+
+from dataclasses import replace
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.marketing.services import category_index
+from app.marketing.services.category_index import sync_category_index
+from app.marketing.services.seo_categories import get_all_categories
+from app.models.insight import Insight
+from app.models.insight_category import InsightCategory
+from app.models.raw_signal import RawSignal
+
+FINTECH = "fintech-startup-ideas"
+
+
+async def _add_insight(db: AsyncSession, signal: RawSignal, title: str, relevance: float = 0.8):
+    insight = Insight(
+        id=uuid4(),
+        raw_signal_id=signal.id,
+        title=title,
+        problem_statement="Operators lose hours every week",
+        proposed_solution="A focused product",
+        market_size_estimate="Medium",
+        relevance_score=relevance,
+    )
+    db.add(insight)
+    await db.commit()
+    return insight
+
+
+async def _memberships(db: AsyncSession, insight: Insight) -> dict[str, float]:
+    result = await db.execute(
+        select(InsightCategory.category_slug, InsightCategory.relevance_score).where(
+            InsightCategory.insight_id == insight.id
+        )
+    )
+    return dict(result.all())
+
+
+@pytest.mark.asyncio
+async def test_insert_and_update_maintain_memberships(
+    db_session: AsyncSession, test_signal: RawSignal
+):
+    insight = await _add_insight(db_session, test_signal, "Neobank for freelancers")
+    assert await _memberships(db_session, insight) == {FINTECH: 0.8}
+
+    insight.relevance_score = 0.6
+    await db_session.commit()
+    assert await _memberships(db_session, insight) == {FINTECH: 0.6}
+
+    insight.title = "Dog walking marketplace"
+    await db_session.commit()
+    assert await _memberships(db_session, insight) == {"ecommerce-gaps": 0.6}
+
+
+@pytest.mark.asyncio
+async def test_sync_rebuilds_only_changed_categories(
+    db_session: AsyncSession, test_signal: RawSignal
+):
+    insight = await _add_insight(db_session, test_signal, "Carbon ledger")
+    assert await _memberships(db_session, insight) == {"sustainability-startups": 0.8}
+
+    # Up-to-date categories are skipped; ones without rows are re-run (cheap)
+    result = await sync_category_index(db_session)
+    assert "sustainability-startups" not in result["rebuilt"]
+    assert result["removed"] == []
+
+    changed = [
+        replace(c, keywords=["ledger"]) if c.slug == FINTECH else c
+        for c in get_all_categories()
+        if c.slug != "sustainability-startups"
+    ]
+    with patch.object(category_index, "get_all_categories", return_value=changed):
+        result = await sync_category_index(db_session)
+
+    assert FINTECH in result["rebuilt"]
+    assert result["removed"] == ["sustainability-startups"]
+    assert await _memberships(db_session, insight) == {FINTECH: 0.8}
+
+
+@pytest.mark.asyncio
+async def test_explore_keyset_pagination(
+    client: AsyncClient, db_session: AsyncSession, test_signal: RawSignal
+):
+    for title, relevance in [
+        ("Fintech payouts", 0.9),
+        ("Neobank onboarding", 0.7),
+        ("Lending desk", 0.6),
+        ("Payment links", 0.3),  # Below the explore threshold
+    ]:
+        await _add_insight(db_session, test_signal, title, relevance)
+
+    first = (await client.get(f"/api/explore/{FINTECH}", params={"limit": 2})).json()
+    assert first["total"] == 3
+    assert [i["title"] for i in first["insights"]] == ["Fintech payouts", "Neobank onboarding"]
+    assert first["next_cursor"]
+
+    second = (
+        await client.get(
+            f"/api/explore/{FINTECH}", params={"limit": 2, "cursor": first["next_cursor"]}
+        )
+    ).json()
+    assert [i["title"] for i in second["insights"]] == ["Lending desk"]
+    assert second["next_cursor"] is None
+
+    bad = await client.get(f"/api/explore/{FINTECH}", params={"cursor": "not-a-cursor"})
+    assert bad.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_widget_category_filter(
+    client: AsyncClient, db_session: AsyncSession, test_signal: RawSignal
+):
+    await _add_insight(db_session, test_signal, "Neobank onboarding", 0.9)
+    await _add_insight(db_session, test_signal, "Telehealth triage", 0.9)
+
+    resp = await client.get("/api/widgets/trending", params={"category": FINTECH})
+    assert [idea["title"] for idea in resp.json()["ideas"]] == ["Neobank onboarding"]
+
+    missing = await client.get("/api/widgets/trending", params={"category": "nope"})
+    assert missing.status_code == 404
@@ -63,7 +63,7 @@ class TestSubscriberCountFormatting:
 class TestCommunityValidatorInit:
     """Test CommunityValidator initialization."""
 
-    @patch("app.services.community_validator.praw.Reddit")
+    @patch("praw.Reddit")
     @patch("app.services.community_validator.settings")
     def test_init_with_credentials(self, mock_settings, mock_reddit):
         """Should initialize with credentials."""
@@ -0,0 +1,132 @@
+"""Tests for the background trend forecast engine."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.constants import FORECAST_MAX_HORIZON_DAYS
+from app.models.trend import Trend
+from app.services import forecast_engine
+from app.services.forecast_engine import (
+    ForecastEngine,
+    series_hash,
+    slice_forecast,
+    trend_history,
+)
+
+DATES = [f"2026-10-{d:02d}" for d in range(1, 15)]
+VALUES = list(range(40, 54))
+
+
+def _fake_forecast(trend_data, periods):
+    return {
+        "dates": [f"d{i}" for i in range(periods)],
+        "values": list(range(periods)),
+        "confidence_intervals": {"lower": [0] * periods, "upper": [9] * periods},
+        "model_accuracy": {"mape": 0.1, "rmse": 1.0},
+        "metadata": {"prediction_horizon": periods},
+    }
+
+
+@pytest.fixture
+def engine():
+    """Engine with a thread pool and a fake fit so tests stay in-process."""
+    engine = ForecastEngine()
+    engine._executor = ThreadPoolExecutor(max_workers=2)
+    calls = {"n": 0}
+    lock = threading.Lock()
+
+    def fake_fit(trend_data, periods):
+        with lock:
+            calls["n"] += 1
+        return _fake_forecast(trend_data, periods)
+
+    with (
+        patch.object(forecast_engine, "_fit", fake_fit),
+        patch.object(forecast_engine, "cache_get", AsyncMock(return_value=None)),
+        patch.object(forecast_engine, "cache_set", AsyncMock(return_value=True)),
+    ):
+        engine.calls = calls
+        yield engine
+    engine._executor.shutdown()
+
+
+def test_series_hash_tracks_data():
+    assert series_hash(DATES, VALUES) == series_hash(list(DATES), list(VALUES))
+    assert series_hash(DATES, VALUES) != series_hash(DATES, VALUES[:-1] + [0])
+
+
+def test_slice_forecast_trims_every_array():
+    sliced = slice_forecast(_fake_forecast(None, 30), 7)
+    assert len(sliced["dates"]) == len(sliced["values"]) == 7
+    assert len(sliced["confidence_intervals"]["upper"]) == 7
+    assert sliced["metadata"]["prediction_horizon"] == 7
+
+
+def test_synthetic_history_is_stable_within_a_day():
+    trend = Trend(keyword="ai agents", growth_percentage=40.0, trend_data={})
+    assert trend_history(trend) == trend_history(trend)
+    assert len(trend_history(trend)[0]) == 30
+
+
+@pytest.mark.asyncio
+async def test_miss_returns_pending_then_serves_fit(engine):
+    first = await engine.get_or_schedule("ai agents", DATES, VALUES, periods=7)
+    assert first["status"] == "pending"
+
+    await asyncio.gather(*engine._background)
+    second = await engine.get_or_schedule("ai agents", DATES, VALUES, periods=7)
+
+    assert second["values"] == list(range(7))
+    assert engine.calls["n"] == 1
+    stored_key = forecast_engine.cache_set.await_args.args[0]
+    assert stored_key == (
+        f"forecast:ai agents:{series_hash(DATES, VALUES)}:{FORECAST_MAX_HORIZON_DAYS}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refits_share_one_fit(engine):
+    await asyncio.gather(*(engine.refit("ai agents", DATES, VALUES) for _ in range(5)))
+    assert engine.calls["n"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_fit_is_not_rescheduled(engine):
+    with patch.object(forecast_engine, "_fit", side_effect=ValueError("too short")):
+        await engine.get_or_schedule("x", DATES, VALUES, periods=7)
+        await asyncio.gather(*engine._background)
+        result = await engine.get_or_schedule("x", DATES, VALUES, periods=7)
+
+    assert result["status"] == "unavailable"
+    assert engine.fits_failed == 1
+
+
+@pytest.mark.asyncio
+async def test_predictions_endpoint_is_a_pure_read(client: AsyncClient, db_session, engine):
+    """The endpoint never fits in-request: it serves stored forecasts only."""
+    trend = Trend(
+        keyword="ai agents",
+        category="AI",
+        search_volume=1000,
+        growth_percentage=40.0,
+        business_implications="Growing fast",
+        trend_data={"dates": DATES, "values": VALUES},
+        is_published=True,
+    )
+    db_session.add(trend)
+    await db_session.commit()
+    await engine.refit("ai agents", DATES, VALUES)
+
+    with patch.object(forecast_engine, "_forecast_engine", engine):
+        response = await client.get("/api/trends/predictions")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body[0]["keyword"] == "ai agents"
+    assert body[0]["predictions"]["values"] == list(range(7))
+    assert engine.calls["n"] == 1
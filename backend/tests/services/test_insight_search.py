@@ -0,0 +1,110 @@
+"""Tests for full-text insight search.
+
+SQLite exercises the ILIKE fallback end to end; the PostgreSQL statement is
+checked by compiling it against the postgresql dialect.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import cache_codec
+from app.models.insight import Insight
+from app.models.raw_signal import RawSignal
+from app.services.insight_search import _render_highlight, search_insights
+
+
+async def cache_miss(key, compute, ttl=None):
+    """Stand-in for cache_get_or_compute_json that always computes."""
+    return cache_codec.dumps(await compute())
+
+
+async def _add_insights(
+    db: AsyncSession, signal: RawSignal, *titles: str, relevance: float = 0.8
+) -> None:
+    for title in titles:
+        db.add(
+            Insight(
+                id=uuid4(),
+                raw_signal_id=signal.id,
+                title=title,
+                problem_statement=f"Problem behind {title}",
+                proposed_solution="A focused product",
+                market_size_estimate="Medium",
+                relevance_score=relevance,
+            )
+        )
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_search_total_counts_all_matches(db_session: AsyncSession, test_signal: RawSignal):
+    await _add_insights(
+        db_session, test_signal, "Ledger for freelancers", "Ledger sync", "Dog walking app"
+    )
+
+    page = await search_insights(db_session, select(Insight), term="ledger", limit=1)
+    assert page.total == 2
+    assert [hit.insight.title for hit in page.hits] in (["Ledger for freelancers"], ["Ledger sync"])
+
+    past_end = await search_insights(db_session, select(Insight), term="ledger", offset=5)
+    assert past_end.hits == []
+    assert past_end.total == 2
+
+    none = await search_insights(db_session, select(Insight), term="quantum")
+    assert (none.hits, none.total) == ([], 0)
+
+
+@pytest.mark.asyncio
+@patch("app.core.cache_registry.cache_get_or_compute_json", side_effect=cache_miss)
+async def test_list_insights_search(
+    mock_cache: AsyncMock,
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_signal: RawSignal,
+):
+    await _add_insights(
+        db_session, test_signal, "Ledger for freelancers", "Ledger sync", "Dog walking app"
+    )
+
+    resp = await client.get("/api/insights", params={"search": "ledger", "limit": 1})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["total"] == 2
+    assert len(data["insights"]) == 1
+    assert "search_highlight" in data["insights"][0]
+
+
+@pytest.mark.asyncio
+async def test_postgres_statement_uses_search_vector():
+    result = MagicMock()
+    result.all.return_value = []
+    db = MagicMock()
+    db.get_bind.return_value = SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+    db.execute = AsyncMock(return_value=result)
+
+    await search_insights(db, select(Insight), keywords=["AI", 'say "hi"'], limit=5)
+
+    stmt = db.execute.await_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    params = stmt.compile(dialect=postgresql.dialect()).params
+    assert "insights.search_vector @@ websearch_to_tsquery" in sql
+    assert "ts_rank_cd(insights.search_vector" in sql
+    assert "count(*) OVER ()" in sql
+    assert "ts_headline" in sql
+    assert "ILIKE" not in sql.upper()
+    assert '"AI" OR "say  hi"' in params.values()
+
+
+def test_highlight_escapes_source_markup():
+    fragment = "<script>x</script> \x02ledger\x03 & more"
+    assert _render_highlight(fragment) == (
+        "&lt;script&gt;x&lt;/script&gt; <mark>ledger</mark> &amp; more"
+    )
+    assert _render_highlight("no match here") is None
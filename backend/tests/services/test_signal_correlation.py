@@ -0,0 +1,53 @@
+"""Tests for the persisted correlation index in app.services.signal_correlation."""
+
+import uuid
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.dml import Delete
+
+from app.services.signal_correlation import correlate_recent_insights
+
+
+@pytest.mark.asyncio
+async def test_run_prunes_index_and_skips_rejected_candidates():
+    """Entries older than the window are deleted; candidates must still be approved."""
+    new_row = (
+        uuid.uuid4(),
+        "AI bookkeeping for freelancers",
+        "Freelancers lose hours on invoices",
+        datetime.now(UTC),
+        "reddit",
+        None,
+        None,
+    )
+    statements = []
+
+    async def execute(stmt, params=None):
+        statements.append(stmt)
+        result = MagicMock()
+        result.all.return_value = [new_row] if len(statements) == 2 else []
+        return result
+
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=execute)
+    session.commit = AsyncMock()
+
+    @asynccontextmanager
+    async def fake_session():
+        yield session
+
+    with patch("app.services.signal_correlation.AsyncSessionLocal", fake_session):
+        assert await correlate_recent_insights() == []
+
+    prune = statements[0]
+    assert isinstance(prune, Delete)
+    assert "insight_created_at <" in str(prune.compile(dialect=postgresql.dialect()))
+
+    candidates = str(statements[-1].compile(dialect=postgresql.dialect()))
+    assert "band_keys &&" in candidates
+    assert "insights.admin_status =" in candidates
+    session.commit.assert_awaited_once()
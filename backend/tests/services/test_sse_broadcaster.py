@@ -0,0 +1,170 @@
+"""Tests for the shared SSE pub/sub broadcaster."""
+
+import asyncio
+
+import pytest
+
+from app.services.sse_broadcaster import SlowConsumerError, SSEBroadcaster
+
+
+def _counting_producer():
+    calls = {"n": 0}
+
+    async def produce():
+        calls["n"] += 1
+        return {"event": "metrics_update", "data": str(calls["n"])}
+
+    return produce, calls
+
+
+@pytest.mark.asyncio
+async def test_one_producer_shared_by_all_subscribers():
+    """Ten subscribers on one topic trigger one producer call per interval, not ten."""
+    broadcaster = SSEBroadcaster(queue_size=8, use_redis=False)
+    produce, calls = _counting_producer()
+
+    async def consume(results: list):
+        async with broadcaster.subscribe("admin:metrics", produce, 0.01) as sub:
+            for _ in range(3):
+                results.append(await sub.next(timeout=1))
+
+    results: list[list] = [[] for _ in range(10)]
+    await asyncio.gather(*(consume(r) for r in results))
+
+    assert all(len(r) == 3 and None not in r for r in results)
+    assert calls["n"] < 10
+
+
+@pytest.mark.asyncio
+async def test_producer_stops_with_last_subscriber():
+    """The topic is torn down once nobody is listening."""
+    broadcaster = SSEBroadcaster(use_redis=False)
+    produce, calls = _counting_producer()
+
+    async with broadcaster.subscribe("t", produce, 0.01) as sub:
+        await sub.next(timeout=1)
+        assert broadcaster.subscriber_count("t") == 1
+
+    assert broadcaster.subscriber_count() == 0
+    produced = calls["n"]
+    await asyncio.sleep(0.05)
+    assert calls["n"] == produced
+
+
+@pytest.mark.asyncio
+async def test_late_subscriber_gets_latest_snapshot_immediately():
+    broadcaster = SSEBroadcaster(use_redis=False)
+    produce, _ = _counting_producer()
+
+    async with broadcaster.subscribe("t", produce, 10) as first:
+        await first.next(timeout=1)
+        async with broadcaster.subscribe("t", produce, 10) as second:
+            payload = await second.next(timeout=0.1)
+
+    assert payload == {"event": "metrics_update", "data": "1"}
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_is_dropped():
+    """A subscriber that never reads is disconnected once its queue fills."""
+    broadcaster = SSEBroadcaster(queue_size=2, use_redis=False)
+    produce, _ = _counting_producer()
+
+    async with broadcaster.subscribe("t", produce, 0.005) as fast:
+        async with broadcaster.subscribe("t", produce, 0.005) as slow:
+            for _ in range(6):
+                assert await fast.next(timeout=1) is not None
+            with pytest.raises(SlowConsumerError):
+                await slow.next(timeout=1)
+
+    assert broadcaster.dropped_subscribers == 1
+
+
+@pytest.mark.asyncio
+async def test_producer_error_becomes_error_event():
+    broadcaster = SSEBroadcaster(use_redis=False)
+
+    async def boom():
+        raise RuntimeError("db down")
+
+    async with broadcaster.subscribe("t", boom, 10) as sub:
+        payload = await sub.next(timeout=1)
+
+    assert payload["event"] == "error"
+    assert "Internal metrics error" in payload["data"]
+
+
+class _FakeRedis:
+    """Just enough of redis.asyncio for leader election and pub/sub relay."""
+
+    def __init__(self):
+        self.store: dict[str, str] = {}
+        self.channels: dict[str, list[asyncio.Queue]] = {}
+        self.published = 0
+
+    async def ping(self):
+        return True
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def pexpire(self, key, ttl):
+        return True
+
+    async def publish(self, channel, message):
+        self.published += 1
+        for queue in self.channels.get(channel, []):
+            queue.put_nowait({"type": "message", "data": message})
+
+    def pubsub(self):
+        redis = self
+
+        class _PubSub:
+            queue: asyncio.Queue = asyncio.Queue()
+
+            async def subscribe(self, channel):
+                redis.channels.setdefault(channel, []).append(self.queue)
+
+            async def get_message(self, ignore_subscribe_messages=True, timeout=1.0):
+                try:
+                    return await asyncio.wait_for(self.queue.get(), timeout)
+                except TimeoutError:
+                    return None
+
+            async def unsubscribe(self):
+                pass
+
+            async def aclose(self):
+                pass
+
+        return _PubSub()
+
+
+@pytest.mark.asyncio
+async def test_redis_mode_one_leader_across_processes():
+    """Two 'processes' sharing Redis: only the leader produces, both relay."""
+    redis = _FakeRedis()
+    a, b = SSEBroadcaster(use_redis=True), SSEBroadcaster(use_redis=True)
+    for broadcaster in (a, b):
+        broadcaster._get_redis = lambda: _async_value(redis)
+    produce_a, calls_a = _counting_producer()
+    produce_b, calls_b = _counting_producer()
+
+    async with a.subscribe("t", produce_a, 0.01) as sub_a:
+        async with b.subscribe("t", produce_b, 0.01) as sub_b:
+            for _ in range(3):
+                assert await sub_a.next(timeout=1) is not None
+                assert await sub_b.next(timeout=1) is not None
+
+    assert calls_a["n"] > 0
+    assert calls_b["n"] == 0
+
+
+async def _async_value(value):
+    return value
@@ -0,0 +1,105 @@
+"""Tests for the trend_points time-series read/write API and spike detection."""
+
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.models.trend_point import TrendPoint
+from app.services.spike_detection import detect_keyword_spikes
+from app.services.trend_points import (
+    TrendSeries,
+    get_trend_series,
+    get_trend_series_many,
+    trend_key,
+)
+
+NOW = datetime(2026, 10, 16, 12, 0, tzinfo=UTC)
+
+
+def _series(values: list[int], start: datetime = NOW) -> TrendSeries:
+    rows = [(start + timedelta(hours=i), v) for i, v in enumerate(values)]
+    return TrendSeries.from_rows("ai agents", "US", rows)
+
+
+class TestTrendSeries:
+    def test_arrays_are_numpy(self):
+        series = _series([10, 20, 30])
+        assert series.timestamps.dtype == np.dtype("datetime64[us]")
+        assert series.values.dtype == np.float64
+        assert series.values.mean() == 20
+        assert series.latest_timestamp == NOW + timedelta(hours=2)
+
+    def test_after_is_exclusive(self):
+        series = _series([10, 20, 30])
+        newer = series.after(NOW + timedelta(hours=1))
+        assert newer.values.tolist() == [30]
+        assert series.after(None) is series
+
+    def test_to_points_round_trips_iso_utc(self):
+        points = _series([42]).to_points()
+        assert points == [{"timestamp": NOW.isoformat(), "value": 42}]
+
+    def test_daily_means(self):
+        series = _series([10, 20, 30], start=datetime(2026, 10, 16, 22, tzinfo=UTC))
+        assert series.daily() == {"dates": ["2026-10-16", "2026-10-17"], "values": [15.0, 30.0]}
+        assert TrendSeries.empty("x").daily() == {"dates": [], "values": []}
+
+
+def test_trend_key_defaults_geo():
+    assert trend_key({"keyword": "ai agents"}) == ("ai agents", "US")
+    assert trend_key({"keyword": "ai agents", "geo": "MY"}) == ("ai agents", "MY")
+    assert trend_key({"geo": "MY"}) is None
+    assert trend_key(None) is None
+
+
+async def _seed(db_session, keyword: str, geo: str, values: list[int]) -> None:
+    for i, v in enumerate(values):
+        db_session.add(TrendPoint(keyword=keyword, geo=geo, ts=NOW + timedelta(hours=i), value=v))
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_get_series_many_groups_by_key(db_session):
+    await _seed(db_session, "ai agents", "US", [5, 6, 7])
+    await _seed(db_session, "ai agents", "MY", [1])
+    await _seed(db_session, "saas", "US", [9])
+
+    series = await get_trend_series_many(db_session, [("ai agents", "US"), ("saas", "US")])
+    assert set(series) == {("ai agents", "US"), ("saas", "US")}
+    assert series[("ai agents", "US")].values.tolist() == [5, 6, 7]
+
+    recent = await get_trend_series(db_session, "ai agents", "US", since=NOW + timedelta(hours=1))
+    assert recent.values.tolist() == [6, 7]
+
+    missing = await get_trend_series(db_session, "nope")
+    assert len(missing) == 0
+
+
+@pytest.mark.asyncio
+async def test_detect_keyword_spikes_reads_trend_points():
+    """A latest value ≥3× the baseline is flagged; flat series are not."""
+    start = datetime.now(UTC) - timedelta(hours=6)
+    series = {
+        ("ai agents", "US"): _series([10, 10, 10, 10, 40], start=start),
+        ("saas", "US"): _series([10, 10, 10, 10, 11], start=start),
+    }
+
+    @asynccontextmanager
+    async def fake_session():
+        yield None
+
+    async def fake_many(session, keys=None, since=None):
+        return series
+
+    with (
+        patch("app.services.spike_detection.AsyncSessionLocal", fake_session),
+        patch("app.services.spike_detection.get_trend_series_many", fake_many),
+    ):
+        spikes = await detect_keyword_spikes()
+
+    assert [s["keyword"] for s in spikes] == ["ai agents"]
+    assert spikes[0]["baseline"] == 10.0
+    assert spikes[0]["multiplier"] == 4.0
@@ -0,0 +1,70 @@
+"""Tests for the pluggable trend forecasters."""
+
+import math
+import sys
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.core.constants import FORECAST_PROPHET_MIN_POINTS
+from app.services import trend_prediction
+from app.services.trend_prediction import (
+    HoltWintersForecaster,
+    ProphetForecaster,
+    TrendPredictionService,
+    forecast_trend,
+    select_forecaster,
+)
+
+DATES = [f"2026-10-{d:02d}" for d in range(1, 29)]
+
+
+def test_short_series_uses_holt_winters_without_prophet():
+    noise = np.random.default_rng(0).normal(0, 1, len(DATES))
+    values = [40 + i + 5 * math.sin(2 * math.pi * i / 7) + noise[i] for i in range(len(DATES))]
+    with patch.dict(sys.modules, {"prophet": None}):
+        result = forecast_trend({"dates": DATES, "values": values}, periods=7)
+
+    assert result["metadata"]["model"] == "holt_winters"
+    assert result["dates"][0] == "2026-10-29"
+    assert len(result["values"]) == len(result["confidence_intervals"]["upper"]) == 7
+    lower, upper = result["confidence_intervals"]["lower"], result["confidence_intervals"]["upper"]
+    assert all(lo <= v <= hi for lo, v, hi in zip(lower, result["values"], upper, strict=True))
+    # Interval widens with the horizon
+    assert upper[-1] - lower[-1] > upper[0] - lower[0]
+    assert result["model_accuracy"]["mape"] < 0.1
+
+
+def test_holt_winters_tracks_linear_trend():
+    forecast = HoltWintersForecaster().fit_predict(DATES[:15], np.arange(40.0, 55.0), 3)
+    assert np.allclose(forecast.values, [55, 56, 57], atol=0.5)
+
+
+def test_monthly_series_forecasts_months():
+    dates = [f"2026-{m:02d}" for m in range(1, 9)]
+    forecast = HoltWintersForecaster().fit_predict(dates, np.arange(10.0, 90.0, 10), 2)
+    assert forecast.dates == ["2026-09-01", "2026-10-01"]
+
+
+def test_forecaster_selected_by_length():
+    assert isinstance(select_forecaster(30), HoltWintersForecaster)
+    assert isinstance(select_forecaster(FORECAST_PROPHET_MIN_POINTS), ProphetForecaster)
+
+
+def test_too_short_series_rejected():
+    with pytest.raises(ValueError):
+        forecast_trend({"dates": DATES[:6], "values": [1] * 6})
+
+
+def test_accuracy_metrics():
+    accuracy = TrendPredictionService()._calculate_accuracy(
+        np.array([10.0, 20.0, 0.0]), np.array([11.0, 18.0, 1.0])
+    )
+    assert accuracy["mape"] == pytest.approx(0.1)  # Zero actuals excluded
+    assert accuracy["rmse"] == pytest.approx(math.sqrt(2))
+
+
+def test_module_does_not_import_prophet():
+    assert "prophet" not in vars(trend_prediction)
+    assert "pd" not in vars(trend_prediction)
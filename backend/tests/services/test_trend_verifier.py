@@ -71,7 +71,8 @@ class TestTrendVerifierInit:
         assert verifier._hl == "en-US"
         assert verifier._tz == 360
         assert verifier._pytrends is None
-        assert verifier._cache == {}
+        assert verifier._cache.kind == "trend"
+        assert verifier.get_cache_stats()["local_entries"] == 0
 
     def test_custom_initialization(self):
         """Should accept custom settings."""
@@ -4,6 +4,9 @@ Tests the URLValidator class which validates that competitor
 URLs are reachable and resolve correctly.
 """
 
+from unittest.mock import AsyncMock, patch
+
+import httpx
 import pytest
 
 from app.services.url_validator import (
@@ -102,7 +105,7 @@ class TestURLValidatorInit:
         assert validator._timeout == 10.0
         assert validator._max_redirects == 5
         assert validator._verify_ssl is True
-        assert validator._cache == {}
+        assert validator.get_cache_stats()["cached_urls"] == 0
 
     def test_custom_initialization(self):
         """Should accept custom settings."""
@@ -143,48 +146,84 @@ class TestValidateCompetitors:
 class TestCacheOperations:
     """Test cache operations."""
 
-    def test_clear_cache(self):
-        """Should clear the cache."""
-        validator = URLValidator()
-        validator._cache["test"] = URLValidationResult(
-            url="test",
-            valid=True,
-            final_url="test",
-            status_code=200,
+    @pytest.fixture(autouse=True)
+    def _no_redis(self):
+        with patch(
+            "app.services.verification_cache.get_redis",
+            AsyncMock(side_effect=ConnectionError("no redis")),
+        ):
+            yield
+
+    @staticmethod
+    def _result(url: str, valid: bool) -> URLValidationResult:
+        return URLValidationResult(
+            url=url,
+            valid=valid,
+            final_url=url if valid else None,
+            status_code=200 if valid else 404,
             redirect_count=0,
             response_time_ms=100.0,
+            error=None if valid else "HTTP 404",
         )
 
+    @pytest.mark.asyncio
+    async def test_clear_cache(self):
+        """Should clear the in-process cache."""
+        validator = URLValidator()
+        await validator._cache.put("https://a.com", self._result("a", True), positive=True)
+
         validator.clear_cache()
 
-        assert validator._cache == {}
+        assert validator.get_cache_stats()["cached_urls"] == 0
 
-    def test_get_cache_stats(self):
+    @pytest.mark.asyncio
+    async def test_get_cache_stats(self):
         """Should return cache statistics."""
         validator = URLValidator()
-        validator._cache["valid"] = URLValidationResult(
-            url="valid",
-            valid=True,
-            final_url="valid",
-            status_code=200,
-            redirect_count=0,
-            response_time_ms=100.0,
-        )
-        validator._cache["invalid"] = URLValidationResult(
-            url="invalid",
-            valid=False,
-            final_url=None,
-            status_code=404,
-            redirect_count=0,
-            response_time_ms=100.0,
-            error="HTTP 404",
-        )
+        await validator._cache.put("https://a.com", self._result("a", True), positive=True)
+        await validator._cache.put("https://b.com", self._result("b", False), positive=False)
+        await validator._cache.get("https://a.com")
+        await validator._cache.get("https://c.com")
 
         stats = validator.get_cache_stats()
 
         assert stats["cached_urls"] == 2
         assert stats["valid_cached"] == 1
         assert stats["invalid_cached"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_validate_url_uses_pooled_client_and_cache(self):
+        """Should reuse one HTTP/2 client and serve repeats from cache."""
+        validator = URLValidator()
+        head = AsyncMock(
+            return_value=httpx.Response(200, request=httpx.Request("HEAD", "https://a.com"))
+        )
+
+        with patch.object(httpx.AsyncClient, "head", head):
+            first = await validator.validate_url("a.com")
+            client = validator._client
+            await validator.validate_url("https://b.com")
+            repeat = await validator.validate_url("https://a.com/")
+
+        assert first.valid and repeat == first
+        assert head.await_count == 2
+        assert validator._client is client
+        await validator.aclose()
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_client_from_another_loop_is_closed_when_replaced(self):
+        """A client created on a previous event loop is closed, not leaked."""
+        validator = URLValidator()
+        old = await validator._get_client()
+        validator._client_loop = object()  # As if created on another loop
+
+        new = await validator._get_client()
+
+        assert new is not old
+        assert old.is_closed
+        await validator.aclose()
 
 
 class TestGetURLValidator:
@@ -0,0 +1,134 @@
+"""Tests for the shared two-tier verification cache and its use by the validators."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from cachetools import TLRUCache
+
+from app.core.constants import (
+    VERIFICATION_CACHE_LOCAL_TTL_SECONDS,
+    VERIFICATION_CACHE_TTL_SECONDS,
+)
+from app.services.community_validator import CommunityValidator, SubredditValidationResult
+from app.services.trend_verification import TrendVerificationResult, TrendVerifier
+from app.services.verification_cache import VerificationCache, _expires_at
+
+
+class _FakeRedis:
+    """Just enough of redis.asyncio for the cache: setex and a get/ttl pipeline."""
+
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def setex(self, key, ttl, value):
+        self.values[key] = value
+        self.ttls[key] = ttl
+
+    def pipeline(self):
+        pipe = MagicMock()
+        calls = []
+        pipe.get.side_effect = lambda key: calls.append(self.values.get(key))
+        pipe.ttl.side_effect = lambda key: calls.append(self.ttls.get(key, -2))
+        pipe.execute = AsyncMock(side_effect=lambda: list(calls))
+        return pipe
+
+
+@pytest.fixture
+def redis():
+    fake = _FakeRedis()
+    with patch("app.services.verification_cache.get_redis", AsyncMock(return_value=fake)):
+        yield fake
+
+
+def _trend(keyword: str, verified: bool = True) -> TrendVerificationResult:
+    return TrendVerificationResult(
+        keyword=keyword,
+        verified=verified,
+        actual_volume=40 if verified else None,
+        actual_growth_percent=12.5 if verified else None,
+        llm_claimed_volume="10K",
+        llm_claimed_growth="+20%",
+        error=None if verified else "No trend data available for keyword",
+    )
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_shared_between_instances(redis):
+    positive_ttl, negative_ttl = VERIFICATION_CACHE_TTL_SECONDS["trend"]
+    writer = VerificationCache("trend", TrendVerificationResult)
+    await writer.put("ai agents", _trend("ai agents"), positive=True)
+    await writer.put("zzz", _trend("zzz", verified=False), positive=False)
+
+    assert redis.ttls == {"verify:trend:ai agents": positive_ttl, "verify:trend:zzz": negative_ttl}
+
+    # A fresh process: empty local tier, served from Redis and promoted
+    reader = VerificationCache("trend", TrendVerificationResult)
+    assert await reader.get("ai agents") == _trend("ai agents")
+    assert await reader.get("ai agents") == _trend("ai agents")
+    assert await reader.get("unknown") is None
+
+    stats = reader.get_stats()
+    assert (stats["redis_hits"], stats["local_hits"], stats["misses"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.667
+
+
+@pytest.mark.asyncio
+async def test_local_tier_expiry_capped(redis):
+    now = [1000.0]
+    cache = VerificationCache("trend", TrendVerificationResult)
+    cache._local = TLRUCache(maxsize=8, ttu=_expires_at, timer=lambda: now[0])
+    await cache.put("dead", _trend("dead", verified=False), positive=False)
+    await cache.put("live", _trend("live"), positive=True)
+
+    now[0] += VERIFICATION_CACHE_LOCAL_TTL_SECONDS - 1
+    assert len(cache.local_results()) == 2
+
+    # Past the local cap; Redis still holds both for their full TTL
+    now[0] += 2
+    assert cache.local_results() == []
+    assert await cache.get("live") == _trend("live")
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_are_misses():
+    cache = VerificationCache("subreddit", SubredditValidationResult)
+    with patch(
+        "app.services.verification_cache.get_redis", AsyncMock(side_effect=ConnectionError())
+    ):
+        result = SubredditValidationResult("startups", True, 1_000)
+        await cache.put("startups", result, positive=True)
+        assert await cache.get("startups") == result
+        assert await cache.get("other") is None
+
+
+@pytest.mark.asyncio
+async def test_trend_hit_carries_callers_claims(redis):
+    verifier = TrendVerifier()
+    query = MagicMock(return_value=(_trend("AI Agents"), True))
+
+    with patch.object(verifier, "_query_trends", query):
+        await verifier.verify_keyword("AI Agents", llm_claimed_growth="+20%")
+        hit = await verifier.verify_keyword("ai agents", llm_claimed_growth="+900%")
+
+    assert query.call_count == 1
+    assert hit.keyword == "ai agents"
+    assert hit.llm_claimed_growth == "+900%"
+    assert hit.actual_growth_percent == 12.5
+
+
+@pytest.mark.asyncio
+async def test_transient_subreddit_errors_not_cached(redis):
+    validator = CommunityValidator()
+    error = SubredditValidationResult("startups", False, 0, error="Reddit API error: ServerError")
+    missing = SubredditValidationResult("nope", False, 0, error="Subreddit not found")
+    check = MagicMock(side_effect=[(error, False), (error, False), (missing, True)])
+
+    with patch.object(validator, "_check_subreddit", check):
+        await validator.validate_subreddit("r/startups")
+        await validator.validate_subreddit("r/startups")
+        await validator.validate_subreddit("r/Nope")
+        assert (await validator.validate_subreddit("nope")).error == "Subreddit not found"
+
+    assert check.call_count == 3
+    assert list(redis.ttls.values()) == [VERIFICATION_CACHE_TTL_SECONDS["subreddit"][1]]
@@ -4,7 +4,9 @@ import hashlib
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
+from app.models.raw_signal import RawSignal
 from app.scrapers.base_scraper import BaseScraper
 from app.scrapers.firecrawl_client import ScrapeResult
 
@@ -25,12 +27,34 @@ def scraper():
     return _TestScraper()
 
 
+def _fake_execute(existing_hashes=(), existing_urls=(), conflict_hashes=()):
+    """Build an execute side effect for the three-query bulk save path.
+
+    1st call → existing content hashes, 2nd → existing URLs, 3rd → INSERT
+    returning one RawSignal per inserted row (minus any conflict_hashes).
+    """
+    calls = {"n": 0}
+
+    async def execute(stmt, params=None):
+        calls["n"] += 1
+        result = MagicMock()
+        if calls["n"] == 1:
+            result.scalars.return_value.all.return_value = list(existing_hashes)
+        elif calls["n"] == 2:
+            result.scalars.return_value.all.return_value = list(existing_urls)
+        else:
+            result.scalars.return_value.all.return_value = [
+                RawSignal(**row) for row in params if row["content_hash"] not in conflict_hashes
+            ]
+        return result
+
+    return execute
+
+
 @pytest.fixture
 def mock_session():
     session = AsyncMock()
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = None
-    session.execute = AsyncMock(return_value=mock_result)
+    session.execute = AsyncMock(side_effect=_fake_execute())
     session.add = MagicMock()
     session.flush = AsyncMock()
     return session
@@ -127,60 +151,82 @@ def test_truncate_boundary(scraper):
 
 @pytest.mark.asyncio
 async def test_save_new_signals(scraper, mock_session):
-    """Two fresh results each create a new RawSignal; session.add called twice."""
+    """Two fresh results are written with one multi-row INSERT after two lookups."""
     results = [
         make_result(url="https://example.com/1", content="content one"),
         make_result(url="https://example.com/2", content="content two"),
     ]
-    # Both hash and URL checks return None (no duplicates)
-    fresh_result = MagicMock()
-    fresh_result.scalar_one_or_none.return_value = None
-    mock_session.execute = AsyncMock(return_value=fresh_result)
 
     saved = await scraper.save_to_database(mock_session, results)
 
-    assert mock_session.add.call_count == 2
     assert len(saved) == 2
+    assert mock_session.execute.await_count == 3
+    insert_rows = mock_session.execute.await_args_list[2].args[1]
+    assert len(insert_rows) == 2
+    assert scraper.last_save_stats.inserted == 2
 
 
 @pytest.mark.asyncio
 async def test_save_dedup_by_hash(scraper, mock_session):
-    """Result whose content_hash already exists in DB is skipped."""
+    """Result whose content_hash already exists in DB is skipped without an INSERT."""
     results = [make_result(content="duplicate content")]
-
-    existing = MagicMock()
-    existing.scalar_one_or_none.return_value = MagicMock()  # non-None → already exists
-
-    mock_session.execute = AsyncMock(return_value=existing)
+    existing_hash = scraper.compute_content_hash("duplicate content")
+    mock_session.execute = AsyncMock(side_effect=_fake_execute(existing_hashes=[existing_hash]))
 
     saved = await scraper.save_to_database(mock_session, results)
 
-    mock_session.add.assert_not_called()
     assert saved == []
+    assert mock_session.execute.await_count == 2
+    assert scraper.last_save_stats.deduplicated_by_hash == 1
+    assert scraper.last_save_stats.deduplicated_by_url == 0
 
 
 @pytest.mark.asyncio
 async def test_save_dedup_by_url(scraper, mock_session):
     """Result whose URL+source already exists is skipped even if hash is new."""
     results = [make_result(url="https://example.com/exists", content="unique content")]
+    mock_session.execute = AsyncMock(
+        side_effect=_fake_execute(existing_urls=["https://example.com/exists"])
+    )
 
-    call_count = 0
+    saved = await scraper.save_to_database(mock_session, results)
 
-    async def side_effect(*args, **kwargs):
-        nonlocal call_count
-        call_count += 1
-        result = MagicMock()
-        # First call = hash check → None (new hash)
-        # Second call = URL check → existing record
-        result.scalar_one_or_none.return_value = None if call_count == 1 else MagicMock()
-        return result
+    assert saved == []
+    assert scraper.last_save_stats.deduplicated_by_hash == 0
+    assert scraper.last_save_stats.deduplicated_by_url == 1
+
+
+@pytest.mark.asyncio
+async def test_save_dedup_within_batch(scraper, mock_session):
+    """Duplicates inside one batch are collapsed before hitting the database."""
+    results = [
+        make_result(url="https://example.com/1", content="same"),
+        make_result(url="https://example.com/2", content="same"),
+        make_result(url="https://example.com/1", content="different"),
+    ]
+
+    saved = await scraper.save_to_database(mock_session, results)
 
-    mock_session.execute = AsyncMock(side_effect=side_effect)
+    assert len(saved) == 1
+    assert scraper.last_save_stats.deduplicated_by_hash == 1
+    assert scraper.last_save_stats.deduplicated_by_url == 1
+
+
+@pytest.mark.asyncio
+async def test_save_conflict_counts_as_hash_duplicate(scraper, mock_session):
+    """Rows dropped by ON CONFLICT (concurrent insert) are counted as hash duplicates."""
+    results = [
+        make_result(url="https://example.com/1", content="raced"),
+        make_result(url="https://example.com/2", content="fresh"),
+    ]
+    raced_hash = scraper.compute_content_hash("raced")
+    mock_session.execute = AsyncMock(side_effect=_fake_execute(conflict_hashes=[raced_hash]))
 
     saved = await scraper.save_to_database(mock_session, results)
 
-    mock_session.add.assert_not_called()
-    assert saved == []
+    assert len(saved) == 1
+    assert scraper.last_save_stats.deduplicated_by_hash == 1
+    assert scraper.last_save_stats.inserted == 1
 
 
 @pytest.mark.asyncio
@@ -188,34 +234,64 @@ async def test_save_empty_results(scraper, mock_session):
     """Passing an empty list returns an empty list with no DB operations."""
     saved = await scraper.save_to_database(mock_session, [])
 
-    mock_session.add.assert_not_called()
+    mock_session.execute.assert_not_called()
     assert saved == []
 
 
 @pytest.mark.asyncio
 async def test_save_individual_error_continues(scraper, mock_session):
-    """An error processing one result does not prevent others from being saved."""
+    """An error building one row does not prevent others from being saved."""
     results = [
         make_result(url="https://example.com/bad", content="bad content"),
         make_result(url="https://example.com/good", content="good content"),
     ]
+    results[0].content = None  # hashing fails for this result only
 
-    call_count = 0
-
-    async def side_effect(*args, **kwargs):
-        nonlocal call_count
-        call_count += 1
-        # First result's first DB call raises; all subsequent calls succeed
-        if call_count == 1:
-            raise Exception("DB error on first result")
-        result = MagicMock()
-        result.scalar_one_or_none.return_value = None
-        return result
+    saved = await scraper.save_to_database(mock_session, results)
 
-    mock_session.execute = AsyncMock(side_effect=side_effect)
+    assert len(saved) == 1
+    assert saved[0].url == "https://example.com/good"
+    assert scraper.last_save_stats.errors == 1
 
-    # Should not raise; good result should still be processed
-    saved = await scraper.save_to_database(mock_session, results)
 
-    # At least the second result was added
-    assert mock_session.add.call_count >= 1
+@pytest.mark.asyncio
+async def test_save_conflict_runs_against_database(scraper, db_session):
+    """A row raced in after the hash lookup is dropped by ON CONFLICT, not a batch failure."""
+    results = [
+        make_result(url="https://example.com/1", content="raced"),
+        make_result(url="https://example.com/2", content="fresh"),
+    ]
+    raced_hash = scraper.compute_content_hash("raced")
+    execute = db_session.execute
+    statements = []
+
+    async def racing_execute(stmt, params=None):
+        statements.append(stmt)
+        if len(statements) == 3:  # A concurrent run commits the same content first
+            db_session.add(
+                RawSignal(
+                    source="other",
+                    url="https://example.com/other",
+                    content="raced",
+                    content_hash=raced_hash,
+                    extra_metadata={},
+                )
+            )
+            await db_session.flush()
+        return await execute(stmt, params)
+
+    db_session.execute = racing_execute
+    saved = await scraper.save_to_database(db_session, results)
+
+    assert [s.url for s in saved] == ["https://example.com/2"]
+    assert scraper.last_save_stats.deduplicated_by_hash == 1
+    assert scraper.last_save_stats.inserted == 1
+
+    # On PostgreSQL, an ordered RETURNING would key rows on the id sentinel and
+    # reject the batch once ON CONFLICT drops a row
+    compiled = statements[2].compile(
+        dialect=postgresql.asyncpg.dialect(),
+        for_executemany=True,
+        column_keys=["id", "source", "url", "content", "content_hash", "extra_metadata"],
+    )
+    assert compiled._insertmanyvalues.num_sentinel_columns == 0
@@ -1,17 +1,19 @@
 """Unit tests for app.core.cache.
 
 Covers:
-- _Encoder: UUID, datetime, date, Decimal serialization
-- _serialize / _deserialize: JSON round-trips with Pydantic support
+- _serialize / _deserialize: UUID, datetime, date, Decimal, Pydantic round-trips
+- cache_codec: format byte, compression, legacy JSON text
 - cache_get / cache_set: L1 (TTLCache) ↔ L2 (Redis)
 - cache_set_with_stale / cache_get_with_fallback: stale-on-error pattern
 - cache_negative / negative sentinel handling
 - cached decorator: key templating, TTL resolution, cache hit/miss
+- Invalidation: namespace generations, pub/sub L1 eviction
 
-All I/O is async.  Redis is always mocked via @patch("app.core.cache.get_redis").
+All I/O is async.  Redis is always mocked via patch_redis() (both clients).
 """
 
 import json
+from contextlib import contextmanager
 from datetime import UTC, date, datetime
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -27,12 +29,16 @@ from pydantic import BaseModel
 
 @pytest.fixture(autouse=True)
 def reset_l1_cache():
-    """Clear the global TTLCache before and after every test."""
-    from app.core.cache import _l1_cache
+    """Clear the global TTLCache and generation state before and after every test."""
+    from app.core import cache
 
-    _l1_cache.clear()
+    cache._l1_cache.clear()
+    cache._generations.clear()
+    cache._generations_loaded_at = None
     yield
-    _l1_cache.clear()
+    cache._l1_cache.clear()
+    cache._generations.clear()
+    cache._generations_loaded_at = None
 
 
 @pytest.fixture
@@ -44,12 +50,20 @@ def mock_redis():
     r.delete = AsyncMock()
     r.ping = AsyncMock()
     r.info = AsyncMock(return_value={"used_memory_human": "1M"})
+    r.hgetall = AsyncMock(return_value={})
+    r.hincrby = AsyncMock(return_value=1)
+    r.publish = AsyncMock()
 
     pipe = AsyncMock()
-    # pipeline.setex / pipeline.expire are queued (synchronous call, not awaited)
+    # pipeline commands are queued (synchronous call, not awaited)
     pipe.setex = MagicMock()
-    pipe.execute = AsyncMock()
+    pipe.get = MagicMock()
+    pipe.pttl = MagicMock()
+    # cache_get_or_compute reads [value, pttl_ms, compute_ms] in one pipeline
+    pipe.execute = AsyncMock(return_value=[None, -2, None])
     r.pipeline = MagicMock(return_value=pipe)
+    r.set = AsyncMock(return_value=True)
+    r.eval = AsyncMock()
 
     return r
 
@@ -59,6 +73,16 @@ def mock_redis():
 # ---------------------------------------------------------------------------
 
 
+@contextmanager
+def patch_redis(r):
+    """Patch both Redis clients: text (keys, pub/sub) and bytes (cached values)."""
+    with (
+        patch("app.core.cache.get_redis", return_value=r),
+        patch("app.core.cache.get_redis_binary", return_value=r),
+    ):
+        yield r
+
+
 class _SampleModel(BaseModel):
     """Minimal Pydantic model for serialization tests."""
 
@@ -72,42 +96,35 @@ class _SampleModel(BaseModel):
 
 
 class TestSerializer:
-    """Tests for _Encoder and _serialize / _deserialize."""
+    """Tests for _serialize / _deserialize and the payload codec."""
 
-    def test_encoder_uuid(self):
+    def test_serialize_uuid(self):
         """UUID instance must be serialized to its string representation."""
-        from app.core.cache import _Encoder
+        from app.core.cache import _deserialize, _serialize
 
         uid = uuid4()
-        result = json.dumps({"id": uid}, cls=_Encoder)
-        parsed = json.loads(result)
-        assert parsed["id"] == str(uid)
+        assert _deserialize(_serialize({"id": uid}))["id"] == str(uid)
 
-    def test_encoder_datetime(self):
+    def test_serialize_datetime(self):
         """datetime must be serialized via isoformat()."""
-        from app.core.cache import _Encoder
+        from app.core.cache import _deserialize, _serialize
 
         dt = datetime(2026, 3, 20, 12, 0, 0, tzinfo=UTC)
-        result = json.dumps({"ts": dt}, cls=_Encoder)
-        parsed = json.loads(result)
-        assert parsed["ts"] == dt.isoformat()
+        assert _deserialize(_serialize({"ts": dt}))["ts"] == dt.isoformat()
 
-    def test_encoder_date(self):
+    def test_serialize_date(self):
         """date (without time) must be serialized via isoformat()."""
-        from app.core.cache import _Encoder
+        from app.core.cache import _deserialize, _serialize
 
         d = date(2026, 3, 20)
-        result = json.dumps({"d": d}, cls=_Encoder)
-        parsed = json.loads(result)
-        assert parsed["d"] == d.isoformat()
+        assert _deserialize(_serialize({"d": d}))["d"] == d.isoformat()
 
-    def test_encoder_decimal(self):
+    def test_serialize_decimal(self):
         """Decimal must be serialized to a float."""
-        from app.core.cache import _Encoder
+        from app.core.cache import _deserialize, _serialize
 
         val = Decimal("3.14159")
-        result = json.dumps({"price": val}, cls=_Encoder)
-        parsed = json.loads(result)
+        parsed = _deserialize(_serialize({"price": val}))
         assert isinstance(parsed["price"], float)
         assert abs(parsed["price"] - float(val)) < 1e-9
 
@@ -123,6 +140,60 @@ class TestSerializer:
         assert recovered["name"] == "hello"
         assert recovered["value"] == 42
 
+    def test_small_payload_uncompressed(self):
+        """Payloads under the threshold are stored as format byte + JSON."""
+        from app.core.cache_codec import FORMAT_JSON, decode, encode
+
+        payload = encode({"a": [1, 2]})
+        assert payload == bytes((FORMAT_JSON,)) + b'{"a":[1,2]}'
+        assert decode(payload) == {"a": [1, 2]}
+
+    def test_large_payload_compressed(self):
+        """Large payloads are zstd-compressed, or zlib without zstandard."""
+        from app.core import cache_codec
+
+        value = {"problem_statement": "word " * 500}
+        payload = cache_codec.encode(value)
+        assert payload[0] == cache_codec.FORMAT_ZSTD
+        assert len(payload) < len(cache_codec.dumps(value)) // 4
+        assert cache_codec.decode(payload) == value
+
+        with patch.object(cache_codec, "_zstd_compressor", None):
+            payload = cache_codec.encode(value)
+        assert payload[0] == cache_codec.FORMAT_ZLIB
+        assert cache_codec.decode(payload) == value
+
+    def test_stdlib_json_fallback_interchangeable(self):
+        """Without orjson the stdlib json module writes the same documents."""
+        from app.core import cache_codec
+
+        value = {"id": uuid4(), "ts": datetime(2026, 3, 20, tzinfo=UTC), "n": 1.5}
+        fast = cache_codec.dumps(value)
+        with patch.object(cache_codec, "orjson", None):
+            slow = cache_codec.dumps(value)
+            assert cache_codec.loads(fast) == cache_codec.loads(slow)
+
+    def test_legacy_json_text_still_read(self):
+        """Values written before the format byte (plain JSON text) decode as before."""
+        from app.core.cache_codec import decode, unpack
+
+        assert decode('{"a": 1}') == {"a": 1}
+        assert decode(b"[1, 2]") == [1, 2]
+        assert unpack(b'{"a": 1}') == b'{"a": 1}'
+
+    def test_unreadable_payloads_rejected(self):
+        """Unknown formats, and zstd without zstandard, raise CodecError."""
+        from app.core import cache_codec
+
+        with pytest.raises(cache_codec.CodecError):
+            cache_codec.unpack(b"\x07{}")
+        payload = cache_codec.encode({"x": "y" * 2000})
+        with (
+            patch.object(cache_codec, "_zstd_decompressor", None),
+            pytest.raises(cache_codec.CodecError),
+        ):
+            cache_codec.unpack(payload)
+
 
 # ---------------------------------------------------------------------------
 # TestCacheGetSet
@@ -144,7 +215,7 @@ class TestCacheGetSet:
         key = "test:l1_hit"
         _l1_cache[key] = {"data": 1}  # store deserialized form, as real code does
 
-        with patch("app.core.cache.get_redis", return_value=mock_redis):
+        with patch_redis(mock_redis):
             result = await cache_get(key)
 
         mock_redis.get.assert_not_called()
@@ -158,7 +229,7 @@ class TestCacheGetSet:
         payload = _serialize({"data": 2})
         mock_redis.get = AsyncMock(return_value=payload)
 
-        with patch("app.core.cache.get_redis", return_value=mock_redis):
+        with patch_redis(mock_redis):
             result = await cache_get(key)
 
         assert result == {"data": 2}
@@ -170,7 +241,7 @@ class TestCacheGetSet:
 
         mock_redis.get = AsyncMock(return_value=None)
 
-        with patch("app.core.cache.get_redis", return_value=mock_redis):
+        with patch_redis(mock_redis):
             result = await cache_get("test:miss")
 
         assert result is None
@@ -181,7 +252,7 @@ class TestCacheGetSet:
 
         mock_redis.get = AsyncMock(side_effect=ConnectionError("Redis down"))
 
-        with patch("app.core.cache.get_redis", return_value=mock_redis):
+        with patch_redis(mock_redis):
             result = await cache_get("test:redis_error")
 
         assert result is None
@@ -193,7 +264,7 @@ class TestCacheGetSet:
         key = "test:set_both"
         value = {"answer": 42}
 
-        with patch("app.core.cache.get_redis", return_value=mock_redis):
+        with patch_redis(mock_redis):
             success = await cache_set(key, value, ttl=60)
 
         assert success is True
@@ -206,7 +277,7 @@ class TestCacheGetSet:
 
         mock_redis.setex = AsyncMock(side_effect=ConnectionError("Redis down"))
 
-        with patch("app.core.cache.get_redis", return_value=mock_redis):
+        with patch_redis(mock_redis):
             result = await cache_set("test:set_error", {"x": 1}, ttl=60)
 
         assert result is False
@@ -230,7 +301,7 @@ class TestStaleOnError:
 
         pipe = mock_redis.pipeline.return_value
 
-        with patch("app.core.cache.get_redis", return_value=mock_redis):
+        with patch_redis(mock_redis):
             await cache_set_with_stale(key, value, ttl=ttl)
 
         assert pipe.setex.call_count == 2
@@ -248,7 +319,7 @@ class TestStaleOnError:
         payload = _serialize({"fresh": True})
         mock_redis.get = AsyncMock(return_value=payload)
 
-        with patch("app.core.cache.get_redis", return_value=mock_redis):
+        with patch_redis(mock_redis):
             result = await cache_get_with_fallback(key)
 
         assert result == {"fresh": True}
@@ -268,7 +339,7 @@ class TestStaleOnError:
 
         mock_redis.get = AsyncMock(side_effect=fake_get)
 
-        with patch("app.core.cache.get_redis", return_value=mock_redis):
+        with patch_redis(mock_redis):
             result = await cache_get_with_fallback(key)
 
         assert result == {"stale": True}
@@ -279,7 +350,7 @@ class TestStaleOnError:
 
         mock_redis.get = AsyncMock(return_value=None)
 
-        with patch("app.core.cache.get_redis", return_value=mock_redis):
+        with patch_redis(mock_redis):
             result = await cache_get_with_fallback("test:total_miss")
 
         assert result is None
@@ -297,7 +368,7 @@ class TestStaleOnError:
 
         mock_redis.get = AsyncMock(side_effect=ConnectionError("Redis down"))
 
-        with patch("app.core.cache.get_redis", return_value=mock_redis):
+        with patch_redis(mock_redis):
             result = await cache_get_with_fallback(key)
 
         assert result == {"from": "l1"}
@@ -317,7 +388,7 @@ class TestNegativeCache:
 
         key = "test:neg_sentinel"
 
-        with patch("app.core.cache.get_redis", return_value=mock_redis):
+        with patch_redis(mock_redis):
             await cache_negative(key)
 
         mock_redis.setex.assert_called_once()
@@ -334,7 +405,7 @@ class TestNegativeCache:
         # Encode exactly as the cache module would store it
         mock_redis.get = AsyncMock(return_value=_NEGATIVE_SENTINEL.encode())
 
-        with patch("app.core.cache.get_redis", return_value=mock_redis):
+        with patch_redis(mock_redis):
             result = await cache_get_with_fallback(key)
 
         assert result is None
@@ -346,7 +417,7 @@ class TestNegativeCache:
         key = "test:neg_in_l1"
         _l1_cache[key] = _NEGATIVE_SENTINEL
 
-        with patch("app.core.cache.get_redis", return_value=mock_redis):
+        with patch_redis(mock_redis):
             result = await cache_get_with_fallback(key)
 
         mock_redis.get.assert_not_called()
@@ -359,7 +430,7 @@ class TestNegativeCache:
         key = "test:neg_ttl"
         custom_ttl = 777
 
-        with patch("app.core.cache.get_redis", return_value=mock_redis):
+        with patch_redis(mock_redis):
             await cache_negative(key, ttl=custom_ttl)
 
         mock_redis.setex.assert_called_once()
@@ -376,12 +447,22 @@ class TestNegativeCache:
 class TestCachedDecorator:
     """Tests for the @cached decorator."""
 
+    @staticmethod
+    def _stored(mock_redis) -> list[tuple]:
+        """(key, ttl) of values written through the pipeline (compute times excluded)."""
+        pipe = mock_redis.pipeline.return_value
+        return [
+            call.args[:2]
+            for call in pipe.setex.call_args_list
+            if not call.args[0].startswith("cache-delta:")
+        ]
+
     async def test_cached_hit_skips_function(self, mock_redis):
         """When the cache key exists, the decorated function must NOT be called."""
         from app.core.cache import _serialize, cached
 
         payload = _serialize({"result": "cached_value"})
-        mock_redis.get = AsyncMock(return_value=payload)
+        mock_redis.pipeline.return_value.execute.return_value = [payload, 60_000, None]
 
         call_count = 0
 
@@ -391,7 +472,7 @@ class TestCachedDecorator:
             call_count += 1
             return {"result": "fresh_value"}
 
-        with patch("app.core.cache.get_redis", return_value=mock_redis):
+        with patch_redis(mock_redis):
             result = await expensive()
 
         assert call_count == 0
@@ -401,9 +482,6 @@ class TestCachedDecorator:
         """On a cache miss, the function must be called and the result stored."""
         from app.core.cache import cached
 
-        mock_redis.get = AsyncMock(return_value=None)
-        mock_redis.setex = AsyncMock()
-
         call_count = 0
 
         @cached("test:decorator:miss", ttl=120)
@@ -412,87 +490,321 @@ class TestCachedDecorator:
             call_count += 1
             return {"computed": True}
 
-        with patch("app.core.cache.get_redis", return_value=mock_redis):
+        with patch_redis(mock_redis):
             result = await compute()
 
         assert call_count == 1
         assert result == {"computed": True}
-        mock_redis.setex.assert_called_once()
+        assert self._stored(mock_redis) == [("cache:test:decorator:miss", 120)]
 
     async def test_cached_kwargs_template(self, mock_redis):
         """Key template variables must be filled from the decorated function's kwargs."""
         from app.core.cache import cached
 
-        mock_redis.get = AsyncMock(return_value=None)
-        mock_redis.setex = AsyncMock()
-
-        captured_keys: list[str] = []
-
-        original_setex = mock_redis.setex
-
-        async def capture_setex(key, *args, **kwargs):
-            captured_keys.append(key)
-
-        mock_redis.setex = AsyncMock(side_effect=capture_setex)
-
         @cached("insights:list:{page}:{limit}", ttl=60)
         async def list_insights(page: int = 1, limit: int = 10) -> list:
-            return []
+            return ["x"]
 
-        with patch("app.core.cache.get_redis", return_value=mock_redis):
+        with patch_redis(mock_redis):
             await list_insights(page=2, limit=5)
 
-        assert len(captured_keys) == 1
-        # The resolved key must contain the actual kwarg values
-        resolved_key = captured_keys[0]
-        assert "2" in resolved_key
-        assert "5" in resolved_key
+        assert [key for key, _ in self._stored(mock_redis)] == ["cache:insights:list:2:5"]
 
     async def test_cached_ttl_key_lookup(self, mock_redis):
         """ttl_key="tools" must cause the decorator to use CACHE_TTL["tools"]."""
         from app.core.cache import CACHE_TTL, cached
 
-        mock_redis.get = AsyncMock(return_value=None)
-
-        captured_ttls: list[int] = []
-
-        async def capture_setex(key, ttl, *args, **kwargs):
-            captured_ttls.append(ttl)
-
-        mock_redis.setex = AsyncMock(side_effect=capture_setex)
-
         @cached("test:ttl_key", ttl_key="tools")
         async def get_tools() -> list:
             return ["tool_a"]
 
-        with patch("app.core.cache.get_redis", return_value=mock_redis):
+        with patch_redis(mock_redis):
             await get_tools()
 
-        assert len(captured_ttls) == 1
-        assert captured_ttls[0] == CACHE_TTL["tools"]
+        assert [ttl for _, ttl in self._stored(mock_redis)] == [CACHE_TTL["tools"]]
 
     async def test_cached_explicit_ttl_override(self, mock_redis):
         """An explicit ttl= argument must take precedence over ttl_key lookup."""
         from app.core.cache import CACHE_TTL, cached
 
-        mock_redis.get = AsyncMock(return_value=None)
-
-        captured_ttls: list[int] = []
-
-        async def capture_setex(key, ttl, *args, **kwargs):
-            captured_ttls.append(ttl)
-
-        mock_redis.setex = AsyncMock(side_effect=capture_setex)
-
         # ttl_key points at "tools" (3600) but explicit ttl=999 should win
         @cached("test:ttl_override", ttl=999, ttl_key="tools")
         async def get_data() -> dict:
-            return {}
+            return {"a": 1}
 
         assert 999 != CACHE_TTL.get("tools"), "Sanity: explicit TTL must differ from tools TTL"
 
-        with patch("app.core.cache.get_redis", return_value=mock_redis):
+        with patch_redis(mock_redis):
             await get_data()
 
-        assert len(captured_ttls) == 1
-        assert captured_ttls[0] == 999
+        assert [ttl for _, ttl in self._stored(mock_redis)] == [999]
+
+
+# ---------------------------------------------------------------------------
+# TestSingleFlight
+# ---------------------------------------------------------------------------
+
+
+class TestSingleFlight:
+    """Tests for cache_get_or_compute: coalescing, cross-process locking, XFetch."""
+
+    @pytest.fixture(autouse=True)
+    def reset_stats(self):
+        from app.core import cache
+
+        saved = dict(cache._single_flight_stats)
+        cache._single_flight_stats.update(dict.fromkeys(saved, 0))
+        yield
+        cache._single_flight_stats.update(saved)
+
+    async def test_concurrent_misses_compute_once(self, mock_redis):
+        """Concurrent misses in one process share a single computation."""
+        import asyncio
+
+        from app.core.cache import cache_get_or_compute, get_single_flight_stats
+
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"n": calls}
+
+        with patch_redis(mock_redis):
+            results = await asyncio.gather(
+                *[cache_get_or_compute("pulse:stats", compute, ttl=30) for _ in range(10)]
+            )
+
+        assert calls == 1
+        assert results == [{"n": 1}] * 10
+        assert get_single_flight_stats()["coalesced_local"] == 9
+        mock_redis.set.assert_awaited_once()
+        mock_redis.eval.assert_awaited_once()  # Lock released
+
+    async def test_failure_propagates_to_joined_callers(self, mock_redis):
+        """Callers that joined a failed computation get its error, and nothing is cached."""
+        import asyncio
+
+        from app.core.cache import _inflight, cache_get_or_compute
+
+        async def compute():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("db down")
+
+        with patch_redis(mock_redis):
+            results = await asyncio.gather(
+                *[cache_get_or_compute("pulse:stats", compute) for _ in range(3)],
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert _inflight == {}
+        mock_redis.pipeline.return_value.setex.assert_not_called()
+
+    async def test_waits_for_other_process(self, mock_redis):
+        """When another process holds the lock, poll for its value instead of computing."""
+        from app.core.cache import _serialize, cache_get_or_compute, get_single_flight_stats
+
+        mock_redis.set = AsyncMock(return_value=None)  # Lock held elsewhere
+        mock_redis.get = AsyncMock(side_effect=[None, _serialize({"from": "peer"})])
+        compute = AsyncMock()
+
+        with (
+            patch_redis(mock_redis),
+            patch("app.core.cache._SINGLE_FLIGHT_POLL_SECONDS", 0),
+        ):
+            value = await cache_get_or_compute("insights:list:abc", compute, ttl=60)
+
+        assert value == {"from": "peer"}
+        compute.assert_not_awaited()
+        assert get_single_flight_stats()["coalesced_remote"] == 1
+
+    async def test_early_refresh_near_expiry(self, mock_redis):
+        """A hit about to expire is recomputed by the caller that wins the lock."""
+        from app.core.cache import _serialize, cache_get_or_compute, get_single_flight_stats
+
+        # 1 ms left on a value that took 500 ms to compute
+        mock_redis.pipeline.return_value.execute.return_value = [_serialize({"v": 1}), 1, "500"]
+
+        with patch_redis(mock_redis):
+            value = await cache_get_or_compute("pulse:stats", AsyncMock(return_value={"v": 2}))
+
+        assert value == {"v": 2}
+        assert get_single_flight_stats()["early_refreshes"] == 1
+
+    async def test_early_refresh_in_progress_serves_current(self, mock_redis):
+        """While another process refreshes early, the current value is served."""
+        from app.core.cache import _serialize, cache_get_or_compute
+
+        mock_redis.pipeline.return_value.execute.return_value = [_serialize({"v": 1}), 1, "500"]
+        mock_redis.set = AsyncMock(return_value=None)
+        compute = AsyncMock()
+
+        with patch_redis(mock_redis):
+            value = await cache_get_or_compute("pulse:stats", compute)
+
+        assert value == {"v": 1}
+        compute.assert_not_awaited()
+
+    def test_refresh_probability(self):
+        """XFetch never fires far from expiry, always fires at it."""
+        from app.core.cache import _refresh_early
+
+        assert not any(_refresh_early(10, 3_600_000, 1.0) for _ in range(1000))
+        assert _refresh_early(10, 0, 1.0) is False  # Expired: a plain miss, not a refresh
+        assert sum(_refresh_early(100, 100, 1.0) for _ in range(2000)) > 500
+
+
+class TestJsonFastPath:
+    """Tests for cache_get_or_compute_json (cached JSON handed out unparsed)."""
+
+    async def test_hit_returns_stored_document_unparsed(self, mock_redis):
+        """A Redis hit is decompressed and returned without being parsed."""
+        from app.core import cache_codec
+        from app.core.cache import cache_get_or_compute_json
+
+        body = b'{"insights":[],"total":3}'
+        mock_redis.pipeline.return_value.execute.return_value = [
+            cache_codec.pack(body),
+            60_000,
+            None,
+        ]
+
+        with (
+            patch_redis(mock_redis),
+            patch.object(cache_codec, "loads", side_effect=AssertionError("parsed")),
+        ):
+            result = await cache_get_or_compute_json("insights_list:x", AsyncMock())
+
+        assert result == body
+        assert isinstance(result, cache_codec.JsonBytes)
+
+    async def test_miss_serializes_model_once(self, mock_redis):
+        """The computed model is serialized once, for Redis and the caller alike."""
+        from app.core import cache_codec
+        from app.core.cache import cache_get_or_compute_json
+
+        model = _SampleModel(name="hello", value=42)
+        with patch_redis(mock_redis):
+            result = await cache_get_or_compute_json(
+                "insights_list:y", AsyncMock(return_value=model)
+            )
+            # Served from L1 afterwards
+            assert await cache_get_or_compute_json("insights_list:y", AsyncMock()) == result
+
+        assert result == model.model_dump_json().encode()
+        stored = mock_redis.pipeline.return_value.setex.call_args_list[0].args
+        assert stored[:2] == ("cache:insights_list:y", 300)
+        assert cache_codec.unpack(stored[2]) == result
+
+    async def test_l1_value_served_as_json(self, mock_redis):
+        """L1 holds values or documents; each is converted for the other kind of reader."""
+        from app.core.cache import _l1_cache, cache_get_or_compute, cache_get_or_compute_json
+        from app.core.cache_codec import dumps
+
+        _l1_cache["pulse_stats:z"] = {"total": 1}
+        _l1_cache["insights_list:z"] = dumps({"total": 2})
+        with patch_redis(mock_redis):
+            assert await cache_get_or_compute_json("pulse_stats:z", AsyncMock()) == b'{"total":1}'
+            assert await cache_get_or_compute("insights_list:z", AsyncMock()) == {"total": 2}
+
+
+# ---------------------------------------------------------------------------
+# TestInvalidation
+# ---------------------------------------------------------------------------
+
+
+class TestInvalidation:
+    """Tests for namespace generations and cross-process L1 eviction."""
+
+    async def test_namespace_pattern_bumps_generation_without_scan(self, mock_redis):
+        """'insights:*' is one HINCRBY plus a broadcast; later keys use the new generation."""
+        from app.core.cache import _l1_cache, cache_delete_pattern, cache_set
+
+        _l1_cache["insights:list:abc"] = {"stale": True}
+        _l1_cache["trends:list:abc"] = {"other": True}
+        mock_redis.hincrby = AsyncMock(return_value=3)
+        mock_redis.scan_iter = MagicMock()
+
+        with patch_redis(mock_redis):
+            await cache_delete_pattern("insights:*")
+            await cache_set("insights:list:abc", {"fresh": True}, ttl=60)
+
+        mock_redis.scan_iter.assert_not_called()
+        mock_redis.hincrby.assert_awaited_once_with("cache-generations", "insights", 1)
+        channel, message = mock_redis.publish.await_args.args
+        assert channel == "cache:invalidate"
+        assert json.loads(message) == {"namespace": "insights", "generation": 3}
+        assert mock_redis.setex.await_args.args[0] == "cache:insights@3:list:abc"
+        assert "trends:list:abc" in _l1_cache
+
+    async def test_generations_loaded_from_redis(self, mock_redis):
+        """A process that missed the broadcast reads the generation from Redis."""
+        from app.core.cache import cache_get
+
+        mock_redis.hgetall = AsyncMock(return_value={"trends": "7"})
+
+        with patch_redis(mock_redis):
+            await cache_get("trends:list:x")
+            await cache_get("tools:list")
+
+        keys = [call.args[0] for call in mock_redis.get.await_args_list]
+        assert keys == ["cache:trends@7:list:x", "cache:tools:list"]
+        mock_redis.hgetall.assert_awaited_once()
+
+    async def test_remote_invalidation_evicts_l1(self):
+        """Messages from other processes evict by namespace, key and pattern."""
+        from app.core.cache import _apply_invalidation, _generations, _l1_cache
+
+        _l1_cache.update(
+            {"insights:a": 1, "insightsx:a": 2, "pulse:stats": 3, "trends:list:1": 4, "tools": 5}
+        )
+
+        _apply_invalidation({"namespace": "insights", "generation": 2})
+        _apply_invalidation({"keys": ["pulse:stats"]})
+        _apply_invalidation({"pattern": "trends:list:*"})
+
+        assert dict(_l1_cache) == {"insightsx:a": 2, "tools": 5}
+        assert _generations["insights"] == 2
+
+    async def test_other_patterns_scan_and_broadcast(self, mock_redis):
+        """Sub-namespace patterns still SCAN, and every process evicts its L1 matches."""
+        from app.core.cache import _l1_cache, cache_delete_pattern
+
+        async def scan(pattern):
+            yield "cache:insights:list:1"
+
+        _l1_cache["insights:list:1"] = {"x": 1}
+        mock_redis.scan_iter = MagicMock(side_effect=scan)
+
+        with patch_redis(mock_redis):
+            deleted = await cache_delete_pattern("insights:list:*")
+
+        assert deleted == 1
+        mock_redis.scan_iter.assert_called_once_with("cache:insights:list:*")
+        assert json.loads(mock_redis.publish.await_args.args[1]) == {"pattern": "insights:list:*"}
+        assert "insights:list:1" not in _l1_cache
+
+    async def test_listener_applies_published_messages(self, mock_redis):
+        """The listener task applies messages received on the channel."""
+        import asyncio
+
+        from app.core import cache
+
+        cache._l1_cache["tools:list"] = [1]
+        message = {"type": "message", "data": json.dumps({"keys": ["tools:list"]})}
+        pubsub = AsyncMock()
+        pubsub.get_message = AsyncMock(side_effect=[message] + [None] * 1000)
+        mock_redis.pubsub = MagicMock(return_value=pubsub)
+
+        with patch_redis(mock_redis):
+            await cache.start_invalidation_listener()
+            for _ in range(20):
+                await asyncio.sleep(0)
+                if "tools:list" not in cache._l1_cache:
+                    break
+            await cache.stop_invalidation_listener()
+
+        assert "tools:list" not in cache._l1_cache
+        pubsub.subscribe.assert_awaited_once_with("cache:invalidate")
@@ -0,0 +1,128 @@
+"""Tests for the cached query registry (app.core.cache_registry)."""
+
+import json
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from httpx import AsyncClient
+
+from app.api.routes import pulse, trends  # noqa: F401  (register their queries)
+from app.api.routes.insights import INSIGHT_LIST_QUERY
+from app.core import cache_codec, cache_registry
+from app.core.cache_registry import (
+    hydrate_cached_queries,
+    invalidate_dependents,
+    register_cached_query,
+)
+from app.schemas.insight import MessageResponse
+
+
+async def _load_message(db, *, text: str = "hi") -> MessageResponse:
+    return MessageResponse(message=text)
+
+
+@pytest.fixture
+def registry():
+    """Isolated registry holding only the queries a test registers."""
+    with patch.dict(cache_registry._registry, clear=True):
+        yield cache_registry._registry
+
+
+@asynccontextmanager
+async def _session():
+    yield MagicMock()
+
+
+def test_key_requires_exact_parameters(registry):
+    query = register_cached_query(
+        "messages", _load_message, MessageResponse, params={"text": "hi"}, ttl=60
+    )
+    assert query.key(text="hi") == query.key(text="hi")
+    assert query.key(text="hi") != query.key(text="ho")
+    assert query.key(text="hi").startswith("messages:")
+
+    with pytest.raises(TypeError):
+        query.key()
+    with pytest.raises(TypeError):
+        query.key(text="hi", lang="en")
+
+
+@pytest.mark.parametrize("name", ["messages", "messages:list", "messages*"])
+def test_names_are_unique_namespaces(registry, name):
+    register_cached_query("messages", _load_message, MessageResponse, ttl=60)
+    with pytest.raises(ValueError):
+        register_cached_query(name, _load_message, MessageResponse, ttl=60)
+
+
+@pytest.mark.asyncio
+async def test_hydration_warms_keys_requested_by_route(client: AsyncClient):
+    """Parameter sets recorded from real requests are warmed under the keys the route reads."""
+    read_keys = []
+
+    async def record_read(key, compute, ttl=None):
+        read_keys.append(key)
+        return cache_codec.dumps(await compute())
+
+    with (
+        patch.dict(
+            cache_registry._registry, {INSIGHT_LIST_QUERY.name: INSIGHT_LIST_QUERY}, clear=True
+        ),
+        patch.object(INSIGHT_LIST_QUERY, "_usage", type(INSIGHT_LIST_QUERY._usage)()),
+    ):
+        with patch.object(cache_registry, "cache_get_or_compute_json", side_effect=record_read):
+            await client.get("/api/insights", params={"sort": "fit", "limit": 4})
+            await client.get("/api/insights", headers={"Accept-Language": "zh-CN"})
+
+        redis = MagicMock()
+        redis.zrevrange = AsyncMock(return_value=list(INSIGHT_LIST_QUERY._usage))
+        refresh = AsyncMock(return_value={"insights": [], "total": 0, "limit": 20, "offset": 0})
+        with (
+            patch.object(cache_registry, "get_redis", AsyncMock(return_value=redis)),
+            patch.object(cache_registry, "cache_refresh", refresh),
+            patch("app.db.session.AsyncSessionLocal", _session),
+        ):
+            result = await hydrate_cached_queries()
+
+    warmed_keys = [call.args[0] for call in refresh.await_args_list]
+    default_key = INSIGHT_LIST_QUERY.key(**INSIGHT_LIST_QUERY.params)
+    assert warmed_keys == [default_key, *read_keys]
+    assert result == {"insights_list": 3}
+
+
+@pytest.mark.asyncio
+async def test_usage_flushed_in_batches(registry):
+    query = register_cached_query(
+        "messages", _load_message, MessageResponse, params={"text": "hi"}, ttl=60
+    )
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis = MagicMock()
+    redis.pipeline.return_value = pipe
+
+    with (
+        patch.object(cache_registry, "get_redis", AsyncMock(return_value=redis)),
+        patch.object(
+            cache_registry, "cache_get_or_compute", AsyncMock(return_value={"message": "x"})
+        ),
+    ):
+        for text in ["a", "a", "b"]:
+            await query.get(MagicMock(), text=text)
+        pipe.execute.assert_not_awaited()  # Within the flush interval
+
+        await query.flush_usage()
+
+    increments = {call.args[2]: call.args[1] for call in pipe.zincrby.call_args_list}
+    assert increments == {json.dumps(["a"]): 2, json.dumps(["b"]): 1}
+    pipe.zremrangebyrank.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_dependents_by_table():
+    with patch.object(cache_registry, "cache_delete_pattern", AsyncMock()) as delete:
+        names = await invalidate_dependents("insights")
+
+    assert set(names) >= {"insights_list", "pulse_stats"}
+    assert "trends_list" not in names
+    patterns = {call.args[0] for call in delete.await_args_list}
+    assert {"insights_list:*", "pulse_stats:*"} <= patterns
@@ -0,0 +1,91 @@
+"""Unit tests for token streaming in the chat strategist agent."""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.agents import chat_agent
+from app.agents.chat_agent import ChatContext, stream_chat_response
+from app.monitoring.metrics import get_metrics_tracker
+
+CONTEXT = ChatContext(
+    insight_title="AI bookkeeping",
+    problem_statement="Small firms hate bookkeeping",
+    proposed_solution="Autonomous ledger agent",
+)
+
+
+class _FakeAgent:
+    """Stands in for pydantic_ai.Agent.run_stream; one script per attempt."""
+
+    def __init__(self, *scripts):
+        self.scripts = list(scripts)
+        self.attempts = 0
+
+    @asynccontextmanager
+    async def run_stream(self, prompt):
+        script = self.scripts[self.attempts]
+        self.attempts += 1
+
+        async def stream_text(delta=False, debounce_by=None):
+            for item in script:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+
+        yield SimpleNamespace(
+            stream_text=stream_text,
+            usage=lambda: SimpleNamespace(input_tokens=120, output_tokens=6),
+        )
+
+
+async def _collect(agent: _FakeAgent) -> list[str]:
+    with (
+        patch.object(chat_agent, "_build_agent", return_value=agent),
+        patch("app.agents.chat_agent.asyncio.sleep", AsyncMock()),
+    ):
+        return [
+            delta async for delta in stream_chat_response("general", "How big is it?", CONTEXT, [])
+        ]
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    get_metrics_tracker().reset()
+    yield
+    get_metrics_tracker().reset()
+
+
+@pytest.mark.asyncio
+async def test_yields_deltas_and_records_ttft():
+    deltas = await _collect(_FakeAgent(["The ", "market ", "is large."]))
+
+    assert deltas == ["The ", "market ", "is large."]
+    call = get_metrics_tracker().metrics.llm_calls[-1]
+    assert call.success
+    assert call.output_tokens == 6
+    assert call.response_length == len("The market is large.")
+    assert call.ttft_ms is not None and call.ttft_ms >= 0
+    assert "average_ttft_ms" in get_metrics_tracker().get_summary()["llm"]
+
+
+@pytest.mark.asyncio
+async def test_retries_before_first_token():
+    agent = _FakeAgent([httpx.TimeoutException("slow")], ["ok"])
+
+    assert await _collect(agent) == ["ok"]
+    assert agent.attempts == 2
+    assert [c.success for c in get_metrics_tracker().metrics.llm_calls] == [False, True]
+
+
+@pytest.mark.asyncio
+async def test_no_retry_once_text_was_sent():
+    """A retry after partial output would duplicate text on the client."""
+    agent = _FakeAgent(["partial", httpx.TimeoutException("dropped")], ["never"])
+
+    with pytest.raises(httpx.TimeoutException):
+        await _collect(agent)
+    assert agent.attempts == 1
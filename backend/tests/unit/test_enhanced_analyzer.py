@@ -3,8 +3,14 @@
 Covers:
 - EnhancedInsightSchema Pydantic validation (constraints, literals, nested models)
 - get_enhanced_system_prompt() language dispatch
+- run_validation_stage() concurrency, per-validator budgets and latency reporting
 """
 
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
 import pytest
 from pydantic import ValidationError
 
@@ -17,7 +23,10 @@ from app.agents.enhanced_analyzer import (
     ProofSignal,
     ValueLadderTier,
     get_enhanced_system_prompt,
+    run_validation_stage,
 )
+from app.core.config import settings
+from app.monitoring.metrics import get_metrics_tracker
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -306,3 +315,74 @@ class TestLanguageNegotiation:
     def test_chinese_prompt_contains_chinese_text(self):
         """ENHANCED_SYSTEM_PROMPT_ZH_CN contains at least one Chinese character."""
         assert any("\u4e00" <= ch <= "\u9fff" for ch in ENHANCED_SYSTEM_PROMPT_ZH_CN)
+
+
+# ---------------------------------------------------------------------------
+# Post-LLM validation stage
+# ---------------------------------------------------------------------------
+
+
+def _validator(method: str, delay: float, result=None, error: Exception | None = None):
+    async def run(items):
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return result
+
+    return lambda: SimpleNamespace(**{method: run})
+
+
+@pytest.mark.asyncio
+class TestValidationStage:
+    COMMUNITIES = [{"platform": "Reddit", "communities": "r/SaaS"}]
+    TRENDS = [{"keyword": "ai crm", "volume": "10K", "growth": "+50%"}]
+    COMPETITORS = [{"name": "Acme", "url": "https://acme.test"}]
+
+    async def _run(self, community, trend, url):
+        with (
+            patch("app.agents.enhanced_analyzer.get_community_validator", community),
+            patch("app.agents.enhanced_analyzer.get_trend_verifier", trend),
+            patch("app.agents.enhanced_analyzer.get_url_validator", url),
+            patch.object(settings, "trend_verification_timeout", 0.2),
+        ):
+            return await run_validation_stage(self.COMMUNITIES, self.TRENDS, self.COMPETITORS)
+
+    async def test_validators_run_concurrently(self):
+        verified = [{"keyword": "ai crm", "volume": "1K", "growth": "+5%"}]
+        start = time.perf_counter()
+        communities, trends, competitors, report = await self._run(
+            _validator("validate_community_signals", 0.1, ([], 0, 1)),
+            _validator("verify_trend_keywords", 0.1, (verified, 1, 0)),
+            _validator("validate_competitors", 0.1, (self.COMPETITORS, 1, 0)),
+        )
+
+        assert time.perf_counter() - start < 0.25  # ~max, not the sum, of the three
+        assert (communities, trends, competitors) == ([], verified, self.COMPETITORS)
+        assert report["validators"]["trend"] == {
+            "status": "ok",
+            "latency_ms": pytest.approx(100, abs=50),
+            "valid": 1,
+            "invalid": 0,
+        }
+
+    async def test_slow_or_failing_validator_keeps_llm_values(self):
+        tracker = get_metrics_tracker()
+        tracker.reset()
+        start = time.perf_counter()
+        communities, trends, competitors, report = await self._run(
+            _validator("validate_community_signals", 0, error=RuntimeError("praw down")),
+            _validator("verify_trend_keywords", 5.0, ([], 0, 0)),  # Exceeds 0.2s budget
+            _validator("validate_competitors", 0, ([], 0, 1)),
+        )
+
+        assert time.perf_counter() - start < 1.0
+        assert communities == self.COMMUNITIES
+        assert trends == self.TRENDS
+        assert competitors == []
+        statuses = {name: v["status"] for name, v in report["validators"].items()}
+        assert statuses == {"community": "error", "trend": "timeout", "url": "ok"}
+
+        summary = tracker.get_summary()["validation"]
+        assert summary["trend"]["timeout"] == 1
+        assert summary["community"]["error"] == 1
+        assert summary["url"]["runs"] == 1
@@ -0,0 +1,146 @@
+"""Unit tests for the batched hourly_trends_update_task pipeline in app.worker."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app import worker
+from app.models.insight import Insight
+from app.models.raw_signal import RawSignal
+
+
+async def _seed(db_session, keyword: str, geo: str, n_insights: int, score: float = 0.5):
+    signal = RawSignal(
+        id=uuid4(),
+        source="google_trends",
+        url=f"https://trends.google.com/trends/explore?q={keyword}",
+        content=f"Google Trends: {keyword}",
+        extra_metadata={"keyword": keyword, "geo": geo},
+    )
+    db_session.add(signal)
+    for _ in range(n_insights):
+        db_session.add(
+            Insight(
+                id=uuid4(),
+                raw_signal_id=signal.id,
+                problem_statement=f"Problem about {keyword}",
+                proposed_solution="Solution",
+                market_size_estimate="Large",
+                relevance_score=score,
+            )
+        )
+    await db_session.commit()
+
+
+def _fake_scraper_cls(calls: list):
+    """GoogleTrendsScraper stand-in: one request per 5 keywords, interest = len(keyword)."""
+
+    def factory(keywords, timeframe, geo):
+        calls.append((geo, list(keywords)))
+        scraper = MagicMock()
+        scraper.request_count = -(-len(keywords) // 5)
+
+        async def scrape_keywords():
+            return [
+                MagicMock(metadata={"keyword": k, "normalized_interest": len(k), "geo": geo})
+                for k in keywords
+            ]
+
+        scraper.scrape_keywords = scrape_keywords
+        return scraper
+
+    return factory
+
+
+@pytest.mark.asyncio
+async def test_keywords_deduped_and_fanned_out(db_session):
+    """Insights sharing a (keyword, geo) trigger one fetch; every insight counts as updated."""
+    await _seed(db_session, "ai agents", "US", n_insights=3)
+    await _seed(db_session, "saas", "US", n_insights=2)
+    await _seed(db_session, "ai agents", "MY", n_insights=1)
+
+    @asynccontextmanager
+    async def session_factory():
+        yield db_session
+
+    calls: list = []
+    append = AsyncMock(return_value=3)
+    with (
+        patch.object(worker, "AsyncSessionLocal", session_factory),
+        patch.object(worker, "GoogleTrendsScraper", side_effect=_fake_scraper_cls(calls)),
+        patch("app.services.trend_points.append_trend_points", append),
+        patch("app.services.trend_points.purge_trend_points", AsyncMock(return_value=0)),
+        patch("app.services.spike_detection.detect_keyword_spikes", AsyncMock(return_value=[])),
+    ):
+        result = await worker.hourly_trends_update_task({})
+
+    assert result["status"] == "success"
+    assert result["total"] == 6
+    assert result["updated"] == 6
+    assert result["keywords"] == 3
+    assert result["requests"] == 2  # one batch per geo
+    assert "wall_time_ms" in result
+
+    assert sorted((geo, sorted(kws)) for geo, kws in calls) == [
+        ("MY", ["ai agents"]),
+        ("US", ["ai agents", "saas"]),
+    ]
+    points = append.await_args.args[1]
+    assert sorted((k, g, v) for k, g, _, v in points) == [
+        ("ai agents", "MY", 9),
+        ("ai agents", "US", 9),
+        ("saas", "US", 4),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_missing_keyword_counts_as_failed(db_session):
+    """Insights whose keyword returned no data are reported as failed."""
+    await _seed(db_session, "ai agents", "US", n_insights=2)
+
+    @asynccontextmanager
+    async def session_factory():
+        yield db_session
+
+    def empty_scraper(keywords, timeframe, geo):
+        scraper = MagicMock()
+        scraper.request_count = 1
+        scraper.scrape_keywords = AsyncMock(return_value=[])
+        return scraper
+
+    with (
+        patch.object(worker, "AsyncSessionLocal", session_factory),
+        patch.object(worker, "GoogleTrendsScraper", side_effect=empty_scraper),
+        patch("app.services.trend_points.append_trend_points", AsyncMock(return_value=0)),
+        patch("app.services.trend_points.purge_trend_points", AsyncMock(return_value=0)),
+        patch("app.services.spike_detection.detect_keyword_spikes", AsyncMock(return_value=[])),
+    ):
+        result = await worker.hourly_trends_update_task({})
+
+    assert result["updated"] == 0
+    assert result["failed"] == 2
+    assert result["requests"] == 1
+
+
+@pytest.mark.asyncio
+async def test_scraper_normalizes_each_keyword_to_its_own_peak():
+    """Batch-relative values are rescaled so a small keyword isn't squashed by a big one."""
+    import pandas as pd
+
+    from app.scrapers.sources.trends_scraper import GoogleTrendsScraper
+
+    with patch("pytrends.request.TrendReq"):
+        scraper = GoogleTrendsScraper(keywords=["big", "small", "flat"], timeframe="now 1-H")
+    scraper.pytrends.interest_over_time.return_value = pd.DataFrame(
+        {"big": [100, 80, 50], "small": [2, 4, 3], "flat": [0, 0, 0]}
+    )
+
+    results = await scraper.scrape_keywords()
+
+    by_keyword = {r.metadata["keyword"]: r.metadata for r in results}
+    assert by_keyword["small"]["current_interest"] == 3
+    assert by_keyword["small"]["normalized_interest"] == 75
+    assert by_keyword["big"]["normalized_interest"] == 50
+    assert by_keyword["flat"]["normalized_interest"] == 0
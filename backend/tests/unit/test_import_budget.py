@@ -0,0 +1,94 @@
+"""Cold-import budget for the API and worker entry points.
+
+Each entry point is imported in a fresh interpreter (-X importtime), so the
+numbers reflect a real cold start rather than this test process's warm caches.
+
+The lazy-import and module-count checks always run. The wall-clock budget
+depends on the machine, so it only runs with IMPORT_BUDGET_STRICT=1 (or use
+scripts/import_profile.py, which reports against the same budgets).
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.core.constants import (
+    IMPORT_MODULE_BUDGET,
+    IMPORT_TIME_BUDGET_SECONDS,
+    LAZY_IMPORT_MODULES,
+)
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+_PROBE = (
+    "import json, sys\n"
+    "import {entry}\n"
+    "print(json.dumps(sorted(set(sys.modules) & set({modules!r}))))"
+)
+
+
+_IMPORT_LINE = re.compile(r"^import time:\s+\d+ \|", re.M)
+
+
+def _cold_import(entry: str) -> tuple[float, int, list[str]]:
+    """Returns (cumulative import seconds, modules loaded, lazy-import modules that got loaded)."""
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            _PROBE.format(entry=entry, modules=LAZY_IMPORT_MODULES),
+        ],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(BACKEND_DIR)},
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    match = re.search(rf"^import time:\s+\d+ \|\s+(\d+) \| {re.escape(entry)}$", proc.stderr, re.M)
+    assert match, f"no importtime line for {entry}"
+    return (
+        int(match.group(1)) / 1e6,
+        len(_IMPORT_LINE.findall(proc.stderr)),
+        json.loads(proc.stdout.strip().splitlines()[-1]),
+    )
+
+
+@pytest.mark.parametrize("entry", sorted(IMPORT_TIME_BUDGET_SECONDS))
+def test_no_heavy_imports_at_startup(entry):
+    _, _, leaked = _cold_import(entry)
+
+    assert leaked == [], (
+        f"{entry} imports {leaked} at startup; import them where they are used "
+        f"(run scripts/import_profile.py {entry} to see the import chain)"
+    )
+
+
+@pytest.mark.parametrize("entry", sorted(IMPORT_MODULE_BUDGET))
+def test_cold_import_module_count_within_budget(entry):
+    _, modules, _ = _cold_import(entry)
+
+    assert modules <= IMPORT_MODULE_BUDGET[entry], (
+        f"{entry} cold import loads {modules} modules "
+        f"(budget {IMPORT_MODULE_BUDGET[entry]}); see scripts/import_profile.py"
+    )
+
+
+@pytest.mark.skipif(
+    os.environ.get("IMPORT_BUDGET_STRICT") != "1",
+    reason="Timing-dependent; set IMPORT_BUDGET_STRICT=1 to enforce the import budget",
+)
+@pytest.mark.parametrize("entry", sorted(IMPORT_TIME_BUDGET_SECONDS))
+def test_cold_import_within_budget(entry):
+    seconds, _, _ = _cold_import(entry)
+
+    assert seconds <= IMPORT_TIME_BUDGET_SECONDS[entry], (
+        f"{entry} cold import took {seconds:.2f}s "
+        f"(budget {IMPORT_TIME_BUDGET_SECONDS[entry]:.1f}s); see scripts/import_profile.py"
+    )
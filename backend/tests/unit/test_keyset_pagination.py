@@ -0,0 +1,129 @@
+"""Tests for keyset pagination and cached totals in app.db.query_helpers."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import cache_codec
+from app.db.query_helpers import InvalidCursorError, SortKey, encode_cursor, paginate
+from app.models.insight import Insight
+from app.models.raw_signal import RawSignal
+
+FIT_SORT = [SortKey(Insight.founder_fit_score, nulls_last=True), SortKey(Insight.id)]
+NEWEST_SORT = [SortKey(Insight.created_at), SortKey(Insight.id)]
+
+
+async def cache_miss(key, compute, ttl=None):
+    """Stand-in for cache_get_or_compute that always computes."""
+    return await compute()
+
+
+async def json_cache_miss(key, compute, ttl=None):
+    """Stand-in for cache_get_or_compute_json that always computes."""
+    return cache_codec.dumps(await compute())
+
+
+@pytest_asyncio.fixture
+async def insights(db_session: AsyncSession, test_signal: RawSignal) -> list[Insight]:
+    # Repeated and NULL founder_fit scores; pairs of equal created_at
+    rows = [
+        Insight(
+            id=uuid4(),
+            raw_signal_id=test_signal.id,
+            title=f"Idea {n}",
+            problem_statement="Problem",
+            proposed_solution="Solution",
+            market_size_estimate="Small",
+            relevance_score=0.5,
+            founder_fit_score=[7, None, 9, 7, None, 3, 9][n],
+            created_at=datetime(2026, 10, 1, tzinfo=UTC) + timedelta(hours=n // 2),
+        )
+        for n in range(7)
+    ]
+    db_session.add_all(rows)
+    await db_session.commit()
+    return rows
+
+
+async def _walk(db: AsyncSession, sort: list[SortKey], limit: int) -> list[Insight]:
+    seen, cursor = [], None
+    while True:
+        page = await paginate(db, select(Insight), sort, limit=limit, cursor=cursor)
+        assert page.total == 7
+        seen += page.items
+        if not page.has_more:
+            return seen
+        cursor = page.next_cursor
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sort", [FIT_SORT, NEWEST_SORT], ids=["nullable", "datetime"])
+async def test_cursor_walk_matches_offset_order(db_session, insights, sort):
+    everything = await paginate(db_session, select(Insight), sort, limit=100)
+    walked = await _walk(db_session, sort, limit=2)
+
+    assert [i.id for i in walked] == [i.id for i in everything.items]
+    assert len({i.id for i in walked}) == 7
+
+
+@pytest.mark.asyncio
+async def test_nulls_sort_last(db_session, insights):
+    page = await paginate(db_session, select(Insight), FIT_SORT, limit=100)
+    scores = [i.founder_fit_score for i in page.items]
+    assert scores == [9, 9, 7, 7, 3, None, None]
+
+
+@pytest.mark.asyncio
+async def test_offset_mode_still_supported(db_session, insights):
+    page = await paginate(db_session, select(Insight), FIT_SORT, limit=2, offset=6)
+    assert len(page.items) == 1
+    assert not page.has_more
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "cursor",
+    ["!!not-base64!!", encode_cursor({"a": 1}), encode_cursor([1]), encode_cursor(["x", "y"])],
+    ids=["garbage", "not-a-list", "wrong-length", "wrong-types"],
+)
+async def test_invalid_cursor_rejected(db_session, cursor):
+    with pytest.raises(InvalidCursorError):
+        await paginate(db_session, select(Insight), FIT_SORT, cursor=cursor)
+
+
+@pytest.mark.asyncio
+async def test_total_served_from_cache(db_session, insights):
+    with patch("app.db.query_helpers.cache_get_or_compute", side_effect=cache_miss) as mock_cache:
+        page = await paginate(db_session, select(Insight), FIT_SORT, count_ttl=60)
+    assert page.total == 7
+    key = mock_cache.await_args.args[0]
+    assert key.startswith("count:") and mock_cache.await_args.kwargs["ttl"] == 60
+
+    with patch("app.db.query_helpers.cache_get_or_compute", AsyncMock(return_value=42)):
+        page = await paginate(db_session, select(Insight), FIT_SORT, count_ttl=60)
+    assert page.total == 42
+
+
+@pytest.mark.asyncio
+@patch("app.core.cache_registry.cache_get_or_compute_json", side_effect=json_cache_miss)
+async def test_list_insights_cursor(mock_cache: AsyncMock, client: AsyncClient, insights):
+    first = (await client.get("/api/insights", params={"sort": "fit", "limit": 4})).json()
+    assert first["next_cursor"]
+
+    second = (
+        await client.get(
+            "/api/insights", params={"sort": "fit", "limit": 4, "cursor": first["next_cursor"]}
+        )
+    ).json()
+    ids = [i["id"] for i in first["insights"] + second["insights"]]
+    assert len(set(ids)) == 7
+    assert second["next_cursor"] is None
+
+    bad = await client.get("/api/insights", params={"cursor": "garbage"})
+    assert bad.status_code == 400
@@ -0,0 +1,85 @@
+"""Unit tests for the LLM token-bucket rate limiter in app.core.llm_rate_limiter."""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.core.llm_rate_limiter import LLMRateLimiter, TokenBucket, estimate_llm_tokens
+
+
+def test_bucket_starts_full():
+    """A new bucket has its full capacity available."""
+    bucket = TokenBucket(capacity=10, refill_per_second=1)
+    assert bucket.wait_time(10) == 0.0
+
+
+def test_bucket_wait_time_after_consume():
+    """Draining the bucket yields a wait proportional to the deficit."""
+    bucket = TokenBucket(capacity=10, refill_per_second=2)
+    bucket.consume(10)
+    wait = bucket.wait_time(4)
+    assert 1.9 < wait <= 2.0
+
+
+def test_bucket_clamps_oversized_requests():
+    """Requests larger than capacity are clamped instead of waiting forever."""
+    bucket = TokenBucket(capacity=5, refill_per_second=1)
+    assert bucket.wait_time(100) == 0.0
+    bucket.consume(100)
+    assert bucket.available < 1
+
+
+@pytest.mark.asyncio
+async def test_limiter_acquire_within_quota_does_not_wait():
+    """Calls within the burst allowance return immediately."""
+    limiter = LLMRateLimiter(requests_per_minute=5, tokens_per_minute=10_000)
+    for _ in range(5):
+        assert await limiter.acquire(1000) == 0.0
+    assert limiter.total_acquired == 5
+
+
+@pytest.mark.asyncio
+async def test_limiter_waits_when_rpm_exhausted():
+    """Exceeding RPM sleeps for the refill time of one request."""
+    limiter = LLMRateLimiter(requests_per_minute=2, tokens_per_minute=1_000_000)
+    await limiter.acquire(10)
+    await limiter.acquire(10)
+
+    slept: list[float] = []
+
+    async def fake_sleep(delay):
+        slept.append(delay)
+        # Simulate time passing by topping up the request bucket
+        limiter.requests._tokens = limiter.requests.capacity
+
+    with patch("app.core.llm_rate_limiter.asyncio.sleep", side_effect=fake_sleep):
+        waited = await limiter.acquire(10)
+
+    assert len(slept) == 1
+    assert 29 < slept[0] <= 30  # 2 RPM → one request every 30s
+    assert waited == slept[0]
+
+
+@pytest.mark.asyncio
+async def test_limiter_waits_when_tpm_exhausted():
+    """Token quota is enforced independently of request count."""
+    limiter = LLMRateLimiter(requests_per_minute=100, tokens_per_minute=600)
+    await limiter.acquire(600)
+
+    slept: list[float] = []
+
+    async def fake_sleep(delay):
+        slept.append(delay)
+        limiter.tokens._tokens = limiter.tokens.capacity
+
+    with patch("app.core.llm_rate_limiter.asyncio.sleep", side_effect=fake_sleep):
+        await limiter.acquire(300)
+
+    assert len(slept) == 1
+    assert 29 < slept[0] <= 30  # 300 tokens at 10 tokens/s
+
+
+def test_estimate_llm_tokens():
+    """Estimate is ~4 chars per token plus the completion budget."""
+    assert estimate_llm_tokens("x" * 400, expected_output_tokens=50) == 150
+    assert estimate_llm_tokens("", expected_output_tokens=0) == 0
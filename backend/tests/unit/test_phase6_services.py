@@ -7,8 +7,14 @@ import uuid
 
 from app.services.anomaly_detection import WelfordBaseline
 from app.services.signal_correlation import (
+    _band_keys,
+    _candidate_pairs,
     _compute_tfidf,
     _cosine_similarity,
+    _IndexedDoc,
+    _minhash_signature,
+    _plan_group_updates,
+    _score_pairs,
     _tokenize,
 )
 
@@ -147,6 +153,70 @@ class TestTfIdf:
         assert _compute_tfidf([]) == []
 
 
+def _doc(source: str, text: str, group_id=None, score=None) -> _IndexedDoc:
+    terms = _tokenize(text)
+    counts = {t: terms.count(t) for t in set(terms)}
+    return _IndexedDoc(
+        uuid.uuid4(), source, counts, _band_keys(_minhash_signature(counts)), group_id, score
+    )
+
+
+class TestMinHashLSH:
+    def test_signature_is_deterministic(self):
+        terms = ["invoice", "automation", "freelancers"]
+        assert _minhash_signature(terms) == _minhash_signature(reversed(terms))
+        assert _minhash_signature([]) == []
+
+    def test_near_duplicates_share_band_keys(self):
+        a = _doc("reddit", "Freelancers struggle with invoice automation and late payments")
+        b = _doc("hacker_news", "Freelancers struggle with invoice automation and payments")
+        assert set(a.band_keys) & set(b.band_keys)
+
+    def test_unrelated_documents_are_not_candidates(self):
+        a = _doc("reddit", "Freelancers struggle with invoice automation and late payments")
+        b = _doc("product_hunt", "Restaurant kitchens waste vegetables during weekend prep")
+        assert _candidate_pairs([a, b], {a.insight_id, b.insight_id}) == set()
+
+    def test_candidates_skip_same_source_and_old_pairs(self):
+        text = "Freelancers struggle with invoice automation and late payments"
+        a, b, c = _doc("reddit", text), _doc("reddit", text), _doc("twitter", text)
+        # a/b same source; only pairs touching the new doc c are emitted
+        assert _candidate_pairs([a, b, c], {c.insight_id}) == {(0, 2), (1, 2)}
+
+    def test_score_pairs_applies_threshold(self):
+        a = _doc("reddit", "Freelancers struggle with invoice automation and late payments")
+        b = _doc("twitter", "Freelancers struggle with invoice automation and payments")
+        scored = _score_pairs([a, b], [(0, 1)])
+        assert len(scored) == 1
+        assert scored[0][2] > 0.5
+
+
+class TestPlanGroupUpdates:
+    def test_new_pair_creates_group(self):
+        a, b = _doc("reddit", "x"), _doc("twitter", "y")
+        params, groups = _plan_group_updates(
+            {a.insight_id: a, b.insight_id: b}, [(a.insight_id, b.insight_id, 0.71234)]
+        )
+        assert len(params) == 2
+        assert params[0]["correlation_group_id"] == params[1]["correlation_group_id"]
+        assert {p["correlation_score"] for p in params} == {0.7123}
+        assert groups[0]["source_count"] == 2
+
+    def test_new_insight_joins_existing_group(self):
+        gid = uuid.uuid4()
+        old_a = _doc("reddit", "x", group_id=gid, score=0.9)
+        old_b = _doc("twitter", "y", group_id=gid, score=0.9)
+        new = _doc("hacker_news", "z")
+        members = {d.insight_id: d for d in (old_a, old_b, new)}
+        params, groups = _plan_group_updates(members, [(new.insight_id, old_a.insight_id, 0.4)])
+
+        assert {p["correlation_group_id"] for p in params} == {gid}
+        assert len(params) == 3
+        assert groups[0]["source_count"] == 3
+        # Existing members keep their higher historical score
+        assert next(p for p in params if p["id"] == old_b.insight_id)["correlation_score"] == 0.9
+
+
 class TestWelfordBaseline:
     def test_roundtrip(self):
         """Init from (count, mean, variance), update, verify consistency."""
@@ -0,0 +1,108 @@
+"""Unit tests for the verified-principal cache in app.api.deps."""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import jwt
+import pytest
+
+from app.api import deps
+from app.models.user import User
+
+_SECRET = "x" * 16 + "abcdefghijklmnopqrstuvwxyz0123456789"
+
+
+def _token(sub: str, email: str = "a@example.com", full_name: str = "Ada") -> str:
+    payload = {
+        "sub": sub,
+        "email": email,
+        "aud": "authenticated",
+        "iss": f"{deps.settings.supabase_url}/auth/v1",
+        "exp": int(time.time()) + 3600,
+        "email_confirmed_at": "2026-01-01T00:00:00Z",
+        "user_metadata": {"full_name": full_name},
+    }
+    return jwt.encode(payload, _SECRET, algorithm="HS256")
+
+
+@pytest.fixture(autouse=True)
+def _auth_settings(monkeypatch):
+    monkeypatch.setattr(deps.settings, "jwt_secret", _SECRET)
+    monkeypatch.setattr(deps.settings, "supabase_url", "https://test.supabase.co")
+    deps._principal_l1.clear()
+    redis = AsyncMock()
+    redis.get = AsyncMock(return_value=None)
+    with patch.object(deps, "get_redis", AsyncMock(return_value=redis)):
+        yield redis
+    deps._principal_l1.clear()
+
+
+def _db_returning(user: User) -> AsyncMock:
+    db = AsyncMock()
+    result = MagicMock()
+    result.scalar_one.return_value = user
+    db.execute = AsyncMock(return_value=result)
+    db.get = AsyncMock(return_value=user)
+    return db
+
+
+def _user(sub: str) -> User:
+    return User(id=uuid4(), supabase_user_id=sub, email="a@example.com", deleted_at=None)
+
+
+def test_claims_hash_ignores_irrelevant_claims():
+    """Only provisioning claims feed the hash; exp/iat churn does not."""
+    base = {"email": "a@x.com", "user_metadata": {"full_name": "A"}}
+    assert deps._principal_claims_hash({**base, "exp": 1}) == deps._principal_claims_hash(
+        {**base, "exp": 2}
+    )
+    changed = {"email": "b@x.com", "user_metadata": {"full_name": "A"}}
+    assert deps._principal_claims_hash(base) != deps._principal_claims_hash(changed)
+
+
+@pytest.mark.asyncio
+async def test_first_request_upserts_then_cached_request_reads_by_pk():
+    """The UPSERT runs once; a repeat request with identical claims uses db.get only."""
+    sub = str(uuid4())
+    user = _user(sub)
+
+    db = _db_returning(user)
+    await deps._verify_and_get_user(_token(sub), db)
+    assert db.execute.await_count >= 1  # UPSERT (+ newsletter merge)
+
+    db2 = _db_returning(user)
+    result = await deps._verify_and_get_user(_token(sub), db2)
+    assert result is user
+    db2.execute.assert_not_awaited()
+    db2.commit.assert_not_awaited()
+    db2.get.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_changed_claims_trigger_reprovisioning():
+    """A new display name in the token re-runs the UPSERT."""
+    sub = str(uuid4())
+    user = _user(sub)
+    await deps._verify_and_get_user(_token(sub, full_name="Ada"), _db_returning(user))
+
+    db = _db_returning(user)
+    await deps._verify_and_get_user(_token(sub, full_name="Ada Lovelace"), db)
+    assert db.execute.await_count >= 1
+    db.get.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_reprovisioning(_auth_settings):
+    """invalidate_principal_cache drops L1 and the Redis key."""
+    sub = str(uuid4())
+    user = _user(sub)
+    await deps._verify_and_get_user(_token(sub), _db_returning(user))
+
+    await deps.invalidate_principal_cache(sub)
+    _auth_settings.delete.assert_awaited_with(f"auth:principal:{sub}")
+
+    db = _db_returning(user)
+    await deps._verify_and_get_user(_token(sub), db)
+    db.get.assert_not_awaited()
+    assert db.execute.await_count >= 1
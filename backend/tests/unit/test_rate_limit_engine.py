@@ -0,0 +1,103 @@
+"""Unit tests for the shared GCRA rate limiting engine."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core import rate_limit_engine
+from app.core.rate_limit_engine import LocalGCRA, RateLimitEngine
+from app.core.rate_limits import check_tier_rate_limit, parse_rate_limit
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = _Clock()
+    with patch("app.core.rate_limit_engine.time.monotonic", clock):
+        yield clock
+
+
+class TestLocalGCRA:
+    def test_burst_then_deny_then_refill(self, clock):
+        gcra = LocalGCRA()
+        results = [gcra.hit("ip", limit=3, period=60) for _ in range(4)]
+
+        assert [r.allowed for r in results] == [True, True, True, False]
+        assert [r.remaining for r in results[:3]] == [2, 1, 0]
+        assert results[3].retry_after == pytest.approx(20.0)
+
+        clock.now += 20
+        assert gcra.hit("ip", limit=3, period=60).allowed
+        assert not gcra.hit("ip", limit=3, period=60).allowed
+
+    def test_denied_hits_do_not_consume(self, clock):
+        gcra = LocalGCRA()
+        for _ in range(10):
+            gcra.hit("ip", limit=1, period=10)
+        clock.now += 10
+        assert gcra.hit("ip", limit=1, period=10).allowed
+
+    def test_key_set_is_bounded(self, clock):
+        gcra = LocalGCRA(max_keys=100)
+        for i in range(1000):
+            gcra.hit(f"ip-{i}", limit=5, period=60)
+        assert len(gcra) == 100
+
+
+@pytest.mark.asyncio
+async def test_engine_uses_redis_script_result():
+    engine = RateLimitEngine(use_redis=True)
+    script = AsyncMock(return_value=[0, 0, 1500])
+    engine._get_script = AsyncMock(return_value=script)
+
+    result = await engine.hit("payments:1.2.3.4", limit=100, period=3600)
+
+    assert not result.allowed
+    assert result.retry_after == 1.5
+    assert script.await_args.kwargs == {
+        "keys": ["ratelimit:payments:1.2.3.4"],
+        "args": [36000.0, 3600000, 1],
+    }
+    assert engine.get_stats()["redis_checks"] == 1
+
+
+@pytest.mark.asyncio
+async def test_engine_falls_back_when_redis_fails(clock):
+    engine = RateLimitEngine(use_redis=True)
+    script = AsyncMock(side_effect=ConnectionError("redis down"))
+    engine._script = script
+
+    with patch("app.core.cache.get_redis", AsyncMock()) as get_redis:
+        first = await engine.hit("ip", limit=1, period=60)
+        second = await engine.hit("ip", limit=1, period=60)
+
+    assert first.allowed and not second.allowed
+    assert script.await_count == 1  # Redis not retried during the back-off window
+    get_redis.assert_not_awaited()
+    assert engine.get_stats()["local_checks"] == 2
+
+
+def test_parse_rate_limit():
+    assert parse_rate_limit("20/minute") == (20, 60)
+    assert parse_rate_limit("5/hour") == (5, 3600)
+    assert parse_rate_limit("1000/days") == (1000, 86400)
+    with pytest.raises(ValueError):
+        parse_rate_limit("10/fortnight")
+
+
+@pytest.mark.asyncio
+async def test_tier_limit_uses_engine(clock):
+    engine = RateLimitEngine(use_redis=False)
+    with patch.object(rate_limit_engine, "_rate_limit_engine", engine):
+        results = [await check_tier_rate_limit("user:1", "anonymous") for _ in range(21)]
+        pro = await check_tier_rate_limit("user:2", "pro")
+
+    assert sum(r.allowed for r in results) == 20
+    assert pro.remaining == 119
@@ -0,0 +1,99 @@
+"""Tests for the fused pure-ASGI RequestPipelineMiddleware."""
+
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+from app.core import rate_limit_engine
+from app.core.rate_limit_engine import RateLimitEngine
+from app.middleware.pipeline import RequestPipelineMiddleware
+
+
+async def _echo_state(request: Request):
+    return JSONResponse(
+        {"request_id": request.state.request_id},
+        headers={"X-Frame-Options": "SAMEORIGIN"},
+    )
+
+
+async def _stream(request: Request):
+    async def body():
+        for i in range(3):
+            yield f"data: {i}\n\n"
+            await asyncio.sleep(0)
+
+    return StreamingResponse(body(), media_type="text/event-stream")
+
+
+def _client(**kwargs) -> AsyncClient:
+    app = Starlette(
+        routes=[
+            Route("/state", _echo_state),
+            Route("/stream", _stream),
+            Route("/api/checkout", _echo_state, methods=["POST"]),
+        ]
+    )
+    app.add_middleware(RequestPipelineMiddleware, **kwargs)
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.fixture(autouse=True)
+def _local_rate_limits(monkeypatch):
+    monkeypatch.setattr(rate_limit_engine, "_rate_limit_engine", RateLimitEngine(use_redis=False))
+
+
+@pytest.mark.asyncio
+async def test_request_and_correlation_ids_propagate():
+    async with _client() as client:
+        response = await client.get(
+            "/state", headers={"X-Request-ID": "req-1", "X-Correlation-ID": "corr-1"}
+        )
+
+    assert response.json() == {"request_id": "req-1"}
+    assert response.headers["x-request-id"] == "req-1"
+    assert response.headers["x-correlation-id"] == "corr-1"
+    assert float(response.headers["x-response-time-ms"]) >= 0
+
+
+@pytest.mark.asyncio
+async def test_pipeline_headers_replace_app_headers():
+    """Security headers override (not duplicate) values set by the endpoint."""
+    async with _client() as client:
+        response = await client.get("/state")
+
+    assert response.headers.get_list("x-frame-options") == ["DENY"]
+    assert response.headers["api-version"] == "1"
+    assert "strict-transport-security" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_streaming_body_passes_through():
+    async with _client() as client:
+        response = await client.get("/stream")
+
+    assert response.text == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
+    assert response.headers["x-content-type-options"] == "nosniff"
+
+
+@pytest.mark.asyncio
+async def test_oversized_request_rejected_with_headers():
+    async with _client() as client:
+        response = await client.get("/state", headers={"content-length": "2000000"})
+
+    assert response.status_code == 413
+    assert response.headers["api-version"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_payment_endpoint_rate_limited():
+    async with _client(rate_limit_max_requests=2) as client:
+        statuses = [(await client.post("/api/checkout")).status_code for _ in range(3)]
+        unlimited = await client.get("/state")
+
+    assert statuses == [200, 200, 429]
+    assert unlimited.status_code == 200
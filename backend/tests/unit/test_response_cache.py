@@ -0,0 +1,193 @@
+"""Tests for the HTTP response cache (app.middleware.response_cache)."""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI, Request, Response
+from httpx import ASGITransport, AsyncClient
+
+from app.middleware import response_cache
+from app.middleware.response_cache import ResponseCacheMiddleware
+
+POLICIES = {
+    "/items": (60, 300, ("a", "b")),
+    "/items/{slug}": (60, 300, ()),
+    "/feed": (900, 3600, ()),
+}
+
+
+def _build_app() -> tuple[FastAPI, list[str]]:
+    app = FastAPI()
+    calls: list[str] = []
+
+    @app.get("/items")
+    async def items(request: Request):
+        calls.append(str(request.url))
+        return {"items": [1, 2, 3], "lang": request.headers.get("accept-language")}
+
+    @app.get("/items/{slug}")
+    async def item(slug: str):
+        calls.append(slug)
+        if slug == "missing":
+            return Response(status_code=404)
+        if slug == "session":
+            response = Response(content=b"{}", media_type="application/json")
+            response.set_cookie("sid", "1")
+            return response
+        return {"slug": slug}
+
+    @app.get("/feed")
+    async def feed():
+        calls.append("feed")
+        return Response(
+            content=b"<rss/>",
+            media_type="application/rss+xml",
+            headers={"Cache-Control": "public, max-age=900"},
+        )
+
+    @app.get("/private")
+    async def private():
+        calls.append("private")
+        return {"ok": True}
+
+    app.add_middleware(ResponseCacheMiddleware, policies=POLICIES)
+    return app, calls
+
+
+@pytest.fixture
+def store():
+    """In-memory stand-in for the raw Redis helpers."""
+    data: dict[str, bytes] = {}
+
+    async def get_raw(key):
+        return data.get(key)
+
+    async def set_raw(key, value, ttl=None):
+        data[key] = value
+        return True
+
+    with (
+        patch.object(response_cache, "cache_get_raw", side_effect=get_raw),
+        patch.object(response_cache, "cache_set_raw", side_effect=set_raw),
+    ):
+        yield data
+
+
+@pytest.fixture
+async def cached_client(store):
+    app, calls = _build_app()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        ac.calls = calls
+        yield ac
+
+
+@pytest.mark.asyncio
+async def test_miss_then_hit(cached_client, store):
+    first = await cached_client.get("/items")
+    second = await cached_client.get("/items")
+
+    assert cached_client.calls == ["http://test/items"]
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.content == first.content
+    assert second.headers["etag"] == first.headers["etag"]
+    assert second.headers["cache-control"] == "public, max-age=60, stale-while-revalidate=300"
+    assert second.headers["vary"] == "Accept-Language"
+    assert second.headers["content-type"] == "application/json"
+    assert len(store) == 1
+
+
+@pytest.mark.asyncio
+async def test_if_none_match_gets_304(cached_client):
+    etag = (await cached_client.get("/items")).headers["etag"]
+
+    response = await cached_client.get("/items", headers={"If-None-Match": f"W/{etag}"})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert "content-type" not in response.headers
+    assert len(cached_client.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_key_ignores_query_order_but_not_language(cached_client, store):
+    await cached_client.get("/items?a=1&b=2")
+    await cached_client.get("/items?b=2&a=1")
+    assert len(cached_client.calls) == 1
+
+    await cached_client.get("/items", headers={"Accept-Language": "zh-CN"})
+    await cached_client.get("/items", headers={"Accept-Language": "id-ID"})
+    assert len(cached_client.calls) == 3
+    assert len(store) == 3
+
+
+@pytest.mark.asyncio
+async def test_language_key_is_the_negotiated_language(cached_client, store):
+    await cached_client.get("/items")
+    await cached_client.get("/items", headers={"Accept-Language": "en-US,en;q=0.9"})
+    await cached_client.get("/items", headers={"Accept-Language": "xx-random"})
+    await cached_client.get("/items", headers={"Accept-Language": "zh, en;q=0.5"})
+    await cached_client.get("/items", headers={"Accept-Language": "zh-CN"})
+
+    assert len(cached_client.calls) == 2  # "en" and "zh-CN"
+    assert len(store) == 2
+
+
+@pytest.mark.asyncio
+async def test_undeclared_query_parameters_bypass_cache(cached_client, store):
+    for i in range(3):
+        response = await cached_client.get(f"/items?a=1&x={i}")
+        assert "x-cache" not in response.headers
+
+    assert len(cached_client.calls) == 3
+    assert store == {}
+
+
+@pytest.mark.asyncio
+async def test_path_parameters_are_cached_per_path(cached_client):
+    await cached_client.get("/items/a")
+    await cached_client.get("/items/a")
+    await cached_client.get("/items/b")
+
+    assert cached_client.calls == ["a", "b"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("path", "headers"),
+    [
+        ("/items", {"Authorization": "Bearer token"}),
+        ("/items/missing", {}),
+        ("/items/session", {}),
+        ("/private", {}),
+    ],
+    ids=["authenticated", "not-200", "set-cookie", "no-policy"],
+)
+async def test_not_cached(cached_client, store, path, headers):
+    await cached_client.get(path, headers=headers)
+    response = await cached_client.get(path, headers=headers)
+
+    assert len(cached_client.calls) == 2
+    assert "x-cache" not in response.headers
+    assert store == {}
+
+
+@pytest.mark.asyncio
+async def test_app_cache_control_is_kept(cached_client):
+    await cached_client.get("/feed")
+    response = await cached_client.get("/feed")
+
+    assert response.headers["x-cache"] == "HIT"
+    assert response.headers["cache-control"] == "public, max-age=900"
+    assert response.headers["content-type"] == "application/rss+xml"
+
+
+@pytest.mark.asyncio
+async def test_disabled_by_setting(cached_client, store):
+    with patch.object(response_cache.settings, "response_cache_enabled", False):
+        await cached_client.get("/items")
+        await cached_client.get("/items")
+
+    assert len(cached_client.calls) == 2
+    assert store == {}
@@ -16,8 +16,15 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.routes.insights import parse_accept_language
+from app.core import cache_codec
 from app.models.insight import Insight
 
+
+async def cache_miss(key, compute, ttl=None):
+    """Stand-in for cache_get_or_compute_json that always computes."""
+    return cache_codec.dumps(await compute())
+
+
 # ---------------------------------------------------------------------------
 # Pure-function tests: parse_accept_language
 # ---------------------------------------------------------------------------
@@ -74,12 +81,10 @@ class TestParseAcceptLanguage:
 class TestListInsights:
     """Tests for GET /api/insights."""
 
-    @patch("app.api.routes.insights.cache_get", new_callable=AsyncMock, return_value=None)
-    @patch("app.api.routes.insights.cache_set", new_callable=AsyncMock)
+    @patch("app.core.cache_registry.cache_get_or_compute_json", side_effect=cache_miss)
     async def test_empty_db_returns_200_with_empty_list(
         self,
-        mock_cache_set: AsyncMock,
-        mock_cache_get: AsyncMock,
+        mock_cache: AsyncMock,
         client: AsyncClient,
     ):
         """With no insights in DB, returns 200 with empty insights list."""
@@ -89,12 +94,10 @@ class TestListInsights:
         assert data["insights"] == []
         assert data["total"] == 0
 
-    @patch("app.api.routes.insights.cache_get", new_callable=AsyncMock, return_value=None)
-    @patch("app.api.routes.insights.cache_set", new_callable=AsyncMock)
+    @patch("app.core.cache_registry.cache_get_or_compute_json", side_effect=cache_miss)
     async def test_list_pagination_fields_present(
         self,
-        mock_cache_set: AsyncMock,
-        mock_cache_get: AsyncMock,
+        mock_cache: AsyncMock,
         client: AsyncClient,
     ):
         """Response always contains pagination envelope fields."""
@@ -108,12 +111,10 @@ class TestListInsights:
         assert data["limit"] == 10
         assert data["offset"] == 0
 
-    @patch("app.api.routes.insights.cache_get", new_callable=AsyncMock, return_value=None)
-    @patch("app.api.routes.insights.cache_set", new_callable=AsyncMock)
+    @patch("app.core.cache_registry.cache_get_or_compute_json", side_effect=cache_miss)
     async def test_list_with_insight_in_db(
         self,
-        mock_cache_set: AsyncMock,
-        mock_cache_get: AsyncMock,
+        mock_cache: AsyncMock,
         client: AsyncClient,
         test_insight: Insight,
     ):
@@ -124,43 +125,38 @@ class TestListInsights:
         assert data["total"] == 1
         assert len(data["insights"]) == 1
 
-    @patch("app.api.routes.insights.cache_get", new_callable=AsyncMock)
+    @patch("app.core.cache_registry.cache_get_or_compute_json", new_callable=AsyncMock)
     async def test_cache_hit_skips_db_query(
         self,
-        mock_cache_get: AsyncMock,
+        mock_cache: AsyncMock,
         client: AsyncClient,
     ):
-        """When cache returns data, the route responds with cached payload."""
-        mock_cache_get.return_value = {
-            "insights": [],
-            "total": 0,
-            "limit": 20,
-            "offset": 0,
-        }
+        """When cache returns data, the route responds with the cached JSON as is."""
+        mock_cache.return_value = cache_codec.dumps(
+            {"insights": [], "total": 0, "limit": 20, "offset": 0}
+        )
         resp = await client.get("/api/insights")
         assert resp.status_code == 200
         data = resp.json()
         assert data["total"] == 0
         assert data["insights"] == []
 
-    @patch("app.api.routes.insights.cache_get", new_callable=AsyncMock, return_value=None)
-    @patch("app.api.routes.insights.cache_set", new_callable=AsyncMock)
+    @patch("app.core.cache_registry.cache_get_or_compute_json", side_effect=cache_miss)
     async def test_list_cache_set_called_after_db(
         self,
-        mock_cache_set: AsyncMock,
-        mock_cache_get: AsyncMock,
+        mock_cache: AsyncMock,
         client: AsyncClient,
     ):
-        """cache_set is called after a DB fetch (cache miss path)."""
+        """The DB fetch is cached under an insights_list key for 60s (cache miss path)."""
         await client.get("/api/insights")
-        mock_cache_set.assert_called_once()
+        mock_cache.assert_awaited_once()
+        assert mock_cache.await_args.args[0].startswith("insights_list:")
+        assert mock_cache.await_args.kwargs["ttl"] == 60
 
-    @patch("app.api.routes.insights.cache_get", new_callable=AsyncMock, return_value=None)
-    @patch("app.api.routes.insights.cache_set", new_callable=AsyncMock)
+    @patch("app.core.cache_registry.cache_get_or_compute_json", side_effect=cache_miss)
     async def test_invalid_limit_rejected(
         self,
-        mock_cache_set: AsyncMock,
-        mock_cache_get: AsyncMock,
+        mock_cache: AsyncMock,
         client: AsyncClient,
     ):
         """limit > 100 is rejected with 422 Unprocessable Entity."""
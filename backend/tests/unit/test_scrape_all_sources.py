@@ -0,0 +1,81 @@
+"""Unit tests for the concurrent scrape_all_sources_task fan-out in app.worker."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app import worker
+
+SOURCE_TASKS = {
+    "reddit": "scrape_reddit_task",
+    "product_hunt": "scrape_product_hunt_task",
+    "google_trends": "scrape_trends_task",
+    "twitter": "scrape_twitter_task",
+    "hacker_news": "scrape_hackernews_task",
+}
+
+
+def _patch_sources(fakes: dict):
+    """Patch each per-source task on the worker module with the given fake."""
+    patchers = [patch.object(worker, attr, fakes[name]) for name, attr in SOURCE_TASKS.items()]
+    for p in patchers:
+        p.start()
+    return patchers
+
+
+@pytest.mark.asyncio
+async def test_sources_run_concurrently_under_cap(monkeypatch):
+    """No more than scrape_all_concurrency sources are in flight at once."""
+    monkeypatch.setattr(worker.settings, "scrape_all_concurrency", 2)
+    in_flight = 0
+    peak = 0
+
+    def make_fake(name):
+        async def fake(ctx):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"status": "success", "source": name, "signals_saved": 1}
+
+        return fake
+
+    patchers = _patch_sources({name: make_fake(name) for name in SOURCE_TASKS})
+    try:
+        result = await worker.scrape_all_sources_task({})
+    finally:
+        for p in patchers:
+            p.stop()
+
+    assert peak == 2
+    assert result["total_signals"] == 5
+    assert set(result["timings_ms"]) == set(SOURCE_TASKS)
+    assert result["wall_time_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_crashing_source_is_isolated(monkeypatch):
+    """An exception in one source is reported without affecting the others."""
+    monkeypatch.setattr(worker.settings, "scrape_all_concurrency", 5)
+
+    async def ok(ctx):
+        return {"status": "success", "signals_saved": 2}
+
+    async def boom(ctx):
+        raise RuntimeError("playwright crashed")
+
+    fakes = {name: ok for name in SOURCE_TASKS}
+    fakes["product_hunt"] = boom
+    patchers = _patch_sources(fakes)
+    try:
+        result = await worker.scrape_all_sources_task({})
+    finally:
+        for p in patchers:
+            p.stop()
+
+    assert result["details"]["product_hunt"]["status"] == "error"
+    assert "playwright crashed" in result["details"]["product_hunt"]["error"]
+    assert result["total_signals"] == 8
+    assert "product_hunt" in result["timings_ms"]
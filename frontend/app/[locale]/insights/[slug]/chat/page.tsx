@@ -244,6 +244,7 @@ export default function ChatPage() {
       created_at: new Date().toISOString(),
     };
     setMessages(prev => [...prev, tempUserMsg]);
+    const streamingMsgId = `streaming-${Date.now()}`;
 
     try {
       const response = await fetch(`${API_URL}/api/idea-chats/${activeChatId}/messages`, {
@@ -283,15 +284,31 @@ export default function ChatPage() {
                   : m
                 )
               );
+            } else if (event.type === 'assistant_delta') {
+              // Grow the in-progress assistant message token by token
+              setMessages(prev =>
+                prev.some(m => m.id === streamingMsgId)
+                  ? prev.map(m => m.id === streamingMsgId
+                    ? { ...m, content: m.content + event.content }
+                    : m
+                  )
+                  : [...prev, {
+                    id: streamingMsgId,
+                    role: 'assistant',
+                    content: event.content,
+                    created_at: new Date().toISOString(),
+                  }]
+              );
             } else if (event.type === 'assistant_message') {
-              setMessages(prev => [...prev, {
+              // Final persisted message replaces the streamed draft
+              setMessages(prev => [...prev.filter(m => m.id !== streamingMsgId), {
                 id: event.id,
                 role: 'assistant',
                 content: event.content,
                 created_at: new Date().toISOString(),
               }]);
             } else if (event.type === 'error') {
-              setMessages(prev => [...prev, {
+              setMessages(prev => [...prev.filter(m => m.id !== streamingMsgId), {
                 id: `error-${Date.now()}`,
                 role: 'assistant',
                 content: `Error: ${event.message}`,